@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class CacheStatisticsDTO(BaseModel):
+    hits: int
+    misses: int
+    entries: int
+
+
+class CacheStatisticsResultDTO(BaseModel):
+    translation: CacheStatisticsDTO
+    transcription: CacheStatisticsDTO
@@ -0,0 +1,11 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class JobResultDTO(BaseModel):
+    job_id: str
+    status: str
+    progress: float
+    result: Optional[str] = None
+    error: Optional[str] = None
@@ -0,0 +1,7 @@
+from typing import Literal
+
+from api.dtos.transcribe_dto import TranscribeDTO
+
+
+class TranscribeBatchDTO(TranscribeDTO):  # type: ignore
+    result_format: Literal["text", "srt"] = "text"
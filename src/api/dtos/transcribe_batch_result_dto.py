@@ -0,0 +1,11 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class TranscribeBatchResultDTO(BaseModel):
+    index: int
+    file_name: Optional[str] = None
+    status: str
+    result: Optional[str] = None
+    error: Optional[str] = None
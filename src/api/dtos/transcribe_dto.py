@@ -1,3 +1,4 @@
+import json
 import re
 from typing import Any, Dict, Optional
 
@@ -29,3 +30,11 @@ class TranscribeDTO(BaseModel):
             return cls.validate_language_format(v)
 
         return v
+
+    @field_validator("transcription_parameters", "translation_parameters", mode="before")
+    def parse_parameters(cls, v: Any) -> Any:
+        # Multipart form fields carry the parameters as JSON text
+        if isinstance(v, str):
+            return json.loads(v)
+
+        return v
@@ -0,0 +1,16 @@
+from pydantic import model_validator
+
+from api.dtos.transcribe_dto import TranscribeDTO
+from domain.exceptions.streaming_translation_not_supported_error import (
+    StreamingTranslationNotSupportedError,
+)
+
+
+class TranscribeSrtStreamDTO(TranscribeDTO):  # type: ignore
+    @model_validator(mode="after")
+    def validate_no_translation(self) -> "TranscribeSrtStreamDTO":
+        # Segments are sent as soon as they are decoded, before the sentences they belong to are complete
+        if self.target_language and self.target_language != self.source_language:
+            raise StreamingTranslationNotSupportedError()
+
+        return self
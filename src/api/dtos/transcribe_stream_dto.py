@@ -0,0 +1,25 @@
+import json
+from typing import Any, Dict, Literal
+
+from pydantic import BaseModel, field_validator
+
+from api.dtos.transcribe_dto import TranscribeDTO
+
+
+class TranscribeStreamDTO(BaseModel):
+    language: str
+    format: Literal["pcm_s16le", "pcm_f32le", "opus"] = "pcm_s16le"
+    transcription_parameters: Dict[str, Any] = {}
+
+    @field_validator("language")
+    def validate_language(cls, v: str) -> str:
+        language: str = TranscribeDTO.validate_language_format(v)
+        return language
+
+    @field_validator("transcription_parameters", mode="before")
+    def parse_parameters(cls, v: Any) -> Any:
+        # Query parameters carry the parameters as JSON text
+        if isinstance(v, str):
+            return json.loads(v)
+
+        return v
@@ -1,10 +1,15 @@
 import traceback
+from typing import Type
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from api.dtos.error_response_dto import ErrorResponseDto
 from core.logger.logger import Logger
+from domain.exceptions.admission_rejected_error import AdmissionRejectedError
+from domain.exceptions.job_not_found_error import JobNotFoundError
+from domain.exceptions.job_queue_full_error import JobQueueFullError
+from domain.exceptions.upload_quota_exceeded_error import UploadQuotaExceededError
 
 
 class GlobalExceptionHandler:
@@ -13,7 +18,49 @@ class GlobalExceptionHandler:
         self.logger = logger
         self.register_handlers()
 
+    def register_status_handler(
+        self,
+        exception_type: Type[Exception],
+        status_code: int,
+        message: str,
+    ) -> None:
+        async def handle_status_error(request: Request, exc: Exception) -> JSONResponse:
+            content = ErrorResponseDto(
+                status_code=status_code,
+                message=message,
+                details={"error_type": exc.__class__.__name__, "error_message": str(exc)},
+            ).model_dump(exclude_none=True)
+
+            self.logger.warning(f"{exception_type.__name__} occurred: {str(content)}")
+
+            return JSONResponse(
+                status_code=status_code,
+                content=content,
+            )
+
+        self.app.add_exception_handler(exception_type, handle_status_error)
+
     def register_handlers(self) -> None:
+        self.register_status_handler(JobNotFoundError, 404, "Not found")
+        self.register_status_handler(JobQueueFullError, 503, "Service unavailable")
+        self.register_status_handler(UploadQuotaExceededError, 507, "Insufficient storage")
+
+        @self.app.exception_handler(AdmissionRejectedError)
+        async def handle_admission_rejected_error(request: Request, exc: AdmissionRejectedError) -> JSONResponse:
+            content = ErrorResponseDto(
+                status_code=429,
+                message="Too many requests",
+                details={"error_type": exc.__class__.__name__, "error_message": str(exc)},
+            ).model_dump(exclude_none=True)
+
+            self.logger.warning(f"Request rejected by admission control: {str(content)}")
+
+            return JSONResponse(
+                status_code=429,
+                content=content,
+                headers={"Retry-After": str(exc.retry_after)},
+            )
+
         @self.app.exception_handler(ValueError)
         async def handle_value_error(request: Request, exc: ValueError) -> JSONResponse:
             content = ErrorResponseDto(
@@ -0,0 +1,56 @@
+from typing import Dict
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.client_context.client_context import (
+    ANONYMOUS_CLIENT_ID,
+    reset_client_id,
+    set_client_id,
+)
+
+
+class ClientIdentityMiddleware:
+    # A plain ASGI middleware runs the whole request, including streamed bodies and WebSocket sessions,
+    # inside the context that carries the client identity
+    def __init__(
+        self,
+        app: ASGIApp,
+        client_api_keys: Dict[str, str],
+    ) -> None:
+        self.app = app
+        self.client_api_keys = client_api_keys
+
+    def _identify(
+        self,
+        scope: Scope,
+    ) -> str:
+        api_key = Headers(scope=scope).get("X-API-Key")
+        # Identities come from keys the operator handed out, so a client cannot claim another one by a header
+        client_id = self.client_api_keys.get(api_key) if api_key else None
+
+        if client_id:
+            return client_id
+
+        # Unknown keys are ignored, as a fresh key on every request would otherwise get fresh quotas and shares
+        client = scope.get("client")
+
+        return str(client[0]) if client else ANONYMOUS_CLIENT_ID
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        token = set_client_id(self._identify(scope))
+
+        try:
+            await self.app(scope, receive, send)
+
+        finally:
+            reset_client_id(token)
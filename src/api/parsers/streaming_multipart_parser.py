@@ -0,0 +1,174 @@
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from domain.exceptions.invalid_multipart_request_error import (
+    InvalidMultipartRequestError,
+)
+from domain.models.saved_file_model import SavedFileModel
+
+MAX_FIELD_SIZE = 1024 * 1024  # 1MB
+
+SaveFile = Callable[[Optional[str], AsyncIterable[bytes]], Awaitable[SavedFileModel]]
+DeleteFile = Callable[[SavedFileModel], None]
+
+
+@dataclass
+class StreamingMultipartForm:
+    fields: Dict[str, str] = field(default_factory=dict)
+    files: Dict[str, List[SavedFileModel]] = field(default_factory=dict)
+
+
+class StreamingMultipartParser:
+    def __init__(
+        self,
+        headers: Mapping[str, str],
+        stream: AsyncIterable[bytes],
+        max_field_size: int = MAX_FIELD_SIZE,
+    ) -> None:
+        content_type, options = parse_options_header(headers.get("content-type", ""))
+        boundary = options.get(b"boundary")
+
+        if content_type != b"multipart/form-data" or not boundary:
+            raise InvalidMultipartRequestError("expected multipart/form-data with a boundary")
+
+        self._stream = stream.__aiter__()
+        self._max_field_size = max_field_size
+        self._events: Deque[Tuple[str, bytes]] = deque()
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: Dict[bytes, bytes] = {}
+        self._finished = False
+        self._complete = False
+        self._parser = MultipartParser(
+            boundary,
+            {
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+                "on_end": self._on_end,
+            },
+        )
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        self._events.append(("headers", self._headers.get(b"content-disposition", b"")))
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        self._events.append(("data", data[start:end]))
+
+    def _on_part_end(self) -> None:
+        self._events.append(("end", b""))
+
+    def _on_end(self) -> None:
+        self._complete = True
+
+    async def _next_event(self) -> Optional[Tuple[str, bytes]]:
+        # The body is pulled from the client only when the current part needs more data
+        while not self._events:
+            if self._finished:
+                return None
+
+            try:
+                chunk = await self._stream.__anext__()
+
+            except StopAsyncIteration:
+                if not self._complete:
+                    raise InvalidMultipartRequestError("request body ended before the closing boundary")
+
+                self._finished = True
+                continue
+
+            try:
+                self._parser.write(chunk)
+
+            except MultipartParseError as e:
+                raise InvalidMultipartRequestError(str(e)) from e
+
+        return self._events.popleft()
+
+    async def _part_chunks(self) -> AsyncIterator[bytes]:
+        while (event := await self._next_event()) is not None:
+            kind, data = event
+
+            if kind == "end":
+                return
+
+            yield data
+
+    async def _read_field(self) -> str:
+        value = bytearray()
+
+        async for data in self._part_chunks():
+            value += data
+
+            if len(value) > self._max_field_size:
+                raise InvalidMultipartRequestError("form field is too large")
+
+        return value.decode("utf-8")
+
+    async def parse(
+        self,
+        save_file: SaveFile,
+        delete_file: DeleteFile,
+    ) -> StreamingMultipartForm:
+        form = StreamingMultipartForm()
+
+        try:
+            while (event := await self._next_event()) is not None:
+                _, content_disposition = event
+                _, options = parse_options_header(content_disposition)
+                name = options.get(b"name", b"").decode("utf-8")
+                file_name = options.get(b"filename")
+
+                if file_name is None:
+                    form.fields[name] = await self._read_field()
+                    continue
+
+                # File parts go straight from the request body to the staging file
+                chunks = self._part_chunks()
+                saved_file = await save_file(file_name.decode("utf-8"), chunks)
+                form.files.setdefault(name, []).append(saved_file)
+
+                async for _ in chunks:
+                    pass
+
+        except BaseException:
+            for saved_files in form.files.values():
+                for saved_file in saved_files:
+                    delete_file(saved_file)
+
+            raise
+
+        return form
@@ -0,0 +1,92 @@
+from typing import Any, Dict, List, Tuple, Type, TypeVar
+
+from fastapi import Request
+
+from api.dtos.transcribe_dto import TranscribeDTO
+from api.parsers.streaming_multipart_parser import StreamingMultipartParser
+from application.usecases.stage_uploaded_file_usecase import StageUploadedFileUseCase
+from domain.exceptions.invalid_multipart_request_error import (
+    InvalidMultipartRequestError,
+)
+from domain.models.saved_file_model import SavedFileModel
+
+TranscribeDTOType = TypeVar("TranscribeDTOType", bound=TranscribeDTO)
+
+TRANSCRIBE_FORM_PROPERTIES: Dict[str, Any] = {
+    "file": {"type": "string", "format": "binary"},
+    "source_language": {"type": "string"},
+    "target_language": {"type": "string"},
+    "transcription_parameters": {"type": "string", "default": "{}"},
+    "translation_parameters": {"type": "string", "default": "{}"},
+}
+
+
+def create_transcribe_request_body(**extra_properties: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["file", "source_language"],
+                        "properties": {**TRANSCRIBE_FORM_PROPERTIES, **extra_properties},
+                    },
+                },
+            },
+        },
+    }
+
+
+async def _parse_transcribe_form(
+    request: Request,
+    stage_uploaded_file_usecase: StageUploadedFileUseCase,
+    dto_type: Type[TranscribeDTOType],
+    single_file: bool,
+) -> Tuple[TranscribeDTOType, List[SavedFileModel]]:
+    # The multipart body is parsed while it streams in, so the upload is written to disk only once
+    form = await StreamingMultipartParser(request.headers, request.stream()).parse(
+        stage_uploaded_file_usecase.execute,
+        stage_uploaded_file_usecase.discard,
+    )
+    files = form.files.pop("file", [])
+    unexpected_files = [saved_file for saved_files in form.files.values() for saved_file in saved_files]
+
+    try:
+        if single_file and len(files) != 1:
+            raise InvalidMultipartRequestError("expected exactly one 'file' field")
+
+        if not files:
+            raise InvalidMultipartRequestError("expected at least one 'file' field")
+
+        transcribe_dto = dto_type.model_validate(
+            {name: value for name, value in form.fields.items() if value},
+        )
+
+    except ValueError:
+        unexpected_files.extend(files)
+        raise
+
+    finally:
+        for saved_file in unexpected_files:
+            stage_uploaded_file_usecase.discard(saved_file)
+
+    return transcribe_dto, files
+
+
+async def parse_transcribe_request(
+    request: Request,
+    stage_uploaded_file_usecase: StageUploadedFileUseCase,
+    dto_type: Type[TranscribeDTOType],
+) -> Tuple[TranscribeDTOType, SavedFileModel]:
+    transcribe_dto, files = await _parse_transcribe_form(request, stage_uploaded_file_usecase, dto_type, True)
+
+    return transcribe_dto, files[0]
+
+
+async def parse_transcribe_batch_request(
+    request: Request,
+    stage_uploaded_file_usecase: StageUploadedFileUseCase,
+    dto_type: Type[TranscribeDTOType],
+) -> Tuple[TranscribeDTOType, List[SavedFileModel]]:
+    return await _parse_transcribe_form(request, stage_uploaded_file_usecase, dto_type, False)
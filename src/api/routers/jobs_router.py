@@ -0,0 +1,80 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request
+
+from api.dtos.job_result_dto import JobResultDTO
+from api.dtos.transcribe_job_dto import TranscribeJobDTO
+from api.parsers.transcribe_request_parser import (
+    create_transcribe_request_body,
+    parse_transcribe_request,
+)
+from application.usecases.cancel_transcription_job_usecase import (
+    CancelTranscriptionJobUseCase,
+)
+from application.usecases.get_transcription_job_usecase import (
+    GetTranscriptionJobUseCase,
+)
+from application.usecases.stage_uploaded_file_usecase import StageUploadedFileUseCase
+from application.usecases.submit_transcription_job_usecase import (
+    SubmitTranscriptionJobUseCase,
+)
+from domain.models.job_model import JobModel
+
+JOB_REQUEST_BODY = create_transcribe_request_body(
+    result_format={"type": "string", "enum": ["text", "srt"], "default": "text"},
+)
+
+
+class JobsRouter:
+    def __init__(self) -> None:
+        self.router = APIRouter()
+        self.router.post("/jobs", status_code=202, openapi_extra=JOB_REQUEST_BODY)(self.submit_job)
+        self.router.get("/jobs/{job_id}")(self.get_job)
+        self.router.delete("/jobs/{job_id}")(self.cancel_job)
+
+    @staticmethod
+    def _to_dto(job: JobModel) -> JobResultDTO:
+        return JobResultDTO(
+            job_id=job.job_id,
+            status=job.status.value,
+            progress=job.progress,
+            result=job.result,
+            error=job.error,
+        )
+
+    async def submit_job(
+        self,
+        request: Request,
+        stage_uploaded_file_usecase: Annotated[StageUploadedFileUseCase, Depends()],
+        submit_transcription_job_usecase: Annotated[SubmitTranscriptionJobUseCase, Depends()],
+    ) -> JobResultDTO:
+        transcribe_job_dto, file = await parse_transcribe_request(
+            request,
+            stage_uploaded_file_usecase,
+            TranscribeJobDTO,
+        )
+
+        job = submit_transcription_job_usecase.execute(
+            file,
+            transcribe_job_dto.source_language,
+            transcribe_job_dto.target_language,
+            transcribe_job_dto.transcription_parameters,
+            transcribe_job_dto.translation_parameters,
+            transcribe_job_dto.result_format,
+        )
+
+        return self._to_dto(job)
+
+    async def get_job(
+        self,
+        job_id: str,
+        get_transcription_job_usecase: Annotated[GetTranscriptionJobUseCase, Depends()],
+    ) -> JobResultDTO:
+        return self._to_dto(get_transcription_job_usecase.execute(job_id))
+
+    async def cancel_job(
+        self,
+        job_id: str,
+        cancel_transcription_job_usecase: Annotated[CancelTranscriptionJobUseCase, Depends()],
+    ) -> JobResultDTO:
+        return self._to_dto(cancel_transcription_job_usecase.execute(job_id))
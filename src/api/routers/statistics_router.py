@@ -0,0 +1,26 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from api.dtos.cache_statistics_result_dto import (
+    CacheStatisticsDTO,
+    CacheStatisticsResultDTO,
+)
+from application.usecases.get_cache_statistics_usecase import GetCacheStatisticsUseCase
+
+
+class StatisticsRouter:
+    def __init__(self) -> None:
+        self.router = APIRouter()
+        self.router.get("/statistics/cache")(self.cache_statistics)
+
+    async def cache_statistics(
+        self,
+        get_cache_statistics_usecase: Annotated[GetCacheStatisticsUseCase, Depends()],
+    ) -> CacheStatisticsResultDTO:
+        statistics = get_cache_statistics_usecase.execute()
+
+        return CacheStatisticsResultDTO(
+            translation=CacheStatisticsDTO(**statistics["translation"].model_dump()),
+            transcription=CacheStatisticsDTO(**statistics["transcription"].model_dump()),
+        )
@@ -0,0 +1,67 @@
+import json
+from typing import Annotated, AsyncIterator
+
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+
+from api.dtos.transcribe_stream_dto import TranscribeStreamDTO
+from application.usecases.transcribe_stream_usecase import TranscribeStreamUseCase
+from core.logger.logger import Logger
+
+END_OF_STREAM_MESSAGE = "end"
+
+
+class StreamingRouter:
+    def __init__(self) -> None:
+        self.router = APIRouter()
+        self.router.websocket("/ws/transcribe")(self.transcribe_stream)
+
+    @staticmethod
+    async def _receive_frames(websocket: WebSocket) -> AsyncIterator[bytes]:
+        while True:
+            message = await websocket.receive()
+
+            if message["type"] == "websocket.disconnect":
+                return
+
+            if message.get("bytes"):
+                yield message["bytes"]
+
+            elif message.get("text") is not None and message["text"].strip() == END_OF_STREAM_MESSAGE:
+                return
+
+    async def transcribe_stream(
+        self,
+        websocket: WebSocket,
+        transcribe_stream_usecase: Annotated[TranscribeStreamUseCase, Depends()],
+        logger: Annotated[Logger, Depends()],
+    ) -> None:
+        await websocket.accept()
+
+        try:
+            transcribe_stream_dto = TranscribeStreamDTO.model_validate(dict(websocket.query_params))
+
+            async for segment in transcribe_stream_usecase.execute(
+                self._receive_frames(websocket),
+                transcribe_stream_dto.language,
+                transcribe_stream_dto.format,
+                transcribe_stream_dto.transcription_parameters,
+            ):
+                await websocket.send_text(segment.model_dump_json(exclude_none=True))
+
+        except WebSocketDisconnect:
+            logger.info("Streaming transcription client disconnected")
+            return
+
+        except ValueError as e:
+            logger.warning(f"Streaming transcription rejected: {e}")
+            await websocket.send_text(json.dumps({"type": "error", "message": str(e)}))
+            await websocket.close(code=1008)
+            return
+
+        except Exception as e:
+            logger.error(f"Streaming transcription failed: {e}")
+            await websocket.send_text(json.dumps({"type": "error", "message": "Internal server error"}))
+            await websocket.close(code=1011)
+            return
+
+        await websocket.close()
@@ -1,47 +1,134 @@
-from typing import Annotated, Any, Dict, Optional
+import json
+from contextlib import AsyncExitStack
+from functools import partial
+from typing import Annotated, AsyncIterator
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile
-from fastapi.responses import PlainTextResponse
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
+from api.dtos.transcribe_batch_dto import TranscribeBatchDTO
+from api.dtos.transcribe_batch_result_dto import TranscribeBatchResultDTO
 from api.dtos.transcribe_dto import TranscribeDTO
+from api.dtos.transcribe_srt_stream_dto import TranscribeSrtStreamDTO
 from api.dtos.transcribe_text_result_dto import TranscribeTextResultDTO
+from api.parsers.transcribe_request_parser import (
+    create_transcribe_request_body,
+    parse_transcribe_batch_request,
+    parse_transcribe_request,
+)
+from application.usecases.stage_uploaded_file_usecase import StageUploadedFileUseCase
+from application.usecases.transcribe_batch_usecase import TranscribeBatchUseCase
+from application.usecases.transcribe_file_to_srt_stream_usecase import (
+    TranscribeFileToSrtStreamUseCase,
+)
 from application.usecases.transcribe_file_to_srt_usecase import (
     TranscribeFileToSrtUseCase,
 )
 from application.usecases.transcribe_file_to_text_usecase import (
     TranscribeFileToTextUseCase,
 )
+from core.admission.admission_controller import AdmissionController
+from core.logger.logger import Logger
+from domain.models.batch_item_result_model import BatchItemResultModel
+from domain.models.subtitle_segment_model import SubtitleSegmentModel
+
+TRANSCRIBE_REQUEST_BODY = create_transcribe_request_body()
+TRANSCRIBE_BATCH_REQUEST_BODY = create_transcribe_request_body(
+    file={"type": "array", "items": {"type": "string", "format": "binary"}},
+    result_format={"type": "string", "enum": ["text", "srt"], "default": "text"},
+)
 
 
 class TranscribeRouter:
     def __init__(self) -> None:
         self.router = APIRouter()
-        self.router.post("/transcribe")(self.transcribe)
-        self.router.post("/transcribe/srt")(self.transcribe_srt)
+        self.router.post("/transcribe", openapi_extra=TRANSCRIBE_REQUEST_BODY)(self.transcribe)
+        self.router.post("/transcribe/srt", openapi_extra=TRANSCRIBE_REQUEST_BODY)(self.transcribe_srt)
+        self.router.post(
+            "/transcribe/srt/stream",
+            openapi_extra=TRANSCRIBE_REQUEST_BODY,
+            response_class=StreamingResponse,
+        )(self.transcribe_srt_stream)
+        self.router.post(
+            "/transcribe/batch",
+            openapi_extra=TRANSCRIBE_BATCH_REQUEST_BODY,
+            response_class=StreamingResponse,
+        )(self.transcribe_batch)
+
+    @staticmethod
+    def _format_event(event: str, data: str) -> str:
+        return f"event: {event}\ndata: {data}\n\n"
+
+    async def _stream_subtitle_events(
+        self,
+        subtitle_segments: AsyncIterator[SubtitleSegmentModel],
+        exit_stack: AsyncExitStack,
+        logger: Logger,
+    ) -> AsyncIterator[str]:
+        # The response has started by the time errors occur, so they are reported as an event instead of a status
+        async with exit_stack:
+            try:
+                async for subtitle_segment in subtitle_segments:
+                    yield self._format_event("segment", subtitle_segment.model_dump_json())
+
+            except Exception as e:
+                logger.error(f"Streamed transcription to SRT failed: {e}")
+                yield self._format_event(
+                    "error",
+                    json.dumps({"error_type": e.__class__.__name__, "error_message": str(e)}),
+                )
+                return
+
+            yield self._format_event("end", "{}")
+
+    @staticmethod
+    async def _admit_batch_files(
+        admission_controller: AdmissionController,
+        exit_stack: AsyncExitStack,
+        file_count: int,
+    ) -> None:
+        # Every file is transcribed as a request of its own, and the first one holds the slot taken before the upload
+        if file_count > 1:
+            await exit_stack.enter_async_context(admission_controller.admit(file_count - 1, held_units=1))
+
+    @staticmethod
+    async def _stream_batch_results(
+        results: AsyncIterator[BatchItemResultModel],
+        exit_stack: AsyncExitStack,
+    ) -> AsyncIterator[str]:
+        async with exit_stack:
+            async for result in results:
+                batch_result_dto = TranscribeBatchResultDTO(
+                    index=result.index,
+                    file_name=result.file_name,
+                    status="failed" if result.error is not None else "completed",
+                    result=result.result,
+                    error=result.error,
+                )
+                yield f"{batch_result_dto.model_dump_json(exclude_none=True)}\n"
 
     async def transcribe(
         self,
+        request: Request,
+        stage_uploaded_file_usecase: Annotated[StageUploadedFileUseCase, Depends()],
         transcribe_file_to_text_usecase: Annotated[TranscribeFileToTextUseCase, Depends()],
-        file: UploadFile = File(...),
-        source_language: str = Form(...),
-        target_language: Optional[str] = Form(None),
-        transcription_parameters: Dict[str, Any] = Form({}),
-        translation_parameters: Dict[str, Any] = Form({}),
+        admission_controller: Annotated[AdmissionController, Depends()],
     ) -> TranscribeTextResultDTO:
-        transcribe_dto = TranscribeDTO(
-            source_language=source_language,
-            target_language=target_language,
-            transcription_parameters=transcription_parameters,
-            translation_parameters=translation_parameters,
-        )
+        # Admission is checked before the upload is read, so rejected clients do not pay for sending the file
+        async with admission_controller.admit():
+            transcribe_dto, file = await parse_transcribe_request(
+                request,
+                stage_uploaded_file_usecase,
+                TranscribeDTO,
+            )
 
-        transcription = await transcribe_file_to_text_usecase.execute(
-            file,
-            transcribe_dto.source_language,
-            transcribe_dto.target_language,
-            transcribe_dto.transcription_parameters,
-            transcribe_dto.translation_parameters,
-        )
+            transcription = await transcribe_file_to_text_usecase.execute(
+                file,
+                transcribe_dto.source_language,
+                transcribe_dto.target_language,
+                transcribe_dto.transcription_parameters,
+                transcribe_dto.translation_parameters,
+            )
 
         return TranscribeTextResultDTO(
             transcription=transcription,
@@ -49,26 +136,82 @@ class TranscribeRouter:
 
     async def transcribe_srt(
         self,
+        request: Request,
+        stage_uploaded_file_usecase: Annotated[StageUploadedFileUseCase, Depends()],
         transcribe_file_to_srt_usecase: Annotated[TranscribeFileToSrtUseCase, Depends()],
-        file: UploadFile = File(...),
-        source_language: str = Form(...),
-        target_language: Optional[str] = Form(None),
-        transcription_parameters: Dict[str, Any] = Form({}),
-        translation_parameters: Dict[str, Any] = Form({}),
+        admission_controller: Annotated[AdmissionController, Depends()],
     ) -> PlainTextResponse:
-        transcribe_dto = TranscribeDTO(
-            source_language=source_language,
-            target_language=target_language,
-            transcription_parameters=transcription_parameters,
-            translation_parameters=translation_parameters,
-        )
+        # Admission is checked before the upload is read, so rejected clients do not pay for sending the file
+        async with admission_controller.admit():
+            transcribe_dto, file = await parse_transcribe_request(
+                request,
+                stage_uploaded_file_usecase,
+                TranscribeDTO,
+            )
 
-        srt = await transcribe_file_to_srt_usecase.execute(
-            file,
-            transcribe_dto.source_language,
-            transcribe_dto.target_language,
-            transcribe_dto.transcription_parameters,
-            transcribe_dto.translation_parameters,
-        )
+            srt = await transcribe_file_to_srt_usecase.execute(
+                file,
+                transcribe_dto.source_language,
+                transcribe_dto.target_language,
+                transcribe_dto.transcription_parameters,
+                transcribe_dto.translation_parameters,
+            )
 
         return PlainTextResponse(content=srt)
+
+    async def transcribe_srt_stream(
+        self,
+        request: Request,
+        stage_uploaded_file_usecase: Annotated[StageUploadedFileUseCase, Depends()],
+        transcribe_file_to_srt_stream_usecase: Annotated[TranscribeFileToSrtStreamUseCase, Depends()],
+        admission_controller: Annotated[AdmissionController, Depends()],
+        logger: Annotated[Logger, Depends()],
+    ) -> StreamingResponse:
+        # The admission slot is held until the last event is sent, not only until the handler returns
+        async with AsyncExitStack() as exit_stack:
+            await exit_stack.enter_async_context(admission_controller.admit())
+            transcribe_dto, file = await parse_transcribe_request(
+                request,
+                stage_uploaded_file_usecase,
+                TranscribeSrtStreamDTO,
+            )
+            subtitle_segments = transcribe_file_to_srt_stream_usecase.execute(
+                file,
+                transcribe_dto.source_language,
+                transcribe_dto.transcription_parameters,
+            )
+            events = self._stream_subtitle_events(subtitle_segments, exit_stack.pop_all(), logger)
+
+        return StreamingResponse(
+            events,
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
+
+    async def transcribe_batch(
+        self,
+        request: Request,
+        stage_uploaded_file_usecase: Annotated[StageUploadedFileUseCase, Depends()],
+        transcribe_batch_usecase: Annotated[TranscribeBatchUseCase, Depends()],
+        admission_controller: Annotated[AdmissionController, Depends()],
+    ) -> StreamingResponse:
+        # The admission slot is held until the last result is sent, not only until the handler returns
+        async with AsyncExitStack() as exit_stack:
+            await exit_stack.enter_async_context(admission_controller.admit())
+            transcribe_batch_dto, files = await parse_transcribe_batch_request(
+                request,
+                stage_uploaded_file_usecase,
+                TranscribeBatchDTO,
+            )
+            results = await transcribe_batch_usecase.execute(
+                files,
+                transcribe_batch_dto.source_language,
+                transcribe_batch_dto.target_language,
+                transcribe_batch_dto.transcription_parameters,
+                transcribe_batch_dto.translation_parameters,
+                transcribe_batch_dto.result_format,
+                partial(self._admit_batch_files, admission_controller, exit_stack),
+            )
+            lines = self._stream_batch_results(results, exit_stack.pop_all())
+
+        return StreamingResponse(lines, media_type="application/x-ndjson")
@@ -2,8 +2,12 @@ import uvicorn
 from fastapi import FastAPI
 
 from api.handlers.global_exception_handler import GlobalExceptionHandler
+from api.middlewares.client_identity_middleware import ClientIdentityMiddleware
 from api.middlewares.process_time_middleware import ProcessTimeMiddleware
 from api.routers.health_check_router import HealthCheckRouter
+from api.routers.jobs_router import JobsRouter
+from api.routers.statistics_router import StatisticsRouter
+from api.routers.streaming_router import StreamingRouter
 from api.routers.transcribe_router import TranscribeRouter
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
@@ -19,9 +23,13 @@ class APIServer:
         self.logger = logger
         self.app = FastAPI()
         self.exception_handler = GlobalExceptionHandler(self.app, logger)
+        self.app.add_middleware(ClientIdentityMiddleware, client_api_keys=config.client_api_keys)
         self.app.add_middleware(ProcessTimeMiddleware, logger=logger)
         self.app.include_router(TranscribeRouter().router, tags=["Transcribe"])
+        self.app.include_router(JobsRouter().router, tags=["Jobs"])
+        self.app.include_router(StreamingRouter().router, tags=["Streaming"])
         self.app.include_router(HealthCheckRouter().router, tags=["HealthCheck"])
+        self.app.include_router(StatisticsRouter().router, tags=["Statistics"])
 
     def start(self) -> None:
         self.logger.info("Starting FastAPI server...")
@@ -0,0 +1,28 @@
+from typing import Annotated, Dict
+
+from fastapi import Depends
+
+from core.logger.logger import Logger
+from domain.models.cache_statistics_model import CacheStatisticsModel
+from domain.services.transcription_service import TranscriptionService
+from domain.services.translation_service import TranslationService
+
+
+class GetCacheStatisticsUseCase:
+    def __init__(
+        self,
+        logger: Annotated[Logger, Depends()],
+        translation_service: Annotated[TranslationService, Depends()],
+        transcription_service: Annotated[TranscriptionService, Depends()],
+    ) -> None:
+        self.logger = logger
+        self.translation_service = translation_service
+        self.transcription_service = transcription_service
+
+    def execute(self) -> Dict[str, CacheStatisticsModel]:
+        self.logger.debug("Executing cache statistics retrieval")
+
+        return {
+            "translation": self.translation_service.get_cache_statistics(),
+            "transcription": self.transcription_service.get_cache_statistics(),
+        }
@@ -0,0 +1,25 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from core.job_queue.job_queue import JobQueue
+from core.logger.logger import Logger
+from domain.models.job_model import JobModel
+
+
+class GetTranscriptionJobUseCase:
+    def __init__(
+        self,
+        logger: Annotated[Logger, Depends()],
+        job_queue: Annotated[JobQueue, Depends()],
+    ) -> None:
+        self.logger = logger
+        self.job_queue = job_queue
+
+    def execute(
+        self,
+        job_id: str,
+    ) -> JobModel:
+        self.logger.debug(f"Executing retrieval of job {job_id}")
+
+        return self.job_queue.get(job_id)
@@ -0,0 +1,33 @@
+from typing import Annotated, AsyncIterable, Optional
+
+from fastapi import Depends
+
+from core.logger.logger import Logger
+from domain.models.saved_file_model import SavedFileModel
+from domain.services.transcription_service import TranscriptionService
+
+
+class StageUploadedFileUseCase:
+    def __init__(
+        self,
+        logger: Annotated[Logger, Depends()],
+        transcription_service: Annotated[TranscriptionService, Depends()],
+    ) -> None:
+        self.logger = logger
+        self.transcription_service = transcription_service
+
+    async def execute(
+        self,
+        file_name: Optional[str],
+        chunks: AsyncIterable[bytes],
+    ) -> SavedFileModel:
+        self.logger.debug(f"Executing staging of uploaded file '{file_name}'")
+
+        return await self.transcription_service.stage_file(file_name, chunks)
+
+    def discard(
+        self,
+        saved_file: SavedFileModel,
+    ) -> None:
+        self.logger.debug(f"Discarding uploaded file '{saved_file.file_name}'")
+        self.transcription_service.discard_file(saved_file)
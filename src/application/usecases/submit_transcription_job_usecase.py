@@ -0,0 +1,74 @@
+import json
+from typing import Annotated, Any, Dict, Optional
+
+from fastapi import Depends
+
+from application.usecases.transcribe_file_to_srt_usecase import (
+    TranscribeFileToSrtUseCase,
+)
+from application.usecases.transcribe_file_to_text_usecase import (
+    TranscribeFileToTextUseCase,
+)
+from core.job_queue.job_queue import JobQueue
+from core.logger.logger import Logger
+from domain.exceptions.job_queue_full_error import JobQueueFullError
+from domain.models.job_model import JobModel
+from domain.models.saved_file_model import SavedFileModel
+from domain.services.transcription_service import TranscriptionService
+
+
+class SubmitTranscriptionJobUseCase:
+    def __init__(
+        self,
+        logger: Annotated[Logger, Depends()],
+        job_queue: Annotated[JobQueue, Depends()],
+        transcription_service: Annotated[TranscriptionService, Depends()],
+        transcribe_file_to_text_usecase: Annotated[TranscribeFileToTextUseCase, Depends()],
+        transcribe_file_to_srt_usecase: Annotated[TranscribeFileToSrtUseCase, Depends()],
+    ) -> None:
+        self.logger = logger
+        self.job_queue = job_queue
+        self.transcription_service = transcription_service
+        self.transcribe_file_to_text_usecase = transcribe_file_to_text_usecase
+        self.transcribe_file_to_srt_usecase = transcribe_file_to_srt_usecase
+
+    def execute(
+        self,
+        file: SavedFileModel,
+        source_language: str,
+        target_language: Optional[str],
+        transcription_parameters: Dict[str, Any],
+        translation_parameters: Dict[str, Any],
+        result_format: str,
+    ) -> JobModel:
+        self.logger.info(f"Submitting {result_format} transcription job for file '{file.file_name}'")
+
+        usecase = (
+            self.transcribe_file_to_srt_usecase if result_format == "srt" else self.transcribe_file_to_text_usecase
+        )
+        job_key = (
+            file.content_hash,
+            source_language,
+            target_language,
+            json.dumps(transcription_parameters, sort_keys=True, default=str),
+            json.dumps(translation_parameters, sort_keys=True, default=str),
+            result_format,
+        )
+
+        try:
+            return self.job_queue.submit(
+                job_key,
+                lambda progress_callback: usecase.execute(
+                    file,
+                    source_language,
+                    target_language,
+                    transcription_parameters,
+                    translation_parameters,
+                    progress_callback,
+                ),
+                lambda: self.transcription_service.discard_file(file),
+            )
+
+        except JobQueueFullError:
+            self.transcription_service.discard_file(file)
+            raise
@@ -0,0 +1,181 @@
+import asyncio
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+)
+
+from fastapi import Depends
+
+from application.usecases.transcribe_file_to_srt_usecase import (
+    TranscribeFileToSrtUseCase,
+)
+from application.usecases.transcribe_file_to_text_usecase import (
+    TranscribeFileToTextUseCase,
+)
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.exceptions.batch_too_large_error import BatchTooLargeError
+from domain.models.batch_item_result_model import BatchItemResultModel
+from domain.models.saved_file_model import SavedFileModel
+from domain.services.language_mapping_service import LanguageMappingService
+from domain.services.transcription_service import TranscriptionService
+
+ARCHIVE_EXTENSION = ".zip"
+# Files ahead of the workers are decoded while the workers are busy, without decoding the whole batch at once
+BATCH_PIPELINE_DEPTH = 2
+
+
+class TranscribeBatchUseCase:
+    def __init__(
+        self,
+        config: Annotated[AppConfig, Depends()],
+        logger: Annotated[Logger, Depends()],
+        transcription_service: Annotated[TranscriptionService, Depends()],
+        language_mapping_service: Annotated[LanguageMappingService, Depends()],
+        transcribe_file_to_text_usecase: Annotated[TranscribeFileToTextUseCase, Depends()],
+        transcribe_file_to_srt_usecase: Annotated[TranscribeFileToSrtUseCase, Depends()],
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self.transcription_service = transcription_service
+        self.language_mapping_service = language_mapping_service
+        self.transcribe_file_to_text_usecase = transcribe_file_to_text_usecase
+        self.transcribe_file_to_srt_usecase = transcribe_file_to_srt_usecase
+
+    def _validate_languages(
+        self,
+        source_language: str,
+        target_language: Optional[str],
+    ) -> None:
+        # Languages are checked once for the whole batch, before any file is transcribed
+        self.language_mapping_service.map_language(source_language, self.config.speech_to_text_model_name)
+
+        if target_language and target_language != source_language:
+            self.language_mapping_service.map_language(source_language, self.config.translation_model_name)
+            self.language_mapping_service.map_language(target_language, self.config.translation_model_name)
+
+    async def _prepare_files(
+        self,
+        files: List[SavedFileModel],
+        source_language: str,
+        target_language: Optional[str],
+        reserve_files: Optional[Callable[[int], Awaitable[None]]],
+    ) -> List[SavedFileModel]:
+        max_files = self.config.transcribe_batch_max_files
+        pending_files = list(files)
+        prepared_files: List[SavedFileModel] = []
+
+        try:
+            self._validate_languages(source_language, target_language)
+
+            while pending_files:
+                file = pending_files.pop(0)
+
+                if file.file_name and file.file_name.lower().endswith(ARCHIVE_EXTENSION):
+                    prepared_files.extend(
+                        await self.transcription_service.extract_archive(file, max_files - len(prepared_files)),
+                    )
+                else:
+                    prepared_files.append(file)
+
+                if len(prepared_files) > max_files:
+                    raise BatchTooLargeError(max_files)
+
+            # Archives are counted by their entries, so the batch is reserved once every file is known
+            if reserve_files:
+                await reserve_files(len(prepared_files))
+
+        except BaseException:
+            for file in prepared_files + pending_files:
+                self.transcription_service.discard_file(file)
+
+            raise
+
+        return prepared_files
+
+    async def _transcribe_files(
+        self,
+        files: List[SavedFileModel],
+        source_language: str,
+        target_language: Optional[str],
+        transcription_parameters: Dict[str, Any],
+        translation_parameters: Dict[str, Any],
+        result_format: str,
+    ) -> AsyncIterator[BatchItemResultModel]:
+        usecase = (
+            self.transcribe_file_to_srt_usecase if result_format == "srt" else self.transcribe_file_to_text_usecase
+        )
+        semaphore = asyncio.Semaphore(self.config.speech_to_text_worker_pool_size * BATCH_PIPELINE_DEPTH)
+        results: asyncio.Queue[BatchItemResultModel] = asyncio.Queue()
+        started_files: Set[int] = set()
+
+        async def transcribe_file(
+            index: int,
+            file: SavedFileModel,
+        ) -> None:
+            async with semaphore:
+                started_files.add(index)
+
+                try:
+                    result = await usecase.execute(
+                        file,
+                        source_language,
+                        target_language,
+                        transcription_parameters,
+                        translation_parameters,
+                    )
+                    results.put_nowait(BatchItemResultModel(index=index, file_name=file.file_name, result=result))
+
+                except Exception as e:
+                    self.logger.error(f"Batch transcription of file '{file.file_name}' failed: {e}")
+                    results.put_nowait(BatchItemResultModel(index=index, file_name=file.file_name, error=str(e)))
+
+        transcriptions = [asyncio.ensure_future(transcribe_file(index, file)) for index, file in enumerate(files)]
+
+        try:
+            # Results are sent in the order the files finish, each one tagged with its position in the batch
+            for _ in transcriptions:
+                yield await results.get()
+
+        finally:
+            for transcription in transcriptions:
+                transcription.cancel()
+
+            for index, file in enumerate(files):
+                if index not in started_files:
+                    self.transcription_service.discard_file(file)
+
+        self.logger.info(f"Completed batch transcription of {len(files)} files")
+
+    async def execute(
+        self,
+        files: List[SavedFileModel],
+        source_language: str,
+        target_language: Optional[str],
+        transcription_parameters: Dict[str, Any],
+        translation_parameters: Dict[str, Any],
+        result_format: str,
+        reserve_files: Optional[Callable[[int], Awaitable[None]]] = None,
+    ) -> AsyncIterator[BatchItemResultModel]:
+        self.logger.info(
+            f"Executing {result_format} batch transcription of {len(files)} uploaded files "
+            f"from '{source_language}' to '{target_language}'",
+        )
+
+        prepared_files = await self._prepare_files(files, source_language, target_language, reserve_files)
+
+        return self._transcribe_files(
+            prepared_files,
+            source_language,
+            target_language,
+            transcription_parameters,
+            translation_parameters,
+            result_format,
+        )
@@ -0,0 +1,65 @@
+import asyncio
+from typing import Annotated, Any, AsyncGenerator, Dict, Optional
+
+from fastapi import Depends
+
+from core.logger.logger import Logger
+from domain.models.saved_file_model import SavedFileModel
+from domain.models.subtitle_segment_model import SubtitleSegmentModel
+from domain.models.transcription_result_model import TranscriptionResultModel
+from domain.services.subtitle_service import SubtitleService
+from domain.services.transcription_service import TranscriptionService
+
+
+class TranscribeFileToSrtStreamUseCase:
+    def __init__(
+        self,
+        logger: Annotated[Logger, Depends()],
+        transcription_service: Annotated[TranscriptionService, Depends()],
+        subtitle_service: Annotated[SubtitleService, Depends()],
+    ) -> None:
+        self.logger = logger
+        self.transcription_service = transcription_service
+        self.subtitle_service = subtitle_service
+
+    async def execute(
+        self,
+        file: SavedFileModel,
+        source_language: str,
+        transcription_parameters: Dict[str, Any],
+    ) -> AsyncGenerator[SubtitleSegmentModel, None]:
+        self.logger.info(
+            f"Executing streamed transcription to SRT for file '{file.file_name}' from '{source_language}'"
+        )
+
+        partial_results: asyncio.Queue[Optional[TranscriptionResultModel]] = asyncio.Queue()
+        transcription = asyncio.ensure_future(
+            self.transcription_service.transcribe(
+                file,
+                source_language,
+                transcription_parameters,
+                segment_fields=(),
+                segment_callback=partial_results.put_nowait,
+            ),
+        )
+        transcription.add_done_callback(lambda _: partial_results.put_nowait(None))
+        subtitle_count = 0
+
+        try:
+            while (partial_result := await partial_results.get()) is not None:
+                subtitle_segments = self.subtitle_service.convert_to_subtitle_segments(
+                    partial_result,
+                    subtitle_count + 1,
+                )
+                subtitle_count += len(subtitle_segments)
+
+                for subtitle_segment in subtitle_segments:
+                    yield subtitle_segment
+
+            await transcription
+
+        finally:
+            # A client that disconnects early stops the transcription it no longer waits for
+            transcription.cancel()
+
+        self.logger.info(f"Streamed {subtitle_count} subtitle segments for file '{file.file_name}'")
@@ -1,10 +1,14 @@
-from typing import Annotated, Any, Dict, Optional
+import asyncio
+from typing import Annotated, Any, Callable, Dict, Optional
 
-from fastapi import Depends, UploadFile
+from fastapi import Depends
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from domain.models.saved_file_model import SavedFileModel
+from domain.models.sentence_model import SentenceModel
 from domain.models.subtitle_segment_model import SubtitleSegmentModel
+from domain.models.transcription_result_model import TranscriptionResultModel
 from domain.services.sentence_service import SentenceService
 from domain.services.subtitle_service import SubtitleService
 from domain.services.transcription_service import TranscriptionService
@@ -28,64 +32,135 @@ class TranscribeFileToSrtUseCase:
         self.sentence_service = sentence_service
         self.translation_service = translation_service
 
-    def _generate_srt(
+    async def _generate_srt(
         self,
         subtitle_segments: list[SubtitleSegmentModel],
     ) -> str:
-        srt_result: str = self.subtitle_service.generate_srt_result(subtitle_segments)
+        srt_result: str = await asyncio.to_thread(self.subtitle_service.generate_srt_result, subtitle_segments)
         return srt_result
 
-    def _translate_subtitles(
+    async def _transcribe_and_translate_subtitles(
         self,
-        subtitle_segments: list[SubtitleSegmentModel],
+        file: SavedFileModel,
         source_language: str,
         target_language: str,
+        transcription_parameters: Dict[str, Any],
         translation_parameters: Dict[str, Any],
-    ) -> None:
-        sentences = self.sentence_service.create_sentence_models(subtitle_segments)
-        self.translation_service.translate_sentences(
-            sentences,
-            source_language,
-            target_language,
-            translation_parameters,
+        progress_callback: Optional[Callable[[float], None]],
+    ) -> list[SubtitleSegmentModel]:
+        subtitle_segments: list[SubtitleSegmentModel] = []
+        sentences: list[SentenceModel] = []
+        sentence_builder = self.sentence_service.create_sentence_builder()
+        translations: list["asyncio.Future[None]"] = []
+        # Translation runs alongside transcription, so transcription progress covers most of the job
+        report_progress = (
+            await self.transcription_service.create_progress_reporter(file, progress_callback, 0.6)
+            if progress_callback
+            else None
         )
-        self.sentence_service.apply_translated_sentences(
+
+        def translate(completed_sentences: list[SentenceModel]) -> None:
+            if completed_sentences:
+                sentences.extend(completed_sentences)
+                translations.append(
+                    asyncio.ensure_future(
+                        self.translation_service.translate_sentences(
+                            completed_sentences,
+                            source_language,
+                            target_language,
+                            translation_parameters,
+                        ),
+                    ),
+                )
+
+        def on_segments(partial_result: TranscriptionResultModel) -> None:
+            # Completed sentences go to the translation model while Whisper keeps decoding the next windows
+            new_segments = self.subtitle_service.convert_to_subtitle_segments(
+                partial_result,
+                len(subtitle_segments) + 1,
+            )
+            subtitle_segments.extend(new_segments)
+            translate(sentence_builder.add_segments(new_segments))
+
+            if report_progress:
+                report_progress(partial_result)
+
+        try:
+            await self.transcription_service.transcribe(
+                file,
+                source_language,
+                transcription_parameters,
+                segment_fields=(),
+                segment_callback=on_segments,
+            )
+
+            if progress_callback:
+                progress_callback(0.6)
+
+            translate(sentence_builder.flush())
+            await asyncio.gather(*translations)
+
+        finally:
+            for translation in translations:
+                translation.cancel()
+
+        await asyncio.to_thread(
+            self.sentence_service.apply_translated_sentences,
             subtitle_segments,
             sentences,
         )
 
+        return subtitle_segments
+
     async def execute(
         self,
-        file: UploadFile,
+        file: SavedFileModel,
         source_language: str,
         target_language: Optional[str],
         transcription_parameters: Dict[str, Any],
         translation_parameters: Dict[str, Any],
+        progress_callback: Optional[Callable[[float], None]] = None,
     ) -> str:
         self.logger.info(
-            f"Executing transcription to SRT for file '{file.filename}' "
+            f"Executing transcription to SRT for file '{file.file_name}' "
             f"from '{source_language}' to '{target_language}'",
         )
 
-        transcription_result = await self.transcription_service.transcribe(
-            file,
-            source_language,
-            transcription_parameters,
-        )
-        subtitle_segments = self.subtitle_service.convert_to_subtitle_segments(transcription_result)
-
         if not target_language or source_language == target_language:
-            self.logger.info(f"Returning SRT result for file '{file.filename}'")
+            # Transcription dominates the running time
+            segment_callback = (
+                await self.transcription_service.create_progress_reporter(file, progress_callback, 0.9)
+                if progress_callback
+                else None
+            )
+            transcription_result = await self.transcription_service.transcribe(
+                file,
+                source_language,
+                transcription_parameters,
+                segment_fields=(),
+                segment_callback=segment_callback,
+            )
+            subtitle_segments = await asyncio.to_thread(
+                self.subtitle_service.convert_to_subtitle_segments,
+                transcription_result,
+            )
 
-            return self._generate_srt(subtitle_segments)
+            if progress_callback:
+                progress_callback(0.9)
 
-        self._translate_subtitles(
-            subtitle_segments,
+            self.logger.info(f"Returning SRT result for file '{file.file_name}'")
+
+            return await self._generate_srt(subtitle_segments)
+
+        subtitle_segments = await self._transcribe_and_translate_subtitles(
+            file,
             source_language,
             target_language,
+            transcription_parameters,
             translation_parameters,
+            progress_callback,
         )
 
-        self.logger.info(f"Returning translated SRT result for file '{file.filename}'")
+        self.logger.info(f"Returning translated SRT result for file '{file.file_name}'")
 
-        return self._generate_srt(subtitle_segments)
+        return await self._generate_srt(subtitle_segments)
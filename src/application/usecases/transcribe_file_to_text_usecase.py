@@ -1,9 +1,10 @@
-from typing import Annotated, Any, Dict, Optional
+from typing import Annotated, Any, Callable, Dict, Optional
 
-from fastapi import Depends, UploadFile
+from fastapi import Depends
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from domain.models.saved_file_model import SavedFileModel
 from domain.services.transcription_service import TranscriptionService
 from domain.services.translation_service import TranslationService
 
@@ -23,34 +24,48 @@ class TranscribeFileToTextUseCase:
 
     async def execute(
         self,
-        file: UploadFile,
+        file: SavedFileModel,
         source_language: str,
         target_language: Optional[str],
         transcription_parameters: Dict[str, Any],
         translation_parameters: Dict[str, Any],
+        progress_callback: Optional[Callable[[float], None]] = None,
     ) -> str:
         self.logger.info(
-            f"Executing transcription for file '{file.filename}' from '{source_language}' to '{target_language}'",
+            f"Executing transcription for file '{file.file_name}' from '{source_language}' to '{target_language}'",
+        )
+
+        # Transcription dominates the running time, and translation takes most of the rest
+        transcription_share = 0.9 if not target_language or source_language == target_language else 0.6
+        segment_callback = (
+            await self.transcription_service.create_progress_reporter(file, progress_callback, transcription_share)
+            if progress_callback
+            else None
         )
 
         transcription_result = await self.transcription_service.transcribe(
             file,
             source_language,
             transcription_parameters,
+            segment_fields=(),
+            segment_callback=segment_callback,
         )
 
+        if progress_callback:
+            progress_callback(transcription_share)
+
         if not target_language or source_language == target_language:
-            self.logger.info(f"Returning transcription result for file '{file.filename}'")
+            self.logger.info(f"Returning transcription result for file '{file.file_name}'")
 
             return str(transcription_result.text)
 
-        translation_result: str = self.translation_service.translate_text(
+        translation_result: str = await self.translation_service.translate_text(
             transcription_result.text,
             source_language,
             target_language,
             translation_parameters,
         )
 
-        self.logger.info(f"Returning translation result for file '{file.filename}'")
+        self.logger.info(f"Returning translation result for file '{file.file_name}'")
 
         return translation_result
@@ -0,0 +1,53 @@
+from typing import Annotated, Any, AsyncIterable, AsyncIterator, Dict
+
+from fastapi import Depends
+
+from core.audio.stream_decoder import create_stream_decoder
+from core.logger.logger import Logger
+from domain.models.streaming_segment_model import StreamingSegmentModel
+from domain.services.streaming_transcription_service import (
+    StreamingTranscriptionService,
+)
+
+
+class TranscribeStreamUseCase:
+    def __init__(
+        self,
+        logger: Annotated[Logger, Depends()],
+        streaming_transcription_service: Annotated[StreamingTranscriptionService, Depends()],
+    ) -> None:
+        self.logger = logger
+        self.streaming_transcription_service = streaming_transcription_service
+
+    async def execute(
+        self,
+        frames: AsyncIterable[bytes],
+        language: str,
+        audio_format: str,
+        transcription_parameters: Dict[str, Any],
+    ) -> AsyncIterator[StreamingSegmentModel]:
+        self.logger.info(f"Executing streaming transcription of '{audio_format}' audio in '{language}'")
+
+        stream_decoder = create_stream_decoder(audio_format)
+        session = self.streaming_transcription_service.create_session(language, transcription_parameters)
+
+        try:
+            async for frame in frames:
+                for segment in await session.push_audio(await stream_decoder.decode(frame)):
+                    yield segment
+
+            for segment in await session.push_audio(await stream_decoder.flush()):
+                yield segment
+
+            for segment in await session.finish():
+                yield segment
+
+        finally:
+            await stream_decoder.close()
+
+            if session.latencies:
+                self.logger.info(
+                    f"Streaming transcription finished with {len(session.latencies)} final segments, "
+                    f"average latency {sum(session.latencies) / len(session.latencies):.3f}s, "
+                    f"maximum latency {max(session.latencies):.3f}s",
+                )
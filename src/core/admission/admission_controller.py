@@ -0,0 +1,170 @@
+import math
+import threading
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Annotated, AsyncIterator, Optional
+
+from fastapi import Depends
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.exceptions.admission_rejected_error import AdmissionRejectedError
+
+RATE_DECAY = 0.9
+
+# Set while a request holds an admission slot, so its transcriptions are not counted a second time
+_admitted: ContextVar[bool] = ContextVar("admitted", default=False)
+
+
+class AdmissionController:
+    _instance: Optional["AdmissionController"] = None
+    _lock = threading.Lock()
+
+    def __new__(
+        cls,
+        config: Annotated[AppConfig, Depends()],
+        logger: Annotated[Logger, Depends()],
+    ) -> "AdmissionController":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(AdmissionController, cls).__new__(cls)
+                    cls._instance._initialize(config, logger)
+
+        return cls._instance
+
+    def _initialize(
+        self,
+        config: AppConfig,
+        logger: Logger,
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self.depth = 0
+        self.transcriptions = 0
+        self.background_transcriptions = 0
+        self.processed_requests = 0.0
+        self.processed_audio_seconds = 0.0
+        self.busy_seconds = 0.0
+        self.recorded_busy_seconds = 0.0
+        self.last_update = time.monotonic()
+
+    def _advance(self, now: float) -> None:
+        # Only time with transcriptions in flight counts, so idle periods do not lower the measured rate
+        if self.transcriptions > 0:
+            self.busy_seconds += now - self.last_update
+
+        self.last_update = now
+
+    def get_processing_rate(self) -> Optional[float]:
+        # Seconds of audio transcribed per second with transcriptions in flight
+        if self.processed_audio_seconds <= 0 or self.busy_seconds <= 0:
+            return None
+
+        rate: float = self.processed_audio_seconds / self.busy_seconds
+        return rate
+
+    def _get_average_audio_seconds(self) -> float:
+        average_audio_seconds: float = self.processed_audio_seconds / self.processed_requests
+        return average_audio_seconds
+
+    def _get_requests_ahead(self) -> int:
+        # Jobs and other work transcribed outside of admitted requests occupy the same workers
+        requests_ahead: int = (
+            self.depth + self.background_transcriptions - self.config.speech_to_text_worker_pool_size + 1
+        )
+        return requests_ahead
+
+    def _estimate_wait(
+        self,
+        requests_ahead: int,
+    ) -> float:
+        rate = self.get_processing_rate()
+
+        if rate is None or requests_ahead <= 0:
+            return 0.0
+
+        # Requests ahead are expected to carry as much audio as the recent ones that reached a worker
+        return requests_ahead * self._get_average_audio_seconds() / rate
+
+    def estimate_wait(self) -> float:
+        return self._estimate_wait(self._get_requests_ahead())
+
+    def _record_transcription(
+        self,
+        audio_seconds: float,
+    ) -> None:
+        # Decaying the totals weights the rate towards recent transcriptions. Busy time since the last
+        # transcription belongs to this one, so like its audio it is added without decay
+        recent_busy_seconds = self.busy_seconds - self.recorded_busy_seconds
+        self.busy_seconds = self.recorded_busy_seconds * RATE_DECAY + recent_busy_seconds
+        self.recorded_busy_seconds = self.busy_seconds
+        self.processed_requests = self.processed_requests * RATE_DECAY + 1
+        self.processed_audio_seconds = self.processed_audio_seconds * RATE_DECAY + audio_seconds
+
+    @asynccontextmanager
+    async def track_transcription(
+        self,
+        audio_seconds: float,
+    ) -> AsyncIterator[None]:
+        # Wraps only audio a worker transcribes, so cache hits and joined flights do not inflate the rate
+        background = not _admitted.get()
+        self._advance(time.monotonic())
+        self.transcriptions += 1
+        self.background_transcriptions += background
+
+        try:
+            yield
+            self._advance(time.monotonic())
+            self._record_transcription(audio_seconds)
+
+        finally:
+            self._advance(time.monotonic())
+            self.transcriptions -= 1
+            self.background_transcriptions -= background
+
+    def _check(
+        self,
+        units: int,
+        held_units: int,
+    ) -> None:
+        rate = self.get_processing_rate()
+        # Units the request already holds are not ahead of it, so a batch larger than the queue still runs
+        # when nothing else is waiting
+        requests_ahead = self._get_requests_ahead() - held_units
+        waiting = requests_ahead + held_units + units - 1
+        estimated_wait = self._estimate_wait(requests_ahead)
+        max_wait = self.config.admission_max_wait_seconds
+
+        if self.config.admission_queue_size and requests_ahead > 0 and waiting > self.config.admission_queue_size:
+            retry_after = (
+                math.ceil((waiting - self.config.admission_queue_size) * self._get_average_audio_seconds() / rate)
+                if rate
+                else 1
+            )
+            self.logger.warning(f"Admission queue is full with {self.depth} requests in flight")
+            raise AdmissionRejectedError(max(1, retry_after))
+
+        if max_wait and estimated_wait > max_wait:
+            self.logger.warning(f"Estimated wait of {estimated_wait:.1f}s exceeds {max_wait}s budget")
+            raise AdmissionRejectedError(max(1, math.ceil(estimated_wait - max_wait)))
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        units: int = 1,
+        held_units: int = 0,
+    ) -> AsyncIterator[None]:
+        # A unit stands for one file to transcribe, and held units are those the same request already holds
+        self._check(units, held_units)
+        self.depth += units
+        _admitted.set(True)
+
+        try:
+            yield
+
+        finally:
+            # Streamed responses release the slot from the task sending the response, so the flag is cleared there
+            _admitted.set(False)
+            self.depth -= units
@@ -0,0 +1,42 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from core.audio.audio_decoder import SAMPLE_RATE
+
+FRAME_SAMPLES = SAMPLE_RATE // 50  # 20ms
+# Chunks end at the quietest frame in the last part of their maximum length
+SILENCE_SEARCH_FRACTION = 0.2
+
+AudioChunk = Tuple[int, int]
+
+
+def find_quietest_frame(
+    samples: np.ndarray,
+    frame_samples: int = FRAME_SAMPLES,
+) -> int:
+    frames = samples[: len(samples) // frame_samples * frame_samples].reshape(-1, frame_samples)
+
+    if not len(frames):
+        return len(samples) // 2
+
+    energy = np.einsum("ij,ij->i", frames, frames)
+
+    return int(np.argmin(energy)) * frame_samples + frame_samples // 2
+
+
+def split_at_silence(
+    samples: np.ndarray,
+    max_chunk_samples: int,
+) -> List[AudioChunk]:
+    search_samples = max(1, min(max_chunk_samples - 1, int(max_chunk_samples * SILENCE_SEARCH_FRACTION)))
+    boundaries = [0]
+
+    while len(samples) - boundaries[-1] > max_chunk_samples:
+        search_start = boundaries[-1] + max_chunk_samples - search_samples
+        search_end = boundaries[-1] + max_chunk_samples
+        boundaries.append(search_start + find_quietest_frame(samples[search_start:search_end]))
+
+    boundaries.append(len(samples))
+
+    return list(zip(boundaries, boundaries[1:]))
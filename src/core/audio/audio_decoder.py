@@ -0,0 +1,287 @@
+import os
+import shutil
+import subprocess  # nosec B404
+import tempfile
+import traceback
+from contextlib import suppress
+from dataclasses import dataclass, replace
+from multiprocessing import shared_memory
+from typing import Annotated, Callable, List, Optional, Tuple, TypeVar
+
+import numpy as np
+from fastapi import Depends
+
+from core.logger.logger import Logger
+from domain.exceptions.audio_decoding_error import AudioDecodingError
+
+SAMPLE_RATE = 16000
+SAMPLE_DTYPE = np.float32
+SAMPLE_WIDTH = np.dtype(SAMPLE_DTYPE).itemsize
+# ffmpeg output is copied to scratch files in pieces of this size, so the whole stream is never held in memory
+SCRATCH_FILE_COPY_BYTES = 1024 * 1024
+
+ResultType = TypeVar("ResultType")
+
+
+@dataclass(frozen=True)
+class SharedAudioDescriptor:
+    name: str
+    num_samples: int
+    offset: int = 0
+    # Long audio is kept in a memory-mapped scratch file, named by its path, instead of shared memory
+    file_backed: bool = False
+
+    def slice(
+        self,
+        start: int,
+        end: int,
+    ) -> "SharedAudioDescriptor":
+        # Slices share the mapping, so chunks of one file are handed to several workers without copies
+        return replace(self, num_samples=end - start, offset=self.offset + start)
+
+
+class SharedAudio:
+    def __init__(
+        self,
+        memory: shared_memory.SharedMemory,
+        num_samples: int,
+    ) -> None:
+        self._memory = memory
+        self.descriptor = SharedAudioDescriptor(memory.name, num_samples)
+
+    def release(self) -> None:
+        self._memory.close()
+        self._memory.unlink()
+
+
+class ScratchFileAudio(SharedAudio):
+    def __init__(
+        self,
+        path: str,
+        num_samples: int,
+    ) -> None:
+        self._path = path
+        self.descriptor = SharedAudioDescriptor(path, num_samples, file_backed=True)
+
+    def release(self) -> None:
+        with suppress(FileNotFoundError):
+            os.remove(self._path)
+
+
+def _map_scratch_file(descriptor: SharedAudioDescriptor) -> np.ndarray:
+    if not descriptor.num_samples:
+        return np.zeros(0, dtype=SAMPLE_DTYPE)
+
+    # Pages are read when they are accessed and can be dropped again, so only the processed part stays resident.
+    # Copy on write keeps the samples writable for torch without changing the file.
+    return np.memmap(
+        descriptor.name,
+        dtype=SAMPLE_DTYPE,
+        mode="c",
+        offset=descriptor.offset * SAMPLE_WIDTH,
+        shape=(descriptor.num_samples,),
+    )
+
+
+def process_shared_audio(
+    descriptor: SharedAudioDescriptor,
+    function: Callable[[np.ndarray], ResultType],
+) -> ResultType:
+    if descriptor.file_backed:
+        try:
+            return function(_map_scratch_file(descriptor))
+
+        except Exception as e:
+            traceback.clear_frames(e.__traceback__)
+            raise
+
+    memory = shared_memory.SharedMemory(name=descriptor.name)
+
+    try:
+        return function(
+            np.ndarray(
+                (descriptor.num_samples,),
+                dtype=SAMPLE_DTYPE,
+                buffer=memory.buf,
+                offset=descriptor.offset * SAMPLE_WIDTH,
+            ),
+        )
+
+    except Exception as e:
+        # Frames kept by the traceback would otherwise hold views into the mapping
+        traceback.clear_frames(e.__traceback__)
+        raise
+
+    finally:
+        # The mapping stays open while a view is still referenced and is released by the garbage collector
+        with suppress(BufferError):
+            memory.close()
+
+
+class AudioDecoder:
+    def __init__(
+        self,
+        logger: Annotated[Logger, Depends()],
+    ) -> None:
+        self.logger = logger
+
+    @staticmethod
+    def _ffmpeg_command(file_path: str) -> List[str]:
+        return [
+            "ffmpeg",
+            "-nostdin",
+            "-threads",
+            "0",
+            "-i",
+            file_path,
+            "-f",
+            "f32le",
+            "-ac",
+            "1",
+            "-acodec",
+            "pcm_f32le",
+            "-ar",
+            str(SAMPLE_RATE),
+            "-",
+        ]
+
+    def _run_ffmpeg(
+        self,
+        file_path: str,
+    ) -> bytes:
+        command = self._ffmpeg_command(file_path)
+
+        try:
+            return subprocess.run(command, capture_output=True, check=True).stdout  # nosec B603 B607
+
+        except subprocess.CalledProcessError as e:
+            raise AudioDecodingError(e.stderr.decode(errors="ignore").strip()) from e
+
+    def probe_duration(
+        self,
+        file_path: str,
+    ) -> Optional[float]:
+        # Reading the container metadata is cheap compared to decoding the whole stream
+        command = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            file_path,
+        ]
+
+        try:
+            output = subprocess.run(command, capture_output=True, check=True).stdout  # nosec B603 B607
+            return float(output.decode(errors="ignore").strip())
+
+        except (subprocess.CalledProcessError, ValueError):
+            self.logger.debug(f"Could not probe duration of audio file: {file_path}")
+            return None
+
+    def decode_to_shared_memory(
+        self,
+        file_path: str,
+    ) -> SharedAudio:
+        self.logger.debug(f"Decoding audio file: {file_path}")
+
+        shared_audio = self.copy_to_shared_memory(self._run_ffmpeg(file_path))
+        self.logger.debug(
+            f"Decoded {shared_audio.descriptor.num_samples} samples into shared memory: {shared_audio.descriptor.name}",
+        )
+
+        return shared_audio
+
+    @staticmethod
+    def _create_scratch_file() -> "tempfile._TemporaryFileWrapper[bytes]":
+        return tempfile.NamedTemporaryFile(prefix="audio_", suffix=".f32", delete=False)
+
+    def decode_to_scratch_file(
+        self,
+        file_path: str,
+    ) -> ScratchFileAudio:
+        self.logger.debug(f"Decoding audio file to scratch file: {file_path}")
+
+        scratch_file = self._create_scratch_file()
+
+        try:
+            with scratch_file, tempfile.TemporaryFile() as error_output:
+                process = subprocess.Popen(  # nosec B603 B607
+                    self._ffmpeg_command(file_path),
+                    stdout=subprocess.PIPE,
+                    stderr=error_output,
+                )
+
+                with process.stdout:  # type: ignore
+                    shutil.copyfileobj(process.stdout, scratch_file, SCRATCH_FILE_COPY_BYTES)  # type: ignore
+
+                if process.wait():
+                    error_output.seek(0)
+                    raise AudioDecodingError(error_output.read().decode(errors="ignore").strip())
+
+                num_samples = scratch_file.tell() // SAMPLE_WIDTH
+
+        except BaseException:
+            os.remove(scratch_file.name)
+            raise
+
+        self.logger.debug(f"Decoded {num_samples} samples into scratch file: {scratch_file.name}")
+
+        return ScratchFileAudio(scratch_file.name, num_samples)
+
+    def copy_to_shared_memory(
+        self,
+        data: bytes,
+    ) -> SharedAudio:
+        memory = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        np.ndarray((len(data),), dtype=np.uint8, buffer=memory.buf)[:] = np.frombuffer(data, dtype=np.uint8)
+
+        return SharedAudio(memory, len(data) // SAMPLE_WIDTH)
+
+    def copy_regions_to_shared_memory(
+        self,
+        descriptor: SharedAudioDescriptor,
+        regions: List[Tuple[int, int]],
+    ) -> SharedAudio:
+        if descriptor.file_backed:
+            return self._copy_regions_to_scratch_file(descriptor, regions)
+
+        num_samples = sum(end - start for start, end in regions)
+        memory = shared_memory.SharedMemory(create=True, size=max(num_samples * SAMPLE_WIDTH, 1))
+        shared_audio = SharedAudio(memory, num_samples)
+
+        def copy_regions(samples: np.ndarray) -> None:
+            target = np.ndarray((num_samples,), dtype=SAMPLE_DTYPE, buffer=memory.buf)
+            np.concatenate([samples[start:end] for start, end in regions], out=target)
+
+        try:
+            process_shared_audio(descriptor, copy_regions)
+
+        except Exception:
+            shared_audio.release()
+            raise
+
+        return shared_audio
+
+    def _copy_regions_to_scratch_file(
+        self,
+        descriptor: SharedAudioDescriptor,
+        regions: List[Tuple[int, int]],
+    ) -> ScratchFileAudio:
+        scratch_file = self._create_scratch_file()
+
+        def write_regions(samples: np.ndarray) -> None:
+            for start, end in regions:
+                samples[start:end].tofile(scratch_file.file)
+
+        try:
+            with scratch_file:
+                process_shared_audio(descriptor, write_regions)
+
+        except BaseException:
+            os.remove(scratch_file.name)
+            raise
+
+        return ScratchFileAudio(scratch_file.name, sum(end - start for start, end in regions))
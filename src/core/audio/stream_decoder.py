@@ -0,0 +1,157 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+import numpy as np
+
+from core.audio.audio_decoder import SAMPLE_DTYPE, SAMPLE_RATE, SAMPLE_WIDTH
+from domain.exceptions.unsupported_audio_format_error import UnsupportedAudioFormatError
+
+PCM_SAMPLE_TYPES: Dict[str, np.dtype] = {
+    "pcm_s16le": np.dtype("<i2"),
+    "pcm_f32le": np.dtype("<f4"),
+}
+OPUS_FORMAT = "opus"
+FFMPEG_READ_SIZE = 65536
+
+
+class StreamDecoder(ABC):
+    @abstractmethod
+    async def decode(
+        self,
+        chunk: bytes,
+    ) -> bytes:
+        pass
+
+    @abstractmethod
+    async def flush(self) -> bytes:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class PcmStreamDecoder(StreamDecoder):
+    def __init__(
+        self,
+        sample_type: np.dtype,
+    ) -> None:
+        self._sample_type = sample_type
+        self._remainder = b""
+
+    async def decode(
+        self,
+        chunk: bytes,
+    ) -> bytes:
+        # Frames may split a sample, so the incomplete tail waits for the next frame
+        data = self._remainder + chunk
+        whole = len(data) - len(data) % self._sample_type.itemsize
+        self._remainder = data[whole:]
+        samples = np.frombuffer(data[:whole], dtype=self._sample_type)
+
+        if self._sample_type.kind == "i":
+            return (samples / np.iinfo(self._sample_type).max).astype(SAMPLE_DTYPE).tobytes()
+
+        return samples.astype(SAMPLE_DTYPE).tobytes()
+
+    async def flush(self) -> bytes:
+        self._remainder = b""
+        return b""
+
+
+class FfmpegStreamDecoder(StreamDecoder):
+    def __init__(self) -> None:
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional["asyncio.Task[None]"] = None
+        self._output = bytearray()
+
+    async def _start(self) -> asyncio.subprocess.Process:
+        # A small probe keeps ffmpeg from buffering seconds of audio before it starts decoding
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg",
+            "-loglevel",
+            "error",
+            "-probesize",
+            "4096",
+            "-analyzeduration",
+            "0",
+            "-fflags",
+            "nobuffer",
+            "-i",
+            "pipe:0",
+            "-f",
+            "f32le",
+            "-ac",
+            "1",
+            "-ar",
+            str(SAMPLE_RATE),
+            "pipe:1",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        self._reader = asyncio.ensure_future(self._read(process))
+
+        return process
+
+    async def _read(
+        self,
+        process: asyncio.subprocess.Process,
+    ) -> None:
+        if process.stdout is None:
+            return
+
+        while chunk := await process.stdout.read(FFMPEG_READ_SIZE):
+            self._output += chunk
+
+    def _take_samples(self) -> bytes:
+        whole = len(self._output) - len(self._output) % SAMPLE_WIDTH
+        data = bytes(self._output[:whole])
+        del self._output[:whole]
+
+        return data
+
+    async def decode(
+        self,
+        chunk: bytes,
+    ) -> bytes:
+        if self._process is None:
+            self._process = await self._start()
+
+        if self._process.stdin is not None:
+            self._process.stdin.write(chunk)
+            await self._process.stdin.drain()
+
+        return self._take_samples()
+
+    async def flush(self) -> bytes:
+        if self._process is None:
+            return b""
+
+        if self._process.stdin is not None:
+            self._process.stdin.close()
+
+        if self._reader is not None:
+            await self._reader
+
+        await self._process.wait()
+
+        return self._take_samples()
+
+    async def close(self) -> None:
+        if self._process is not None and self._process.returncode is None:
+            self._process.kill()
+            await self._process.wait()
+
+        if self._reader is not None:
+            self._reader.cancel()
+
+
+def create_stream_decoder(audio_format: str) -> StreamDecoder:
+    if audio_format in PCM_SAMPLE_TYPES:
+        return PcmStreamDecoder(PCM_SAMPLE_TYPES[audio_format])
+
+    if audio_format == OPUS_FORMAT:
+        return FfmpegStreamDecoder()
+
+    raise UnsupportedAudioFormatError(audio_format)
@@ -0,0 +1,133 @@
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.audio.audio_chunker import FRAME_SAMPLES, AudioChunk
+from core.audio.audio_decoder import SAMPLE_RATE
+from domain.exceptions.invalid_voice_activity_parameter_error import (
+    InvalidVoiceActivityParameterError,
+)
+
+VAD_PARAMETER = "vad"
+VAD_PARAMETER_PREFIX = "vad_"
+# Frames quieter than this are silence even in files without any loud frame
+SILENCE_FLOOR_DB = -60.0
+# The loudness reference ignores the loudest frames, so a single click does not raise the threshold
+REFERENCE_PERCENTILE = 95
+# Spectra are computed for a bounded number of frames at a time to keep memory flat on long files
+FRAMES_PER_BLOCK = 3000
+EPSILON = 1e-10
+
+
+@dataclass(frozen=True)
+class VoiceActivityParameters:
+    threshold_db: float = -35.0
+    max_spectral_flatness: float = 0.45
+    min_silence_ms: float = 500.0
+    min_speech_ms: float = 250.0
+    padding_ms: float = 200.0
+
+
+def split_voice_activity_parameters(
+    transcription_parameters: Dict[str, Any],
+) -> Tuple[Optional[VoiceActivityParameters], Dict[str, Any]]:
+    # Detection parameters share the request's transcription parameters but are never passed to whisper
+    whisper_parameters = {
+        name: value
+        for name, value in transcription_parameters.items()
+        if name != VAD_PARAMETER and not name.startswith(VAD_PARAMETER_PREFIX)
+    }
+
+    if not transcription_parameters.get(VAD_PARAMETER):
+        return None, whisper_parameters
+
+    known_parameters = {VAD_PARAMETER_PREFIX + field.name for field in fields(VoiceActivityParameters)}
+    values: Dict[str, float] = {}
+
+    for name, value in transcription_parameters.items():
+        if not name.startswith(VAD_PARAMETER_PREFIX):
+            continue
+
+        if name not in known_parameters or isinstance(value, bool):
+            raise InvalidVoiceActivityParameterError(name)
+
+        try:
+            values[name.removeprefix(VAD_PARAMETER_PREFIX)] = float(value)
+
+        except (TypeError, ValueError) as e:
+            raise InvalidVoiceActivityParameterError(name) from e
+
+    return VoiceActivityParameters(**values), whisper_parameters
+
+
+def _classify_frames(
+    frames: np.ndarray,
+    parameters: VoiceActivityParameters,
+) -> np.ndarray:
+    energy_db = 10 * np.log10(np.einsum("ij,ij->i", frames, frames) / frames.shape[1] + EPSILON)
+    threshold_db = max(np.percentile(energy_db, REFERENCE_PERCENTILE) + parameters.threshold_db, SILENCE_FLOOR_DB)
+    window = np.hanning(frames.shape[1]).astype(frames.dtype)
+    flatness = np.empty(len(frames))
+
+    # Noise spreads its power evenly over the spectrum, while voiced speech concentrates it in harmonics
+    for start in range(0, len(frames), FRAMES_PER_BLOCK):
+        spectrum = np.abs(np.fft.rfft(frames[start:][:FRAMES_PER_BLOCK] * window, axis=1)) ** 2 + EPSILON
+        flatness[start:][:FRAMES_PER_BLOCK] = np.exp(np.mean(np.log(spectrum), axis=1)) / np.mean(spectrum, axis=1)
+
+    is_speech: np.ndarray = (energy_db > threshold_db) & (flatness < parameters.max_spectral_flatness)
+    return is_speech
+
+
+def _merge_close_regions(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    min_gap: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    keep = starts[1:] - ends[:-1] >= min_gap
+
+    return np.concatenate([starts[:1], starts[1:][keep]]), np.concatenate([ends[:-1][keep], ends[-1:]])
+
+
+def detect_speech(
+    samples: np.ndarray,
+    parameters: VoiceActivityParameters,
+) -> List[AudioChunk]:
+    frames = samples[: len(samples) // FRAME_SAMPLES * FRAME_SAMPLES].reshape(-1, FRAME_SAMPLES)
+
+    if not len(frames):
+        return []
+
+    edges = np.diff(np.concatenate([[0], _classify_frames(frames, parameters).astype(np.int8), [0]]))
+    starts = np.flatnonzero(edges == 1) * FRAME_SAMPLES
+    ends = np.flatnonzero(edges == -1) * FRAME_SAMPLES
+
+    if not len(starts):
+        return []
+
+    starts, ends = _merge_close_regions(starts, ends, int(parameters.min_silence_ms * SAMPLE_RATE / 1000))
+    speech = ends - starts >= parameters.min_speech_ms * SAMPLE_RATE / 1000
+    starts, ends = starts[speech], ends[speech]
+
+    if not len(starts):
+        return []
+
+    padding = int(parameters.padding_ms * SAMPLE_RATE / 1000)
+    starts, ends = _merge_close_regions(
+        np.maximum(starts - padding, 0),
+        np.minimum(ends + padding, len(samples)),
+        1,
+    )
+
+    return [(int(start), int(end)) for start, end in zip(starts, ends)]
+
+
+def create_speech_timeline(
+    regions: List[AudioChunk],
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Start of each region in seconds, in the audio assembled from the regions and in the original audio
+    lengths = np.array([end - start for start, end in regions])
+    assembled_starts = np.concatenate([[0], np.cumsum(lengths)[:-1]]) / SAMPLE_RATE
+    original_starts = np.array([start for start, _ in regions]) / SAMPLE_RATE
+
+    return assembled_starts, original_starts
@@ -0,0 +1,17 @@
+from contextvars import ContextVar, Token
+
+ANONYMOUS_CLIENT_ID = "anonymous"
+
+_current_client_id: ContextVar[str] = ContextVar("current_client_id", default=ANONYMOUS_CLIENT_ID)
+
+
+def get_client_id() -> str:
+    return _current_client_id.get()
+
+
+def set_client_id(client_id: str) -> Token[str]:
+    return _current_client_id.set(client_id)
+
+
+def reset_client_id(token: Token[str]) -> None:
+    _current_client_id.reset(token)
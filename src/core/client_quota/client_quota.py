@@ -0,0 +1,149 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Annotated, AsyncIterator, Dict, Optional
+
+from fastapi import Depends
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+
+
+@dataclass
+class ClientBudget:
+    tokens: float
+    updated_at: float
+    active_jobs: int = 0
+    reservations: int = 0
+    slot_released: asyncio.Condition = field(default_factory=asyncio.Condition)
+
+
+class ClientQuota:
+    _instance: Optional["ClientQuota"] = None
+    _lock = threading.Lock()
+
+    def __new__(
+        cls,
+        config: Annotated[AppConfig, Depends()],
+        logger: Annotated[Logger, Depends()],
+    ) -> "ClientQuota":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(ClientQuota, cls).__new__(cls)
+                    cls._instance._initialize(config, logger)
+
+        return cls._instance
+
+    def _initialize(
+        self,
+        config: AppConfig,
+        logger: Logger,
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self.budgets: Dict[str, ClientBudget] = {}
+
+    def _get_budget(
+        self,
+        client_id: str,
+    ) -> ClientBudget:
+        budget = self.budgets.get(client_id)
+
+        if budget is None:
+            budget = ClientBudget(
+                tokens=float(self.config.client_audio_seconds_per_minute), updated_at=time.monotonic()
+            )
+            self.budgets[client_id] = budget
+
+        return budget
+
+    def _refill(
+        self,
+        budget: ClientBudget,
+    ) -> None:
+        now = time.monotonic()
+        capacity = float(self.config.client_audio_seconds_per_minute)
+        budget.tokens = min(capacity, budget.tokens + (now - budget.updated_at) * capacity / 60)
+        budget.updated_at = now
+
+    async def _acquire_slot(
+        self,
+        client_id: str,
+        budget: ClientBudget,
+    ) -> None:
+        limit = self.config.client_max_concurrent_jobs
+
+        async with budget.slot_released:
+            if limit and budget.active_jobs >= limit:
+                self.logger.debug(f"Client {client_id} reached {limit} concurrent jobs, waiting for a free slot")
+
+            await budget.slot_released.wait_for(lambda: not limit or budget.active_jobs < limit)
+            budget.active_jobs += 1
+
+    async def _release_slot(
+        self,
+        budget: ClientBudget,
+    ) -> None:
+        async with budget.slot_released:
+            budget.active_jobs -= 1
+            budget.slot_released.notify()
+
+    def _forget_idle_budget(
+        self,
+        client_id: str,
+        budget: ClientBudget,
+    ) -> None:
+        self._refill(budget)
+
+        # Budgets of clients without reservations and with a full bucket carry no state worth keeping
+        if budget.reservations == 0 and budget.tokens >= self.config.client_audio_seconds_per_minute:
+            self.budgets.pop(client_id, None)
+
+    async def _consume_audio_seconds(
+        self,
+        client_id: str,
+        budget: ClientBudget,
+        audio_seconds: float,
+    ) -> None:
+        capacity = self.config.client_audio_seconds_per_minute
+
+        if not capacity:
+            return
+
+        # Audio longer than the whole bucket waits for a full bucket and leaves the client in debt
+        required = min(audio_seconds, capacity)
+        self._refill(budget)
+
+        while budget.tokens < required:
+            delay = (required - budget.tokens) * 60 / capacity
+            self.logger.debug(f"Client {client_id} is over its audio budget, waiting {delay:.1f}s")
+            await asyncio.sleep(delay)
+            self._refill(budget)
+
+        budget.tokens -= audio_seconds
+
+    @asynccontextmanager
+    async def reserve(
+        self,
+        client_id: str,
+        audio_seconds: float,
+    ) -> AsyncIterator[None]:
+        budget = self._get_budget(client_id)
+        budget.reservations += 1
+
+        try:
+            await self._acquire_slot(client_id, budget)
+
+            try:
+                await self._consume_audio_seconds(client_id, budget, audio_seconds)
+                yield
+
+            finally:
+                await self._release_slot(budget)
+
+        finally:
+            budget.reservations -= 1
+            self._forget_idle_budget(client_id, budget)
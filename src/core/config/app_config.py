@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import Dict, Optional
 
 from dotenv import load_dotenv
 
@@ -21,6 +21,38 @@ class AppConfig:
     translation_model_name: Optional[str]
     translation_model_download_path: Optional[str]
     model_idle_timeout: Optional[int]
+    speech_to_text_worker_pool_size: Optional[int]
+    translation_batch_window_ms: Optional[int]
+    translation_max_batch_size: Optional[int]
+    translation_max_batch_tokens: Optional[int]
+    translation_cache_size: Optional[int]
+    translation_cache_persistent: Optional[bool]
+    translation_cache_persistent_size: Optional[int]
+    transcription_cache_size: Optional[int]
+    transcription_cache_path: Optional[str]
+    transcription_cache_max_size_mb: Optional[int]
+    file_upload_max_age_seconds: Optional[int]
+    file_upload_cleanup_interval: Optional[int]
+    file_upload_quota_mb: Optional[int]
+    job_queue_size: Optional[int]
+    job_workers: Optional[int]
+    job_result_ttl: Optional[int]
+    admission_queue_size: Optional[int]
+    admission_max_wait_seconds: Optional[int]
+    speech_to_text_scheduler_aging: Optional[float]
+    client_weights: Optional[Dict[str, float]]
+    client_api_keys: Optional[Dict[str, str]]
+    client_max_concurrent_jobs: Optional[int]
+    client_audio_seconds_per_minute: Optional[int]
+    streaming_step_ms: Optional[int]
+    streaming_max_window_seconds: Optional[int]
+    transcribe_batch_max_files: Optional[int]
+    speech_to_text_chunk_seconds: Optional[int]
+    speech_to_text_block_seconds: Optional[int]
+    speech_to_text_batch_window_ms: Optional[int]
+    speech_to_text_max_batch_size: Optional[int]
+    speech_to_text_checkpoint_seconds: Optional[int]
+    transcription_checkpoint_path: Optional[str]
 
     def __new__(cls) -> "AppConfig":
         if cls._instance is None:
@@ -31,6 +63,29 @@ class AppConfig:
     def _str_to_bool(self, value: str) -> bool:
         return value.lower() in ("true", "1", "yes")
 
+    def _str_to_weights(self, value: str) -> Dict[str, float]:
+        weights: Dict[str, float] = {}
+
+        for pair in value.split(","):
+            name, separator, weight = pair.partition("=")
+
+            if separator and name.strip():
+                weights[name.strip()] = max(0.01, float(weight))
+
+        return weights
+
+    def _str_to_api_keys(self, value: str) -> Dict[str, str]:
+        # Pairs are written client first, but requests are looked up by the key they carry
+        api_keys: Dict[str, str] = {}
+
+        for pair in value.split(","):
+            name, separator, api_key = pair.partition("=")
+
+            if separator and name.strip() and api_key.strip():
+                api_keys[api_key.strip()] = name.strip()
+
+        return api_keys
+
     def _load_env_variables(self) -> None:
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
         self.device = os.getenv("DEVICE", "cpu")
@@ -40,6 +95,7 @@ class AppConfig:
         self.model_idle_timeout = int(os.getenv("MODEL_IDLE_TIMEOUT", "60"))
         self.speech_to_text_model_name = os.getenv("SPEECH_TO_TEXT_MODEL_NAME", "openai/whisper")
         self.speech_to_text_model_type = os.getenv("SPEECH_TO_TEXT_MODEL_TYPE", "turbo")
+        self.speech_to_text_worker_pool_size = max(1, int(os.getenv("SPEECH_TO_TEXT_WORKER_POOL_SIZE", "1")))
         self.speech_to_text_model_download_path = os.getenv(
             "SPEECH_TO_TEXT_MODEL_DOWNLOAD_PATH",
             "downloaded_speech_to_text_models",
@@ -49,6 +105,37 @@ class AppConfig:
             "TRANSLATION_MODEL_DOWNLOAD_PATH",
             "downloaded_translation_models",
         )
+        self.translation_batch_window_ms = max(0, int(os.getenv("TRANSLATION_BATCH_WINDOW_MS", "10")))
+        self.translation_max_batch_size = max(1, int(os.getenv("TRANSLATION_MAX_BATCH_SIZE", "16")))
+        self.translation_max_batch_tokens = max(1, int(os.getenv("TRANSLATION_MAX_BATCH_TOKENS", "4096")))
+        self.translation_cache_size = max(0, int(os.getenv("TRANSLATION_CACHE_SIZE", "10000")))
+        self.translation_cache_persistent = self._str_to_bool(os.getenv("TRANSLATION_CACHE_PERSISTENT", "false"))
+        self.translation_cache_persistent_size = max(1, int(os.getenv("TRANSLATION_CACHE_PERSISTENT_SIZE", "100000")))
+        self.transcription_cache_size = max(0, int(os.getenv("TRANSCRIPTION_CACHE_SIZE", "100")))
+        self.transcription_cache_path = os.getenv("TRANSCRIPTION_CACHE_PATH", "transcription_cache")
+        self.transcription_cache_max_size_mb = max(0, int(os.getenv("TRANSCRIPTION_CACHE_MAX_SIZE_MB", "1024")))
+        self.file_upload_max_age_seconds = max(0, int(os.getenv("FILE_UPLOAD_MAX_AGE_SECONDS", "3600")))
+        self.file_upload_cleanup_interval = max(1, int(os.getenv("FILE_UPLOAD_CLEANUP_INTERVAL", "300")))
+        self.file_upload_quota_mb = max(0, int(os.getenv("FILE_UPLOAD_QUOTA_MB", "0")))
+        self.job_queue_size = max(1, int(os.getenv("JOB_QUEUE_SIZE", "100")))
+        self.job_workers = max(1, int(os.getenv("JOB_WORKERS", "1")))
+        self.job_result_ttl = max(0, int(os.getenv("JOB_RESULT_TTL", "3600")))
+        self.admission_queue_size = max(0, int(os.getenv("ADMISSION_QUEUE_SIZE", "32")))
+        self.admission_max_wait_seconds = max(0, int(os.getenv("ADMISSION_MAX_WAIT_SECONDS", "120")))
+        self.speech_to_text_scheduler_aging = max(0.0, float(os.getenv("SPEECH_TO_TEXT_SCHEDULER_AGING", "1.0")))
+        self.client_weights = self._str_to_weights(os.getenv("CLIENT_WEIGHTS", ""))
+        self.client_api_keys = self._str_to_api_keys(os.getenv("CLIENT_API_KEYS", ""))
+        self.client_max_concurrent_jobs = max(0, int(os.getenv("CLIENT_MAX_CONCURRENT_JOBS", "0")))
+        self.client_audio_seconds_per_minute = max(0, int(os.getenv("CLIENT_AUDIO_SECONDS_PER_MINUTE", "0")))
+        self.streaming_step_ms = max(100, int(os.getenv("STREAMING_STEP_MS", "1000")))
+        self.streaming_max_window_seconds = max(1, int(os.getenv("STREAMING_MAX_WINDOW_SECONDS", "15")))
+        self.transcribe_batch_max_files = max(1, int(os.getenv("TRANSCRIBE_BATCH_MAX_FILES", "100")))
+        self.speech_to_text_chunk_seconds = max(0, int(os.getenv("SPEECH_TO_TEXT_CHUNK_SECONDS", "0")))
+        self.speech_to_text_block_seconds = max(0, int(os.getenv("SPEECH_TO_TEXT_BLOCK_SECONDS", "900")))
+        self.speech_to_text_batch_window_ms = max(0, int(os.getenv("SPEECH_TO_TEXT_BATCH_WINDOW_MS", "20")))
+        self.speech_to_text_max_batch_size = max(1, int(os.getenv("SPEECH_TO_TEXT_MAX_BATCH_SIZE", "8")))
+        self.speech_to_text_checkpoint_seconds = max(0, int(os.getenv("SPEECH_TO_TEXT_CHECKPOINT_SECONDS", "60")))
+        self.transcription_checkpoint_path = os.getenv("TRANSCRIPTION_CHECKPOINT_PATH", "transcription_checkpoints")
         try:
             self.fastapi_port = int(os.getenv("FASTAPI_PORT", "8000"))
         except ValueError:
@@ -72,8 +159,40 @@ class AppConfig:
             f"SPEECH_TO_TEXT_MODEL_NAME: {self.speech_to_text_model_name}\n"
             f"SPEECH_TO_TEXT_MODEL_TYPE: {self.speech_to_text_model_type}\n"
             f"SPEECH_TO_TEXT_MODEL_DOWNLOAD_PATH: {self.speech_to_text_model_download_path}\n"
+            f"SPEECH_TO_TEXT_WORKER_POOL_SIZE: {self.speech_to_text_worker_pool_size}\n"
             f"TRANSLATION_MODEL_NAME: {self.translation_model_name}\n"
             f"TRANSLATION_MODEL_DOWNLOAD_PATH: {self.translation_model_download_path}\n"
+            f"TRANSLATION_BATCH_WINDOW_MS: {self.translation_batch_window_ms}\n"
+            f"TRANSLATION_MAX_BATCH_SIZE: {self.translation_max_batch_size}\n"
+            f"TRANSLATION_MAX_BATCH_TOKENS: {self.translation_max_batch_tokens}\n"
+            f"TRANSLATION_CACHE_SIZE: {self.translation_cache_size}\n"
+            f"TRANSLATION_CACHE_PERSISTENT: {self.translation_cache_persistent}\n"
+            f"TRANSLATION_CACHE_PERSISTENT_SIZE: {self.translation_cache_persistent_size}\n"
+            f"TRANSCRIPTION_CACHE_SIZE: {self.transcription_cache_size}\n"
+            f"TRANSCRIPTION_CACHE_PATH: {self.transcription_cache_path}\n"
+            f"TRANSCRIPTION_CACHE_MAX_SIZE_MB: {self.transcription_cache_max_size_mb}\n"
+            f"FILE_UPLOAD_MAX_AGE_SECONDS: {self.file_upload_max_age_seconds}\n"
+            f"FILE_UPLOAD_CLEANUP_INTERVAL: {self.file_upload_cleanup_interval}\n"
+            f"FILE_UPLOAD_QUOTA_MB: {self.file_upload_quota_mb}\n"
+            f"JOB_QUEUE_SIZE: {self.job_queue_size}\n"
+            f"JOB_WORKERS: {self.job_workers}\n"
+            f"JOB_RESULT_TTL: {self.job_result_ttl}\n"
+            f"ADMISSION_QUEUE_SIZE: {self.admission_queue_size}\n"
+            f"ADMISSION_MAX_WAIT_SECONDS: {self.admission_max_wait_seconds}\n"
+            f"SPEECH_TO_TEXT_SCHEDULER_AGING: {self.speech_to_text_scheduler_aging}\n"
+            f"CLIENT_WEIGHTS: {self.client_weights}\n"
+            f"CLIENT_API_KEYS: {sorted(set((self.client_api_keys or {}).values()))}\n"
+            f"CLIENT_MAX_CONCURRENT_JOBS: {self.client_max_concurrent_jobs}\n"
+            f"CLIENT_AUDIO_SECONDS_PER_MINUTE: {self.client_audio_seconds_per_minute}\n"
+            f"STREAMING_STEP_MS: {self.streaming_step_ms}\n"
+            f"STREAMING_MAX_WINDOW_SECONDS: {self.streaming_max_window_seconds}\n"
+            f"TRANSCRIBE_BATCH_MAX_FILES: {self.transcribe_batch_max_files}\n"
+            f"SPEECH_TO_TEXT_CHUNK_SECONDS: {self.speech_to_text_chunk_seconds}\n"
+            f"SPEECH_TO_TEXT_BLOCK_SECONDS: {self.speech_to_text_block_seconds}\n"
+            f"SPEECH_TO_TEXT_BATCH_WINDOW_MS: {self.speech_to_text_batch_window_ms}\n"
+            f"SPEECH_TO_TEXT_MAX_BATCH_SIZE: {self.speech_to_text_max_batch_size}\n"
+            f"SPEECH_TO_TEXT_CHECKPOINT_SECONDS: {self.speech_to_text_checkpoint_seconds}\n"
+            f"TRANSCRIPTION_CHECKPOINT_PATH: {self.transcription_checkpoint_path}\n"
             f"MODEL_IDLE_TIMEOUT: {self.model_idle_timeout}"
         )
         logger.info(config_message)
@@ -0,0 +1,225 @@
+import asyncio
+import contextvars
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Annotated, Awaitable, Callable, Deque, Dict, Hashable, List, Optional
+
+from fastapi import Depends
+
+from core.client_context.client_context import get_client_id
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.exceptions.job_not_found_error import JobNotFoundError
+from domain.exceptions.job_queue_full_error import JobQueueFullError
+from domain.models.job_model import JobModel, JobStatus
+
+ProgressCallback = Callable[[float], None]
+JobFunction = Callable[[ProgressCallback], Awaitable[str]]
+
+FINISHED_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED})
+
+
+@dataclass
+class QueuedJob:
+    job: JobModel
+    key: Hashable
+    function: JobFunction
+    discard: Callable[[], None]
+    task: Optional["asyncio.Task[None]"] = None
+    # The context of the submitting request carries its client identity into the job
+    context: contextvars.Context = field(default_factory=contextvars.copy_context)
+
+
+class JobQueue:
+    _instance: Optional["JobQueue"] = None
+    _lock = threading.Lock()
+
+    def __new__(
+        cls,
+        config: Annotated[AppConfig, Depends()],
+        logger: Annotated[Logger, Depends()],
+    ) -> "JobQueue":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(JobQueue, cls).__new__(cls)
+                    cls._instance._initialize(config, logger)
+
+        return cls._instance
+
+    def _initialize(
+        self,
+        config: AppConfig,
+        logger: Logger,
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self.jobs: Dict[str, QueuedJob] = {}
+        self.job_ids_by_key: Dict[Hashable, str] = {}
+        # Clients are kept in the order of their turns, and each holds its queued jobs first in, first out
+        self.client_queues: Dict[str, Deque[str]] = {}
+        self.queue: Optional["asyncio.Queue[None]"] = None
+        self.runners: List["asyncio.Task[None]"] = []
+
+    def _start_runners(self) -> "asyncio.Queue[None]":
+        # The queue and its runners are bound to the event loop of the first submitted job
+        if self.queue is None:
+            self.queue = asyncio.Queue(maxsize=self.config.job_queue_size)
+            self.runners = [asyncio.ensure_future(self._run(self.queue)) for _ in range(self.config.job_workers)]
+
+        return self.queue
+
+    def _update(
+        self,
+        queued_job: QueuedJob,
+        **changes: object,
+    ) -> None:
+        for name, value in changes.items():
+            setattr(queued_job.job, name, value)
+
+        queued_job.job.updated_at = time.time()
+
+    def _prune(self) -> None:
+        expiration_time = time.time() - self.config.job_result_ttl
+
+        for job_id, queued_job in list(self.jobs.items()):
+            if queued_job.job.status in FINISHED_STATUSES and queued_job.job.updated_at <= expiration_time:
+                del self.jobs[job_id]
+
+                if self.job_ids_by_key.get(queued_job.key) == job_id:
+                    del self.job_ids_by_key[queued_job.key]
+
+    async def _execute(
+        self,
+        queued_job: QueuedJob,
+    ) -> None:
+        self._update(queued_job, status=JobStatus.RUNNING)
+        self.logger.info(f"Running job {queued_job.job.job_id}")
+
+        try:
+            result = await queued_job.function(lambda progress: self._update(queued_job, progress=progress))
+
+        except asyncio.CancelledError:
+            self._update(queued_job, status=JobStatus.CANCELLED)
+            self.logger.info(f"Job {queued_job.job.job_id} cancelled")
+            raise
+
+        except Exception as e:
+            self._update(queued_job, status=JobStatus.FAILED, error=str(e))
+            self.logger.error(f"Job {queued_job.job.job_id} failed: {e}")
+            return
+
+        self._update(queued_job, status=JobStatus.COMPLETED, progress=1.0, result=result)
+        self.logger.info(f"Job {queued_job.job.job_id} completed")
+
+    def _next_job_id(self) -> str:
+        # Clients take turns, so a client that submitted many jobs does not hold back the jobs of the others
+        client_id = next(iter(self.client_queues))
+        job_ids = self.client_queues.pop(client_id)
+        job_id = job_ids.popleft()
+
+        if job_ids:
+            self.client_queues[client_id] = job_ids
+
+        return job_id
+
+    async def _run(
+        self,
+        queue: "asyncio.Queue[None]",
+    ) -> None:
+        while True:
+            # The queue holds one entry per submitted job, so a job is waiting whenever an entry is taken
+            await queue.get()
+            queued_job = self.jobs.get(self._next_job_id())
+
+            if queued_job is None or queued_job.job.status != JobStatus.QUEUED:
+                continue
+
+            # Each job runs in its own task, so cancelling a job never stops the runner
+            queued_job.task = asyncio.get_running_loop().create_task(
+                self._execute(queued_job),
+                context=queued_job.context,
+            )
+            await asyncio.wait([queued_job.task])
+
+    def submit(
+        self,
+        key: Hashable,
+        function: JobFunction,
+        discard: Callable[[], None],
+    ) -> JobModel:
+        self._prune()
+        client_id = get_client_id()
+        # Jobs are shared only within a client, so no client can cancel a job another client is waiting for
+        client_key = (client_id, key)
+        existing_job_id = self.job_ids_by_key.get(client_key)
+
+        # A retried submission joins the job that is already doing or has done the same work
+        if existing_job_id is not None:
+            existing_job = self.jobs[existing_job_id]
+
+            if existing_job.job.status not in (JobStatus.FAILED, JobStatus.CANCELLED):
+                self.logger.debug(f"Returning existing job {existing_job_id} for identical submission")
+                discard()
+
+                return existing_job.job
+
+        queue = self._start_runners()
+
+        if queue.full():
+            raise JobQueueFullError()
+
+        job = JobModel(job_id=uuid.uuid4().hex, updated_at=time.time())
+        self.jobs[job.job_id] = QueuedJob(job=job, key=client_key, function=function, discard=discard)
+        self.job_ids_by_key[client_key] = job.job_id
+        self.client_queues.setdefault(client_id, deque()).append(job.job_id)
+        queue.put_nowait(None)
+        self.logger.info(f"Job {job.job_id} queued")
+
+        return job
+
+    def get(
+        self,
+        job_id: str,
+    ) -> JobModel:
+        queued_job = self.jobs.get(job_id)
+
+        if queued_job is None:
+            raise JobNotFoundError(job_id)
+
+        return queued_job.job
+
+    def cancel(
+        self,
+        job_id: str,
+    ) -> JobModel:
+        queued_job = self.jobs.get(job_id)
+
+        if queued_job is None:
+            raise JobNotFoundError(job_id)
+
+        if queued_job.job.status == JobStatus.QUEUED:
+            self._update(queued_job, status=JobStatus.CANCELLED)
+            queued_job.discard()
+            self.logger.info(f"Job {job_id} cancelled before start")
+
+        elif queued_job.job.status == JobStatus.RUNNING and queued_job.task is not None:
+            if queued_job.task.cancel():
+                self._update(queued_job, status=JobStatus.CANCELLED)
+
+        return queued_job.job
+
+    async def shutdown(self) -> None:
+        tasks = [queued_job.task for queued_job in self.jobs.values() if queued_job.task is not None]
+        tasks.extend(self.runners)
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.client_queues.clear()
+        self.queue = None
+        self.runners = []
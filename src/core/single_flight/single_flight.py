@@ -0,0 +1,68 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+ResultType = TypeVar("ResultType")
+
+
+class SingleFlight:
+    _instance: Optional["SingleFlight"] = None
+
+    _in_flight: Dict[Hashable, "asyncio.Future[Any]"]
+    _waiters: Dict[Hashable, int]
+
+    def __new__(cls) -> "SingleFlight":
+        if cls._instance is None:
+            cls._instance = super(SingleFlight, cls).__new__(cls)
+            cls._instance._in_flight = {}
+            cls._instance._waiters = {}
+
+        return cls._instance
+
+    def _forget(
+        self,
+        key: Hashable,
+        task: "asyncio.Future[Any]",
+    ) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+            self._waiters.pop(key, None)
+
+        # Marks the error as retrieved when every caller was cancelled before the work finished
+        if not task.cancelled():
+            task.exception()
+
+    def is_in_flight(
+        self,
+        key: Hashable,
+    ) -> bool:
+        return key in self._in_flight
+
+    async def run(
+        self,
+        key: Hashable,
+        function: Callable[[], Awaitable[ResultType]],
+    ) -> ResultType:
+        task = self._in_flight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(function())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+
+        try:
+            # A cancelled caller must not cancel the work other callers are waiting for
+            result: ResultType = await asyncio.shield(task)
+
+        except asyncio.CancelledError:
+            # Work nobody waits for any more only holds resources, so the last caller to leave cancels it
+            if self._in_flight.get(key) is task:
+                self._waiters[key] -= 1
+
+                if not self._waiters[key]:
+                    task.cancel()
+
+            raise
+
+        return result
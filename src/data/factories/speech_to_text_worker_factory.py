@@ -1,3 +1,4 @@
+import os
 from typing import Annotated
 
 from fastapi import Depends
@@ -22,6 +23,10 @@ class SpeechToTextWorkerFactory:
         self.config = config
         self.logger = logger
 
+    def _get_num_threads(self) -> int:
+        pool_size: int = self.config.speech_to_text_worker_pool_size
+        return max(1, (os.cpu_count() or 1) // pool_size)
+
     def create(self) -> WhisperSpeechToTextWorker:
         if self.config.speech_to_text_model_name == "openai/whisper":
             return WhisperSpeechToTextWorker(
@@ -30,6 +35,8 @@ class SpeechToTextWorkerFactory:
                     model_type=self.config.speech_to_text_model_type,
                     model_download_path=self.config.speech_to_text_model_download_path,
                     log_level=self.config.log_level,
+                    num_threads=self._get_num_threads(),
+                    checkpoint_interval_seconds=self.config.speech_to_text_checkpoint_seconds,
                 ),
                 logger=self.logger,
             )
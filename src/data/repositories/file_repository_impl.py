@@ -1,65 +1,304 @@
+import asyncio
+import hashlib
 import os
-from typing import Annotated
+import queue
+import threading
+import time
+import uuid
+import zipfile
+from typing import Annotated, AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple
 
-from fastapi import Depends, UploadFile
+from fastapi import Depends
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
 from data.repositories.directory_repository_impl import DirectoryRepositoryImpl
+from domain.exceptions.batch_too_large_error import BatchTooLargeError
+from domain.exceptions.invalid_archive_error import InvalidArchiveError
 from domain.exceptions.invalid_file_name_error import InvalidFileNameError
 from domain.exceptions.invalid_file_path_error import InvalidFilePathError
+from domain.exceptions.upload_quota_exceeded_error import UploadQuotaExceededError
+from domain.models.saved_file_model import SavedFileModel
 from domain.repositories.directory_repository import DirectoryRepository
 from domain.repositories.file_repository import FileRepository
 
+WRITE_BUFFER_SIZE = 1024 * 1024  # 1MB
+
 
 class FileRepositoryImpl(FileRepository):  # type: ignore
-    def __init__(
-        self,
+    _instance: Optional["FileRepositoryImpl"] = None
+    _lock = threading.Lock()
+
+    def __new__(
+        cls,
         config: Annotated[AppConfig, Depends()],
         logger: Annotated[Logger, Depends()],
         directory_repository: Annotated[DirectoryRepository, Depends(DirectoryRepositoryImpl)],
+    ) -> "FileRepositoryImpl":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(FileRepositoryImpl, cls).__new__(cls)
+                    cls._instance._initialize(config, logger, directory_repository)
+
+        return cls._instance
+
+    def _initialize(
+        self,
+        config: AppConfig,
+        logger: Logger,
+        directory_repository: DirectoryRepository,
     ) -> None:
         self.config = config
         self.logger = logger
-        self.directory_repository = directory_repository
+        self.started_at = time.time()
+        self.upload_path = os.path.abspath(config.file_upload_path)
+        self.quota_bytes = config.file_upload_quota_mb * 1024 * 1024
+        self.disk_usage = 0
+        self.active_files: Dict[str, int] = {}
+        self.usage_lock = threading.Lock()
+        # Deletions carry the bytes they still hold against the quota
+        self.deletion_queue: "queue.Queue[Optional[Tuple[str, int]]]" = queue.Queue()
 
-    async def save_file(
+        directory_repository.create_directory(config.file_upload_path)
+
+        self.janitor = threading.Thread(target=self._run_janitor, name="upload-janitor", daemon=True)
+        self.janitor.start()
+
+    def _remove(
+        self,
+        path: str,
+        counted_size: int = 0,
+    ) -> None:
+        try:
+            os.remove(path)
+            self.logger.debug(f"File deleted: {path}")
+
+        except FileNotFoundError:
+            pass
+
+        except OSError as e:
+            self.logger.warning(f"Failed to delete file {path}: {e}")
+            return
+
+        with self.usage_lock:
+            self.disk_usage = max(0, self.disk_usage - counted_size)
+
+    def _sweep(
         self,
-        file: UploadFile,
+        expiration_time: float,
+    ) -> None:
+        with os.scandir(self.upload_path) as entries:
+            for entry in entries:
+                with self.usage_lock:
+                    in_use = entry.path in self.active_files
+
+                if not in_use and entry.is_file() and entry.stat().st_mtime <= expiration_time:
+                    self.logger.debug(f"Removing orphaned upload: {entry.path}")
+                    self._remove(entry.path)
+
+    def _run_janitor(self) -> None:
+        # Unused files are orphans only when deletion is enabled, otherwise they were kept on purpose
+        sweeps_orphans = self.config.delete_files_after_transcription
+
+        # Files staged before a restart belong to no request
+        if sweeps_orphans:
+            self._sweep(self.started_at)
+
+        next_sweep_at = time.monotonic() + self.config.file_upload_cleanup_interval
+
+        while True:
+            # Sweeps keep their own schedule, so a steady stream of deletions cannot postpone them
+            if time.monotonic() >= next_sweep_at:
+                if sweeps_orphans and self.config.file_upload_max_age_seconds > 0:
+                    self._sweep(time.time() - self.config.file_upload_max_age_seconds)
+
+                next_sweep_at = time.monotonic() + self.config.file_upload_cleanup_interval
+
+            try:
+                deletion = self.deletion_queue.get(timeout=max(0.0, next_sweep_at - time.monotonic()))
+
+            except queue.Empty:
+                continue
+
+            if deletion is None:
+                return
+
+            self._remove(*deletion)
+
+    def _reserve(
+        self,
+        path: str,
+        size: int,
+    ) -> None:
+        with self.usage_lock:
+            if self.quota_bytes and self.disk_usage + size > self.quota_bytes:
+                raise UploadQuotaExceededError(self.config.file_upload_quota_mb)
+
+            self.disk_usage += size
+            self.active_files[path] += size
+
+    def _release(
+        self,
+        path: str,
+    ) -> int:
+        with self.usage_lock:
+            return self.active_files.pop(path, 0)
+
+    def _validate_path(
+        self,
+        path: str,
     ) -> str:
-        self.logger.debug(f"Saving file: {file.filename}")
-        self.directory_repository.create_directory(self.config.file_upload_path)
+        absolute_path = os.path.abspath(os.path.normpath(path))
+
+        if os.path.dirname(absolute_path) != self.upload_path:
+            self.logger.error("Invalid file path")
+            raise InvalidFilePathError()
+
+        return absolute_path
+
+    async def save_file(
+        self,
+        file_name: Optional[str],
+        chunks: AsyncIterable[bytes],
+    ) -> SavedFileModel:
+        self.logger.debug(f"Saving file: {file_name}")
 
-        file_path = os.path.join(self.config.file_upload_path, file.filename or "unknown")
+        file_path = os.path.join(self.config.file_upload_path, file_name or "unknown")
         normalized_file_path = os.path.normpath(file_path)
         normalized_file_upload_path = os.path.normpath(self.config.file_upload_path)
-        absolute_path = os.path.abspath(normalized_file_path)
 
         if not normalized_file_path.startswith(normalized_file_upload_path):
             self.logger.error("Invalid file name")
             raise InvalidFileNameError()
 
-        with open(absolute_path, "wb") as f:
-            while content := await file.read(1024 * 1024):  # 1MB chunks
-                f.write(content)
+        # Every upload gets its own path, so concurrent uploads with the same name never share a file
+        _, extension = os.path.splitext(normalized_file_path)
+        absolute_path = os.path.join(self.upload_path, f"{uuid.uuid4().hex}{extension}")
+        content_hash = hashlib.sha256()
+        size = 0
+        buffer = bytearray()
+
+        with self.usage_lock:
+            self.active_files[absolute_path] = 0
+
+        f = await asyncio.to_thread(open, absolute_path, "wb")
+
+        try:
+            # Chunks arrive straight from the request body, so the upload is hashed and written in one pass
+            async for chunk in chunks:
+                content_hash.update(chunk)
+                size += len(chunk)
+                buffer += chunk
+
+                if len(buffer) >= WRITE_BUFFER_SIZE:
+                    self._reserve(absolute_path, len(buffer))
+                    await asyncio.to_thread(f.write, buffer)
+                    buffer.clear()
+
+            self._reserve(absolute_path, len(buffer))
+            await asyncio.to_thread(f.write, buffer)
+
+        except BaseException:
+            f.close()
+            os.remove(absolute_path)
+
+            with self.usage_lock:
+                self.disk_usage -= self.active_files.pop(absolute_path, 0)
+
+            raise
+
+        await asyncio.to_thread(f.close)
 
         self.logger.debug(f"File saved at: {absolute_path}")
-        return absolute_path
+        return SavedFileModel(
+            path=absolute_path,
+            content_hash=content_hash.hexdigest(),
+            file_name=file_name,
+            size=size,
+        )
 
-    def delete_file(
+    @staticmethod
+    async def _read_archive_entry(
+        archive: zipfile.ZipFile,
+        entry: zipfile.ZipInfo,
+    ) -> AsyncIterator[bytes]:
+        with await asyncio.to_thread(archive.open, entry) as f:
+            while chunk := await asyncio.to_thread(f.read, WRITE_BUFFER_SIZE):
+                yield chunk
+
+    async def extract_archive(
+        self,
+        saved_file: SavedFileModel,
+        max_files: int,
+    ) -> List[SavedFileModel]:
+        absolute_path = self._validate_path(saved_file.path)
+        self.logger.debug(f"Extracting archive: {absolute_path}")
+
+        try:
+            archive = await asyncio.to_thread(zipfile.ZipFile, absolute_path)
+
+        except zipfile.BadZipFile:
+            raise InvalidArchiveError(saved_file.file_name or "unknown")
+
+        # Directories and hidden entries, like the metadata macOS adds to archives, are not media files
+        entries = [
+            entry
+            for entry in archive.infolist()
+            if not entry.is_dir()
+            and not any(part.startswith(".") or part == "__MACOSX" for part in entry.filename.split("/"))
+        ]
+        extracted_files: List[SavedFileModel] = []
+
+        try:
+            if len(entries) > max_files:
+                raise BatchTooLargeError(max_files)
+
+            # Entries are staged like uploads, so they count against the same quota and get the same cleanup
+            for entry in entries:
+                extracted_files.append(
+                    await self.save_file(
+                        os.path.basename(entry.filename),
+                        self._read_archive_entry(archive, entry),
+                    ),
+                )
+
+        except BaseException:
+            for extracted_file in extracted_files:
+                self.delete_file(extracted_file.path)
+
+            raise
+
+        finally:
+            archive.close()
+
+        self.logger.debug(f"Extracted {len(extracted_files)} files from archive: {absolute_path}")
+        return extracted_files
+
+    def release_file(
         self,
         path: str,
     ) -> None:
-        self.logger.debug(f"Deleting file: {path}")
-        self.directory_repository.create_directory(self.config.file_upload_path)
+        absolute_path = self._validate_path(path)
+        size = self._release(absolute_path)
 
-        normalized_path = os.path.normpath(path)
-        normalized_file_upload_path = os.path.normpath(self.config.file_upload_path)
-        absolute_path = os.path.abspath(normalized_path)
+        # Kept files are no longer staged for a request, so they stop counting against the upload quota
+        with self.usage_lock:
+            self.disk_usage = max(0, self.disk_usage - size)
 
-        if normalized_file_upload_path not in absolute_path:
-            self.logger.error("Invalid file path")
-            raise InvalidFilePathError()
+        self.logger.debug(f"File released: {absolute_path}")
+
+    def delete_file(
+        self,
+        path: str,
+    ) -> None:
+        absolute_path = self._validate_path(path)
+        size = self._release(absolute_path)
+
+        # Removal happens on the janitor thread, off the request path
+        self.logger.debug(f"Scheduling file deletion: {absolute_path}")
+        self.deletion_queue.put((absolute_path, size))
 
-        os.remove(absolute_path)
-        self.logger.debug(f"File deleted: {absolute_path}")
+    def shutdown(self) -> None:
+        self.deletion_queue.put(None)
+        self.janitor.join()
@@ -1,17 +1,57 @@
+import asyncio
+import os
 import threading
 import time
-from typing import Annotated, Any, Dict, Optional
+import uuid
+from typing import Annotated, Any, Callable, Collection, Dict, FrozenSet, List, Optional
 
 from fastapi import Depends
 
+from core.admission.admission_controller import AdmissionController
+from core.audio.audio_chunker import AudioChunk, split_at_silence
+from core.audio.audio_decoder import (
+    SAMPLE_RATE,
+    SAMPLE_WIDTH,
+    AudioDecoder,
+    SharedAudio,
+    SharedAudioDescriptor,
+    process_shared_audio,
+)
+from core.audio.voice_activity_detector import (
+    VoiceActivityParameters,
+    create_speech_timeline,
+    detect_speech,
+    split_voice_activity_parameters,
+)
+from core.client_context.client_context import get_client_id
+from core.client_quota.client_quota import ClientQuota
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
 from core.timer.timer import TimerFactory
 from data.factories.speech_to_text_worker_factory import SpeechToTextWorkerFactory
 from data.repositories.directory_repository_impl import DirectoryRepositoryImpl
+from data.workers.compact_transcription_result import CompactTranscriptionResult
+from data.workers.transcription_batcher import TranscriptionBatcher
+from data.workers.transcription_checkpoint import delete_checkpoint, load_checkpoint
+from data.workers.transcription_cost_model import TranscriptionCostModel
+from data.workers.whisper_batch_transcription import (
+    BATCH_MAX_SAMPLES,
+    BATCH_TRANSCRIPTION_PARAMETERS,
+)
+from data.workers.whisper_speech_to_text_worker import WhisperSpeechToTextWorker
+from data.workers.worker_pool import WorkerPool
+from domain.exceptions.worker_not_running_error import WorkerNotRunningError
+from domain.models.transcription_result_model import TranscriptionResultModel
+from domain.models.word_model import WordModel
 from domain.repositories.directory_repository import DirectoryRepository
 from domain.repositories.speech_to_text_repository import SpeechToTextRepository
 
+# Characters of the previous block's text given as the prompt of the next block
+BLOCK_PROMPT_LENGTH = 200
+CHECKPOINT_FILE_EXTENSION = ".json"
+# A transcription resumes at most this many times, and only after its worker saved a checkpoint
+MAX_CHECKPOINT_RESUMES = 3
+
 
 class SpeechToTextRepositoryImpl(SpeechToTextRepository):  # type: ignore
     _instance: Optional["SpeechToTextRepositoryImpl"] = None
@@ -24,12 +64,24 @@ class SpeechToTextRepositoryImpl(SpeechToTextRepository):  # type: ignore
         timer_factory: Annotated[TimerFactory, Depends()],
         logger: Annotated[Logger, Depends()],
         worker_factory: Annotated[SpeechToTextWorkerFactory, Depends()],
+        audio_decoder: Annotated[AudioDecoder, Depends()],
+        client_quota: Annotated[ClientQuota, Depends()],
+        admission_controller: Annotated[AdmissionController, Depends()],
     ) -> "SpeechToTextRepositoryImpl":
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = super(SpeechToTextRepositoryImpl, cls).__new__(cls)
-                    cls._instance._initialize(config, directory_repository, timer_factory, logger, worker_factory)
+                    cls._instance._initialize(
+                        config,
+                        directory_repository,
+                        timer_factory,
+                        logger,
+                        worker_factory,
+                        audio_decoder,
+                        client_quota,
+                        admission_controller,
+                    )
 
         return cls._instance
 
@@ -40,49 +92,609 @@ class SpeechToTextRepositoryImpl(SpeechToTextRepository):  # type: ignore
         timer_factory: TimerFactory,
         logger: Logger,
         worker_factory: SpeechToTextWorkerFactory,
+        audio_decoder: AudioDecoder,
+        client_quota: ClientQuota,
+        admission_controller: AdmissionController,
     ) -> None:
         directory_repository.create_directory(config.speech_to_text_model_download_path)
+
+        if config.speech_to_text_checkpoint_seconds:
+            directory_repository.create_directory(config.transcription_checkpoint_path)
+
         self.config = config
-        self.timer = timer_factory.create()
         self.logger = logger
-        self.worker = worker_factory.create()
+        self.audio_decoder = audio_decoder
+        self.client_quota = client_quota
+        self.admission_controller = admission_controller
+        self.worker_pool: WorkerPool[WhisperSpeechToTextWorker] = WorkerPool(
+            [worker_factory.create() for _ in range(config.speech_to_text_worker_pool_size)],
+            timer_factory,
+            config.model_idle_timeout,
+            logger,
+            "Speech to text model",
+            config.speech_to_text_scheduler_aging,
+            config.client_weights,
+        )
+        self.cost_model = TranscriptionCostModel(config.speech_to_text_model_type)
+        self.batcher = TranscriptionBatcher(
+            self._transcribe_batch,
+            config.speech_to_text_batch_window_ms / 1000,
+            config.speech_to_text_max_batch_size,
+            logger,
+        )
         self.last_access_time = 0.0
 
-    def _check_idle_timeout(self) -> None:
-        self.logger.debug("Checking speech to text model idle timeout")
+    @staticmethod
+    def _split_at_silence(
+        descriptor: SharedAudioDescriptor,
+        max_seconds: int,
+    ) -> List[AudioChunk]:
+        max_samples = max_seconds * SAMPLE_RATE
 
-        if self.worker.is_alive() and not self.worker.is_processing():
-            with self._lock:
-                self.worker.stop()
-                self.timer.cancel()
-                self.logger.info("Speech to text model stopped due to idle timeout")
+        if not max_samples or descriptor.num_samples <= max_samples:
+            return [(0, descriptor.num_samples)]
 
-    def transcribe(
+        chunks: List[AudioChunk] = process_shared_audio(
+            descriptor,
+            lambda samples: split_at_silence(samples, max_samples),
+        )
+
+        return chunks
+
+    @staticmethod
+    def _create_block_parameters(
+        transcription_parameters: Dict[str, Any],
+        previous_text: str,
+    ) -> Dict[str, Any]:
+        # whisper only uses the initial prompt for its first window and then conditions on its own text,
+        # so a block is prompted with the end of the previous block
+        block_parameters = {name: value for name, value in transcription_parameters.items() if name != "initial_prompt"}
+        prompt = previous_text.strip()[-BLOCK_PROMPT_LENGTH:]
+
+        if prompt and transcription_parameters.get("condition_on_previous_text", True):
+            block_parameters["initial_prompt"] = prompt
+
+        return block_parameters
+
+    async def _transcribe_attempt(
         self,
-        file_path: str,
+        descriptor: SharedAudioDescriptor,
         language: str,
         transcription_parameters: Dict[str, Any],
-    ) -> dict[str, str]:
-        with self._lock:
-            if not self.worker.is_alive():
-                self.logger.info("Starting speech to text worker")
-                self.worker.start()
+        segment_fields: Optional[FrozenSet[str]],
+        on_segments: Optional[Callable[[CompactTranscriptionResult], None]],
+        estimated_cost: float,
+        checkpoint_path: Optional[str],
+    ) -> CompactTranscriptionResult:
+        async with self.worker_pool.lease(estimated_cost) as worker:
+            started_at = time.monotonic()
+            compact_result = await worker.transcribe(
+                descriptor,
+                language,
+                transcription_parameters,
+                segment_fields,
+                on_segments,
+                checkpoint_path,
+            )
+            self.cost_model.observe(
+                descriptor.num_samples / SAMPLE_RATE,
+                transcription_parameters,
+                time.monotonic() - started_at,
+            )
 
-        self.logger.debug(f"Transcribing file: {file_path}, language: {language}")
+        return compact_result
+
+    async def _transcribe_on_worker(
+        self,
+        descriptor: SharedAudioDescriptor,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[FrozenSet[str]],
+        on_segments: Optional[Callable[[CompactTranscriptionResult], None]],
+        estimated_cost: float,
+    ) -> CompactTranscriptionResult:
+        if not self.config.speech_to_text_checkpoint_seconds:
+            return await self._transcribe_attempt(
+                descriptor,
+                language,
+                transcription_parameters,
+                segment_fields,
+                on_segments,
+                estimated_cost,
+                None,
+            )
+
+        checkpoint_path = os.path.join(
+            self.config.transcription_checkpoint_path,
+            f"{uuid.uuid4().hex}{CHECKPOINT_FILE_EXTENSION}",
+        )
+        completed_results: List[CompactTranscriptionResult] = []
+        completed_segments = 0
+        resumed_samples = 0
+        resumes = 0
+        reported_segments = 0
+        attempt_segments = 0
+
+        def on_attempt_segments(partial_result: CompactTranscriptionResult) -> None:
+            nonlocal reported_segments, attempt_segments
+
+            # Segments reported after the checkpoint a transcription resumed from are not reported again
+            first_segment = completed_segments + attempt_segments
+            attempt_segments += partial_result.segment_count
+            new_segments = partial_result.skip_segments(max(0, reported_segments - first_segment))
+
+            if on_segments and new_segments.segment_count:
+                on_segments(new_segments.shift(resumed_samples / SAMPLE_RATE, reported_segments))
+                reported_segments += new_segments.segment_count
+
+        try:
+            while True:
+                remaining = descriptor.slice(resumed_samples, descriptor.num_samples)
+                attempt_segments = 0
+
+                try:
+                    attempt_result = await self._transcribe_attempt(
+                        remaining,
+                        language,
+                        (
+                            self._create_block_parameters(transcription_parameters, completed_results[-1].text)
+                            if completed_results
+                            else transcription_parameters
+                        ),
+                        segment_fields,
+                        on_attempt_segments if on_segments else None,
+                        estimated_cost * remaining.num_samples / max(1, descriptor.num_samples),
+                        checkpoint_path,
+                    )
+
+                except WorkerNotRunningError:
+                    checkpoint = await asyncio.to_thread(load_checkpoint, checkpoint_path)
+                    decoded_samples = round(checkpoint.decoded_seconds * SAMPLE_RATE) if checkpoint else 0
+
+                    if not checkpoint or not decoded_samples:
+                        self.logger.warning(
+                            "Speech to text worker stopped during transcription before saving a checkpoint, "
+                            "transcription cannot be resumed",
+                        )
+                        raise
+
+                    if resumes == MAX_CHECKPOINT_RESUMES:
+                        raise
+
+                    # Checkpoints are relative to the attempt that saved them, so each one is used once
+                    await asyncio.to_thread(delete_checkpoint, checkpoint_path)
+                    checkpoint_result = CompactTranscriptionResult.from_whisper_result(
+                        checkpoint.to_whisper_result(),
+                        segment_fields,
+                    )
+                    completed_results.append(
+                        checkpoint_result.shift(resumed_samples / SAMPLE_RATE, completed_segments),
+                    )
+                    completed_segments += checkpoint_result.segment_count
+                    resumed_samples = min(resumed_samples + decoded_samples, descriptor.num_samples)
+                    resumes += 1
+                    self.logger.warning(
+                        f"Speech to text worker stopped during transcription, "
+                        f"resuming from checkpoint at {resumed_samples / SAMPLE_RATE:.1f}s",
+                    )
+
+                    if resumed_samples < descriptor.num_samples:
+                        continue
+
+                    return CompactTranscriptionResult.concatenate(completed_results)
+
+                if not completed_results:
+                    return attempt_result
+
+                completed_results.append(attempt_result.shift(resumed_samples / SAMPLE_RATE, completed_segments))
+
+                return CompactTranscriptionResult.concatenate(completed_results)
+
+        finally:
+            await asyncio.to_thread(delete_checkpoint, checkpoint_path)
+
+    async def _transcribe_batch(
+        self,
+        audios: List[SharedAudioDescriptor],
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[FrozenSet[str]],
+        client_ids: List[str],
+    ) -> List[Optional[CompactTranscriptionResult]]:
+        # Batched decoding costs less per second of audio, so it is not observed to keep single file estimates right
+        async with self.worker_pool.lease() as worker:
+            results: List[Optional[CompactTranscriptionResult]] = await worker.transcribe_batch(
+                audios,
+                language,
+                transcription_parameters,
+                segment_fields,
+            )
+
+        # A batch can carry clips of several clients, so each client is charged for its own clips once it ran
+        client_costs: Dict[str, float] = {}
+
+        for audio, client_id in zip(audios, client_ids):
+            client_costs[client_id] = client_costs.get(client_id, 0.0) + self.cost_model.estimate(
+                audio.num_samples / SAMPLE_RATE,
+                transcription_parameters,
+            )
+
+        for client_id, cost in client_costs.items():
+            self.worker_pool.charge(client_id, cost)
+
+        return results
+
+    def _is_batchable(
+        self,
+        descriptor: SharedAudioDescriptor,
+        transcription_parameters: Dict[str, Any],
+        on_segments: Optional[Callable[[CompactTranscriptionResult], None]],
+    ) -> bool:
+        return (
+            self.config.speech_to_text_max_batch_size > 1
+            and on_segments is None
+            and descriptor.num_samples <= BATCH_MAX_SAMPLES
+            and set(transcription_parameters) <= BATCH_TRANSCRIPTION_PARAMETERS
+        )
+
+    async def _transcribe_blocks(
+        self,
+        descriptor: SharedAudioDescriptor,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[FrozenSet[str]],
+        on_segments: Optional[Callable[[CompactTranscriptionResult], None]],
+        audio_duration: float,
+    ) -> CompactTranscriptionResult:
+        blocks = await asyncio.to_thread(
+            self._split_at_silence,
+            descriptor,
+            self.config.speech_to_text_block_seconds,
+        )
+
+        if len(blocks) == 1:
+            return await self._transcribe_on_worker(
+                descriptor,
+                language,
+                transcription_parameters,
+                segment_fields,
+                on_segments,
+                self.cost_model.estimate(audio_duration, transcription_parameters),
+            )
+
+        self.logger.debug(f"Transcribing {len(blocks)} blocks in sequence")
+
+        block_results: List[CompactTranscriptionResult] = []
+        forwarded_segments = 0
+
+        def create_block_callback(
+            offset: float,
+        ) -> Callable[[CompactTranscriptionResult], None]:
+            def on_block_segments(partial_result: CompactTranscriptionResult) -> None:
+                nonlocal forwarded_segments
+
+                if on_segments:
+                    on_segments(partial_result.shift(offset, forwarded_segments))
+                    forwarded_segments += partial_result.segment_count
+
+            return on_block_segments
+
+        # Workers only map the block they transcribe, so their memory does not grow with the length of the file
+        for start, end in blocks:
+            block = descriptor.slice(start, end)
+            offset = start / SAMPLE_RATE
+            block_parameters = (
+                self._create_block_parameters(transcription_parameters, block_results[-1].text)
+                if block_results
+                else transcription_parameters
+            )
+            block_result = await self._transcribe_on_worker(
+                block,
+                language,
+                block_parameters,
+                segment_fields,
+                create_block_callback(offset) if on_segments else None,
+                self.cost_model.estimate(block.num_samples / SAMPLE_RATE, transcription_parameters),
+            )
+            block_results.append(
+                block_result.shift(offset, sum(result.segment_count for result in block_results)),
+            )
+
+        return CompactTranscriptionResult.concatenate(block_results)
+
+    async def _transcribe_chunks(
+        self,
+        descriptor: SharedAudioDescriptor,
+        chunks: List[AudioChunk],
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[FrozenSet[str]],
+        on_segments: Optional[Callable[[CompactTranscriptionResult], None]],
+    ) -> CompactTranscriptionResult:
+        offsets = [start / SAMPLE_RATE for start, _ in chunks]
+        buffered_segments: List[List[CompactTranscriptionResult]] = [[] for _ in chunks]
+        completed_chunks = [False] * len(chunks)
+        live_chunk = 0
+        forwarded_segments = 0
+
+        def forward_segments(
+            index: int,
+            partial_result: CompactTranscriptionResult,
+        ) -> None:
+            nonlocal forwarded_segments
+
+            if on_segments:
+                on_segments(partial_result.shift(offsets[index], forwarded_segments))
+                forwarded_segments += partial_result.segment_count
 
-        result: dict[str, str] = self.worker.transcribe(
-            file_path,
+        def on_chunk_segments(
+            index: int,
+            partial_result: CompactTranscriptionResult,
+        ) -> None:
+            # Segments reach the callback in file order, so later chunks wait until the earlier ones complete
+            if index == live_chunk:
+                forward_segments(index, partial_result)
+            else:
+                buffered_segments[index].append(partial_result)
+
+        async def transcribe_chunk(
+            index: int,
+            start: int,
+            end: int,
+        ) -> CompactTranscriptionResult:
+            nonlocal live_chunk
+
+            chunk = descriptor.slice(start, end)
+            compact_result = await self._transcribe_blocks(
+                chunk,
+                language,
+                transcription_parameters,
+                segment_fields,
+                (lambda partial_result: on_chunk_segments(index, partial_result)) if on_segments else None,
+                chunk.num_samples / SAMPLE_RATE,
+            )
+            completed_chunks[index] = True
+
+            while live_chunk < len(chunks) and completed_chunks[live_chunk]:
+                live_chunk += 1
+
+                if live_chunk < len(chunks):
+                    for partial_result in buffered_segments[live_chunk]:
+                        forward_segments(live_chunk, partial_result)
+
+                    buffered_segments[live_chunk].clear()
+
+            return compact_result
+
+        self.logger.debug(f"Transcribing {len(chunks)} chunks in parallel")
+
+        transcriptions = [
+            asyncio.ensure_future(transcribe_chunk(index, start, end)) for index, (start, end) in enumerate(chunks)
+        ]
+
+        try:
+            chunk_results = await asyncio.gather(*transcriptions)
+
+        finally:
+            for transcription in transcriptions:
+                transcription.cancel()
+
+        shifted_results = []
+        first_id = 0
+
+        for offset, chunk_result in zip(offsets, chunk_results):
+            shifted_results.append(chunk_result.shift(offset, first_id))
+            first_id += chunk_result.segment_count
+
+        return CompactTranscriptionResult.concatenate(shifted_results)
+
+    async def _transcribe_audio(
+        self,
+        descriptor: SharedAudioDescriptor,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[FrozenSet[str]],
+        on_segments: Optional[Callable[[CompactTranscriptionResult], None]],
+        audio_duration: float,
+    ) -> CompactTranscriptionResult:
+        # Every worker transcription is measured, including jobs that never passed admission
+        async with self.admission_controller.track_transcription(audio_duration):
+            if self._is_batchable(descriptor, transcription_parameters, on_segments):
+                compact_result: CompactTranscriptionResult = await self.batcher.transcribe(
+                    descriptor,
+                    language,
+                    transcription_parameters,
+                    segment_fields,
+                )
+
+            else:
+                compact_result = await self._transcribe_unbatched(
+                    descriptor,
+                    language,
+                    transcription_parameters,
+                    segment_fields,
+                    on_segments,
+                    audio_duration,
+                )
+
+        return compact_result
+
+    async def _transcribe_unbatched(
+        self,
+        descriptor: SharedAudioDescriptor,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[FrozenSet[str]],
+        on_segments: Optional[Callable[[CompactTranscriptionResult], None]],
+        audio_duration: float,
+    ) -> CompactTranscriptionResult:
+        chunks = (
+            await asyncio.to_thread(self._split_at_silence, descriptor, self.config.speech_to_text_chunk_seconds)
+            if self.config.speech_to_text_worker_pool_size > 1
+            else [(0, descriptor.num_samples)]
+        )
+
+        if len(chunks) > 1:
+            return await self._transcribe_chunks(
+                descriptor,
+                chunks,
+                language,
+                transcription_parameters,
+                segment_fields,
+                on_segments,
+            )
+
+        return await self._transcribe_blocks(
+            descriptor,
             language,
             transcription_parameters,
+            segment_fields,
+            on_segments,
+            audio_duration,
+        )
+
+    async def _transcribe_speech(
+        self,
+        descriptor: SharedAudioDescriptor,
+        voice_activity_parameters: VoiceActivityParameters,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[FrozenSet[str]],
+        on_segments: Optional[Callable[[CompactTranscriptionResult], None]],
+    ) -> CompactTranscriptionResult:
+        regions = await asyncio.to_thread(
+            process_shared_audio,
+            descriptor,
+            lambda samples: detect_speech(samples, voice_activity_parameters),
+        )
+
+        if not regions:
+            self.logger.debug("No speech detected, skipping transcription")
+            return CompactTranscriptionResult.from_whisper_result({"text": "", "segments": []}, segment_fields)
+
+        speech_starts, original_starts = create_speech_timeline(regions)
+        speech_audio = await asyncio.to_thread(self.audio_decoder.copy_regions_to_shared_memory, descriptor, regions)
+        self.logger.debug(
+            f"Detected {len(regions)} speech regions, "
+            f"{speech_audio.descriptor.num_samples / SAMPLE_RATE:.1f}s of {descriptor.num_samples / SAMPLE_RATE:.1f}s",
         )
 
-        self.timer.start(
-            self.config.model_idle_timeout,
-            self._check_idle_timeout,
+        def on_speech_segments(partial_result: CompactTranscriptionResult) -> None:
+            if on_segments:
+                on_segments(partial_result.remap_timestamps(speech_starts, original_starts))
+
+        try:
+            compact_result = await self._transcribe_audio(
+                speech_audio.descriptor,
+                language,
+                transcription_parameters,
+                segment_fields,
+                on_speech_segments if on_segments else None,
+                speech_audio.descriptor.num_samples / SAMPLE_RATE,
+            )
+
+        finally:
+            speech_audio.release()
+
+        return compact_result.remap_timestamps(speech_starts, original_starts)
+
+    def _decode(
+        self,
+        file_path: str,
+        probed_duration: Optional[float],
+    ) -> SharedAudio:
+        block_seconds = self.config.speech_to_text_block_seconds
+
+        if block_seconds and probed_duration and probed_duration > block_seconds:
+            return self.audio_decoder.decode_to_scratch_file(file_path)
+
+        return self.audio_decoder.decode_to_shared_memory(file_path)
+
+    async def probe_duration(
+        self,
+        file_path: str,
+    ) -> Optional[float]:
+        probed_duration: Optional[float] = await asyncio.to_thread(self.audio_decoder.probe_duration, file_path)
+        return probed_duration
+
+    async def transcribe(
+        self,
+        file_path: str,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[Collection[str]] = None,
+        segment_callback: Optional[Callable[[TranscriptionResultModel], None]] = None,
+    ) -> TranscriptionResultModel:
+        self.logger.debug(f"Transcribing file: {file_path}, language: {language}")
+
+        def on_segments(partial_result: CompactTranscriptionResult) -> None:
+            if segment_callback:
+                segment_callback(partial_result.to_transcription_result_model())
+
+        voice_activity_parameters, transcription_parameters = split_voice_activity_parameters(
+            transcription_parameters,
         )
+        probed_duration = await self.probe_duration(file_path)
+
+        # Quota waits happen before decoding, so a throttled client does not hold decoded audio in memory
+        async with self.client_quota.reserve(get_client_id(), probed_duration or 0.0):
+            audio = await asyncio.to_thread(self._decode, file_path, probed_duration)
+            fields = None if segment_fields is None else frozenset(segment_fields)
+
+            try:
+                if voice_activity_parameters:
+                    compact_result = await self._transcribe_speech(
+                        audio.descriptor,
+                        voice_activity_parameters,
+                        language,
+                        transcription_parameters,
+                        fields,
+                        on_segments if segment_callback else None,
+                    )
+                else:
+                    compact_result = await self._transcribe_audio(
+                        audio.descriptor,
+                        language,
+                        transcription_parameters,
+                        fields,
+                        on_segments if segment_callback else None,
+                        probed_duration or audio.descriptor.num_samples / SAMPLE_RATE,
+                    )
+
+            finally:
+                audio.release()
 
         self.last_access_time = time.time()
 
         self.logger.debug(f"Transcription completed for file: {file_path}, language: {language}")
 
-        return result
+        return await asyncio.to_thread(compact_result.to_transcription_result_model)
+
+    async def transcribe_words(
+        self,
+        audio: bytes,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+    ) -> List[WordModel]:
+        # Live windows are short enough that detecting speech in them would not save any decoding
+        _, transcription_parameters = split_voice_activity_parameters(transcription_parameters)
+        audio_duration = len(audio) / SAMPLE_WIDTH / SAMPLE_RATE
+        shared_audio = await asyncio.to_thread(self.audio_decoder.copy_to_shared_memory, audio)
+
+        try:
+            # Windows are short, so live streams are served ahead of long queued files
+            async with self.worker_pool.lease(
+                self.cost_model.estimate(audio_duration, transcription_parameters)
+            ) as worker:
+                word_timestamps = await worker.transcribe_words(
+                    shared_audio.descriptor,
+                    language,
+                    transcription_parameters,
+                )
+
+        finally:
+            shared_audio.release()
+
+        self.last_access_time = time.time()
+
+        return [WordModel(start=start, end=end, text=text) for start, end, text in word_timestamps]
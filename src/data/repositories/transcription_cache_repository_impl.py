@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Annotated, Any, Collection, Dict, List, Optional, Tuple
+
+from fastapi import Depends
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from data.repositories.directory_repository_impl import DirectoryRepositoryImpl
+from domain.models.cache_statistics_model import CacheStatisticsModel
+from domain.models.transcription_result_model import TranscriptionResultModel
+from domain.repositories.directory_repository import DirectoryRepository
+from domain.repositories.transcription_cache_repository import (
+    TranscriptionCacheRepository,
+)
+
+CACHE_FILE_EXTENSION = ".json"
+
+
+class TranscriptionCacheRepositoryImpl(TranscriptionCacheRepository):  # type: ignore
+    _instance: Optional["TranscriptionCacheRepositoryImpl"] = None
+    _lock = threading.Lock()
+
+    def __new__(
+        cls,
+        config: Annotated[AppConfig, Depends()],
+        directory_repository: Annotated[DirectoryRepository, Depends(DirectoryRepositoryImpl)],
+        logger: Annotated[Logger, Depends()],
+    ) -> "TranscriptionCacheRepositoryImpl":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(TranscriptionCacheRepositoryImpl, cls).__new__(cls)
+                    cls._instance._initialize(config, directory_repository, logger)
+
+        return cls._instance
+
+    def _initialize(
+        self,
+        config: AppConfig,
+        directory_repository: DirectoryRepository,
+        logger: Logger,
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self.entries: OrderedDict[str, TranscriptionResultModel] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.max_disk_bytes = config.transcription_cache_max_size_mb * 1024 * 1024
+        self.disk_usage = 0
+        self.cache_lock = threading.Lock()
+
+        if self.max_disk_bytes > 0:
+            directory_repository.create_directory(config.transcription_cache_path)
+            self.disk_usage = sum(size for _, _, size in self._list_cache_files())
+
+    def _create_key(
+        self,
+        content_hash: str,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[Collection[str]],
+    ) -> str:
+        key = json.dumps(
+            [
+                content_hash,
+                self.config.speech_to_text_model_name,
+                self.config.speech_to_text_model_type,
+                language,
+                transcription_parameters,
+                None if segment_fields is None else sorted(segment_fields),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _get_cache_file_path(self, key: str) -> str:
+        return os.path.join(self.config.transcription_cache_path, f"{key}{CACHE_FILE_EXTENSION}")
+
+    def _list_cache_files(self) -> List[Tuple[float, str, int]]:
+        cache_files: List[Tuple[float, str, int]] = []
+
+        with os.scandir(self.config.transcription_cache_path) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(CACHE_FILE_EXTENSION):
+                    stat = entry.stat()
+                    cache_files.append((stat.st_mtime, entry.path, stat.st_size))
+
+        return cache_files
+
+    def _remember(
+        self,
+        key: str,
+        transcription_result: TranscriptionResultModel,
+    ) -> None:
+        if self.config.transcription_cache_size <= 0:
+            return
+
+        self.entries[key] = transcription_result
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.config.transcription_cache_size:
+            self.entries.popitem(last=False)
+
+    def _load_from_disk(
+        self,
+        key: str,
+    ) -> Optional[TranscriptionResultModel]:
+        if self.max_disk_bytes <= 0:
+            return None
+
+        cache_file_path = self._get_cache_file_path(key)
+
+        try:
+            with open(cache_file_path, "r", encoding="utf-8") as f:
+                transcription_result = TranscriptionResultModel.model_validate_json(f.read())
+
+        except FileNotFoundError:
+            return None
+
+        # Refreshing the modification time keeps recently used files out of eviction
+        os.utime(cache_file_path)
+
+        return transcription_result
+
+    def _evict_from_disk(self) -> None:
+        if self.disk_usage <= self.max_disk_bytes:
+            return
+
+        for _, cache_file_path, size in sorted(self._list_cache_files()):
+            os.remove(cache_file_path)
+            self.disk_usage -= size
+            self.logger.debug(f"Evicted transcription cache file: {cache_file_path}")
+
+            if self.disk_usage <= self.max_disk_bytes:
+                break
+
+    def _store_on_disk(
+        self,
+        key: str,
+        transcription_result: TranscriptionResultModel,
+    ) -> None:
+        if self.max_disk_bytes <= 0:
+            return
+
+        cache_file_path = self._get_cache_file_path(key)
+        temporary_file_path = f"{cache_file_path}.tmp"
+        content = transcription_result.model_dump_json().encode("utf-8")
+
+        if len(content) > self.max_disk_bytes:
+            return
+
+        with open(temporary_file_path, "wb") as f:
+            f.write(content)
+
+        if os.path.exists(cache_file_path):
+            self.disk_usage -= os.path.getsize(cache_file_path)
+
+        os.replace(temporary_file_path, cache_file_path)
+        self.disk_usage += len(content)
+        self._evict_from_disk()
+
+    def get_transcription(
+        self,
+        content_hash: str,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[Collection[str]],
+    ) -> Optional[TranscriptionResultModel]:
+        key = self._create_key(content_hash, language, transcription_parameters, segment_fields)
+
+        with self.cache_lock:
+            transcription_result = self.entries.get(key) or self._load_from_disk(key)
+
+            if transcription_result is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._remember(key, transcription_result)
+
+        return transcription_result
+
+    def put_transcription(
+        self,
+        content_hash: str,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[Collection[str]],
+        transcription_result: TranscriptionResultModel,
+    ) -> None:
+        key = self._create_key(content_hash, language, transcription_parameters, segment_fields)
+
+        with self.cache_lock:
+            self._remember(key, transcription_result)
+            self._store_on_disk(key, transcription_result)
+
+    def get_statistics(self) -> CacheStatisticsModel:
+        with self.cache_lock:
+            return CacheStatisticsModel(
+                hits=self.hits,
+                misses=self.misses,
+                entries=len(self.entries),
+            )
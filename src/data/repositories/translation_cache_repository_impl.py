@@ -0,0 +1,235 @@
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Annotated, Any, Dict, List, Optional, Tuple
+
+from fastapi import Depends
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from data.repositories.directory_repository_impl import DirectoryRepositoryImpl
+from domain.models.cache_statistics_model import CacheStatisticsModel
+from domain.repositories.directory_repository import DirectoryRepository
+from domain.repositories.translation_cache_repository import TranslationCacheRepository
+
+CACHE_FILE_NAME = "translation_cache.sqlite3"
+SQLITE_MAX_VARIABLES = 500
+# Writes to the persistent cache are committed together once this many are pending or the interval has passed
+PERSIST_BATCH_SIZE = 256
+PERSIST_INTERVAL_SECONDS = 5.0
+
+
+class TranslationCacheRepositoryImpl(TranslationCacheRepository):  # type: ignore
+    _instance: Optional["TranslationCacheRepositoryImpl"] = None
+    _lock = threading.Lock()
+
+    def __new__(
+        cls,
+        config: Annotated[AppConfig, Depends()],
+        directory_repository: Annotated[DirectoryRepository, Depends(DirectoryRepositoryImpl)],
+        logger: Annotated[Logger, Depends()],
+    ) -> "TranslationCacheRepositoryImpl":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(TranslationCacheRepositoryImpl, cls).__new__(cls)
+                    cls._instance._initialize(config, directory_repository, logger)
+
+        return cls._instance
+
+    def _initialize(
+        self,
+        config: AppConfig,
+        directory_repository: DirectoryRepository,
+        logger: Logger,
+    ) -> None:
+        self.config = config
+        self.logger = logger
+        self.entries: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.connection: Optional[sqlite3.Connection] = None
+        self.cache_lock = threading.Lock()
+        self.pending_writes: Dict[str, Tuple[str, float]] = {}
+        self.pending_touches: Dict[str, float] = {}
+        self.flushed_at = time.monotonic()
+
+        if config.translation_cache_persistent:
+            directory_repository.create_directory(config.translation_model_download_path)
+            cache_path = os.path.join(config.translation_model_download_path, CACHE_FILE_NAME)
+            self.logger.info(f"Using persistent translation cache: {cache_path}")
+            self.connection = sqlite3.connect(cache_path, check_same_thread=False)
+            self._create_schema(self.connection)
+            atexit.register(self.flush)
+
+    @staticmethod
+    def _create_schema(connection: sqlite3.Connection) -> None:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS translations "
+            "(key TEXT PRIMARY KEY, translation TEXT NOT NULL, last_used REAL NOT NULL DEFAULT 0)",
+        )
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(translations)")]
+
+        # Caches written before the persistent size limit existed have no access times
+        if "last_used" not in columns:
+            connection.execute("ALTER TABLE translations ADD COLUMN last_used REAL NOT NULL DEFAULT 0")
+
+        connection.execute("CREATE INDEX IF NOT EXISTS translations_last_used ON translations (last_used)")
+        connection.commit()
+
+    def _create_key(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str,
+        translation_parameters: Dict[str, Any],
+    ) -> str:
+        key = json.dumps(
+            [
+                " ".join(text.split()),
+                source_language,
+                target_language,
+                self.config.translation_model_name,
+                translation_parameters,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _remember(
+        self,
+        key: str,
+        translation: str,
+    ) -> None:
+        if self.config.translation_cache_size <= 0:
+            return
+
+        self.entries[key] = translation
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.config.translation_cache_size:
+            self.entries.popitem(last=False)
+
+    def _load_persisted(
+        self,
+        keys: List[str],
+    ) -> Dict[str, str]:
+        if self.connection is None or not keys:
+            return {}
+
+        persisted = {key: self.pending_writes[key][0] for key in keys if key in self.pending_writes}
+        remaining_keys = [key for key in keys if key not in persisted]
+
+        while remaining_keys:
+            chunk, remaining_keys = remaining_keys[:SQLITE_MAX_VARIABLES], remaining_keys[SQLITE_MAX_VARIABLES:]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self.connection.execute(
+                f"SELECT key, translation FROM translations WHERE key IN ({placeholders})",  # nosec B608
+                chunk,
+            )
+            persisted.update(rows.fetchall())
+
+        now = time.time()
+        self.pending_touches.update((key, now) for key in persisted if key not in self.pending_writes)
+
+        return persisted
+
+    def _evict_persisted(self, connection: sqlite3.Connection) -> None:
+        (rows,) = connection.execute("SELECT COUNT(*) FROM translations").fetchone()
+        excess_rows = rows - self.config.translation_cache_persistent_size
+
+        if excess_rows > 0:
+            connection.execute(
+                "DELETE FROM translations WHERE key IN (SELECT key FROM translations ORDER BY last_used LIMIT ?)",
+                (excess_rows,),
+            )
+
+    def _flush_locked(self) -> None:
+        if self.connection is None or not (self.pending_writes or self.pending_touches):
+            return
+
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO translations (key, translation, last_used) VALUES (?, ?, ?)",
+            ((key, translation, last_used) for key, (translation, last_used) in self.pending_writes.items()),
+        )
+        self.connection.executemany(
+            "UPDATE translations SET last_used = ? WHERE key = ?",
+            ((last_used, key) for key, last_used in self.pending_touches.items()),
+        )
+        self._evict_persisted(self.connection)
+        self.connection.commit()
+        self.pending_writes.clear()
+        self.pending_touches.clear()
+        self.flushed_at = time.monotonic()
+
+    def _flush_if_due(self) -> None:
+        if (
+            len(self.pending_writes) + len(self.pending_touches) >= PERSIST_BATCH_SIZE
+            or time.monotonic() - self.flushed_at >= PERSIST_INTERVAL_SECONDS
+        ):
+            self._flush_locked()
+
+    def flush(self) -> None:
+        with self.cache_lock:
+            self._flush_locked()
+
+    def get_translations(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        translation_parameters: Dict[str, Any],
+    ) -> List[Optional[str]]:
+        keys = [self._create_key(text, source_language, target_language, translation_parameters) for text in texts]
+
+        with self.cache_lock:
+            translations: List[Optional[str]] = [self.entries.get(key) for key in keys]
+            persisted = self._load_persisted([key for key, found in zip(keys, translations) if found is None])
+
+            for index, key in enumerate(keys):
+                if translations[index] is None and key in persisted:
+                    translations[index] = persisted[key]
+
+                if translations[index] is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    self._remember(key, str(translations[index]))
+
+            self._flush_if_due()
+
+        return translations
+
+    def put_translations(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        translation_parameters: Dict[str, Any],
+        translations: List[str],
+    ) -> None:
+        keys = [self._create_key(text, source_language, target_language, translation_parameters) for text in texts]
+
+        with self.cache_lock:
+            for key, translation in zip(keys, translations):
+                self._remember(key, translation)
+
+            if self.connection is not None:
+                now = time.time()
+                self.pending_writes.update((key, (translation, now)) for key, translation in zip(keys, translations))
+                self._flush_if_due()
+
+    def get_statistics(self) -> CacheStatisticsModel:
+        with self.cache_lock:
+            return CacheStatisticsModel(
+                hits=self.hits,
+                misses=self.misses,
+                entries=len(self.entries),
+            )
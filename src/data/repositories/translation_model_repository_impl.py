@@ -1,17 +1,33 @@
+import asyncio
 import threading
 import time
-from typing import Annotated, Any, Dict, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
 from fastapi import Depends
 
+from core.client_context.client_context import get_client_id
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
 from core.timer.timer import TimerFactory
 from data.factories.translation_worker_factory import TranslationWorkerFactory
 from data.repositories.directory_repository_impl import DirectoryRepositoryImpl
+from data.repositories.translation_cache_repository_impl import (
+    TranslationCacheRepositoryImpl,
+)
+from data.workers.fair_queue import FairSemaphore
+from data.workers.translation_batcher import (
+    TranslationBatcher,
+    create_length_buckets,
+    estimate_tokens,
+)
+from domain.models.cache_statistics_model import CacheStatisticsModel
 from domain.repositories.directory_repository import DirectoryRepository
+from domain.repositories.translation_cache_repository import TranslationCacheRepository
 from domain.repositories.translation_model_repository import TranslationModelRepository
 
+# One batch waits in the worker pipe while another is translated, the rest are ordered fairly between clients
+TRANSLATION_PIPELINE_DEPTH = 2
+
 
 class TranslationModelRepositoryImpl(TranslationModelRepository):  # type: ignore
     _instance: Optional["TranslationModelRepositoryImpl"] = None
@@ -24,12 +40,20 @@ class TranslationModelRepositoryImpl(TranslationModelRepository):  # type: ignor
         timer_factory: Annotated[TimerFactory, Depends()],
         logger: Annotated[Logger, Depends()],
         worker_factory: Annotated[TranslationWorkerFactory, Depends()],
+        translation_cache_repository: Annotated[TranslationCacheRepository, Depends(TranslationCacheRepositoryImpl)],
     ) -> "TranslationModelRepositoryImpl":
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = super(TranslationModelRepositoryImpl, cls).__new__(cls)
-                    cls._instance._initialize(config, directory_repository, timer_factory, logger, worker_factory)
+                    cls._instance._initialize(
+                        config,
+                        directory_repository,
+                        timer_factory,
+                        logger,
+                        worker_factory,
+                        translation_cache_repository,
+                    )
 
         return cls._instance
 
@@ -40,12 +64,22 @@ class TranslationModelRepositoryImpl(TranslationModelRepository):  # type: ignor
         timer_factory: TimerFactory,
         logger: Logger,
         worker_factory: TranslationWorkerFactory,
+        translation_cache_repository: TranslationCacheRepository,
     ) -> None:
         directory_repository.create_directory(config.translation_model_download_path)
         self.config = config
         self.timer = timer_factory.create()
         self.logger = logger
         self.worker = worker_factory.create()
+        self.translation_cache_repository = translation_cache_repository
+        self.batcher = TranslationBatcher(
+            self._translate_batch,
+            config.translation_batch_window_ms / 1000,
+            config.translation_max_batch_size,
+            config.translation_max_batch_tokens,
+            logger,
+        )
+        self.fair_semaphore = FairSemaphore(TRANSLATION_PIPELINE_DEPTH, config.client_weights)
         self.last_access_time = 0.0
 
     def _check_idle_timeout(self) -> None:
@@ -57,32 +91,118 @@ class TranslationModelRepositoryImpl(TranslationModelRepository):  # type: ignor
                 self.timer.cancel()
                 self.logger.info("Translation model stopped due to idle timeout")
 
-    def translate(
+    async def _translate_batch(
         self,
-        text: str,
+        texts: List[str],
         source_language: str,
         target_language: str,
         translation_parameters: Dict[str, Any],
-    ) -> str:
+        client_ids: Optional[List[str]] = None,
+    ) -> List[str]:
         with self._lock:
             if not self.worker.is_alive():
                 self.logger.info("Starting translation worker")
                 self.worker.start()
 
+        async with self.fair_semaphore.acquire():
+            result: List[str] = await self.worker.translate_batch(
+                texts,
+                source_language,
+                target_language,
+                translation_parameters,
+            )
+
+        # A batch can carry texts of several clients, so each client is charged for its own tokens once it ran
+        client_tokens: Dict[str, int] = {}
+
+        for text, client_id in zip(texts, client_ids or [get_client_id()] * len(texts)):
+            client_tokens[client_id] = client_tokens.get(client_id, 0) + estimate_tokens(text)
+
+        for client_id, tokens in client_tokens.items():
+            self.fair_semaphore.charge(client_id, tokens)
+
+        self.timer.start(
+            self.config.model_idle_timeout,
+            self._check_idle_timeout,
+        )
+
+        return result
+
+    async def _translate_in_buckets(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        translation_parameters: Dict[str, Any],
+    ) -> List[str]:
+        buckets = create_length_buckets(
+            texts,
+            self.config.translation_max_batch_size,
+            self.config.translation_max_batch_tokens,
+        )
+
+        self.logger.debug(f"Translating {len(texts)} texts in {len(buckets)} batches")
+
+        bucket_results = await asyncio.gather(
+            *(
+                self._translate_batch(
+                    [texts[index] for index in bucket],
+                    source_language,
+                    target_language,
+                    translation_parameters,
+                )
+                for bucket in buckets
+            ),
+        )
+
+        results = [""] * len(texts)
+
+        for bucket, bucket_result in zip(buckets, bucket_results):
+            for index, translation in zip(bucket, bucket_result):
+                results[index] = translation
+
+        return results
+
+    async def translate(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str,
+        translation_parameters: Dict[str, Any],
+    ) -> str:
         self.logger.debug(
             f"Translating started from source_language: {source_language}, target_language: {target_language}",
         )
 
-        result: str = self.worker.translate(
+        # Persistent cache lookups read from disk, so they run off the event loop
+        cached_translations: List[Optional[str]] = await asyncio.to_thread(
+            self.translation_cache_repository.get_translations,
+            [text],
+            source_language,
+            target_language,
+            translation_parameters,
+        )
+        cached_translation = cached_translations[0]
+
+        if cached_translation is not None:
+            self.logger.debug("Translation found in cache")
+
+            return cached_translation
+
+        result: str = await self.batcher.translate(
             text,
             source_language,
             target_language,
             translation_parameters,
         )
 
-        self.timer.start(
-            self.config.model_idle_timeout,
-            self._check_idle_timeout,
+        await asyncio.to_thread(
+            self.translation_cache_repository.put_translations,
+            [text],
+            source_language,
+            target_language,
+            translation_parameters,
+            [result],
         )
 
         self.last_access_time = time.time()
@@ -92,3 +212,59 @@ class TranslationModelRepositoryImpl(TranslationModelRepository):  # type: ignor
         )
 
         return result
+
+    async def translate_batch(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        translation_parameters: Dict[str, Any],
+    ) -> List[str]:
+        self.logger.debug(
+            f"Translating {len(texts)} texts started "
+            f"from source_language: {source_language}, target_language: {target_language}",
+        )
+
+        cached_translations: List[Optional[str]] = await asyncio.to_thread(
+            self.translation_cache_repository.get_translations,
+            texts,
+            source_language,
+            target_language,
+            translation_parameters,
+        )
+        # Repeated lines are sent to the model once
+        missing_texts = list(
+            dict.fromkeys(text for text, translation in zip(texts, cached_translations) if translation is None),
+        )
+        translated: Dict[str, str] = {}
+
+        if missing_texts:
+            missing_translations = await self._translate_in_buckets(
+                missing_texts,
+                source_language,
+                target_language,
+                translation_parameters,
+            )
+            await asyncio.to_thread(
+                self.translation_cache_repository.put_translations,
+                missing_texts,
+                source_language,
+                target_language,
+                translation_parameters,
+                missing_translations,
+            )
+            translated = dict(zip(missing_texts, missing_translations))
+            self.last_access_time = time.time()
+
+        self.logger.debug(
+            f"Translating {len(texts)} texts completed with {len(missing_texts)} sent to the model "
+            f"from source_language: {source_language}, target_language: {target_language}",
+        )
+
+        return [
+            translated[text] if translation is None else translation
+            for text, translation in zip(texts, cached_translations)
+        ]
+
+    def get_cache_statistics(self) -> CacheStatisticsModel:
+        return self.translation_cache_repository.get_statistics()
@@ -1,11 +1,17 @@
+import asyncio
+import itertools
 import multiprocessing
 import multiprocessing.connection
 import multiprocessing.synchronize
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from dataclasses import dataclass
 from multiprocessing.sharedctypes import Synchronized
-from typing import Generic, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar
 
 from core.logger.logger import Logger
+from domain.exceptions.worker_not_running_error import WorkerNotRunningError
 
 InputType = TypeVar("InputType")
 OutputType = TypeVar("OutputType")
@@ -13,6 +19,36 @@ ConfigType = TypeVar("ConfigType")
 SharedObjectType = TypeVar("SharedObjectType")
 
 
+@dataclass(frozen=True)
+class PartialResponse:
+    result: Any
+
+
+class ResponsePipe:
+    def __init__(
+        self,
+        pipe: multiprocessing.connection.Connection,
+        request_id: int,
+        cancelled_request_id: Optional[Synchronized] = None,  # type: ignore
+    ) -> None:
+        self._pipe = pipe
+        self._request_id = request_id
+        self._cancelled_request_id = cancelled_request_id
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled_request_id is not None and self._cancelled_request_id.value == self._request_id
+
+    def send(self, result: Any) -> None:
+        # Nobody waits for the result of a cancelled request any more
+        if not self.is_cancelled():
+            self._pipe.send((self._request_id, result))
+
+    def send_partial(self, result: Any) -> None:
+        # Partial results reach the request's callback while the request stays pending for its final result
+        if not self.is_cancelled():
+            self._pipe.send((self._request_id, PartialResponse(result)))
+
+
 class BaseWorker(
     ABC,
     Generic[
@@ -32,8 +68,33 @@ class BaseWorker(
         self._process: Optional[multiprocessing.Process] = None
         self._is_processing: Synchronized = multiprocessing.Value("b", False)  # type: ignore
         self._processing_lock: multiprocessing.synchronize.Lock = multiprocessing.Lock()
+        self._cancelled_request_id: Synchronized = multiprocessing.Value("q", -1)  # type: ignore
         self._pipe_parent, self._pipe_child = multiprocessing.Pipe()
         self._stop_event = multiprocessing.Event()
+        self._request_ids = itertools.count()
+        self._pending_requests: Dict[int, Future[Any]] = {}
+        self._partial_callbacks: Dict[int, Callable[[Any], None]] = {}
+        self._pending_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._router_thread: Optional[threading.Thread] = None
+        self._router_stop_event = threading.Event()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+
+        for key in (
+            "_process",
+            "_request_ids",
+            "_pending_requests",
+            "_partial_callbacks",
+            "_pending_lock",
+            "_send_lock",
+            "_router_thread",
+            "_router_stop_event",
+        ):
+            state.pop(key, None)
+
+        return state
 
     @abstractmethod
     def initialize_shared_object(
@@ -49,7 +110,7 @@ class BaseWorker(
         args: InputType,
         shared_object: SharedObjectType,
         config: ConfigType,
-        pipe: multiprocessing.connection.Connection,
+        pipe: ResponsePipe,
         is_processing: Synchronized,  # type: ignore
         processing_lock: multiprocessing.synchronize.Lock,
     ) -> None:
@@ -74,18 +135,167 @@ class BaseWorker(
 
             while not stop_event.is_set():
                 if pipe.poll(timeout=1):
-                    command, args = pipe.recv()
-                    self._logger.debug(f"{self.get_worker_name()} received command: {command} with args: {args}")
-                    self.handle_command(command, args, shared_object, config, pipe, is_processing, processing_lock)
-                    self._logger.debug(f"{self.get_worker_name()} command: {command} processed")
+                    request_id, command, args = pipe.recv()
+
+                    if self._cancelled_request_id.value == request_id:
+                        self._logger.debug(f"{self.get_worker_name()} skipped cancelled request {request_id}")
+                        continue
+
+                    self._logger.debug(
+                        f"{self.get_worker_name()} received request {request_id} command: {command} with args: {args}",
+                    )
+                    self.handle_command(
+                        command,
+                        args,
+                        shared_object,
+                        config,
+                        ResponsePipe(pipe, request_id, self._cancelled_request_id),
+                        is_processing,
+                        processing_lock,
+                    )
+                    self._logger.debug(f"{self.get_worker_name()} request {request_id} command: {command} processed")
 
         finally:
             del shared_object
             pipe.close()
             self._logger.info(f"{self.get_worker_name()} stopped with PID: {multiprocessing.current_process().pid}")
 
+    def _fail_pending_requests(self) -> None:
+        with self._pending_lock:
+            pending_requests = list(self._pending_requests.values())
+            self._pending_requests.clear()
+            self._partial_callbacks.clear()
+
+        for future in pending_requests:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(WorkerNotRunningError())
+
+    def _deliver_response(
+        self,
+        request_id: int,
+        result: Any,
+    ) -> None:
+        if isinstance(result, PartialResponse):
+            with self._pending_lock:
+                on_partial = self._partial_callbacks.get(request_id)
+
+            if on_partial is not None:
+                on_partial(result.result)
+
+            return
+
+        with self._pending_lock:
+            future = self._pending_requests.pop(request_id, None)
+            self._partial_callbacks.pop(request_id, None)
+
+        if future is None:
+            self._logger.warning(f"{self.get_worker_name()} received response for unknown request {request_id}")
+        elif not future.set_running_or_notify_cancel():
+            # The caller cancelled the request while its result was on the way
+            return
+        elif isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+    def _route_responses(self) -> None:
+        while not self._router_stop_event.is_set():
+            try:
+                if not self._pipe_parent.poll(timeout=0.1):
+                    if not self.is_alive():
+                        break
+
+                    continue
+
+                request_id, result = self._pipe_parent.recv()
+
+            except (EOFError, OSError):
+                break
+
+            self._deliver_response(request_id, result)
+
+        self._fail_pending_requests()
+
+    def _send_request(
+        self,
+        command: str,
+        args: InputType,
+        on_partial: Optional[Callable[[Any], None]] = None,
+    ) -> Tuple[int, "Future[Any]"]:
+        if not self.is_alive():
+            raise WorkerNotRunningError()
+
+        future: Future[Any] = Future()
+
+        with self._pending_lock:
+            request_id = next(self._request_ids)
+            self._pending_requests[request_id] = future
+
+            if on_partial is not None:
+                self._partial_callbacks[request_id] = on_partial
+
+        with self._send_lock:
+            self._pipe_parent.send((request_id, command, args))
+
+        return request_id, future
+
+    def _cancel_request(
+        self,
+        request_id: int,
+    ) -> None:
+        with self._pending_lock:
+            future = self._pending_requests.pop(request_id, None)
+            self._partial_callbacks.pop(request_id, None)
+
+        if future is None:
+            return
+
+        # The process skips the request if it has not started it yet, and stops sending its results otherwise
+        self._cancelled_request_id.value = request_id
+        future.cancel()
+        self._logger.debug(f"{self.get_worker_name()} cancelled request {request_id}")
+
+    @staticmethod
+    def _call_on_loop(callback: Callable[[Any], None]) -> Callable[[Any], None]:
+        loop = asyncio.get_running_loop()
+
+        # Partials are scheduled on the loop before the final result, so callers see them in order
+        def call_soon(result: Any) -> None:
+            loop.call_soon_threadsafe(callback, result)
+
+        return call_soon
+
+    async def _execute(
+        self,
+        command: str,
+        args: InputType,
+        on_partial: Optional[Callable[[Any], None]] = None,
+    ) -> Any:
+        request_id, future = self._send_request(
+            command,
+            args,
+            None if on_partial is None else self._call_on_loop(on_partial),
+        )
+
+        try:
+            return await asyncio.wrap_future(future)
+
+        except asyncio.CancelledError:
+            self._cancel_request(request_id)
+            raise
+
+    def _stop_router(self) -> None:
+        self._router_stop_event.set()
+
+        if self._router_thread:
+            self._router_thread.join()
+            self._router_thread = None
+
+        self._router_stop_event.clear()
+
     def start(self) -> None:
         if self._process is None or not self._process.is_alive():
+            self._stop_router()
             self._stop_event.clear()
             self._process = multiprocessing.Process(
                 target=self._run_process,
@@ -98,6 +308,8 @@ class BaseWorker(
                 ),
             )
             self._process.start()
+            self._router_thread = threading.Thread(target=self._route_responses, daemon=True)
+            self._router_thread.start()
 
     def stop(self) -> None:
         if self._process and self._process.is_alive():
@@ -109,8 +321,11 @@ class BaseWorker(
 
             self._process = None
 
+        self._stop_router()
+        self._fail_pending_requests()
+
     def is_alive(self) -> bool:
         return self._process is not None and self._process.is_alive()
 
     def is_processing(self) -> bool:
-        return bool(self._is_processing.value)
+        return bool(self._is_processing.value) or bool(self._pending_requests)
@@ -0,0 +1,212 @@
+from dataclasses import dataclass, replace
+from typing import Any, Collection, Dict, List, Literal, Optional, Tuple
+
+import numpy as np
+
+from domain.models.transcription_result_model import (
+    SegmentModel,
+    TranscriptionResultModel,
+)
+
+SEGMENT_COLUMN_TYPES: Dict[str, Any] = {
+    "id": np.int32,
+    "seek": np.int32,
+    "start": np.float64,
+    "end": np.float64,
+    "temperature": np.float64,
+    "avg_logprob": np.float64,
+    "compression_ratio": np.float64,
+    "no_speech_prob": np.float64,
+}
+REQUIRED_SEGMENT_FIELDS = frozenset({"start", "end", "text"})
+# Whisper counts seek positions in mel frames of 10ms
+SEEK_FRAMES_PER_SECOND = 100
+
+
+@dataclass(frozen=True)
+class CompactTranscriptionResult:
+    text: str
+    segment_text: str
+    segment_text_offsets: np.ndarray
+    columns: Dict[str, np.ndarray]
+    tokens: Optional[np.ndarray] = None
+    token_offsets: Optional[np.ndarray] = None
+
+    @property
+    def segment_count(self) -> int:
+        return len(self.segment_text_offsets) - 1
+
+    @staticmethod
+    def _concatenate_offsets(offsets: List[np.ndarray]) -> np.ndarray:
+        bases = np.cumsum([0] + [int(offset[-1]) for offset in offsets[:-1]])
+
+        return np.concatenate(
+            [np.zeros(1, dtype=np.int64)] + [offset[1:] + base for offset, base in zip(offsets, bases)]
+        )
+
+    @staticmethod
+    def _offsets(lengths: List[int]) -> np.ndarray:
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return offsets
+
+    @classmethod
+    def from_whisper_result(
+        cls,
+        result: Dict[str, Any],
+        segment_fields: Optional[Collection[str]] = None,
+    ) -> "CompactTranscriptionResult":
+        segments = result.get("segments", [])
+        fields = (
+            set(SEGMENT_COLUMN_TYPES) | {"tokens"}
+            if segment_fields is None
+            else set(segment_fields) | REQUIRED_SEGMENT_FIELDS
+        )
+        texts = [segment["text"] for segment in segments]
+        columns = {
+            name: np.fromiter((segment[name] for segment in segments), dtype=dtype, count=len(segments))
+            for name, dtype in SEGMENT_COLUMN_TYPES.items()
+            if name in fields
+        }
+        tokens = None
+        token_offsets = None
+
+        if "tokens" in fields:
+            token_lists = [segment["tokens"] for segment in segments]
+            tokens = np.fromiter(
+                (token for token_list in token_lists for token in token_list),
+                dtype=np.int32,
+            )
+            token_offsets = cls._offsets([len(token_list) for token_list in token_lists])
+
+        return cls(
+            text=result["text"],
+            segment_text="".join(texts),
+            segment_text_offsets=cls._offsets([len(text) for text in texts]),
+            columns=columns,
+            tokens=tokens,
+            token_offsets=token_offsets,
+        )
+
+    def shift(
+        self,
+        seconds: float,
+        first_id: int,
+    ) -> "CompactTranscriptionResult":
+        # Moves a result decoded from a chunk to its place in the whole file
+        columns = dict(self.columns)
+
+        for name in ("start", "end"):
+            if name in columns:
+                columns[name] = columns[name] + seconds
+
+        if "seek" in columns:
+            columns["seek"] = columns["seek"] + np.int32(round(seconds * SEEK_FRAMES_PER_SECOND))
+
+        if "id" in columns:
+            columns["id"] = np.arange(first_id, first_id + self.segment_count, dtype=np.int32)
+
+        return replace(self, columns=columns)
+
+    def remap_timestamps(
+        self,
+        source_starts: np.ndarray,
+        target_starts: np.ndarray,
+    ) -> "CompactTranscriptionResult":
+        # Moves times inside each source region, given by its start in seconds, to the same place in its target region
+        columns = dict(self.columns)
+        shifts = target_starts - source_starts
+
+        # An end on a region boundary stays in the region it closes
+        column_sides: List[Tuple[str, int, Literal["left", "right"]]] = [
+            ("start", 1, "right"),
+            ("end", 1, "left"),
+            ("seek", SEEK_FRAMES_PER_SECOND, "right"),
+        ]
+
+        for name, scale, side in column_sides:
+            if name not in columns:
+                continue
+
+            times = columns[name] / scale
+            regions = np.maximum(np.searchsorted(source_starts, times, side=side) - 1, 0)
+            remapped = (times + shifts[regions]) * scale
+
+            if np.issubdtype(columns[name].dtype, np.integer):
+                remapped = np.rint(remapped)
+
+            columns[name] = remapped.astype(columns[name].dtype)
+
+        return replace(self, columns=columns)
+
+    def skip_segments(
+        self,
+        count: int,
+    ) -> "CompactTranscriptionResult":
+        # Drops the first segments, for example ones already reported before a transcription was resumed
+        count = min(count, self.segment_count)
+        text_start = int(self.segment_text_offsets[count])
+        segment_text = self.segment_text[text_start:]
+        tokens = self.tokens
+        token_offsets = self.token_offsets
+
+        if tokens is not None and token_offsets is not None:
+            token_start = int(token_offsets[count])
+            tokens = tokens[token_start:]
+            token_offsets = token_offsets[count:] - token_start
+
+        return CompactTranscriptionResult(
+            text=segment_text,
+            segment_text=segment_text,
+            segment_text_offsets=self.segment_text_offsets[count:] - text_start,
+            columns={name: column[count:] for name, column in self.columns.items()},
+            tokens=tokens,
+            token_offsets=token_offsets,
+        )
+
+    @classmethod
+    def concatenate(
+        cls,
+        results: List["CompactTranscriptionResult"],
+    ) -> "CompactTranscriptionResult":
+        tokens = None
+        token_offsets = None
+        token_arrays = [result.tokens for result in results if result.tokens is not None]
+        token_offset_arrays = [result.token_offsets for result in results if result.token_offsets is not None]
+
+        if len(token_arrays) == len(token_offset_arrays) == len(results):
+            tokens = np.concatenate(token_arrays)
+            token_offsets = cls._concatenate_offsets(token_offset_arrays)
+
+        return cls(
+            text="".join(result.text for result in results),
+            segment_text="".join(result.segment_text for result in results),
+            segment_text_offsets=cls._concatenate_offsets([result.segment_text_offsets for result in results]),
+            columns={name: np.concatenate([result.columns[name] for result in results]) for name in results[0].columns},
+            tokens=tokens,
+            token_offsets=token_offsets,
+        )
+
+    def to_transcription_result_model(self) -> TranscriptionResultModel:
+        text_offsets = self.segment_text_offsets.tolist()
+        texts = [self.segment_text[begin:end] for begin, end in zip(text_offsets, text_offsets[1:])]
+        columns: Dict[str, List[Any]] = {name: column.tolist() for name, column in self.columns.items()}
+
+        if self.tokens is not None and self.token_offsets is not None:
+            flat_tokens = self.tokens.tolist()
+            token_offsets = self.token_offsets.tolist()
+            columns["tokens"] = [flat_tokens[begin:end] for begin, end in zip(token_offsets, token_offsets[1:])]
+
+        # Columns are typed by construction, so segments skip pydantic validation
+        segments = [
+            SegmentModel.model_construct(
+                text=text,
+                **{name: values[index] for name, values in columns.items()},
+            )
+            for index, text in enumerate(texts)
+        ]
+
+        return TranscriptionResultModel.model_construct(
+            text=self.text,
+            segments=segments,
+        )
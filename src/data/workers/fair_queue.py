@@ -0,0 +1,151 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Generic, List, Tuple, TypeVar
+
+from core.client_context.client_context import get_client_id
+
+ItemType = TypeVar("ItemType")
+
+# Requests without a cost estimate still count as one unit, so clients keep taking turns
+UNIT_COST = 1.0
+
+
+@dataclass
+class ClientQueue(Generic[ItemType]):
+    entries: List[Tuple[float, int, float, ItemType]] = field(default_factory=list)
+
+
+class FairQueue(Generic[ItemType]):
+    def __init__(
+        self,
+        weights: Dict[str, float],
+        aging: float = 0.0,
+    ) -> None:
+        self._weights = weights
+        self._aging = aging
+        self._clients: Dict[str, ClientQueue[ItemType]] = {}
+        self._finish_tags: Dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return sum(len(client.entries) for client in self._clients.values())
+
+    def push(
+        self,
+        item: ItemType,
+        client_id: str,
+        priority: float = 0.0,
+    ) -> None:
+        # Within a client lower priorities are served first. Every entry ages at the same rate, so shifting
+        # the priority by the enqueue time fixes the order, and the sequence keeps equal ranks first in, first out
+        rank = priority + self._aging * time.monotonic()
+        client = self._clients.setdefault(client_id, ClientQueue())
+        heapq.heappush(client.entries, (rank, next(self._sequence), max(priority, UNIT_COST), item))
+
+    def _start_tag(
+        self,
+        client_id: str,
+    ) -> float:
+        return max(self._virtual_time, self._finish_tags.get(client_id, 0.0))
+
+    def _finish_tag(
+        self,
+        client_id: str,
+    ) -> Tuple[float, int]:
+        _, sequence, cost, _ = self._clients[client_id].entries[0]
+
+        return self._start_tag(client_id) + cost / self._weights.get(client_id, 1.0), sequence
+
+    def _forget_idle_clients(self) -> None:
+        # Clients that are not ahead of the virtual clock have no credit worth remembering
+        for client_id in [key for key, tag in self._finish_tags.items() if tag <= self._virtual_time]:
+            if client_id not in self._clients:
+                del self._finish_tags[client_id]
+
+    def charge(
+        self,
+        client_id: str,
+        priority: float = 0.0,
+    ) -> None:
+        # Requests served without waiting still use up the share of their client
+        start_tag = self._start_tag(client_id)
+        self._finish_tags[client_id] = start_tag + max(priority, UNIT_COST) / self._weights.get(client_id, 1.0)
+        self._virtual_time = start_tag
+        self._forget_idle_clients()
+
+    def pop(self) -> ItemType:
+        # Self-clocked weighted fair queueing picks the client whose next request would finish first in
+        # virtual time, so each client receives service in proportion to its weight
+        client_id = min(self._clients, key=self._finish_tag)
+        client = self._clients[client_id]
+        start_tag = self._start_tag(client_id)
+        self._finish_tags[client_id], _ = self._finish_tag(client_id)
+        self._virtual_time = start_tag
+        _, _, _, item = heapq.heappop(client.entries)
+
+        if not client.entries:
+            del self._clients[client_id]
+
+        self._forget_idle_clients()
+
+        return item
+
+
+class FairSemaphore:
+    def __init__(
+        self,
+        capacity: int,
+        weights: Dict[str, float],
+    ) -> None:
+        self._available = capacity
+        self._waiters: FairQueue["asyncio.Future[None]"] = FairQueue(weights)
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.pop()
+
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self._available += 1
+
+    def charge(
+        self,
+        client_id: str,
+        priority: float,
+    ) -> None:
+        self._waiters.charge(client_id, priority)
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        priority: float = 0.0,
+    ) -> AsyncIterator[None]:
+        if self._available > 0 and not self._waiters:
+            self._available -= 1
+            self._waiters.charge(get_client_id(), priority)
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiters.push(future, get_client_id(), priority)
+
+            try:
+                await future
+
+            except asyncio.CancelledError:
+                # A slot handed over just before the cancellation is passed on to the next waiter
+                if future.done() and not future.cancelled():
+                    self._release()
+
+                raise
+
+        try:
+            yield
+
+        finally:
+            self._release()
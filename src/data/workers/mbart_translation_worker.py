@@ -1,14 +1,13 @@
 import multiprocessing
-import multiprocessing.connection
 import multiprocessing.synchronize
 from dataclasses import dataclass
 from multiprocessing.sharedctypes import Synchronized
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 
-from data.workers.base_worker import BaseWorker
-from domain.exceptions.worker_not_running_error import WorkerNotRunningError
+from data.workers.base_worker import BaseWorker, ResponsePipe
+from data.workers.translation_batcher import join_generated_sequences
 
 
 @dataclass
@@ -21,39 +20,30 @@ class MBartTranslationConfig:
 
 class MBartTranslationWorker(
     BaseWorker[  # type: ignore
-        Tuple[str, str, str, Dict[str, Any]],
-        str,
+        Tuple[List[str], str, str, Dict[str, Any]],
+        List[str],
         MBartTranslationConfig,
         Tuple[AutoModelForSeq2SeqLM, AutoTokenizer],
     ],
 ):
-    def translate(
+    async def translate_batch(
         self,
-        text: str,
+        texts: List[str],
         source_language: str,
         target_language: str,
         translation_parameters: Dict[str, Any],
-    ) -> str:
-        if not self.is_alive():
-            raise WorkerNotRunningError()
-
-        self._pipe_parent.send(
+    ) -> List[str]:
+        result = await self._execute(
+            "translate_batch",
             (
-                "translate",
-                (
-                    text,
-                    source_language,
-                    target_language,
-                    translation_parameters,
-                ),
+                texts,
+                source_language,
+                target_language,
+                translation_parameters,
             ),
         )
-        result = self._pipe_parent.recv()
-
-        if isinstance(result, Exception):
-            raise result
 
-        return str(result)
+        return [str(translation) for translation in result]
 
     def initialize_shared_object(
         self,
@@ -72,23 +62,23 @@ class MBartTranslationWorker(
     def handle_command(
         self,
         command: str,
-        args: Tuple[str, str, str, Dict[str, Any]],
+        args: Tuple[List[str], str, str, Dict[str, Any]],
         shared_object: Tuple[AutoModelForSeq2SeqLM, AutoTokenizer],
         config: MBartTranslationConfig,
-        pipe: multiprocessing.connection.Connection,
+        pipe: ResponsePipe,
         is_processing: Synchronized,  # type: ignore
         processing_lock: multiprocessing.synchronize.Lock,
     ) -> None:
-        if command == "translate":
+        if command == "translate_batch":
             try:
                 with processing_lock:
                     is_processing.value = True
 
-                text, source_language, target_language, translation_parameters = args
+                texts, source_language, target_language, translation_parameters = args
                 model, tokenizer = shared_object
 
                 tokenizer.src_lang = source_language
-                inputs = tokenizer(text, return_tensors="pt")
+                inputs = tokenizer(texts, return_tensors="pt", padding=True)
                 inputs = {key: tensor.to(config.device) for key, tensor in inputs.items()}
 
                 if "forced_bos_token_id" not in translation_parameters:
@@ -96,9 +86,9 @@ class MBartTranslationWorker(
 
                 translation = model.generate(**inputs, **translation_parameters)
 
-                output = [tokenizer.decode(t, skip_special_tokens=True) for t in translation]
+                output = tokenizer.batch_decode(translation, skip_special_tokens=True)
 
-                pipe.send("".join(output))
+                pipe.send(join_generated_sequences(output, len(texts)))
 
             except Exception as e:
                 pipe.send(e)
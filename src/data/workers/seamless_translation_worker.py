@@ -1,14 +1,13 @@
 import multiprocessing
-import multiprocessing.connection
 import multiprocessing.synchronize
 from dataclasses import dataclass
 from multiprocessing.sharedctypes import Synchronized
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 from transformers import AutoProcessor, SeamlessM4Tv2ForTextToText
 
-from data.workers.base_worker import BaseWorker
-from domain.exceptions.worker_not_running_error import WorkerNotRunningError
+from data.workers.base_worker import BaseWorker, ResponsePipe
+from data.workers.translation_batcher import join_generated_sequences
 
 
 @dataclass
@@ -21,39 +20,30 @@ class SeamlessTranslationConfig:
 
 class SeamlessTranslationWorker(
     BaseWorker[  # type: ignore
-        Tuple[str, str, str, Dict[str, Any]],
-        str,
+        Tuple[List[str], str, str, Dict[str, Any]],
+        List[str],
         SeamlessTranslationConfig,
         Tuple[SeamlessM4Tv2ForTextToText, AutoProcessor],
     ],
 ):
-    def translate(
+    async def translate_batch(
         self,
-        text: str,
+        texts: List[str],
         source_language: str,
         target_language: str,
         translation_parameters: Dict[str, Any],
-    ) -> str:
-        if not self.is_alive():
-            raise WorkerNotRunningError()
-
-        self._pipe_parent.send(
+    ) -> List[str]:
+        result = await self._execute(
+            "translate_batch",
             (
-                "translate",
-                (
-                    text,
-                    source_language,
-                    target_language,
-                    translation_parameters,
-                ),
+                texts,
+                source_language,
+                target_language,
+                translation_parameters,
             ),
         )
-        result = self._pipe_parent.recv()
-
-        if isinstance(result, Exception):
-            raise result
 
-        return str(result)
+        return [str(translation) for translation in result]
 
     def initialize_shared_object(
         self,
@@ -72,23 +62,23 @@ class SeamlessTranslationWorker(
     def handle_command(
         self,
         command: str,
-        args: Tuple[str, str, str, Dict[str, Any]],
+        args: Tuple[List[str], str, str, Dict[str, Any]],
         shared_object: Tuple[SeamlessM4Tv2ForTextToText, AutoProcessor],
         config: SeamlessTranslationConfig,
-        pipe: multiprocessing.connection.Connection,
+        pipe: ResponsePipe,
         is_processing: Synchronized,  # type: ignore
         processing_lock: multiprocessing.synchronize.Lock,
     ) -> None:
-        if command == "translate":
+        if command == "translate_batch":
             try:
                 with processing_lock:
                     is_processing.value = True
 
-                text, source_language, target_language, translation_parameters = args
+                texts, source_language, target_language, translation_parameters = args
                 model, processor = shared_object
 
                 input_tokens = processor(
-                    text,
+                    text=texts,
                     src_lang=source_language,
                     return_tensors="pt",
                     padding=True,
@@ -98,14 +88,14 @@ class SeamlessTranslationWorker(
                     **input_tokens,
                     tgt_lang=target_language,
                     **translation_parameters,
-                )[0].tolist()
+                )
 
-                text_output = processor.decode(
+                text_output = processor.batch_decode(
                     output_tokens,
                     skip_special_tokens=True,
                 )
 
-                pipe.send("".join(text_output))
+                pipe.send(join_generated_sequences(text_output, len(texts)))
 
             except Exception as e:
                 pipe.send(e)
@@ -0,0 +1,136 @@
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from core.audio.audio_decoder import SharedAudioDescriptor
+from core.client_context.client_context import get_client_id
+from core.logger.logger import Logger
+from data.workers.compact_transcription_result import CompactTranscriptionResult
+
+BatchKey = Tuple[str, str, Optional[Tuple[str, ...]]]
+TranscribeBatch = Callable[
+    [List[SharedAudioDescriptor], str, Dict[str, Any], Optional[FrozenSet[str]], List[str]],
+    Awaitable[List[Optional[CompactTranscriptionResult]]],
+]
+
+
+@dataclass
+class PendingTranscriptionBatch:
+    language: str
+    transcription_parameters: Dict[str, Any]
+    segment_fields: Optional[FrozenSet[str]]
+    audios: List[SharedAudioDescriptor] = field(default_factory=list)
+    futures: List["asyncio.Future[CompactTranscriptionResult]"] = field(default_factory=list)
+    client_ids: List[str] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class TranscriptionBatcher:
+    def __init__(
+        self,
+        transcribe_batch: TranscribeBatch,
+        batch_window: float,
+        max_batch_size: int,
+        logger: Logger,
+    ) -> None:
+        self._transcribe_batch = transcribe_batch
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._logger = logger
+        self._pending_batches: Dict[BatchKey, PendingTranscriptionBatch] = {}
+        self._running_batches: Set["asyncio.Task[None]"] = set()
+
+    @staticmethod
+    def _batch_key(
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[FrozenSet[str]],
+    ) -> BatchKey:
+        return (
+            language,
+            json.dumps(transcription_parameters, sort_keys=True, default=str),
+            None if segment_fields is None else tuple(sorted(segment_fields)),
+        )
+
+    def _dispatch(
+        self,
+        key: BatchKey,
+        batch: PendingTranscriptionBatch,
+    ) -> None:
+        if self._pending_batches.get(key) is batch:
+            del self._pending_batches[key]
+
+        if batch.timer:
+            batch.timer.cancel()
+
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._running_batches.add(task)
+        task.add_done_callback(self._running_batches.discard)
+
+    async def _run_batch(
+        self,
+        batch: PendingTranscriptionBatch,
+    ) -> None:
+        requests = [
+            (audio, client_id, future)
+            for audio, client_id, future in zip(batch.audios, batch.client_ids, batch.futures)
+            if not future.done()
+        ]
+
+        if not requests:
+            return
+
+        self._logger.debug(f"Transcribing batch of {len(requests)} clips, language: {batch.language}")
+
+        try:
+            results = await self._transcribe_batch(
+                [audio for audio, _, _ in requests],
+                batch.language,
+                batch.transcription_parameters,
+                batch.segment_fields,
+                [client_id for _, client_id, _ in requests],
+            )
+
+        except Exception as e:
+            for _, _, future in requests:
+                if not future.done():
+                    future.set_exception(e)
+
+            return
+
+        for (_, _, future), result in zip(requests, results):
+            if future.done():
+                continue
+
+            # Only audio released by a cancelled request is missing from the results
+            if result is None:
+                future.cancel()
+            else:
+                future.set_result(result)
+
+    async def transcribe(
+        self,
+        audio: SharedAudioDescriptor,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[FrozenSet[str]],
+    ) -> CompactTranscriptionResult:
+        loop = asyncio.get_running_loop()
+        key = self._batch_key(language, transcription_parameters, segment_fields)
+        batch = self._pending_batches.get(key)
+
+        if batch is None:
+            batch = PendingTranscriptionBatch(language, dict(transcription_parameters), segment_fields)
+            batch.timer = loop.call_later(self._batch_window, self._dispatch, key, batch)
+            self._pending_batches[key] = batch
+
+        future: asyncio.Future[CompactTranscriptionResult] = loop.create_future()
+        batch.audios.append(audio)
+        batch.futures.append(future)
+        batch.client_ids.append(get_client_id())
+
+        if len(batch.audios) >= self._max_batch_size:
+            self._dispatch(key, batch)
+
+        return await future
@@ -0,0 +1,80 @@
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from data.workers.compact_transcription_result import SEEK_FRAMES_PER_SECOND
+
+
+@dataclass(frozen=True)
+class TranscriptionCheckpoint:
+    decoded_seconds: float
+    segments: List[Dict[str, Any]]
+
+    @property
+    def text(self) -> str:
+        return "".join(segment["text"] for segment in self.segments)
+
+    def to_whisper_result(self) -> Dict[str, Any]:
+        return {"text": self.text, "segments": self.segments}
+
+
+def save_checkpoint(
+    path: str,
+    checkpoint: TranscriptionCheckpoint,
+) -> None:
+    # Written next to the target and renamed over it, so a crash while saving keeps the previous checkpoint
+    temporary_path = f"{path}.tmp"
+
+    with open(temporary_path, "w", encoding="utf-8") as file:
+        json.dump({"decoded_seconds": checkpoint.decoded_seconds, "segments": checkpoint.segments}, file)
+
+    os.replace(temporary_path, path)
+
+
+def load_checkpoint(path: str) -> Optional[TranscriptionCheckpoint]:
+    try:
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+
+    except FileNotFoundError:
+        return None
+
+    return TranscriptionCheckpoint(data["decoded_seconds"], data["segments"])
+
+
+def delete_checkpoint(path: str) -> None:
+    for checkpoint_path in (path, f"{path}.tmp"):
+        try:
+            os.remove(checkpoint_path)
+
+        except FileNotFoundError:
+            pass
+
+
+class TranscriptionCheckpointWriter:
+    def __init__(
+        self,
+        path: str,
+        interval_seconds: float,
+    ) -> None:
+        self._path = path
+        self._interval_seconds = interval_seconds
+        self._segments: List[Dict[str, Any]] = []
+        self._saved_at = time.monotonic()
+
+    def on_window(
+        self,
+        segments: List[Dict[str, Any]],
+        decoded_frames: int,
+    ) -> None:
+        self._segments.extend(segments)
+        now = time.monotonic()
+
+        if now - self._saved_at < self._interval_seconds:
+            return
+
+        # Windows end on the seek position, so every saved segment lies before the decoded position
+        save_checkpoint(self._path, TranscriptionCheckpoint(decoded_frames / SEEK_FRAMES_PER_SECOND, self._segments))
+        self._saved_at = now
@@ -0,0 +1,58 @@
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+COST_SMOOTHING = 0.2
+DEFAULT_COST_RATIO = 1.0
+# Prompts differ between stream windows and file blocks but barely change the cost of decoding
+IGNORED_PARAMETERS = frozenset({"initial_prompt"})
+
+CostKey = Tuple[str, str]
+
+
+class TranscriptionCostModel:
+    def __init__(
+        self,
+        model_type: str,
+    ) -> None:
+        self._model_type = model_type
+        self._lock = threading.Lock()
+        self._ratios: Dict[CostKey, float] = {}
+        self._overall_ratio: Optional[float] = None
+
+    def _cost_key(
+        self,
+        transcription_parameters: Dict[str, Any],
+    ) -> CostKey:
+        parameters = {name: value for name, value in transcription_parameters.items() if name not in IGNORED_PARAMETERS}
+
+        return (self._model_type, json.dumps(parameters, sort_keys=True, default=str))
+
+    def estimate(
+        self,
+        audio_duration: float,
+        transcription_parameters: Dict[str, Any],
+    ) -> float:
+        with self._lock:
+            # Unseen parameters fall back to the ratio learned across all requests
+            ratio = self._ratios.get(self._cost_key(transcription_parameters), self._overall_ratio)
+
+        return audio_duration * (DEFAULT_COST_RATIO if ratio is None else ratio)
+
+    def observe(
+        self,
+        audio_duration: float,
+        transcription_parameters: Dict[str, Any],
+        compute_seconds: float,
+    ) -> None:
+        if audio_duration <= 0:
+            return
+
+        ratio = compute_seconds / audio_duration
+        key = self._cost_key(transcription_parameters)
+
+        with self._lock:
+            previous = self._ratios.get(key)
+            self._ratios[key] = ratio if previous is None else previous + COST_SMOOTHING * (ratio - previous)
+            overall = self._overall_ratio
+            self._overall_ratio = ratio if overall is None else overall + COST_SMOOTHING * (ratio - overall)
@@ -0,0 +1,176 @@
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from core.client_context.client_context import get_client_id
+from core.logger.logger import Logger
+
+BatchKey = Tuple[str, str, str]
+# Receives the texts, their languages and parameters, and the client that sent each text
+TranslateBatch = Callable[[List[str], str, str, Dict[str, Any], List[str]], Awaitable[List[str]]]
+
+
+def estimate_tokens(text: str) -> int:
+    # The tokenizer lives in the worker process, so budgets use a rough characters per token ratio
+    return len(text) // 4 + 1
+
+
+def create_length_buckets(
+    texts: List[str],
+    max_batch_size: int,
+    max_batch_tokens: int,
+) -> List[List[int]]:
+    buckets: List[List[int]] = []
+    bucket_tokens = 0
+
+    # Sorting by length keeps similar texts together so padded batches waste little compute
+    for index in sorted(range(len(texts)), key=lambda index: len(texts[index])):
+        tokens = estimate_tokens(texts[index])
+
+        if not buckets or len(buckets[-1]) >= max_batch_size or bucket_tokens + tokens > max_batch_tokens:
+            buckets.append([])
+            bucket_tokens = 0
+
+        buckets[-1].append(index)
+        bucket_tokens += tokens
+
+    return buckets
+
+
+def join_generated_sequences(
+    sequences: List[str],
+    batch_size: int,
+) -> List[str]:
+    # generate returns num_return_sequences rows per input, which are joined like the single text translation did
+    sequences_per_input = max(1, len(sequences) // batch_size)
+    offsets = range(0, batch_size * sequences_per_input, sequences_per_input)
+
+    return ["".join(sequences[offset:][:sequences_per_input]) for offset in offsets]
+
+
+@dataclass
+class PendingBatch:
+    source_language: str
+    target_language: str
+    translation_parameters: Dict[str, Any]
+    texts: List[str] = field(default_factory=list)
+    client_ids: List[str] = field(default_factory=list)
+    futures: List["asyncio.Future[str]"] = field(default_factory=list)
+    tokens: int = 0
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class TranslationBatcher:
+    def __init__(
+        self,
+        translate_batch: TranslateBatch,
+        batch_window: float,
+        max_batch_size: int,
+        max_batch_tokens: int,
+        logger: Logger,
+    ) -> None:
+        self._translate_batch = translate_batch
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._max_batch_tokens = max_batch_tokens
+        self._logger = logger
+        self._pending_batches: Dict[BatchKey, PendingBatch] = {}
+        self._running_batches: Set["asyncio.Task[None]"] = set()
+
+    @staticmethod
+    def _batch_key(
+        source_language: str,
+        target_language: str,
+        translation_parameters: Dict[str, Any],
+    ) -> BatchKey:
+        return (
+            source_language,
+            target_language,
+            json.dumps(translation_parameters, sort_keys=True, default=str),
+        )
+
+    def _dispatch(
+        self,
+        key: BatchKey,
+        batch: PendingBatch,
+    ) -> None:
+        if self._pending_batches.get(key) is batch:
+            del self._pending_batches[key]
+
+        if batch.timer:
+            batch.timer.cancel()
+
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._running_batches.add(task)
+        task.add_done_callback(self._running_batches.discard)
+
+    async def _run_batch(
+        self,
+        batch: PendingBatch,
+    ) -> None:
+        requests = [
+            (text, client_id, future)
+            for text, client_id, future in zip(batch.texts, batch.client_ids, batch.futures)
+            if not future.done()
+        ]
+
+        if not requests:
+            return
+
+        self._logger.debug(
+            f"Translating batch of {len(requests)} texts "
+            f"from source_language: {batch.source_language}, target_language: {batch.target_language}",
+        )
+
+        try:
+            results = await self._translate_batch(
+                [text for text, _, _ in requests],
+                batch.source_language,
+                batch.target_language,
+                batch.translation_parameters,
+                [client_id for _, client_id, _ in requests],
+            )
+
+        except Exception as e:
+            for _, _, future in requests:
+                if not future.done():
+                    future.set_exception(e)
+
+            return
+
+        for (_, _, future), result in zip(requests, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def translate(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str,
+        translation_parameters: Dict[str, Any],
+    ) -> str:
+        loop = asyncio.get_running_loop()
+        key = self._batch_key(source_language, target_language, translation_parameters)
+        tokens = estimate_tokens(text)
+        batch = self._pending_batches.get(key)
+
+        if batch is not None and batch.tokens + tokens > self._max_batch_tokens:
+            self._dispatch(key, batch)
+            batch = None
+
+        if batch is None:
+            batch = PendingBatch(source_language, target_language, dict(translation_parameters))
+            batch.timer = loop.call_later(self._batch_window, self._dispatch, key, batch)
+            self._pending_batches[key] = batch
+
+        future: asyncio.Future[str] = loop.create_future()
+        batch.texts.append(text)
+        batch.client_ids.append(get_client_id())
+        batch.futures.append(future)
+        batch.tokens += tokens
+
+        if len(batch.texts) >= self._max_batch_size:
+            self._dispatch(key, batch)
+
+        return await future
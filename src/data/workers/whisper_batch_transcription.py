@@ -0,0 +1,214 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import torch
+import whisper
+from whisper.audio import HOP_LENGTH, N_FRAMES, N_SAMPLES, SAMPLE_RATE
+from whisper.decoding import DecodingOptions, DecodingResult
+from whisper.tokenizer import Tokenizer, get_tokenizer
+
+# Clips that fit in one 30 second window can share encoder and decoder passes
+BATCH_MAX_SAMPLES = N_SAMPLES
+# Parameters of whisper.transcribe that keep their meaning when single window clips are decoded together
+BATCH_TRANSCRIPTION_PARAMETERS = frozenset(
+    {
+        "language",
+        "task",
+        "fp16",
+        "temperature",
+        "compression_ratio_threshold",
+        "logprob_threshold",
+        "no_speech_threshold",
+        "condition_on_previous_text",
+        "initial_prompt",
+        "beam_size",
+        "best_of",
+        "patience",
+        "length_penalty",
+        "suppress_tokens",
+        "suppress_blank",
+    },
+)
+DEFAULT_TEMPERATURES = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+DEFAULT_COMPRESSION_RATIO_THRESHOLD = 2.4
+DEFAULT_LOGPROB_THRESHOLD = -1.0
+DEFAULT_NO_SPEECH_THRESHOLD = 0.6
+
+SegmentSpan = Tuple[float, float, List[int]]
+
+
+def create_window_mel(
+    model: whisper.Whisper,
+    audio: np.ndarray,
+) -> Tuple[torch.Tensor, float]:
+    # Padded like whisper.transcribe pads its windows, so a clip decodes the same alone and in a batch
+    mel = whisper.log_mel_spectrogram(audio, model.dims.n_mels, padding=N_SAMPLES)
+    content_frames = min(mel.shape[-1] - N_FRAMES, N_FRAMES)
+
+    return whisper.pad_or_trim(mel[:, :content_frames], N_FRAMES), content_frames * HOP_LENGTH / SAMPLE_RATE
+
+
+def split_timestamped_segments(
+    tokens: List[int],
+    timestamp_begin: int,
+    duration: float,
+    time_precision: float,
+) -> List[SegmentSpan]:
+    # Same rules as whisper.transcribe uses for the tokens of a single window
+    timestamps = [token >= timestamp_begin for token in tokens]
+    slices = [index + 1 for index in range(len(tokens) - 1) if timestamps[index] and timestamps[index + 1]]
+
+    if not slices:
+        timestamp_tokens = [token for token in tokens if token >= timestamp_begin]
+
+        if timestamp_tokens and timestamp_tokens[-1] != timestamp_begin:
+            duration = (timestamp_tokens[-1] - timestamp_begin) * time_precision
+
+        return [(0.0, duration, tokens)]
+
+    if timestamps[-2:] == [False, True]:
+        slices.append(len(tokens))
+
+    spans: List[SegmentSpan] = []
+
+    for begin, end in zip([0] + slices, slices):
+        sliced_tokens = tokens[begin:end]
+        spans.append(
+            (
+                (sliced_tokens[0] - timestamp_begin) * time_precision,
+                (sliced_tokens[-1] - timestamp_begin) * time_precision,
+                sliced_tokens,
+            ),
+        )
+
+    return spans
+
+
+def _needs_fallback(
+    result: DecodingResult,
+    compression_ratio_threshold: Optional[float],
+    logprob_threshold: Optional[float],
+    no_speech_threshold: Optional[float],
+) -> bool:
+    if no_speech_threshold is not None and result.no_speech_prob > no_speech_threshold:
+        return False
+
+    return (compression_ratio_threshold is not None and result.compression_ratio > compression_ratio_threshold) or (
+        logprob_threshold is not None and result.avg_logprob < logprob_threshold
+    )
+
+
+def _is_silent(
+    result: DecodingResult,
+    logprob_threshold: Optional[float],
+    no_speech_threshold: Optional[float],
+) -> bool:
+    if no_speech_threshold is None or result.no_speech_prob <= no_speech_threshold:
+        return False
+
+    return logprob_threshold is None or result.avg_logprob <= logprob_threshold
+
+
+def _create_result(
+    result: DecodingResult,
+    tokenizer: Tokenizer,
+    duration: float,
+    time_precision: float,
+    silent: bool,
+) -> Dict[str, Any]:
+    spans = (
+        [] if silent else split_timestamped_segments(result.tokens, tokenizer.timestamp_begin, duration, time_precision)
+    )
+    segments = []
+
+    for index, (start, end, tokens) in enumerate(spans):
+        text = tokenizer.decode([token for token in tokens if token < tokenizer.eot])
+        # Instantaneous or empty segments are kept without text, as whisper.transcribe does
+        empty = start == end or not text.strip()
+        segments.append(
+            {
+                "id": index,
+                "seek": 0,
+                "start": start,
+                "end": end,
+                "text": "" if empty else text,
+                "tokens": [] if empty else tokens,
+                "temperature": result.temperature,
+                "avg_logprob": result.avg_logprob,
+                "compression_ratio": result.compression_ratio,
+                "no_speech_prob": result.no_speech_prob,
+            },
+        )
+
+    return {
+        "text": tokenizer.decode([token for segment in segments for token in segment["tokens"]]),
+        "segments": segments,
+    }
+
+
+def transcribe_batch(
+    model: whisper.Whisper,
+    audios: List[np.ndarray],
+    transcription_parameters: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    decode_options = dict(transcription_parameters)
+    temperature = decode_options.pop("temperature", DEFAULT_TEMPERATURES)
+    temperatures = [temperature] if isinstance(temperature, (int, float)) else list(temperature)
+    compression_ratio_threshold = decode_options.pop("compression_ratio_threshold", DEFAULT_COMPRESSION_RATIO_THRESHOLD)
+    logprob_threshold = decode_options.pop("logprob_threshold", DEFAULT_LOGPROB_THRESHOLD)
+    no_speech_threshold = decode_options.pop("no_speech_threshold", DEFAULT_NO_SPEECH_THRESHOLD)
+    initial_prompt = decode_options.pop("initial_prompt", None)
+    decode_options.pop("condition_on_previous_text", None)
+
+    dtype = torch.float16 if decode_options.get("fp16", True) and model.device.type != "cpu" else torch.float32
+    decode_options["fp16"] = dtype == torch.float16
+    tokenizer = get_tokenizer(
+        model.is_multilingual,
+        num_languages=model.num_languages,
+        language=decode_options["language"],
+        task=decode_options.get("task", "transcribe"),
+    )
+
+    if initial_prompt:
+        decode_options["prompt"] = tokenizer.encode(" " + initial_prompt.strip())
+
+    windows = [create_window_mel(model, audio) for audio in audios]
+    mel = torch.stack([window_mel for window_mel, _ in windows]).to(model.device).to(dtype)
+    time_precision = N_FRAMES // model.dims.n_audio_ctx * HOP_LENGTH / SAMPLE_RATE
+    results: List[Optional[DecodingResult]] = [None] * len(audios)
+    pending = list(range(len(audios)))
+
+    # Clips that fail the quality checks are decoded again at the next temperature, still together
+    for current_temperature in temperatures:
+        options = {**decode_options}
+
+        if current_temperature > 0:
+            options.pop("beam_size", None)
+            options.pop("patience", None)
+        else:
+            options.pop("best_of", None)
+
+        decoded = model.decode(mel[pending], DecodingOptions(**options, temperature=current_temperature))
+
+        for index, result in zip(pending, decoded):
+            results[index] = result
+
+        pending = [
+            index
+            for index in pending
+            if _needs_fallback(results[index], compression_ratio_threshold, logprob_threshold, no_speech_threshold)
+        ]
+
+        if not pending:
+            break
+
+    return [
+        _create_result(
+            result,
+            tokenizer,
+            duration,
+            time_precision,
+            _is_silent(result, logprob_threshold, no_speech_threshold),
+        )
+        for result, (_, duration) in zip(results, windows)
+    ]
@@ -0,0 +1,72 @@
+import importlib
+import sys
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List
+
+from domain.exceptions.unsupported_whisper_version_error import (
+    UnsupportedWhisperVersionError,
+)
+
+# The progress bar replacement reads whisper internals, which only this release is known to keep
+SUPPORTED_WHISPER_VERSION = "20240930"
+# Receives the segments of a decoded window and the number of mel frames decoded so far
+WindowCallback = Callable[[List[Dict[str, Any]], int], None]
+
+
+class SegmentProgress:
+    def __init__(
+        self,
+        on_window: WindowCallback,
+    ) -> None:
+        self._on_window = on_window
+        self._reported_segments = 0
+        self._decoded_frames = 0
+
+    def __enter__(self) -> "SegmentProgress":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def update(
+        self,
+        frames: int,
+    ) -> None:
+        # The pinned whisper release updates its progress bar once per decoded window,
+        # right after appending the window's segments to the all_segments list of the calling frame
+        caller_locals = sys._getframe(1).f_locals
+
+        if "all_segments" not in caller_locals:
+            raise UnsupportedWhisperVersionError(get_whisper_version())
+
+        segments: List[Dict[str, Any]] = caller_locals["all_segments"]
+        reported_segments, self._reported_segments = self._reported_segments, len(segments)
+        # Frames advance the bar by the window's seek increment, so their sum is the seek position
+        self._decoded_frames += frames
+        self._on_window(segments[reported_segments:], self._decoded_frames)
+
+
+def get_whisper_version() -> str:
+    version: str = importlib.import_module("whisper.version").__version__
+    return version
+
+
+@contextmanager
+def report_decoded_windows(on_window: WindowCallback) -> Iterator[None]:
+    # whisper.transcribe exposes no per window callback, so its progress bar is replaced for the call.
+    # Workers handle one command at a time, which keeps the replacement local to a single transcription.
+    version = get_whisper_version()
+
+    if version != SUPPORTED_WHISPER_VERSION:
+        raise UnsupportedWhisperVersionError(version)
+
+    transcribe_module: Any = importlib.import_module("whisper.transcribe")
+    original_tqdm = transcribe_module.tqdm
+    transcribe_module.tqdm = SimpleNamespace(tqdm=lambda *args, **kwargs: SegmentProgress(on_window))
+
+    try:
+        yield
+
+    finally:
+        transcribe_module.tqdm = original_tqdm
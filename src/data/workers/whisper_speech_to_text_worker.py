@@ -1,14 +1,37 @@
 import multiprocessing
-import multiprocessing.connection
 import multiprocessing.synchronize
 from dataclasses import dataclass
 from multiprocessing.sharedctypes import Synchronized
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
 
+import numpy as np
+import torch
 import whisper
 
-from data.workers.base_worker import BaseWorker
-from domain.exceptions.worker_not_running_error import WorkerNotRunningError
+from core.audio.audio_decoder import SharedAudioDescriptor, process_shared_audio
+from data.workers.base_worker import BaseWorker, ResponsePipe
+from data.workers.compact_transcription_result import CompactTranscriptionResult
+from data.workers.transcription_checkpoint import TranscriptionCheckpointWriter
+from data.workers.whisper_batch_transcription import transcribe_batch
+from data.workers.whisper_segment_progress import WindowCallback, report_decoded_windows
+from domain.exceptions.request_cancelled_error import RequestCancelledError
+
+WordTimestamp = Tuple[float, float, str]
+TranscriptionArgs = Tuple[
+    Union[SharedAudioDescriptor, List[SharedAudioDescriptor]],
+    str,
+    Dict[str, Any],
+    Optional[FrozenSet[str]],
+    Optional[str],
+]
+
+
+def extract_word_timestamps(result: Dict[str, Any]) -> List[WordTimestamp]:
+    return [
+        (word["start"], word["end"], word["word"])
+        for segment in result.get("segments", [])
+        for word in segment.get("words", [])
+    ]
 
 
 @dataclass
@@ -17,46 +40,91 @@ class WhisperSpeechToTextConfig:
     model_type: str
     model_download_path: str
     log_level: str
+    num_threads: Optional[int] = None
+    checkpoint_interval_seconds: float = 0.0
 
 
 class WhisperSpeechToTextWorker(
     BaseWorker[  # type: ignore
-        Tuple[str, str, Dict[str, Any]],
-        dict[str, str],
+        TranscriptionArgs,
+        CompactTranscriptionResult,
         WhisperSpeechToTextConfig,
         whisper.Whisper,
     ],
 ):
-    def transcribe(
+    async def transcribe(
         self,
-        file_path: str,
+        audio: SharedAudioDescriptor,
         language: str,
         transcription_parameters: Dict[str, Any],
-    ) -> dict[str, str]:
-        if not self.is_alive():
-            raise WorkerNotRunningError()
+        segment_fields: Optional[FrozenSet[str]] = None,
+        on_segments: Optional[Callable[[CompactTranscriptionResult], None]] = None,
+        checkpoint_path: Optional[str] = None,
+    ) -> CompactTranscriptionResult:
+        # With on_segments the worker also reports the segments of every decoded window as soon as it is done.
+        # With checkpoint_path it saves the decoded segments and its position there at the configured interval.
+        result: CompactTranscriptionResult = await self._execute(
+            "transcribe" if on_segments is None else "transcribe_stream",
+            (
+                audio,
+                language,
+                transcription_parameters,
+                segment_fields,
+                checkpoint_path,
+            ),
+            on_segments,
+        )
 
-        self._pipe_parent.send(
+        return result
+
+    async def transcribe_batch(
+        self,
+        audios: List[SharedAudioDescriptor],
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[FrozenSet[str]] = None,
+    ) -> List[Optional[CompactTranscriptionResult]]:
+        # Clips of one batch share the language and parameters, and each one fits in a single window
+        results: List[Optional[CompactTranscriptionResult]] = await self._execute(
+            "transcribe_batch",
             (
-                "transcribe",
-                (
-                    file_path,
-                    language,
-                    transcription_parameters,
-                ),
+                audios,
+                language,
+                transcription_parameters,
+                segment_fields,
+                None,
             ),
         )
-        result = self._pipe_parent.recv()
 
-        if isinstance(result, Exception):
-            raise result
+        return results
 
-        return dict[str, str](result)
+    async def transcribe_words(
+        self,
+        audio: SharedAudioDescriptor,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+    ) -> List[WordTimestamp]:
+        # The streaming mode decodes short windows and only needs the words with their timestamps
+        words: List[WordTimestamp] = await self._execute(
+            "transcribe_words",
+            (
+                audio,
+                language,
+                transcription_parameters,
+                None,
+                None,
+            ),
+        )
+
+        return words
 
     def initialize_shared_object(
         self,
         config: WhisperSpeechToTextConfig,
     ) -> whisper.Whisper:
+        if config.num_threads:
+            torch.set_num_threads(config.num_threads)
+
         return whisper.load_model(
             config.model_type,
             download_root=config.model_download_path,
@@ -65,19 +133,22 @@ class WhisperSpeechToTextWorker(
     def handle_command(
         self,
         command: str,
-        args: Tuple[str, str, Dict[str, Any]],
+        args: TranscriptionArgs,
         model: whisper.Whisper,
         config: WhisperSpeechToTextConfig,
-        pipe: multiprocessing.connection.Connection,
+        pipe: ResponsePipe,
         is_processing: Synchronized,  # type: ignore
         processing_lock: multiprocessing.synchronize.Lock,
     ) -> None:
-        if command == "transcribe":
+        if command == "transcribe_batch":
+            self._handle_transcribe_batch(args, model, config, pipe, is_processing, processing_lock)
+
+        elif command in ("transcribe", "transcribe_stream", "transcribe_words"):
             try:
                 with processing_lock:
                     is_processing.value = True
 
-                file_path, language, transcription_parameters = args
+                audio, language, transcription_parameters, segment_fields, checkpoint_path = args
 
                 if "language" not in transcription_parameters:
                     transcription_parameters["language"] = language
@@ -85,8 +156,36 @@ class WhisperSpeechToTextWorker(
                 if "fp16" not in transcription_parameters:
                     transcription_parameters["fp16"] = config.device != "cpu"
 
-                result = model.transcribe(file_path, **transcription_parameters)
-                pipe.send(result)
+                if command == "transcribe_words":
+                    transcription_parameters["word_timestamps"] = True
+
+                # Checked once per decoded window, so a cancelled request stops within a window of audio
+                window_callbacks: List[WindowCallback] = [lambda segments, _: self._check_cancelled(pipe)]
+
+                if command == "transcribe_stream":
+                    window_callbacks.append(
+                        lambda segments, _: self._send_segments(pipe, segments, segment_fields),
+                    )
+
+                if checkpoint_path and config.checkpoint_interval_seconds:
+                    window_callbacks.append(
+                        TranscriptionCheckpointWriter(checkpoint_path, config.checkpoint_interval_seconds).on_window,
+                    )
+
+                with report_decoded_windows(
+                    lambda segments, decoded_frames: [
+                        callback(segments, decoded_frames) for callback in window_callbacks
+                    ],
+                ):
+                    result = process_shared_audio(
+                        audio,
+                        lambda samples: model.transcribe(samples, **transcription_parameters),
+                    )
+
+                if command == "transcribe_words":
+                    pipe.send(extract_word_timestamps(result))
+                else:
+                    pipe.send(CompactTranscriptionResult.from_whisper_result(result, segment_fields))
 
             except Exception as e:
                 pipe.send(e)
@@ -95,5 +194,74 @@ class WhisperSpeechToTextWorker(
                 with processing_lock:
                     is_processing.value = False
 
+    @staticmethod
+    def _check_cancelled(pipe: ResponsePipe) -> None:
+        if pipe.is_cancelled():
+            raise RequestCancelledError()
+
+    @staticmethod
+    def _send_segments(
+        pipe: ResponsePipe,
+        segments: List[Dict[str, Any]],
+        segment_fields: Optional[FrozenSet[str]],
+    ) -> None:
+        if segments:
+            pipe.send_partial(
+                CompactTranscriptionResult.from_whisper_result(
+                    {"text": "".join(segment["text"] for segment in segments), "segments": segments},
+                    segment_fields,
+                ),
+            )
+
+    def _handle_transcribe_batch(
+        self,
+        args: TranscriptionArgs,
+        model: whisper.Whisper,
+        config: WhisperSpeechToTextConfig,
+        pipe: ResponsePipe,
+        is_processing: Synchronized,  # type: ignore
+        processing_lock: multiprocessing.synchronize.Lock,
+    ) -> None:
+        try:
+            with processing_lock:
+                is_processing.value = True
+
+            audios, language, transcription_parameters, segment_fields, _ = args
+            samples: List[Optional[np.ndarray]] = []
+
+            for audio in audios:
+                # A request cancelled after its batch was sent may already have released its audio
+                try:
+                    samples.append(process_shared_audio(audio, np.copy))
+
+                except FileNotFoundError:
+                    samples.append(None)
+
+            available = [index for index, audio_samples in enumerate(samples) if audio_samples is not None]
+            results: List[Optional[CompactTranscriptionResult]] = [None] * len(samples)
+
+            if available:
+                batch_results = transcribe_batch(
+                    model,
+                    [samples[index] for index in available],
+                    {
+                        "language": language,
+                        "fp16": config.device != "cpu",
+                        **transcription_parameters,
+                    },
+                )
+
+                for index, result in zip(available, batch_results):
+                    results[index] = CompactTranscriptionResult.from_whisper_result(result, segment_fields)
+
+            pipe.send(results)
+
+        except Exception as e:
+            pipe.send(e)
+
+        finally:
+            with processing_lock:
+                is_processing.value = False
+
     def get_worker_name(self) -> str:
         return type(self).__name__
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Generic, List, Optional, TypeVar
+
+from core.client_context.client_context import get_client_id
+from core.logger.logger import Logger
+from core.timer.timer import Timer, TimerFactory
+from data.workers.base_worker import BaseWorker
+from data.workers.fair_queue import FairQueue
+
+WorkerType = TypeVar("WorkerType", bound=BaseWorker)
+
+
+class WorkerPool(Generic[WorkerType]):
+    def __init__(
+        self,
+        workers: List[WorkerType],
+        timer_factory: TimerFactory,
+        idle_timeout: int,
+        logger: Logger,
+        name: str,
+        aging: float = 0.0,
+        client_weights: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self._workers = workers
+        self._timers: List[Timer] = [timer_factory.create() for _ in workers]
+        self._idle_timeout = idle_timeout
+        self._logger = logger
+        self._name = name
+        self._lock = threading.Lock()
+        self._idle_workers: Deque[int] = deque(range(len(workers)))
+        self._waiters: FairQueue[Future[int]] = FairQueue(client_weights or {}, aging)
+
+    def _check_idle_timeout(self, index: int) -> None:
+        self._logger.debug(f"Checking {self._name} worker {index} idle timeout")
+
+        with self._lock:
+            worker = self._workers[index]
+
+            if index in self._idle_workers and worker.is_alive() and not worker.is_processing():
+                worker.stop()
+                self._timers[index].cancel()
+                self._logger.info(f"{self._name} worker {index} stopped due to idle timeout")
+
+    def _start_worker(self, index: int) -> WorkerType:
+        worker = self._workers[index]
+
+        if not worker.is_alive():
+            self._logger.info(f"Starting {self._name} worker {index}")
+            worker.start()
+
+        return worker
+
+    def acquire(self, priority: float = 0.0) -> "Future[int]":
+        future: Future[int] = Future()
+
+        with self._lock:
+            if self._idle_workers:
+                future.set_running_or_notify_cancel()
+                future.set_result(self._idle_workers.popleft())
+                self._waiters.charge(get_client_id(), priority)
+            else:
+                self._logger.debug(f"All {self._name} workers busy, queueing request with priority {priority:.1f}")
+                self._waiters.push(future, get_client_id(), priority)
+
+        return future
+
+    def charge(
+        self,
+        client_id: str,
+        priority: float,
+    ) -> None:
+        with self._lock:
+            self._waiters.charge(client_id, priority)
+
+    def release(self, index: int) -> None:
+        self._timers[index].start(
+            self._idle_timeout,
+            lambda: self._check_idle_timeout(index),
+        )
+
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.pop()
+
+                if waiter.set_running_or_notify_cancel():
+                    waiter.set_result(index)
+                    return
+
+            self._idle_workers.append(index)
+
+    async def _wait_for_worker(self, priority: float) -> int:
+        future = self.acquire(priority)
+
+        try:
+            return await asyncio.wrap_future(future)
+
+        except asyncio.CancelledError:
+            future.add_done_callback(lambda done: None if done.cancelled() else self.release(done.result()))
+            raise
+
+    @asynccontextmanager
+    async def lease(self, priority: float = 0.0) -> AsyncIterator[WorkerType]:
+        index = await self._wait_for_worker(priority)
+
+        try:
+            self._timers[index].cancel()
+            yield self._start_worker(index)
+
+        finally:
+            self.release(index)
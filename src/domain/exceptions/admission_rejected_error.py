@@ -0,0 +1,4 @@
+class AdmissionRejectedError(Exception):
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(f"Server is busy, retry after {retry_after} seconds")
+        self.retry_after = retry_after
@@ -0,0 +1,3 @@
+class AudioDecodingError(ValueError):
+    def __init__(self, details: str) -> None:
+        super().__init__(f"Failed to decode audio: {details}")
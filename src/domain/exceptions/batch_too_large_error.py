@@ -0,0 +1,3 @@
+class BatchTooLargeError(ValueError):
+    def __init__(self, max_files: int) -> None:
+        super().__init__(f"Batch exceeds the limit of {max_files} files")
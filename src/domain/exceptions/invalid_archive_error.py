@@ -0,0 +1,3 @@
+class InvalidArchiveError(ValueError):
+    def __init__(self, file_name: str) -> None:
+        super().__init__(f"Invalid zip archive: {file_name}")
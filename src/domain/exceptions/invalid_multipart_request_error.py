@@ -0,0 +1,3 @@
+class InvalidMultipartRequestError(ValueError):
+    def __init__(self, details: str) -> None:
+        super().__init__(f"Invalid multipart request: {details}")
@@ -0,0 +1,3 @@
+class InvalidVoiceActivityParameterError(ValueError):
+    def __init__(self, name: str) -> None:
+        super().__init__(f"Invalid voice activity detection parameter: {name}")
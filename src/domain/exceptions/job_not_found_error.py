@@ -0,0 +1,3 @@
+class JobNotFoundError(Exception):
+    def __init__(self, job_id: str) -> None:
+        super().__init__(f"Job not found: {job_id}")
@@ -0,0 +1,3 @@
+class JobQueueFullError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Job queue is full")
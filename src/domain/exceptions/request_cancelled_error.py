@@ -0,0 +1,3 @@
+class RequestCancelledError(RuntimeError):
+    def __init__(self) -> None:
+        super().__init__("Request was cancelled")
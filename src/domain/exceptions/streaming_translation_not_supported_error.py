@@ -0,0 +1,3 @@
+class StreamingTranslationNotSupportedError(ValueError):
+    def __init__(self) -> None:
+        super().__init__("Translation is not supported when streaming subtitles")
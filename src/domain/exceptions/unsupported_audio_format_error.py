@@ -0,0 +1,3 @@
+class UnsupportedAudioFormatError(ValueError):
+    def __init__(self, audio_format: str) -> None:
+        super().__init__(f"Unsupported audio format: {audio_format}")
@@ -0,0 +1,3 @@
+class UnsupportedWhisperVersionError(RuntimeError):
+    def __init__(self, version: str) -> None:
+        super().__init__(f"Decoded window progress is not supported for whisper version: {version}")
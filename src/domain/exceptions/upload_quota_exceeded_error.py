@@ -0,0 +1,3 @@
+class UploadQuotaExceededError(Exception):
+    def __init__(self, quota_mb: int) -> None:
+        super().__init__(f"Upload quota of {quota_mb} MB exceeded")
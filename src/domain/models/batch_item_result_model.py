@@ -0,0 +1,10 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class BatchItemResultModel(BaseModel):
+    index: int
+    file_name: Optional[str] = None
+    result: Optional[str] = None
+    error: Optional[str] = None
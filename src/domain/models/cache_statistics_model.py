@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class CacheStatisticsModel(BaseModel):
+    hits: int
+    misses: int
+    entries: int
@@ -0,0 +1,21 @@
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class JobModel(BaseModel):
+    job_id: str
+    status: JobStatus = JobStatus.QUEUED
+    progress: float = 0.0
+    result: Optional[str] = None
+    error: Optional[str] = None
+    updated_at: float = 0.0
@@ -0,0 +1,10 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class SavedFileModel(BaseModel):
+    path: str
+    content_hash: str
+    file_name: Optional[str] = None
+    size: int = 0
@@ -0,0 +1,17 @@
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class StreamingSegmentType(str, Enum):
+    PARTIAL = "partial"
+    FINAL = "final"
+
+
+class StreamingSegmentModel(BaseModel):
+    type: StreamingSegmentType
+    text: str
+    start: float
+    end: float
+    latency: Optional[float] = None
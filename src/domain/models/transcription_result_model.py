@@ -1,19 +1,19 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel
 
 
 class SegmentModel(BaseModel):
-    id: int
-    seek: int
     start: float
     end: float
     text: str
-    tokens: List[int]
-    temperature: float
-    avg_logprob: float
-    compression_ratio: float
-    no_speech_prob: float
+    id: Optional[int] = None
+    seek: Optional[int] = None
+    tokens: Optional[List[int]] = None
+    temperature: Optional[float] = None
+    avg_logprob: Optional[float] = None
+    compression_ratio: Optional[float] = None
+    no_speech_prob: Optional[float] = None
 
 
 class TranscriptionResultModel(BaseModel):
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class WordModel(BaseModel):
+    start: float
+    end: float
+    text: str
@@ -1,11 +1,20 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterable, List, Optional
 
-from fastapi import UploadFile
+from domain.models.saved_file_model import SavedFileModel
 
 
 class FileRepository(ABC):
     @abstractmethod
-    async def save_file(self, file: UploadFile) -> str:
+    async def save_file(self, file_name: Optional[str], chunks: AsyncIterable[bytes]) -> SavedFileModel:
+        pass
+
+    @abstractmethod
+    async def extract_archive(self, saved_file: SavedFileModel, max_files: int) -> List[SavedFileModel]:
+        pass
+
+    @abstractmethod
+    def release_file(self, file_path: str) -> None:
         pass
 
     @abstractmethod
@@ -1,13 +1,34 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Callable, Collection, Dict, List, Optional
+
+from domain.models.transcription_result_model import TranscriptionResultModel
+from domain.models.word_model import WordModel
 
 
 class SpeechToTextRepository(ABC):
     @abstractmethod
-    def transcribe(
+    async def transcribe(
+        self,
+        file_path: str,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[Collection[str]] = None,
+        segment_callback: Optional[Callable[[TranscriptionResultModel], None]] = None,
+    ) -> TranscriptionResultModel:
+        pass
+
+    @abstractmethod
+    async def probe_duration(
         self,
         file_path: str,
+    ) -> Optional[float]:
+        pass
+
+    @abstractmethod
+    async def transcribe_words(
+        self,
+        audio: bytes,
         language: str,
         transcription_parameters: Dict[str, Any],
-    ) -> dict[str, str]:
+    ) -> List[WordModel]:
         pass
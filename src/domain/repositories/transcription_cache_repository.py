@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Any, Collection, Dict, Optional
+
+from domain.models.cache_statistics_model import CacheStatisticsModel
+from domain.models.transcription_result_model import TranscriptionResultModel
+
+
+class TranscriptionCacheRepository(ABC):
+    @abstractmethod
+    def get_transcription(
+        self,
+        content_hash: str,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[Collection[str]],
+    ) -> Optional[TranscriptionResultModel]:
+        pass
+
+    @abstractmethod
+    def put_transcription(
+        self,
+        content_hash: str,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[Collection[str]],
+        transcription_result: TranscriptionResultModel,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def get_statistics(self) -> CacheStatisticsModel:
+        pass
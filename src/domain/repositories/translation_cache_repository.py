@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from domain.models.cache_statistics_model import CacheStatisticsModel
+
+
+class TranslationCacheRepository(ABC):
+    @abstractmethod
+    def get_translations(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        translation_parameters: Dict[str, Any],
+    ) -> List[Optional[str]]:
+        pass
+
+    @abstractmethod
+    def put_translations(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        translation_parameters: Dict[str, Any],
+        translations: List[str],
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def get_statistics(self) -> CacheStatisticsModel:
+        pass
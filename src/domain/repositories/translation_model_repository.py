@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+from domain.models.cache_statistics_model import CacheStatisticsModel
 
 
 class TranslationModelRepository(ABC):
     @abstractmethod
-    def translate(
+    async def translate(
         self,
         text: str,
         source_language: str,
@@ -12,3 +14,17 @@ class TranslationModelRepository(ABC):
         translation_parameters: Dict[str, Any],
     ) -> str:
         pass
+
+    @abstractmethod
+    async def translate_batch(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        translation_parameters: Dict[str, Any],
+    ) -> List[str]:
+        pass
+
+    @abstractmethod
+    def get_cache_statistics(self) -> CacheStatisticsModel:
+        pass
@@ -1,5 +1,5 @@
 import re
-from typing import Annotated, List
+from typing import Annotated, Dict, List
 
 from fastapi import Depends
 
@@ -8,6 +8,45 @@ from domain.models.sentence_model import SentenceModel
 from domain.models.subtitle_segment_model import SubtitleSegmentModel
 
 
+class SentenceBuilder:
+    def __init__(self) -> None:
+        self._words: List[str] = []
+        self._counter_word_counts: Dict[str, int] = {}
+
+    def _complete_sentence(self) -> SentenceModel:
+        total_words = sum(self._counter_word_counts.values())
+        sentence = SentenceModel(
+            text=" ".join(self._words),
+            segment_percentage={
+                counter: round(count / total_words, 2) for counter, count in self._counter_word_counts.items()
+            },
+        )
+        self._words = []
+        self._counter_word_counts = {}
+
+        return sentence
+
+    def add_segments(
+        self,
+        segments: List[SubtitleSegmentModel],
+    ) -> List[SentenceModel]:
+        # Only sentences closed by punctuation are returned, the unfinished one waits for the next segments
+        sentences = []
+
+        for segment in segments:
+            for word in segment.text.split():
+                self._words.append(word)
+                self._counter_word_counts[segment.counter] = self._counter_word_counts.get(segment.counter, 0) + 1
+
+                if re.search(r"[.!?]", word):
+                    sentences.append(self._complete_sentence())
+
+        return sentences
+
+    def flush(self) -> List[SentenceModel]:
+        return [self._complete_sentence()] if self._words else []
+
+
 class SentenceService:
     def __init__(
         self,
@@ -15,37 +54,17 @@ class SentenceService:
     ) -> None:
         self.logger = logger
 
+    def create_sentence_builder(self) -> SentenceBuilder:
+        return SentenceBuilder()
+
     def create_sentence_models(
         self,
         segments: List["SubtitleSegmentModel"],
     ) -> List[SentenceModel]:
         self.logger.debug("Starting creation of sentence models from subtitle segments")
 
-        words_with_counters: List[tuple[str, str]] = []
-
-        for segment in segments:
-            words = segment.text.split()
-            words_with_counters.extend((word, segment.counter) for word in words)
-
-        sentences = []
-        current_sentence = []
-        counter_word_counts: dict[str, int] = {}
-
-        for word, counter in words_with_counters:
-            current_sentence.append(word)
-            counter_word_counts[counter] = counter_word_counts.get(counter, 0) + 1
-
-            if re.search(r"[.!?]", word) or word == words_with_counters[-1][0]:
-                total_words = sum(counter_word_counts.values())
-                sentence = SentenceModel(
-                    text=" ".join(current_sentence),
-                    segment_percentage={
-                        counter: round(count / total_words, 2) for counter, count in counter_word_counts.items()
-                    },
-                )
-                sentences.append(sentence)
-                current_sentence = []
-                counter_word_counts = {}
+        sentence_builder = self.create_sentence_builder()
+        sentences = sentence_builder.add_segments(segments) + sentence_builder.flush()
 
         self.logger.debug("Completed creation of sentence models")
 
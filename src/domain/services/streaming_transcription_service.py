@@ -0,0 +1,224 @@
+import time
+from collections import deque
+from typing import Annotated, Any, Deque, Dict, List, Tuple
+
+from fastapi import Depends
+
+from core.audio.audio_decoder import SAMPLE_RATE, SAMPLE_WIDTH
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from data.repositories.speech_to_text_repository_impl import SpeechToTextRepositoryImpl
+from domain.models.streaming_segment_model import (
+    StreamingSegmentModel,
+    StreamingSegmentType,
+)
+from domain.models.word_model import WordModel
+from domain.repositories.speech_to_text_repository import SpeechToTextRepository
+from domain.services.language_mapping_service import LanguageMappingService
+
+# Words starting slightly before the last confirmed word are still the same word seen from another window
+COMMITTED_OVERLAP_SECONDS = 0.1
+MAX_REPEATED_WORDS = 5
+PROMPT_LENGTH = 200
+
+
+def normalize_word(word: WordModel) -> str:
+    return "".join(character for character in word.text.lower() if character.isalnum())
+
+
+def join_words(words: List[WordModel]) -> str:
+    return "".join(word.text for word in words).strip()
+
+
+class StreamingTranscriptionSession:
+    def __init__(
+        self,
+        speech_to_text_repository: SpeechToTextRepository,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        step_seconds: float,
+        max_window_seconds: float,
+    ) -> None:
+        self._speech_to_text_repository = speech_to_text_repository
+        self._language = language
+        self._transcription_parameters = transcription_parameters
+        self._step_seconds = step_seconds
+        self._max_window_seconds = max_window_seconds
+        self._buffer = bytearray()
+        self._buffer_offset = 0.0
+        self._undecoded_seconds = 0.0
+        self._arrivals: Deque[Tuple[float, float]] = deque()
+        self.committed: List[WordModel] = []
+        self.hypothesis: List[WordModel] = []
+        self.latencies: List[float] = []
+
+    @property
+    def buffer_end(self) -> float:
+        end: float = self._buffer_offset + len(self._buffer) / SAMPLE_WIDTH / SAMPLE_RATE
+        return end
+
+    def _received_at(
+        self,
+        stream_time: float,
+    ) -> float:
+        # The latency of a word is measured from the arrival of the frame that completed it
+        for buffer_end, received_at in self._arrivals:
+            if buffer_end >= stream_time:
+                return received_at
+
+        return self._arrivals[-1][1]
+
+    async def _decode_window(self) -> List[WordModel]:
+        prompt = join_words(self.committed)[-PROMPT_LENGTH:]
+        transcription_parameters = {
+            **self._transcription_parameters,
+            "condition_on_previous_text": False,
+        }
+
+        if prompt:
+            transcription_parameters["initial_prompt"] = prompt
+
+        words = await self._speech_to_text_repository.transcribe_words(
+            bytes(self._buffer),
+            self._language,
+            transcription_parameters,
+        )
+        last_committed_end = self.committed[-1].end if self.committed else 0.0
+        words = [
+            WordModel(start=word.start + self._buffer_offset, end=word.end + self._buffer_offset, text=word.text)
+            for word in words
+            if word.start + self._buffer_offset >= last_committed_end - COMMITTED_OVERLAP_SECONDS
+        ]
+
+        # A window that still contains confirmed audio repeats its last words, which are skipped
+        for count in range(min(MAX_REPEATED_WORDS, len(self.committed), len(words)), 0, -1):
+            if [normalize_word(word) for word in self.committed[-count:]] == [
+                normalize_word(word) for word in words[:count]
+            ]:
+                return words[count:]
+
+        return words
+
+    def _commit(
+        self,
+        words: List[WordModel],
+    ) -> List[StreamingSegmentModel]:
+        if not words:
+            return []
+
+        latency = time.monotonic() - self._received_at(words[-1].end)
+        self.latencies.append(latency)
+        self.committed.extend(words)
+
+        return [
+            StreamingSegmentModel(
+                type=StreamingSegmentType.FINAL,
+                text=join_words(words),
+                start=words[0].start,
+                end=words[-1].end,
+                latency=latency,
+            ),
+        ]
+
+    def _trim(self) -> None:
+        if self.buffer_end - self._buffer_offset <= self._max_window_seconds:
+            return
+
+        # Audio up to the last confirmed word is no longer needed, without one the oldest audio is dropped
+        trim_time = self.committed[-1].end if self.committed else 0.0
+
+        if trim_time <= self._buffer_offset:
+            trim_time = self.buffer_end - self._max_window_seconds
+
+        trim_samples = int((trim_time - self._buffer_offset) * SAMPLE_RATE)
+        del self._buffer[: trim_samples * SAMPLE_WIDTH]
+        self._buffer_offset += trim_samples / SAMPLE_RATE
+        self.hypothesis = [word for word in self.hypothesis if word.start >= self._buffer_offset]
+
+        while len(self._arrivals) > 1 and self._arrivals[0][0] < self._buffer_offset:
+            self._arrivals.popleft()
+
+    async def _process_window(self) -> List[StreamingSegmentModel]:
+        self._undecoded_seconds = 0.0
+        words = await self._decode_window()
+        agreed = 0
+
+        # Local agreement confirms the words on which the last two windows agree
+        while agreed < min(len(words), len(self.hypothesis)) and normalize_word(words[agreed]) == normalize_word(
+            self.hypothesis[agreed]
+        ):
+            agreed += 1
+
+        segments = self._commit(words[:agreed])
+        self.hypothesis = words[agreed:]
+
+        if self.hypothesis:
+            segments.append(
+                StreamingSegmentModel(
+                    type=StreamingSegmentType.PARTIAL,
+                    text=join_words(self.hypothesis),
+                    start=self.hypothesis[0].start,
+                    end=self.hypothesis[-1].end,
+                ),
+            )
+
+        self._trim()
+
+        return segments
+
+    async def push_audio(
+        self,
+        audio: bytes,
+    ) -> List[StreamingSegmentModel]:
+        if not audio:
+            return []
+
+        self._buffer += audio
+        self._undecoded_seconds += len(audio) / SAMPLE_WIDTH / SAMPLE_RATE
+        self._arrivals.append((self.buffer_end, time.monotonic()))
+
+        if self._undecoded_seconds < self._step_seconds:
+            return []
+
+        return await self._process_window()
+
+    async def finish(self) -> List[StreamingSegmentModel]:
+        # The stream has ended, so the last hypothesis is confirmed without waiting for agreement
+        words = await self._decode_window() if self._buffer and self._undecoded_seconds else self.hypothesis
+        self._undecoded_seconds = 0.0
+        self.hypothesis = []
+
+        return self._commit(words)
+
+
+class StreamingTranscriptionService:
+    def __init__(
+        self,
+        config: Annotated[AppConfig, Depends()],
+        speech_to_text_repository: Annotated[SpeechToTextRepository, Depends(SpeechToTextRepositoryImpl)],
+        language_mapping_service: Annotated[LanguageMappingService, Depends()],
+        logger: Annotated[Logger, Depends()],
+    ) -> None:
+        self.config = config
+        self.speech_to_text_repository = speech_to_text_repository
+        self.language_mapping_service = language_mapping_service
+        self.logger = logger
+
+    def create_session(
+        self,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+    ) -> StreamingTranscriptionSession:
+        language_mapped = self.language_mapping_service.map_language(
+            language,
+            self.config.speech_to_text_model_name,
+        )
+        self.logger.debug(f"Starting streaming transcription with language '{language_mapped}'")
+
+        return StreamingTranscriptionSession(
+            self.speech_to_text_repository,
+            language_mapped,
+            transcription_parameters,
+            self.config.streaming_step_ms / 1000,
+            self.config.streaming_max_window_seconds,
+        )
@@ -28,12 +28,13 @@ class SubtitleService:
     def convert_to_subtitle_segments(
         self,
         transcription_result: TranscriptionResultModel,
+        first_counter: int = 1,
     ) -> List[SubtitleSegmentModel]:
         self.logger.debug("Starting conversion of transcription result to subtitle segments")
 
         srt_segments = []
 
-        for i, segment in enumerate(transcription_result.segments, start=1):
+        for i, segment in enumerate(transcription_result.segments, start=first_counter):
             start_time = self._format_time(segment.start)
             end_time = self._format_time(segment.end)
             time_range = f"{start_time} --> {end_time}"
@@ -1,14 +1,35 @@
-from typing import Annotated, Any, Dict
+import asyncio
+import json
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+)
 
-from fastapi import Depends, UploadFile
+from fastapi import Depends
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from core.single_flight.single_flight import SingleFlight
 from data.repositories.file_repository_impl import FileRepositoryImpl
 from data.repositories.speech_to_text_repository_impl import SpeechToTextRepositoryImpl
+from data.repositories.transcription_cache_repository_impl import (
+    TranscriptionCacheRepositoryImpl,
+)
+from domain.models.cache_statistics_model import CacheStatisticsModel
+from domain.models.saved_file_model import SavedFileModel
 from domain.models.transcription_result_model import TranscriptionResultModel
 from domain.repositories.file_repository import FileRepository
 from domain.repositories.speech_to_text_repository import SpeechToTextRepository
+from domain.repositories.transcription_cache_repository import (
+    TranscriptionCacheRepository,
+)
 from domain.services.language_mapping_service import LanguageMappingService
 
 
@@ -20,38 +41,208 @@ class TranscriptionService:
         file_repository: Annotated[FileRepository, Depends(FileRepositoryImpl)],
         logger: Annotated[Logger, Depends()],
         language_mapping_service: Annotated[LanguageMappingService, Depends()],
+        transcription_cache_repository: Annotated[
+            TranscriptionCacheRepository,
+            Depends(TranscriptionCacheRepositoryImpl),
+        ],
+        single_flight: Annotated[SingleFlight, Depends()],
     ) -> None:
         self.config = config
         self.speech_to_text_repository = speech_to_text_repository
         self.file_repository = file_repository
         self.logger = logger
         self.language_mapping_service = language_mapping_service
+        self.transcription_cache_repository = transcription_cache_repository
+        self.single_flight = single_flight
 
-    async def transcribe(
+    async def _transcribe_saved_file(
+        self,
+        saved_file: SavedFileModel,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[Collection[str]],
+        segment_callback: Optional[Callable[[TranscriptionResultModel], None]],
+    ) -> TranscriptionResultModel:
+        transcription_result = await asyncio.to_thread(
+            self.transcription_cache_repository.get_transcription,
+            saved_file.content_hash,
+            language,
+            transcription_parameters,
+            segment_fields,
+        )
+
+        if transcription_result is not None:
+            self.logger.debug(f"Transcription for file '{saved_file.file_name}' found in cache")
+
+            return transcription_result
+
+        self.logger.debug(f"Starting transcription for file '{saved_file.file_name}' with language '{language}'")
+
+        transcription_result = await self.speech_to_text_repository.transcribe(
+            saved_file.path,
+            language,
+            transcription_parameters,
+            segment_fields,
+            segment_callback,
+        )
+        self.logger.debug(f"Completed transcription for file '{saved_file.file_name}'")
+
+        await asyncio.to_thread(
+            self.transcription_cache_repository.put_transcription,
+            saved_file.content_hash,
+            language,
+            transcription_parameters,
+            segment_fields,
+            transcription_result,
+        )
+
+        return transcription_result
+
+    def _dispose_file(
         self,
-        file: UploadFile,
+        saved_file: SavedFileModel,
+    ) -> None:
+        if self.config.delete_files_after_transcription:
+            self.file_repository.delete_file(saved_file.path)
+        else:
+            self.file_repository.release_file(saved_file.path)
+
+    async def _transcribe_owned_file(
+        self,
+        saved_file: SavedFileModel,
         language: str,
         transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[Collection[str]],
+        segment_callback: Optional[Callable[[TranscriptionResultModel], None]],
     ) -> TranscriptionResultModel:
-        file_path = await self.file_repository.save_file(file)
+        try:
+            return await self._transcribe_saved_file(
+                saved_file,
+                language,
+                transcription_parameters,
+                segment_fields,
+                segment_callback,
+            )
+
+        finally:
+            self._dispose_file(saved_file)
+
+    async def stage_file(
+        self,
+        file_name: Optional[str],
+        chunks: AsyncIterable[bytes],
+    ) -> SavedFileModel:
+        saved_file: SavedFileModel = await self.file_repository.save_file(file_name, chunks)
+        self.logger.debug(f"Staged file '{file_name}' with {saved_file.size} bytes")
+
+        return saved_file
 
+    async def extract_archive(
+        self,
+        saved_file: SavedFileModel,
+        max_files: int,
+    ) -> List[SavedFileModel]:
+        try:
+            extracted_files: List[SavedFileModel] = await self.file_repository.extract_archive(saved_file, max_files)
+
+        finally:
+            self.file_repository.delete_file(saved_file.path)
+
+        self.logger.debug(f"Extracted {len(extracted_files)} files from archive '{saved_file.file_name}'")
+
+        return extracted_files
+
+    def discard_file(
+        self,
+        saved_file: SavedFileModel,
+    ) -> None:
+        self.logger.debug(f"Discarding staged file '{saved_file.file_name}'")
+        self.file_repository.delete_file(saved_file.path)
+
+    async def create_progress_reporter(
+        self,
+        saved_file: SavedFileModel,
+        progress_callback: Callable[[float], None],
+        share: float,
+    ) -> Callable[[TranscriptionResultModel], None]:
+        duration = await self.speech_to_text_repository.probe_duration(saved_file.path)
+
+        def report_progress(partial_result: TranscriptionResultModel) -> None:
+            # Segments arrive in order, so the end of the last one is how far decoding got into the file
+            if duration and partial_result.segments:
+                progress_callback(share * min(partial_result.segments[-1].end / duration, 1.0))
+
+        return report_progress
+
+    async def transcribe(
+        self,
+        saved_file: SavedFileModel,
+        language: str,
+        transcription_parameters: Dict[str, Any],
+        segment_fields: Optional[Collection[str]] = None,
+        segment_callback: Optional[Callable[[TranscriptionResultModel], None]] = None,
+    ) -> TranscriptionResultModel:
         language_mapped = self.language_mapping_service.map_language(
             language,
             self.config.speech_to_text_model_name,
         )
 
-        self.logger.debug(f"Starting transcription for file '{file.filename}' with language '{language_mapped}'")
-
-        result = self.speech_to_text_repository.transcribe(
-            file_path,
+        flight_key = (
+            "transcription",
+            saved_file.content_hash,
             language_mapped,
-            transcription_parameters,
+            json.dumps(transcription_parameters, sort_keys=True, default=str),
+            None if segment_fields is None else tuple(sorted(segment_fields)),
         )
-        self.logger.debug(f"Completed transcription for file '{file.filename}'")
 
-        if self.config.delete_files_after_transcription:
-            self.file_repository.delete_file(file_path)
+        if self.single_flight.is_in_flight(flight_key):
+            self.logger.debug(
+                f"Joining in-flight transcription of identical content for file '{saved_file.file_name}'",
+            )
+
+        delivered_segments = 0
+
+        def deliver_segments(partial_result: TranscriptionResultModel) -> None:
+            nonlocal delivered_segments
+            delivered_segments += len(partial_result.segments)
 
-        transcription_result = TranscriptionResultModel(**result)
+            if segment_callback:
+                segment_callback(partial_result)
+
+        owned_by_flight = False
+
+        def start_flight() -> Awaitable[TranscriptionResultModel]:
+            nonlocal owned_by_flight
+            owned_by_flight = True
+
+            return self._transcribe_owned_file(
+                saved_file,
+                language_mapped,
+                transcription_parameters,
+                segment_fields,
+                deliver_segments if segment_callback else None,
+            )
+
+        try:
+            transcription_result = await self.single_flight.run(flight_key, start_flight)
+
+        finally:
+            # The flight disposes of the file it transcribes once it ends, because callers that joined it
+            # still depend on that file after the caller that started it is cancelled
+            if not owned_by_flight:
+                self._dispose_file(saved_file)
+
+        # Cached results and joined flights arrive at once, so whatever was not streamed is delivered here
+        if segment_callback and delivered_segments < len(transcription_result.segments):
+            remaining_segments = transcription_result.segments[delivered_segments:]
+            segment_callback(
+                TranscriptionResultModel.model_construct(
+                    text="".join(segment.text for segment in remaining_segments),
+                    segments=remaining_segments,
+                ),
+            )
 
         return transcription_result
+
+    def get_cache_statistics(self) -> CacheStatisticsModel:
+        return self.transcription_cache_repository.get_statistics()
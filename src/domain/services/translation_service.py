@@ -1,12 +1,15 @@
+import json
 from typing import Annotated, Any, Dict, List, Optional
 
 from fastapi import Depends
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from core.single_flight.single_flight import SingleFlight
 from data.repositories.translation_model_repository_impl import (
     TranslationModelRepositoryImpl,
 )
+from domain.models.cache_statistics_model import CacheStatisticsModel
 from domain.models.sentence_model import SentenceModel
 from domain.repositories.translation_model_repository import TranslationModelRepository
 from domain.services.language_mapping_service import LanguageMappingService
@@ -19,13 +22,15 @@ class TranslationService:
         translation_model_repository: Annotated[TranslationModelRepository, Depends(TranslationModelRepositoryImpl)],
         logger: Annotated[Logger, Depends()],
         language_mapping_service: Annotated[LanguageMappingService, Depends()],
+        single_flight: Annotated[SingleFlight, Depends()],
     ) -> None:
         self.config = config
         self.translation_model_repository = translation_model_repository
         self.logger = logger
         self.language_mapping_service = language_mapping_service
+        self.single_flight = single_flight
 
-    def translate_sentences(
+    async def translate_sentences(
         self,
         sentences: List[SentenceModel],
         source_language: str,
@@ -45,19 +50,29 @@ class TranslationService:
             self.config.translation_model_name,
         )
 
-        for i, sentence in enumerate(sentences):
-            self.logger.debug(f"Translating sentence {i + 1}/{len(sentences)}")
-
-            sentence.translation = self.translation_model_repository.translate(
-                sentence.text,
+        texts = [sentence.text for sentence in sentences]
+        translations = await self.single_flight.run(
+            (
+                "translate_sentences",
+                tuple(texts),
+                source_language_mapped,
+                target_language_mapped,
+                json.dumps(translation_parameters, sort_keys=True, default=str),
+            ),
+            lambda: self.translation_model_repository.translate_batch(
+                texts,
                 source_language_mapped,
                 target_language_mapped,
                 translation_parameters,
-            )
+            ),
+        )
+
+        for sentence, translation in zip(sentences, translations):
+            sentence.translation = translation
 
         self.logger.debug("Completed translation of sentences")
 
-    def translate_text(
+    async def translate_text(
         self,
         text: str,
         source_language: str,
@@ -75,13 +90,25 @@ class TranslationService:
             self.config.translation_model_name,
         )
 
-        translated_text: str = self.translation_model_repository.translate(
-            text,
-            source_language_mapped,
-            target_language_mapped,
-            translation_parameters,
+        translated_text: str = await self.single_flight.run(
+            (
+                "translate_text",
+                text,
+                source_language_mapped,
+                target_language_mapped,
+                json.dumps(translation_parameters, sort_keys=True, default=str),
+            ),
+            lambda: self.translation_model_repository.translate(
+                text,
+                source_language_mapped,
+                target_language_mapped,
+                translation_parameters,
+            ),
         )
 
         self.logger.debug("Completed translation of text")
 
         return translated_text
+
+    def get_cache_statistics(self) -> CacheStatisticsModel:
+        return self.translation_model_repository.get_cache_statistics()
@@ -72,3 +72,24 @@ def test_transcribe_dto_optional_target_language() -> None:
     assert dto.target_language is None
     assert dto.transcription_parameters == {}
     assert dto.translation_parameters == {}
+
+
+def test_transcribe_dto_parses_json_parameters() -> None:
+    # When
+    dto = TranscribeDTO.model_validate(
+        {
+            "source_language": "en_US",
+            "transcription_parameters": '{"num_beams": 5}',
+            "translation_parameters": '{"max_length": 100}',
+        },
+    )
+
+    # Then
+    assert dto.transcription_parameters == {"num_beams": 5}
+    assert dto.translation_parameters == {"max_length": 100}
+
+
+def test_transcribe_dto_invalid_json_parameters() -> None:
+    # When / Then
+    with pytest.raises(ValidationError):
+        TranscribeDTO.model_validate({"source_language": "en_US", "transcription_parameters": "not json"})
@@ -0,0 +1,20 @@
+import pytest
+from pydantic import ValidationError
+
+from src.api.dtos.transcribe_srt_stream_dto import TranscribeSrtStreamDTO
+
+
+def test_transcribe_srt_stream_dto_allows_same_target_language() -> None:
+    # When
+    dto = TranscribeSrtStreamDTO(source_language="en_US", target_language="en_US")
+
+    # Then
+    assert dto.source_language == "en_US"
+
+
+def test_transcribe_srt_stream_dto_rejects_translation() -> None:
+    # When / Then
+    with pytest.raises(ValidationError) as exc_info:
+        TranscribeSrtStreamDTO(source_language="en_US", target_language="pl_PL")
+
+    assert "Translation is not supported when streaming subtitles" in str(exc_info.value)
@@ -0,0 +1,103 @@
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import AsyncMock
+
+import pytest
+from starlette.types import Receive, Scope, Send
+
+from api.middlewares.client_identity_middleware import ClientIdentityMiddleware
+from core.client_context.client_context import ANONYMOUS_CLIENT_ID, get_client_id
+
+
+def create_scope(
+    headers: Dict[str, str],
+    host: Optional[str] = None,
+    scope_type: str = "http",
+) -> Dict[str, Any]:
+    return {
+        "type": scope_type,
+        "headers": [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()],
+        "client": (host, 5000) if host else None,
+    }
+
+
+async def identify(scope: Dict[str, Any], client_api_keys: Optional[Dict[str, str]] = None) -> str:
+    seen: List[str] = []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        seen.append(get_client_id())
+
+    await ClientIdentityMiddleware(app, client_api_keys or {})(scope, AsyncMock(), AsyncMock())
+
+    return seen[0]
+
+
+@pytest.mark.asyncio
+async def test_middleware_names_client_of_configured_api_key() -> None:
+    # When
+    client_id = await identify(create_scope({"X-API-Key": "secret"}, "10.0.0.1"), {"secret": "tenant"})
+
+    # Then
+    assert client_id == "tenant"
+    assert get_client_id() == ANONYMOUS_CLIENT_ID
+
+
+@pytest.mark.asyncio
+async def test_middleware_ignores_client_id_header() -> None:
+    # When
+    client_id = await identify(create_scope({"X-Client-Id": "tenant"}, "10.0.0.1"), {"secret": "tenant"})
+
+    # Then
+    assert client_id == "10.0.0.1"
+
+
+@pytest.mark.asyncio
+async def test_middleware_identifies_unknown_api_keys_by_client_address() -> None:
+    # When
+    client_ids = [
+        await identify(create_scope({"X-API-Key": api_key}, "10.0.0.1"), {"secret": "tenant"})
+        for api_key in ("random-1", "random-2")
+    ]
+
+    # Then
+    assert client_ids == ["10.0.0.1", "10.0.0.1"]
+
+
+@pytest.mark.asyncio
+async def test_middleware_falls_back_to_client_address() -> None:
+    # When
+    client_id = await identify(create_scope({}, "10.0.0.1"))
+
+    # Then
+    assert client_id == "10.0.0.1"
+
+
+@pytest.mark.asyncio
+async def test_middleware_identifies_websocket_clients() -> None:
+    # When
+    client_id = await identify(create_scope({"X-API-Key": "secret"}, "10.0.0.1", "websocket"), {"secret": "tenant"})
+
+    # Then
+    assert client_id == "tenant"
+
+
+@pytest.mark.asyncio
+async def test_middleware_keeps_identity_while_response_is_streamed() -> None:
+    # Given
+    sent: List[Tuple[str, str]] = []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        for chunk in ("first", "second"):
+            await send({"type": "http.response.body", "body": chunk.encode(), "more_body": True})
+
+    async def send(message: Dict[str, Any]) -> None:
+        sent.append((message["body"].decode(), get_client_id()))
+
+    # When
+    await ClientIdentityMiddleware(app, {"secret": "tenant"})(
+        create_scope({"X-API-Key": "secret"}),
+        AsyncMock(),
+        send,
+    )
+
+    # Then
+    assert sent == [("first", "tenant"), ("second", "tenant")]
@@ -0,0 +1,123 @@
+import hashlib
+from typing import AsyncIterable, AsyncIterator, List, Optional
+from unittest.mock import Mock
+
+import pytest
+
+from api.parsers.streaming_multipart_parser import StreamingMultipartParser
+from domain.exceptions.invalid_multipart_request_error import (
+    InvalidMultipartRequestError,
+)
+from domain.models.saved_file_model import SavedFileModel
+
+BOUNDARY = "test-boundary"
+HEADERS = {"content-type": f"multipart/form-data; boundary={BOUNDARY}"}
+
+
+def create_body(*parts: str) -> bytes:
+    return "".join(f"--{BOUNDARY}\r\n{part}\r\n" for part in parts).encode() + f"--{BOUNDARY}--\r\n".encode()
+
+
+def field_part(name: str, value: str) -> str:
+    return f'Content-Disposition: form-data; name="{name}"\r\n\r\n{value}'
+
+
+def file_part(name: str, file_name: str, content: str) -> str:
+    return (
+        f'Content-Disposition: form-data; name="{name}"; filename="{file_name}"\r\n'
+        f"Content-Type: application/octet-stream\r\n\r\n{content}"
+    )
+
+
+async def stream_body(body: bytes, chunk_size: int = 7) -> AsyncIterator[bytes]:
+    for offset in range(0, len(body), chunk_size):
+        yield body[offset:][:chunk_size]
+
+
+class RecordingFileSink:
+    def __init__(self) -> None:
+        self.contents: List[bytes] = []
+
+    async def save_file(self, file_name: Optional[str], chunks: AsyncIterable[bytes]) -> SavedFileModel:
+        content = b"".join([chunk async for chunk in chunks])
+        self.contents.append(content)
+
+        return SavedFileModel(
+            path=f"staged/{file_name}",
+            content_hash=hashlib.sha256(content).hexdigest(),
+            file_name=file_name,
+            size=len(content),
+        )
+
+
+@pytest.mark.asyncio
+async def test_parse_streams_file_and_reads_fields() -> None:
+    # Given
+    body = create_body(
+        file_part("file", "audio.mp3", "binary audio content"),
+        field_part("source_language", "en_US"),
+        field_part("transcription_parameters", '{"num_beams": 5}'),
+    )
+    sink = RecordingFileSink()
+    delete_file = Mock()
+
+    # When
+    form = await StreamingMultipartParser(HEADERS, stream_body(body)).parse(sink.save_file, delete_file)
+
+    # Then
+    assert form.fields == {"source_language": "en_US", "transcription_parameters": '{"num_beams": 5}'}
+    assert [saved_file.file_name for saved_file in form.files["file"]] == ["audio.mp3"]
+    assert sink.contents == [b"binary audio content"]
+    delete_file.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_parse_drains_partially_consumed_file() -> None:
+    # Given
+    body = create_body(file_part("file", "audio.mp3", "binary audio content"), field_part("source_language", "en_US"))
+
+    async def save_first_chunk(file_name: Optional[str], chunks: AsyncIterable[bytes]) -> SavedFileModel:
+        async for _ in chunks:
+            break
+
+        return SavedFileModel(path="staged", content_hash="hash", file_name=file_name)
+
+    # When
+    form = await StreamingMultipartParser(HEADERS, stream_body(body)).parse(save_first_chunk, Mock())
+
+    # Then
+    assert form.fields == {"source_language": "en_US"}
+
+
+@pytest.mark.asyncio
+async def test_parse_deletes_staged_files_when_body_is_truncated() -> None:
+    # Given
+    body = create_body(file_part("file", "audio.mp3", "binary audio content"), field_part("source_language", "en_US"))
+    sink = RecordingFileSink()
+    delete_file = Mock()
+
+    # When / Then
+    with pytest.raises(InvalidMultipartRequestError):
+        await StreamingMultipartParser(HEADERS, stream_body(body[:-30])).parse(sink.save_file, delete_file)
+
+    delete_file.assert_called_once()
+    assert delete_file.call_args.args[0].file_name == "audio.mp3"
+
+
+@pytest.mark.asyncio
+async def test_parse_rejects_too_large_field() -> None:
+    # Given
+    body = create_body(field_part("source_language", "x" * 100))
+
+    # When / Then
+    with pytest.raises(InvalidMultipartRequestError, match="form field is too large"):
+        await StreamingMultipartParser(HEADERS, stream_body(body), max_field_size=10).parse(
+            RecordingFileSink().save_file,
+            Mock(),
+        )
+
+
+def test_parser_requires_multipart_boundary() -> None:
+    # When / Then
+    with pytest.raises(InvalidMultipartRequestError, match="expected multipart/form-data"):
+        StreamingMultipartParser({"content-type": "application/json"}, stream_body(b""))
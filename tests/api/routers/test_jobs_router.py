@@ -0,0 +1,182 @@
+from typing import AsyncIterable, Optional
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.handlers.global_exception_handler import GlobalExceptionHandler
+from api.routers.jobs_router import JobsRouter
+from application.usecases.cancel_transcription_job_usecase import (
+    CancelTranscriptionJobUseCase,
+)
+from application.usecases.get_transcription_job_usecase import (
+    GetTranscriptionJobUseCase,
+)
+from application.usecases.stage_uploaded_file_usecase import StageUploadedFileUseCase
+from application.usecases.submit_transcription_job_usecase import (
+    SubmitTranscriptionJobUseCase,
+)
+from core.logger.logger import Logger
+from domain.exceptions.job_not_found_error import JobNotFoundError
+from domain.exceptions.job_queue_full_error import JobQueueFullError
+from domain.models.job_model import JobModel, JobStatus
+from domain.models.saved_file_model import SavedFileModel
+
+
+async def stage_file(file_name: Optional[str], chunks: AsyncIterable[bytes]) -> SavedFileModel:
+    content = b"".join([chunk async for chunk in chunks])
+
+    return SavedFileModel(path=f"staged/{file_name}", content_hash="hash", file_name=file_name, size=len(content))
+
+
+@pytest.fixture
+def mock_stage_uploaded_file_usecase() -> StageUploadedFileUseCase:
+    usecase = Mock(StageUploadedFileUseCase)
+    usecase.execute = AsyncMock(side_effect=stage_file)
+    return usecase
+
+
+@pytest.fixture
+def mock_submit_transcription_job_usecase() -> SubmitTranscriptionJobUseCase:
+    return Mock(SubmitTranscriptionJobUseCase)
+
+
+@pytest.fixture
+def mock_get_transcription_job_usecase() -> GetTranscriptionJobUseCase:
+    return Mock(GetTranscriptionJobUseCase)
+
+
+@pytest.fixture
+def mock_cancel_transcription_job_usecase() -> CancelTranscriptionJobUseCase:
+    return Mock(CancelTranscriptionJobUseCase)
+
+
+@pytest.fixture
+def client(
+    mock_stage_uploaded_file_usecase: StageUploadedFileUseCase,
+    mock_submit_transcription_job_usecase: SubmitTranscriptionJobUseCase,
+    mock_get_transcription_job_usecase: GetTranscriptionJobUseCase,
+    mock_cancel_transcription_job_usecase: CancelTranscriptionJobUseCase,
+) -> TestClient:
+    router = JobsRouter()
+    app = FastAPI()
+    GlobalExceptionHandler(app, Mock(Logger))
+    app.include_router(router.router)
+    app.dependency_overrides[StageUploadedFileUseCase] = lambda: mock_stage_uploaded_file_usecase
+    app.dependency_overrides[SubmitTranscriptionJobUseCase] = lambda: mock_submit_transcription_job_usecase
+    app.dependency_overrides[GetTranscriptionJobUseCase] = lambda: mock_get_transcription_job_usecase
+    app.dependency_overrides[CancelTranscriptionJobUseCase] = lambda: mock_cancel_transcription_job_usecase
+    return TestClient(app)
+
+
+def test_submit_job_success(
+    client: TestClient,
+    mock_submit_transcription_job_usecase: Mock,
+) -> None:
+    # Given
+    mock_submit_transcription_job_usecase.execute.return_value = JobModel(job_id="job")
+
+    # When
+    response = client.post(
+        "/jobs",
+        data={"source_language": "en_US", "target_language": "pl_PL", "result_format": "srt"},
+        files={"file": ("test_file.mp3", "file content")},
+    )
+
+    # Then
+    assert response.status_code == 202
+    assert response.json() == {"job_id": "job", "status": "queued", "progress": 0.0, "result": None, "error": None}
+    mock_submit_transcription_job_usecase.execute.assert_called_once_with(
+        SavedFileModel(path="staged/test_file.mp3", content_hash="hash", file_name="test_file.mp3", size=12),
+        "en_US",
+        "pl_PL",
+        {},
+        {},
+        "srt",
+    )
+
+
+def test_submit_job_invalid_result_format(
+    client: TestClient,
+    mock_stage_uploaded_file_usecase: Mock,
+) -> None:
+    # When
+    response = client.post(
+        "/jobs",
+        data={"source_language": "en_US", "result_format": "vtt"},
+        files={"file": ("test_file.mp3", "file content")},
+    )
+
+    # Then
+    assert response.status_code == 422  # Unprocessable Entity
+    mock_stage_uploaded_file_usecase.discard.assert_called_once()
+
+
+def test_submit_job_queue_full(
+    client: TestClient,
+    mock_submit_transcription_job_usecase: Mock,
+) -> None:
+    # Given
+    mock_submit_transcription_job_usecase.execute.side_effect = JobQueueFullError()
+
+    # When
+    response = client.post(
+        "/jobs",
+        data={"source_language": "en_US"},
+        files={"file": ("test_file.mp3", "file content")},
+    )
+
+    # Then
+    assert response.status_code == 503  # Service Unavailable
+
+
+def test_get_job_success(
+    client: TestClient,
+    mock_get_transcription_job_usecase: Mock,
+) -> None:
+    # Given
+    mock_get_transcription_job_usecase.execute.return_value = JobModel(
+        job_id="job",
+        status=JobStatus.COMPLETED,
+        progress=1.0,
+        result="transcription",
+    )
+
+    # When
+    response = client.get("/jobs/job")
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+    assert response.json()["result"] == "transcription"
+
+
+def test_get_job_not_found(
+    client: TestClient,
+    mock_get_transcription_job_usecase: Mock,
+) -> None:
+    # Given
+    mock_get_transcription_job_usecase.execute.side_effect = JobNotFoundError("job")
+
+    # When
+    response = client.get("/jobs/job")
+
+    # Then
+    assert response.status_code == 404  # Not Found
+
+
+def test_cancel_job_success(
+    client: TestClient,
+    mock_cancel_transcription_job_usecase: Mock,
+) -> None:
+    # Given
+    mock_cancel_transcription_job_usecase.execute.return_value = JobModel(job_id="job", status=JobStatus.CANCELLED)
+
+    # When
+    response = client.delete("/jobs/job")
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["status"] == "cancelled"
+    mock_cancel_transcription_job_usecase.execute.assert_called_once_with("job")
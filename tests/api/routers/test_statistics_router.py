@@ -0,0 +1,44 @@
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routers.statistics_router import StatisticsRouter
+from application.usecases.get_cache_statistics_usecase import GetCacheStatisticsUseCase
+from domain.models.cache_statistics_model import CacheStatisticsModel
+
+
+@pytest.fixture
+def mock_get_cache_statistics_usecase() -> GetCacheStatisticsUseCase:
+    return Mock(GetCacheStatisticsUseCase)
+
+
+@pytest.fixture
+def client(mock_get_cache_statistics_usecase: GetCacheStatisticsUseCase) -> TestClient:
+    router = StatisticsRouter()
+    app = FastAPI()
+    app.include_router(router.router)
+    app.dependency_overrides[GetCacheStatisticsUseCase] = lambda: mock_get_cache_statistics_usecase
+    return TestClient(app)
+
+
+def test_cache_statistics_success(
+    client: TestClient,
+    mock_get_cache_statistics_usecase: Mock,
+) -> None:
+    # Given
+    mock_get_cache_statistics_usecase.execute.return_value = {
+        "translation": CacheStatisticsModel(hits=3, misses=2, entries=2),
+        "transcription": CacheStatisticsModel(hits=1, misses=4, entries=4),
+    }
+
+    # When
+    response = client.get("/statistics/cache")
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {
+        "translation": {"hits": 3, "misses": 2, "entries": 2},
+        "transcription": {"hits": 1, "misses": 4, "entries": 4},
+    }
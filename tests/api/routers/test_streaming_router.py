@@ -0,0 +1,71 @@
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routers.streaming_router import StreamingRouter
+from application.usecases.transcribe_stream_usecase import TranscribeStreamUseCase
+from core.logger.logger import Logger
+from domain.models.streaming_segment_model import (
+    StreamingSegmentModel,
+    StreamingSegmentType,
+)
+
+
+async def execute(
+    frames: AsyncIterable[bytes],
+    language: str,
+    audio_format: str,
+    transcription_parameters: Dict[str, Any],
+) -> AsyncIterator[StreamingSegmentModel]:
+    async for frame in frames:
+        yield StreamingSegmentModel(type=StreamingSegmentType.PARTIAL, text=f"{len(frame)} bytes", start=0.0, end=1.0)
+
+    yield StreamingSegmentModel(type=StreamingSegmentType.FINAL, text="done", start=0.0, end=1.0, latency=0.2)
+
+
+@pytest.fixture
+def mock_transcribe_stream_usecase() -> TranscribeStreamUseCase:
+    usecase = Mock(TranscribeStreamUseCase)
+    usecase.execute = Mock(side_effect=execute)
+    return usecase
+
+
+@pytest.fixture
+def client(mock_transcribe_stream_usecase: TranscribeStreamUseCase) -> TestClient:
+    router = StreamingRouter()
+    app = FastAPI()
+    app.include_router(router.router)
+    app.dependency_overrides[TranscribeStreamUseCase] = lambda: mock_transcribe_stream_usecase
+    app.dependency_overrides[Logger] = lambda: Mock(Logger)
+    return TestClient(app)
+
+
+def test_transcribe_stream_sends_segments(
+    client: TestClient,
+    mock_transcribe_stream_usecase: Mock,
+) -> None:
+    # When
+    with client.websocket_connect("/ws/transcribe?language=en_US&format=pcm_s16le") as websocket:
+        websocket.send_bytes(b"\x00" * 320)
+        partial = json.loads(websocket.receive_text())
+        websocket.send_text("end")
+        final = json.loads(websocket.receive_text())
+
+    # Then
+    assert partial == {"type": "partial", "text": "320 bytes", "start": 0.0, "end": 1.0}
+    assert final == {"type": "final", "text": "done", "start": 0.0, "end": 1.0, "latency": 0.2}
+    assert mock_transcribe_stream_usecase.execute.call_args[0][1:] == ("en_US", "pcm_s16le", {})
+
+
+def test_transcribe_stream_rejects_invalid_language(client: TestClient) -> None:
+    # When
+    with client.websocket_connect("/ws/transcribe?language=english") as websocket:
+        message = json.loads(websocket.receive_text())
+
+    # Then
+    assert message["type"] == "error"
+    assert "Invalid language format" in message["message"]
@@ -1,16 +1,37 @@
-from unittest.mock import AsyncMock, Mock
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterable, AsyncIterator, Optional
+from unittest.mock import AsyncMock, Mock, call
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from api.handlers.global_exception_handler import GlobalExceptionHandler
 from api.routers.transcribe_router import TranscribeRouter
+from application.usecases.stage_uploaded_file_usecase import StageUploadedFileUseCase
+from application.usecases.transcribe_batch_usecase import TranscribeBatchUseCase
+from application.usecases.transcribe_file_to_srt_stream_usecase import (
+    TranscribeFileToSrtStreamUseCase,
+)
 from application.usecases.transcribe_file_to_srt_usecase import (
     TranscribeFileToSrtUseCase,
 )
 from application.usecases.transcribe_file_to_text_usecase import (
     TranscribeFileToTextUseCase,
 )
+from core.admission.admission_controller import AdmissionController
+from core.logger.logger import Logger
+from domain.exceptions.admission_rejected_error import AdmissionRejectedError
+from domain.exceptions.upload_quota_exceeded_error import UploadQuotaExceededError
+from domain.models.batch_item_result_model import BatchItemResultModel
+from domain.models.saved_file_model import SavedFileModel
+from domain.models.subtitle_segment_model import SubtitleSegmentModel
+
+
+async def stage_file(file_name: Optional[str], chunks: AsyncIterable[bytes]) -> SavedFileModel:
+    content = b"".join([chunk async for chunk in chunks])
+
+    return SavedFileModel(path=f"staged/{file_name}", content_hash="hash", file_name=file_name, size=len(content))
 
 
 @pytest.fixture
@@ -23,16 +44,55 @@ def mock_transcribe_file_to_srt_usecase() -> TranscribeFileToSrtUseCase:
     return Mock(TranscribeFileToSrtUseCase)
 
 
+@pytest.fixture
+def mock_stage_uploaded_file_usecase() -> StageUploadedFileUseCase:
+    usecase = Mock(StageUploadedFileUseCase)
+    usecase.execute = AsyncMock(side_effect=stage_file)
+    return usecase
+
+
+@pytest.fixture
+def mock_transcribe_file_to_srt_stream_usecase() -> TranscribeFileToSrtStreamUseCase:
+    return Mock(TranscribeFileToSrtStreamUseCase)
+
+
+@pytest.fixture
+def mock_transcribe_batch_usecase() -> TranscribeBatchUseCase:
+    return Mock(TranscribeBatchUseCase)
+
+
+@asynccontextmanager
+async def admit(*args: Any, **kwargs: Any) -> AsyncIterator[None]:
+    yield
+
+
+@pytest.fixture
+def mock_admission_controller() -> AdmissionController:
+    admission_controller = Mock(AdmissionController)
+    admission_controller.admit = Mock(side_effect=admit)
+    return admission_controller
+
+
 @pytest.fixture
 def client(
+    mock_admission_controller: AdmissionController,
+    mock_stage_uploaded_file_usecase: StageUploadedFileUseCase,
     mock_transcribe_file_to_text_usecase: TranscribeFileToTextUseCase,
     mock_transcribe_file_to_srt_usecase: TranscribeFileToSrtUseCase,
+    mock_transcribe_file_to_srt_stream_usecase: TranscribeFileToSrtStreamUseCase,
+    mock_transcribe_batch_usecase: TranscribeBatchUseCase,
 ) -> TestClient:
     router = TranscribeRouter()
     app = FastAPI()
+    GlobalExceptionHandler(app, Mock(Logger))
     app.include_router(router.router)
+    app.dependency_overrides[AdmissionController] = lambda: mock_admission_controller
+    app.dependency_overrides[StageUploadedFileUseCase] = lambda: mock_stage_uploaded_file_usecase
     app.dependency_overrides[TranscribeFileToTextUseCase] = lambda: mock_transcribe_file_to_text_usecase
     app.dependency_overrides[TranscribeFileToSrtUseCase] = lambda: mock_transcribe_file_to_srt_usecase
+    app.dependency_overrides[TranscribeFileToSrtStreamUseCase] = lambda: mock_transcribe_file_to_srt_stream_usecase
+    app.dependency_overrides[TranscribeBatchUseCase] = lambda: mock_transcribe_batch_usecase
+    app.dependency_overrides[Logger] = lambda: Mock(Logger)
     return TestClient(app)
 
 
@@ -60,7 +120,37 @@ def test_transcribe_success(
     assert response.json() == {
         "transcription": "transcription_result",
     }
-    mock_transcribe_file_to_text_usecase.execute.assert_awaited_once()
+    mock_transcribe_file_to_text_usecase.execute.assert_awaited_once_with(
+        SavedFileModel(path="staged/test_file.txt", content_hash="hash", file_name="test_file.txt", size=12),
+        "en_US",
+        "pl_PL",
+        {},
+        {},
+    )
+
+
+def test_transcribe_parses_json_parameters(
+    client: TestClient,
+    mock_transcribe_file_to_text_usecase: TranscribeFileToTextUseCase,
+) -> None:
+    # Given
+    mock_transcribe_file_to_text_usecase.execute = AsyncMock(return_value="transcription_result")
+
+    # When
+    response = client.post(
+        "/transcribe",
+        data={
+            "source_language": "en_US",
+            "transcription_parameters": '{"num_beams": 5}',
+        },
+        files={
+            "file": ("test_file.txt", "file content"),
+        },
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert mock_transcribe_file_to_text_usecase.execute.await_args.args[1:] == ("en_US", None, {"num_beams": 5}, {})
 
 
 def test_transcribe_missing_file(client: TestClient) -> None:
@@ -71,7 +161,30 @@ def test_transcribe_missing_file(client: TestClient) -> None:
     assert response.status_code == 422  # Unprocessable Entity
 
 
-def test_transcribe_missing_source_language(client: TestClient) -> None:
+def test_transcribe_upload_quota_exceeded(
+    client: TestClient,
+    mock_stage_uploaded_file_usecase: StageUploadedFileUseCase,
+) -> None:
+    # Given
+    mock_stage_uploaded_file_usecase.execute = AsyncMock(side_effect=UploadQuotaExceededError(1))
+
+    # When
+    response = client.post(
+        "/transcribe",
+        data={"source_language": "en_US"},
+        files={"file": ("test_file.txt", b"file content")},
+    )
+
+    # Then
+    assert response.status_code == 507  # Insufficient Storage
+    assert response.json()["details"]["error_type"] == "UploadQuotaExceededError"
+
+
+def test_transcribe_missing_source_language(
+    client: TestClient,
+    mock_stage_uploaded_file_usecase: StageUploadedFileUseCase,
+    mock_transcribe_file_to_text_usecase: TranscribeFileToTextUseCase,
+) -> None:
     # When
     response = client.post(
         "/transcribe",
@@ -80,6 +193,8 @@ def test_transcribe_missing_source_language(client: TestClient) -> None:
 
     # Then
     assert response.status_code == 422  # Unprocessable Entity
+    mock_stage_uploaded_file_usecase.discard.assert_called_once()
+    mock_transcribe_file_to_text_usecase.execute.assert_not_called()
 
 
 def test_transcribe_srt_success(
@@ -126,3 +241,239 @@ def test_transcribe_srt_missing_source_language(client: TestClient) -> None:
 
     # Then
     assert response.status_code == 422  # Unprocessable Entity
+
+
+def test_transcribe_rejected_by_admission_control(
+    client: TestClient,
+    mock_admission_controller: AdmissionController,
+    mock_stage_uploaded_file_usecase: StageUploadedFileUseCase,
+    mock_transcribe_file_to_text_usecase: TranscribeFileToTextUseCase,
+) -> None:
+    # Given
+    mock_admission_controller.admit.side_effect = AdmissionRejectedError(7)
+    mock_transcribe_file_to_text_usecase.execute = AsyncMock()
+
+    # When
+    response = client.post(
+        "/transcribe",
+        data={
+            "source_language": "en_US",
+        },
+        files={
+            "file": ("test_file.txt", "file content"),
+        },
+    )
+
+    # Then
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "7"
+    assert response.json()["details"]["error_type"] == "AdmissionRejectedError"
+    mock_stage_uploaded_file_usecase.execute.assert_not_called()
+    mock_transcribe_file_to_text_usecase.execute.assert_not_called()
+
+
+def test_transcribe_srt_rejected_by_admission_control(
+    client: TestClient,
+    mock_admission_controller: AdmissionController,
+    mock_transcribe_file_to_srt_usecase: TranscribeFileToSrtUseCase,
+) -> None:
+    # Given
+    mock_admission_controller.admit.side_effect = AdmissionRejectedError(3)
+    mock_transcribe_file_to_srt_usecase.execute = AsyncMock()
+
+    # When
+    response = client.post(
+        "/transcribe/srt",
+        data={
+            "source_language": "en_US",
+        },
+        files={
+            "file": ("test_file.txt", "file content"),
+        },
+    )
+
+    # Then
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "3"
+    mock_transcribe_file_to_srt_usecase.execute.assert_not_called()
+
+
+def test_transcribe_srt_stream_sends_segment_events(
+    client: TestClient,
+    mock_admission_controller: AdmissionController,
+    mock_transcribe_file_to_srt_stream_usecase: TranscribeFileToSrtStreamUseCase,
+) -> None:
+    # Given
+    async def execute(*args: object) -> AsyncIterator[SubtitleSegmentModel]:
+        yield SubtitleSegmentModel(counter="1", time_range="00:00:00,000 --> 00:00:02,000", text=" First.")
+        yield SubtitleSegmentModel(counter="2", time_range="00:00:30,000 --> 00:00:32,000", text=" Second.")
+
+    mock_transcribe_file_to_srt_stream_usecase.execute = Mock(side_effect=execute)
+
+    # When
+    response = client.post(
+        "/transcribe/srt/stream",
+        data={
+            "source_language": "en_US",
+            "transcription_parameters": '{"num_beams": 5}',
+        },
+        files={
+            "file": ("test_file.txt", "file content"),
+        },
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text.split("\n\n")[:3] == [
+        'event: segment\ndata: {"counter":"1","time_range":"00:00:00,000 --> 00:00:02,000","text":" First."}',
+        'event: segment\ndata: {"counter":"2","time_range":"00:00:30,000 --> 00:00:32,000","text":" Second."}',
+        "event: end\ndata: {}",
+    ]
+    mock_transcribe_file_to_srt_stream_usecase.execute.assert_called_once_with(
+        SavedFileModel(path="staged/test_file.txt", content_hash="hash", file_name="test_file.txt", size=12),
+        "en_US",
+        {"num_beams": 5},
+    )
+    mock_admission_controller.admit.assert_called_once()
+
+
+def test_transcribe_srt_stream_reports_errors_as_event(
+    client: TestClient,
+    mock_transcribe_file_to_srt_stream_usecase: TranscribeFileToSrtStreamUseCase,
+) -> None:
+    # Given
+    async def execute(*args: object) -> AsyncIterator[SubtitleSegmentModel]:
+        raise RuntimeError("Transcription error")
+        yield
+
+    mock_transcribe_file_to_srt_stream_usecase.execute = Mock(side_effect=execute)
+
+    # When
+    response = client.post(
+        "/transcribe/srt/stream",
+        data={
+            "source_language": "en_US",
+        },
+        files={
+            "file": ("test_file.txt", "file content"),
+        },
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.text == (
+        'event: error\ndata: {"error_type": "RuntimeError", "error_message": "Transcription error"}\n\n'
+    )
+
+
+def test_transcribe_srt_stream_rejects_translation(
+    client: TestClient,
+    mock_stage_uploaded_file_usecase: StageUploadedFileUseCase,
+    mock_transcribe_file_to_srt_stream_usecase: TranscribeFileToSrtStreamUseCase,
+) -> None:
+    # When
+    response = client.post(
+        "/transcribe/srt/stream",
+        data={
+            "source_language": "en_US",
+            "target_language": "pl_PL",
+        },
+        files={
+            "file": ("test_file.txt", "file content"),
+        },
+    )
+
+    # Then
+    assert response.status_code == 422
+    mock_stage_uploaded_file_usecase.discard.assert_called_once()
+    mock_transcribe_file_to_srt_stream_usecase.execute.assert_not_called()
+
+
+def test_transcribe_batch_streams_ndjson_results(
+    client: TestClient,
+    mock_transcribe_batch_usecase: TranscribeBatchUseCase,
+) -> None:
+    # Given
+    async def results() -> AsyncIterator[BatchItemResultModel]:
+        yield BatchItemResultModel(index=1, file_name="second.mp3", result="second text")
+        yield BatchItemResultModel(index=0, file_name="first.mp3", error="Decoding error")
+
+    mock_transcribe_batch_usecase.execute = AsyncMock(return_value=results())
+
+    # When
+    response = client.post(
+        "/transcribe/batch",
+        data={
+            "source_language": "en_US",
+            "result_format": "srt",
+        },
+        files=[
+            ("file", ("first.mp3", "first content")),
+            ("file", ("second.mp3", "second content")),
+        ],
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.text.splitlines() == [
+        '{"index":1,"file_name":"second.mp3","status":"completed","result":"second text"}',
+        '{"index":0,"file_name":"first.mp3","status":"failed","error":"Decoding error"}',
+    ]
+    files, *arguments, _ = mock_transcribe_batch_usecase.execute.await_args.args
+    assert [file.file_name for file in files] == ["first.mp3", "second.mp3"]
+    assert arguments == ["en_US", None, {}, {}, "srt"]
+
+
+def test_transcribe_batch_admits_every_file(
+    client: TestClient,
+    mock_transcribe_batch_usecase: TranscribeBatchUseCase,
+    mock_admission_controller: AdmissionController,
+) -> None:
+    # Given
+    async def results() -> AsyncIterator[BatchItemResultModel]:
+        yield BatchItemResultModel(index=0, file_name="archive.zip", result="text")
+
+    async def execute(*args: Any) -> AsyncIterator[BatchItemResultModel]:
+        # The archive holds three files, which are reserved once it is extracted
+        await args[-1](3)
+        return results()
+
+    mock_transcribe_batch_usecase.execute = AsyncMock(side_effect=execute)
+
+    # When
+    response = client.post(
+        "/transcribe/batch",
+        data={
+            "source_language": "en_US",
+        },
+        files=[
+            ("file", ("archive.zip", "archive content")),
+        ],
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert mock_admission_controller.admit.call_args_list == [call(), call(2, held_units=1)]
+
+
+def test_transcribe_rejects_multiple_files(
+    client: TestClient,
+    mock_stage_uploaded_file_usecase: StageUploadedFileUseCase,
+) -> None:
+    # When
+    response = client.post(
+        "/transcribe",
+        data={
+            "source_language": "en_US",
+        },
+        files=[
+            ("file", ("first.mp3", "first content")),
+            ("file", ("second.mp3", "second content")),
+        ],
+    )
+
+    # Then
+    assert response.status_code == 422
+    assert mock_stage_uploaded_file_usecase.discard.call_count == 2
@@ -16,7 +16,9 @@ def mock_logger() -> Logger:
 
 @pytest.fixture
 def mock_config() -> AppConfig:
-    return Mock(AppConfig)
+    config = Mock(AppConfig)
+    config.client_api_keys = {}
+    return config
 
 
 @pytest.fixture
@@ -35,6 +37,8 @@ def test_api_server_initialization(
     assert isinstance(app, FastAPI)
     assert any(isinstance(middleware, type(api_server.app.user_middleware[0])) for middleware in app.user_middleware)
     assert any(getattr(route, "path", None) == "/transcribe" for route in app.routes)
+    assert any(getattr(route, "path", None) == "/statistics/cache" for route in app.routes)
+    assert any(getattr(route, "path", None) == "/jobs/{job_id}" for route in app.routes)
 
 
 def test_api_server_start(
@@ -0,0 +1,49 @@
+from unittest.mock import Mock
+
+import pytest
+
+from application.usecases.get_cache_statistics_usecase import GetCacheStatisticsUseCase
+from core.logger.logger import Logger
+from domain.models.cache_statistics_model import CacheStatisticsModel
+from domain.services.transcription_service import TranscriptionService
+from domain.services.translation_service import TranslationService
+
+
+@pytest.fixture
+def mock_translation_service() -> TranslationService:
+    return Mock(TranslationService)
+
+
+@pytest.fixture
+def mock_transcription_service() -> TranscriptionService:
+    return Mock(TranscriptionService)
+
+
+@pytest.fixture
+def get_cache_statistics_usecase(
+    mock_translation_service: TranslationService,
+    mock_transcription_service: TranscriptionService,
+) -> GetCacheStatisticsUseCase:
+    return GetCacheStatisticsUseCase(
+        logger=Mock(Logger),
+        translation_service=mock_translation_service,
+        transcription_service=mock_transcription_service,
+    )
+
+
+def test_execute_returns_cache_statistics(
+    get_cache_statistics_usecase: GetCacheStatisticsUseCase,
+    mock_translation_service: Mock,
+    mock_transcription_service: Mock,
+) -> None:
+    # Given
+    translation_statistics = CacheStatisticsModel(hits=4, misses=1, entries=4)
+    transcription_statistics = CacheStatisticsModel(hits=1, misses=2, entries=2)
+    mock_translation_service.get_cache_statistics.return_value = translation_statistics
+    mock_transcription_service.get_cache_statistics.return_value = transcription_statistics
+
+    # When
+    result = get_cache_statistics_usecase.execute()
+
+    # Then
+    assert result == {"translation": translation_statistics, "transcription": transcription_statistics}
@@ -0,0 +1,23 @@
+from unittest.mock import Mock
+
+from application.usecases.get_transcription_job_usecase import (
+    GetTranscriptionJobUseCase,
+)
+from core.job_queue.job_queue import JobQueue
+from core.logger.logger import Logger
+from domain.models.job_model import JobModel
+
+
+def test_execute() -> None:
+    # Given
+    job_queue = Mock(JobQueue)
+    job = JobModel(job_id="job")
+    job_queue.get.return_value = job
+    use_case = GetTranscriptionJobUseCase(logger=Mock(Logger), job_queue=job_queue)
+
+    # When
+    result = use_case.execute("job")
+
+    # Then
+    assert result == job
+    job_queue.get.assert_called_once_with("job")
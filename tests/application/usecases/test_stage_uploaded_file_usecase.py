@@ -0,0 +1,61 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.usecases.stage_uploaded_file_usecase import StageUploadedFileUseCase
+from core.logger.logger import Logger
+from domain.models.saved_file_model import SavedFileModel
+from domain.services.transcription_service import TranscriptionService
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_transcription_service() -> TranscriptionService:
+    return Mock(TranscriptionService)
+
+
+@pytest.fixture
+def use_case(
+    mock_logger: Logger,
+    mock_transcription_service: TranscriptionService,
+) -> StageUploadedFileUseCase:
+    return StageUploadedFileUseCase(
+        logger=mock_logger,
+        transcription_service=mock_transcription_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute(
+    use_case: StageUploadedFileUseCase,
+    mock_transcription_service: Mock,
+) -> None:
+    # Given
+    chunks = Mock()
+    saved_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file.txt")
+    mock_transcription_service.stage_file = AsyncMock(return_value=saved_file)
+
+    # When
+    result = await use_case.execute("test_file.txt", chunks)
+
+    # Then
+    assert result == saved_file
+    mock_transcription_service.stage_file.assert_awaited_once_with("test_file.txt", chunks)
+
+
+def test_discard(
+    use_case: StageUploadedFileUseCase,
+    mock_transcription_service: Mock,
+) -> None:
+    # Given
+    saved_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file.txt")
+
+    # When
+    use_case.discard(saved_file)
+
+    # Then
+    mock_transcription_service.discard_file.assert_called_once_with(saved_file)
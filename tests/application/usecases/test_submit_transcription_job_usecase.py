@@ -0,0 +1,110 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.usecases.submit_transcription_job_usecase import (
+    SubmitTranscriptionJobUseCase,
+)
+from application.usecases.transcribe_file_to_srt_usecase import (
+    TranscribeFileToSrtUseCase,
+)
+from application.usecases.transcribe_file_to_text_usecase import (
+    TranscribeFileToTextUseCase,
+)
+from core.job_queue.job_queue import JobQueue
+from core.logger.logger import Logger
+from domain.exceptions.job_queue_full_error import JobQueueFullError
+from domain.models.job_model import JobModel
+from domain.models.saved_file_model import SavedFileModel
+from domain.services.transcription_service import TranscriptionService
+
+
+@pytest.fixture
+def mock_job_queue() -> JobQueue:
+    return Mock(JobQueue)
+
+
+@pytest.fixture
+def mock_transcription_service() -> TranscriptionService:
+    return Mock(TranscriptionService)
+
+
+@pytest.fixture
+def mock_transcribe_file_to_text_usecase() -> TranscribeFileToTextUseCase:
+    return Mock(TranscribeFileToTextUseCase)
+
+
+@pytest.fixture
+def mock_transcribe_file_to_srt_usecase() -> TranscribeFileToSrtUseCase:
+    return Mock(TranscribeFileToSrtUseCase)
+
+
+@pytest.fixture
+def use_case(
+    mock_job_queue: JobQueue,
+    mock_transcription_service: TranscriptionService,
+    mock_transcribe_file_to_text_usecase: TranscribeFileToTextUseCase,
+    mock_transcribe_file_to_srt_usecase: TranscribeFileToSrtUseCase,
+) -> SubmitTranscriptionJobUseCase:
+    return SubmitTranscriptionJobUseCase(
+        logger=Mock(Logger),
+        job_queue=mock_job_queue,
+        transcription_service=mock_transcription_service,
+        transcribe_file_to_text_usecase=mock_transcribe_file_to_text_usecase,
+        transcribe_file_to_srt_usecase=mock_transcribe_file_to_srt_usecase,
+    )
+
+
+@pytest.fixture
+def saved_file() -> SavedFileModel:
+    return SavedFileModel(path="test_path", content_hash="hash", file_name="test_file.mp3")
+
+
+@pytest.mark.asyncio
+async def test_execute_submits_srt_job(
+    use_case: SubmitTranscriptionJobUseCase,
+    mock_job_queue: Mock,
+    mock_transcription_service: Mock,
+    mock_transcribe_file_to_srt_usecase: Mock,
+    saved_file: SavedFileModel,
+) -> None:
+    # Given
+    job = JobModel(job_id="job")
+    mock_job_queue.submit.return_value = job
+    mock_transcribe_file_to_srt_usecase.execute = AsyncMock(return_value="srt")
+    progress_callback = Mock()
+
+    # When
+    result = use_case.execute(saved_file, "en_US", "pl_PL", {}, {"num_beams": 2}, "srt")
+
+    # Then
+    assert result == job
+    key, function, discard = mock_job_queue.submit.call_args.args
+    assert key == ("hash", "en_US", "pl_PL", "{}", '{"num_beams": 2}', "srt")
+    assert await function(progress_callback) == "srt"
+    mock_transcribe_file_to_srt_usecase.execute.assert_awaited_once_with(
+        saved_file,
+        "en_US",
+        "pl_PL",
+        {},
+        {"num_beams": 2},
+        progress_callback,
+    )
+    discard()
+    mock_transcription_service.discard_file.assert_called_once_with(saved_file)
+
+
+def test_execute_discards_file_when_queue_is_full(
+    use_case: SubmitTranscriptionJobUseCase,
+    mock_job_queue: Mock,
+    mock_transcription_service: Mock,
+    saved_file: SavedFileModel,
+) -> None:
+    # Given
+    mock_job_queue.submit.side_effect = JobQueueFullError()
+
+    # When / Then
+    with pytest.raises(JobQueueFullError):
+        use_case.execute(saved_file, "en_US", None, {}, {}, "text")
+
+    mock_transcription_service.discard_file.assert_called_once_with(saved_file)
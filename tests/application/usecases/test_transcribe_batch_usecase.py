@@ -0,0 +1,230 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.usecases.transcribe_batch_usecase import TranscribeBatchUseCase
+from application.usecases.transcribe_file_to_srt_usecase import (
+    TranscribeFileToSrtUseCase,
+)
+from application.usecases.transcribe_file_to_text_usecase import (
+    TranscribeFileToTextUseCase,
+)
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.exceptions.batch_too_large_error import BatchTooLargeError
+from domain.exceptions.language_not_found_error import LanguageNotFoundError
+from domain.models.batch_item_result_model import BatchItemResultModel
+from domain.models.saved_file_model import SavedFileModel
+from domain.services.language_mapping_service import LanguageMappingService
+from domain.services.transcription_service import TranscriptionService
+
+
+@pytest.fixture
+def mock_config() -> AppConfig:
+    config = Mock(AppConfig)
+    config.transcribe_batch_max_files = 3
+    config.speech_to_text_worker_pool_size = 1
+    config.speech_to_text_model_name = "openai/whisper"
+    config.translation_model_name = "facebook/mbart"
+    return config
+
+
+@pytest.fixture
+def mock_transcription_service() -> Mock:
+    return Mock(TranscriptionService)
+
+
+@pytest.fixture
+def mock_language_mapping_service() -> Mock:
+    return Mock(LanguageMappingService)
+
+
+@pytest.fixture
+def mock_transcribe_file_to_text_usecase() -> Mock:
+    return Mock(TranscribeFileToTextUseCase)
+
+
+@pytest.fixture
+def mock_transcribe_file_to_srt_usecase() -> Mock:
+    return Mock(TranscribeFileToSrtUseCase)
+
+
+@pytest.fixture
+def usecase(
+    mock_config: AppConfig,
+    mock_transcription_service: Mock,
+    mock_language_mapping_service: Mock,
+    mock_transcribe_file_to_text_usecase: Mock,
+    mock_transcribe_file_to_srt_usecase: Mock,
+) -> TranscribeBatchUseCase:
+    return TranscribeBatchUseCase(
+        config=mock_config,
+        logger=Mock(Logger),
+        transcription_service=mock_transcription_service,
+        language_mapping_service=mock_language_mapping_service,
+        transcribe_file_to_text_usecase=mock_transcribe_file_to_text_usecase,
+        transcribe_file_to_srt_usecase=mock_transcribe_file_to_srt_usecase,
+    )
+
+
+def create_file(file_name: str) -> SavedFileModel:
+    return SavedFileModel(path=f"staged/{file_name}", content_hash=file_name, file_name=file_name)
+
+
+@pytest.mark.asyncio
+async def test_execute_yields_results_as_files_finish(
+    usecase: TranscribeBatchUseCase,
+    mock_transcribe_file_to_text_usecase: Mock,
+) -> None:
+    # Given
+    durations = {"slow.mp3": 0.02, "fast.mp3": 0.0, "broken.mp3": 0.01}
+
+    async def execute(file: SavedFileModel, *args: Any) -> str:
+        await asyncio.sleep(durations[str(file.file_name)])
+
+        if file.file_name == "broken.mp3":
+            raise RuntimeError("Decoding error")
+
+        return f"text of {file.file_name}"
+
+    mock_transcribe_file_to_text_usecase.execute = AsyncMock(side_effect=execute)
+    usecase.config.speech_to_text_worker_pool_size = 2
+    files = [create_file("slow.mp3"), create_file("fast.mp3"), create_file("broken.mp3")]
+
+    # When
+    results = [result async for result in await usecase.execute(files, "en_US", None, {}, {}, "text")]
+
+    # Then
+    assert results == [
+        BatchItemResultModel(index=1, file_name="fast.mp3", result="text of fast.mp3"),
+        BatchItemResultModel(index=2, file_name="broken.mp3", error="Decoding error"),
+        BatchItemResultModel(index=0, file_name="slow.mp3", result="text of slow.mp3"),
+    ]
+    mock_transcribe_file_to_text_usecase.execute.assert_any_await(files[0], "en_US", None, {}, {})
+
+
+@pytest.mark.asyncio
+async def test_execute_extracts_archives_and_uses_srt_usecase(
+    usecase: TranscribeBatchUseCase,
+    mock_transcription_service: Mock,
+    mock_transcribe_file_to_srt_usecase: Mock,
+) -> None:
+    # Given
+    archive = create_file("clips.ZIP")
+    extracted = [create_file("one.mp3"), create_file("two.mp3")]
+    mock_transcription_service.extract_archive = AsyncMock(return_value=extracted)
+    mock_transcribe_file_to_srt_usecase.execute = AsyncMock(return_value="srt")
+
+    # When
+    results = [result async for result in await usecase.execute([archive], "en_US", "pl_PL", {}, {}, "srt")]
+
+    # Then
+    mock_transcription_service.extract_archive.assert_awaited_once_with(archive, 3)
+    assert sorted(result.file_name for result in results) == ["one.mp3", "two.mp3"]
+    assert mock_transcribe_file_to_srt_usecase.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_reserves_every_extracted_file(
+    usecase: TranscribeBatchUseCase,
+    mock_transcription_service: Mock,
+    mock_transcribe_file_to_text_usecase: Mock,
+) -> None:
+    # Given
+    archive = create_file("clips.zip")
+    extracted = [create_file("one.mp3"), create_file("two.mp3")]
+    mock_transcription_service.extract_archive = AsyncMock(return_value=extracted)
+    mock_transcribe_file_to_text_usecase.execute = AsyncMock(return_value="text")
+    reserve_files = AsyncMock()
+
+    # When
+    await usecase.execute([archive, create_file("three.mp3")], "en_US", None, {}, {}, "text", reserve_files)
+
+    # Then
+    reserve_files.assert_awaited_once_with(3)
+
+
+@pytest.mark.asyncio
+async def test_execute_discards_files_when_reservation_is_rejected(
+    usecase: TranscribeBatchUseCase,
+    mock_transcription_service: Mock,
+    mock_transcribe_file_to_text_usecase: Mock,
+) -> None:
+    # Given
+    files = [create_file("one.mp3"), create_file("two.mp3")]
+    reserve_files = AsyncMock(side_effect=RuntimeError("queue full"))
+
+    # When / Then
+    with pytest.raises(RuntimeError):
+        await usecase.execute(files, "en_US", None, {}, {}, "text", reserve_files)
+
+    assert mock_transcription_service.discard_file.call_count == 2
+    mock_transcribe_file_to_text_usecase.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_rejects_batch_over_limit(
+    usecase: TranscribeBatchUseCase,
+    mock_transcription_service: Mock,
+    mock_transcribe_file_to_text_usecase: Mock,
+) -> None:
+    # Given
+    files = [create_file(f"{index}.mp3") for index in range(4)]
+
+    # When / Then
+    with pytest.raises(BatchTooLargeError):
+        await usecase.execute(files, "en_US", None, {}, {}, "text")
+
+    assert mock_transcription_service.discard_file.call_count == 4
+    mock_transcribe_file_to_text_usecase.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_validates_languages_once_before_transcribing(
+    usecase: TranscribeBatchUseCase,
+    mock_transcription_service: Mock,
+    mock_language_mapping_service: Mock,
+    mock_transcribe_file_to_text_usecase: Mock,
+) -> None:
+    # Given
+    mock_language_mapping_service.map_language.side_effect = [
+        "en",
+        "en_XX",
+        LanguageNotFoundError("xx_XX", "facebook/mbart"),
+    ]
+    files = [create_file("one.mp3"), create_file("two.mp3")]
+
+    # When / Then
+    with pytest.raises(LanguageNotFoundError):
+        await usecase.execute(files, "en_US", "xx_XX", {}, {}, "text")
+
+    assert mock_transcription_service.discard_file.call_count == 2
+    mock_transcribe_file_to_text_usecase.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_discards_files_not_started_when_closed_early(
+    usecase: TranscribeBatchUseCase,
+    mock_transcription_service: Mock,
+    mock_transcribe_file_to_text_usecase: Mock,
+) -> None:
+    # Given
+    async def execute(file: SavedFileModel, *args: Any) -> str:
+        if file.file_name != "one.mp3":
+            await asyncio.Event().wait()
+
+        return "text"
+
+    mock_transcribe_file_to_text_usecase.execute = AsyncMock(side_effect=execute)
+    usecase.config.transcribe_batch_max_files = 4
+    files = [create_file("one.mp3"), create_file("two.mp3"), create_file("three.mp3"), create_file("four.mp3")]
+    results = await usecase.execute(files, "en_US", None, {}, {}, "text")
+
+    # When
+    await results.__anext__()
+    await results.aclose()
+
+    # Then
+    mock_transcription_service.discard_file.assert_called_once_with(files[3])
@@ -0,0 +1,131 @@
+import asyncio
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from core.logger.logger import Logger
+from domain.models.saved_file_model import SavedFileModel
+from domain.models.subtitle_segment_model import SubtitleSegmentModel
+from domain.models.transcription_result_model import (
+    SegmentModel,
+    TranscriptionResultModel,
+)
+from domain.services.subtitle_service import SubtitleService
+from domain.services.transcription_service import TranscriptionService
+from src.application.usecases.transcribe_file_to_srt_stream_usecase import (
+    TranscribeFileToSrtStreamUseCase,
+)
+
+
+@pytest.fixture
+def mock_transcription_service() -> Mock:
+    return Mock(TranscriptionService)
+
+
+@pytest.fixture
+def usecase(mock_transcription_service: Mock) -> TranscribeFileToSrtStreamUseCase:
+    return TranscribeFileToSrtStreamUseCase(
+        logger=Mock(Logger),
+        transcription_service=mock_transcription_service,
+        subtitle_service=SubtitleService(Mock(Logger)),
+    )
+
+
+def create_partial_result(*segments: SegmentModel) -> TranscriptionResultModel:
+    return TranscriptionResultModel(text="".join(segment.text for segment in segments), segments=list(segments))
+
+
+@pytest.mark.asyncio
+async def test_execute_yields_subtitles_of_each_window_with_continuous_counters(
+    usecase: TranscribeFileToSrtStreamUseCase,
+    mock_transcription_service: Mock,
+) -> None:
+    # Given
+    file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file")
+    received_before_completion: list[SubtitleSegmentModel] = []
+    first_window_sent = asyncio.Event()
+    first_window_received = asyncio.Event()
+
+    async def transcribe(*args: Any, segment_callback: Any, **kwargs: Any) -> TranscriptionResultModel:
+        segment_callback(
+            create_partial_result(
+                SegmentModel(start=0.0, end=2.0, text=" First."),
+                SegmentModel(start=2.0, end=4.0, text=" Second."),
+            ),
+        )
+        first_window_sent.set()
+        await first_window_received.wait()
+        segment_callback(create_partial_result(SegmentModel(start=30.0, end=32.0, text=" Third.")))
+        return TranscriptionResultModel(text="", segments=[])
+
+    mock_transcription_service.transcribe.side_effect = transcribe
+
+    # When
+    subtitle_segments = []
+
+    async for subtitle_segment in usecase.execute(file, "en_US", {"num_beams": 2}):
+        subtitle_segments.append(subtitle_segment)
+
+        if len(subtitle_segments) == 2:
+            received_before_completion.extend(subtitle_segments)
+            first_window_received.set()
+
+    # Then
+    assert first_window_sent.is_set()
+    assert [segment.counter for segment in received_before_completion] == ["1", "2"]
+    assert subtitle_segments[2] == SubtitleSegmentModel(
+        counter="3",
+        time_range="00:00:30,000 --> 00:00:32,000",
+        text=" Third.",
+    )
+    assert mock_transcription_service.transcribe.call_args.args == (file, "en_US", {"num_beams": 2})
+    assert mock_transcription_service.transcribe.call_args.kwargs["segment_fields"] == ()
+
+
+@pytest.mark.asyncio
+async def test_execute_propagates_transcription_error(
+    usecase: TranscribeFileToSrtStreamUseCase,
+    mock_transcription_service: Mock,
+) -> None:
+    # Given
+    file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file")
+    mock_transcription_service.transcribe.side_effect = RuntimeError("Transcription error")
+
+    # When / Then
+    with pytest.raises(RuntimeError, match="Transcription error"):
+        async for _ in usecase.execute(file, "en_US", {}):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_execute_cancels_transcription_when_closed_early(
+    usecase: TranscribeFileToSrtStreamUseCase,
+    mock_transcription_service: Mock,
+) -> None:
+    # Given
+    file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file")
+    cancelled = asyncio.Event()
+
+    async def transcribe(*args: Any, segment_callback: Any, **kwargs: Any) -> TranscriptionResultModel:
+        segment_callback(create_partial_result(SegmentModel(start=0.0, end=2.0, text=" First.")))
+
+        try:
+            await asyncio.Event().wait()
+
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+        return TranscriptionResultModel(text="", segments=[])
+
+    mock_transcription_service.transcribe.side_effect = transcribe
+    subtitle_segments = usecase.execute(file, "en_US", {})
+
+    # When
+    await subtitle_segments.__anext__()
+    await subtitle_segments.aclose()
+    await asyncio.sleep(0)
+
+    # Then
+    assert cancelled.is_set()
@@ -1,10 +1,17 @@
+import asyncio
+from typing import Any
 from unittest.mock import AsyncMock, Mock
 
 import pytest
-from fastapi import UploadFile
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from domain.models.saved_file_model import SavedFileModel
+from domain.models.sentence_model import SentenceModel
+from domain.models.transcription_result_model import (
+    SegmentModel,
+    TranscriptionResultModel,
+)
 from domain.services.sentence_service import SentenceService
 from domain.services.subtitle_service import SubtitleService
 from domain.services.transcription_service import TranscriptionService
@@ -72,8 +79,7 @@ async def test_execute_success_no_translation(
     mock_translation_service: Mock,
 ) -> None:
     # Given
-    mock_file = Mock(UploadFile)
-    mock_file.filename = "test_file.txt"
+    mock_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file.txt")
     mock_transcription_service.transcribe = AsyncMock(return_value="transcription_result")
     mock_subtitle_service.convert_to_subtitle_segments.return_value = ["segment1", "segment2"]
     mock_subtitle_service.generate_srt_result.return_value = "srt_result"
@@ -83,7 +89,9 @@ async def test_execute_success_no_translation(
 
     # Then
     assert result == "srt_result"
-    mock_transcription_service.transcribe.assert_awaited_once_with(mock_file, "en", {})
+    mock_transcription_service.transcribe.assert_awaited_once_with(
+        mock_file, "en", {}, segment_fields=(), segment_callback=None
+    )
     mock_subtitle_service.convert_to_subtitle_segments.assert_called_once_with("transcription_result")
     mock_subtitle_service.generate_srt_result.assert_called_once_with(["segment1", "segment2"])
     mock_sentence_service.create_sentence_models.assert_not_called()
@@ -93,36 +101,151 @@ async def test_execute_success_no_translation(
 
 @pytest.mark.asyncio
 async def test_execute_success_with_translation(
+    mock_config: Mock,
+    mock_logger: Mock,
+    mock_transcription_service: Mock,
+    mock_translation_service: Mock,
+) -> None:
+    # Given
+    usecase = TranscribeFileToSrtUseCase(
+        config=mock_config,
+        logger=mock_logger,
+        transcription_service=mock_transcription_service,
+        subtitle_service=SubtitleService(mock_logger),
+        sentence_service=SentenceService(mock_logger),
+        translation_service=mock_translation_service,
+    )
+    mock_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file.txt")
+    translated_texts: list[list[str]] = []
+
+    async def transcribe(*args: Any, segment_callback: Any, **kwargs: Any) -> TranscriptionResultModel:
+        segment_callback(
+            TranscriptionResultModel(
+                text=" First sentence. Second",
+                segments=[
+                    SegmentModel(start=0.0, end=2.0, text=" First sentence."),
+                    SegmentModel(start=2.0, end=3.0, text=" Second"),
+                ],
+            ),
+        )
+        await asyncio.sleep(0)
+        # The first sentence is translated while the next window is still being decoded
+        assert translated_texts == [["First sentence."]]
+        segment_callback(
+            TranscriptionResultModel(
+                text=" sentence.",
+                segments=[SegmentModel(start=30.0, end=31.0, text=" sentence.")],
+            ),
+        )
+        return TranscriptionResultModel(text="", segments=[])
+
+    async def translate_sentences(sentences: list[SentenceModel], *args: Any) -> None:
+        translated_texts.append([sentence.text for sentence in sentences])
+
+        for sentence in sentences:
+            sentence.translation = sentence.text.upper()
+
+    mock_transcription_service.transcribe = AsyncMock(side_effect=transcribe)
+    mock_translation_service.translate_sentences = AsyncMock(side_effect=translate_sentences)
+
+    # When
+    result = await usecase.execute(mock_file, "en", "pl", {}, {"num_beams": 2})
+
+    # Then
+    assert result == (
+        "1\n00:00:00,000 --> 00:00:02,000\nFIRST SENTENCE.\n\n"
+        "2\n00:00:02,000 --> 00:00:03,000\nSECOND\n\n"
+        "3\n00:00:30,000 --> 00:00:31,000\nSENTENCE.\n"
+    )
+    assert translated_texts == [["First sentence."], ["Second sentence."]]
+    assert mock_translation_service.translate_sentences.await_args.args[1:] == ("en", "pl", {"num_beams": 2})
+    assert mock_transcription_service.transcribe.await_args.kwargs["segment_fields"] == ()
+
+
+@pytest.mark.asyncio
+async def test_execute_with_translation_reports_progress_of_decoded_segments(
+    mock_config: Mock,
+    mock_logger: Mock,
+    mock_transcription_service: Mock,
+    mock_translation_service: Mock,
+) -> None:
+    # Given
+    usecase = TranscribeFileToSrtUseCase(
+        config=mock_config,
+        logger=mock_logger,
+        transcription_service=mock_transcription_service,
+        subtitle_service=SubtitleService(mock_logger),
+        sentence_service=SentenceService(mock_logger),
+        translation_service=mock_translation_service,
+    )
+    mock_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file.txt")
+    partial_result = TranscriptionResultModel(
+        text=" First sentence.",
+        segments=[SegmentModel(start=0.0, end=2.0, text=" First sentence.")],
+    )
+
+    async def transcribe(*args: Any, segment_callback: Any, **kwargs: Any) -> TranscriptionResultModel:
+        segment_callback(partial_result)
+        return partial_result
+
+    async def translate_sentences(sentences: list[SentenceModel], *args: Any) -> None:
+        for sentence in sentences:
+            sentence.translation = sentence.text
+
+    progress_reporter = Mock()
+    progress_callback = Mock()
+    mock_transcription_service.create_progress_reporter = AsyncMock(return_value=progress_reporter)
+    mock_transcription_service.transcribe = AsyncMock(side_effect=transcribe)
+    mock_translation_service.translate_sentences = AsyncMock(side_effect=translate_sentences)
+
+    # When
+    await usecase.execute(mock_file, "en", "pl", {}, {}, progress_callback)
+
+    # Then
+    mock_transcription_service.create_progress_reporter.assert_awaited_once_with(mock_file, progress_callback, 0.6)
+    progress_reporter.assert_called_once_with(partial_result)
+    progress_callback.assert_called_once_with(0.6)
+
+
+@pytest.mark.asyncio
+async def test_execute_with_translation_cancels_translations_on_transcription_error(
     usecase: TranscribeFileToSrtUseCase,
     mock_transcription_service: Mock,
-    mock_subtitle_service: Mock,
     mock_sentence_service: Mock,
+    mock_subtitle_service: Mock,
     mock_translation_service: Mock,
 ) -> None:
     # Given
-    mock_file = Mock(UploadFile)
-    mock_file.filename = "test_file.txt"
-    mock_transcription_service.transcribe = AsyncMock(return_value="transcription_result")
-    mock_subtitle_service.convert_to_subtitle_segments.return_value = ["segment1", "segment2"]
-    mock_sentence_service.create_sentence_models.return_value = ["sentence1", "sentence2"]
-    mock_translation_service.translate_sentences.return_value = ["translated_sentence1", "translated_sentence2"]
-    mock_sentence_service.apply_translated_sentences.return_value = ["translated_segment1", "translated_segment2"]
-    mock_subtitle_service.generate_srt_result.return_value = "translated_srt_result"
+    mock_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file.txt")
+    translation_cancelled = asyncio.Event()
+
+    async def transcribe(*args: Any, segment_callback: Any, **kwargs: Any) -> TranscriptionResultModel:
+        segment_callback(TranscriptionResultModel(text=" Done.", segments=[]))
+        await asyncio.sleep(0)
+        raise RuntimeError("Transcription error")
+
+    async def translate_sentences(*args: Any) -> None:
+        try:
+            await asyncio.Event().wait()
+
+        except asyncio.CancelledError:
+            translation_cancelled.set()
+            raise
+
+    mock_sentence_service.create_sentence_builder.return_value.add_segments.return_value = ["sentence"]
+    mock_subtitle_service.convert_to_subtitle_segments.return_value = []
+    mock_transcription_service.transcribe = AsyncMock(side_effect=transcribe)
+    mock_translation_service.translate_sentences = AsyncMock(side_effect=translate_sentences)
 
     # When
-    result = await usecase.execute(mock_file, "en", "pl", {}, {})
+    with pytest.raises(RuntimeError, match="Transcription error"):
+        await usecase.execute(mock_file, "en", "pl", {}, {})
+
+    await asyncio.sleep(0)
 
     # Then
-    assert result == "translated_srt_result"
-    mock_transcription_service.transcribe.assert_awaited_once_with(mock_file, "en", {})
-    mock_subtitle_service.convert_to_subtitle_segments.assert_called_once_with("transcription_result")
-    mock_sentence_service.create_sentence_models.assert_called_once_with(["segment1", "segment2"])
-    mock_translation_service.translate_sentences.assert_called_once_with(["sentence1", "sentence2"], "en", "pl", {})
-    mock_sentence_service.apply_translated_sentences.assert_called_once_with(
-        ["segment1", "segment2"],
-        ["sentence1", "sentence2"],
-    )
-    mock_subtitle_service.generate_srt_result.assert_called_once_with(["segment1", "segment2"])
+    assert translation_cancelled.is_set()
+    mock_sentence_service.apply_translated_sentences.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -134,8 +257,7 @@ async def test_execute_failure(
     mock_translation_service: Mock,
 ) -> None:
     # Given
-    mock_file = Mock(UploadFile)
-    mock_file.filename = "test_file.txt"
+    mock_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file.txt")
     mock_transcription_service.transcribe = AsyncMock(side_effect=Exception("Transcription error"))
 
     # When
@@ -143,7 +265,8 @@ async def test_execute_failure(
         await usecase.execute(mock_file, "en", "pl", {}, {})
 
     # Then
-    mock_transcription_service.transcribe.assert_awaited_once_with(mock_file, "en", {})
+    mock_transcription_service.transcribe.assert_awaited_once()
+    assert mock_transcription_service.transcribe.await_args.args == (mock_file, "en", {})
     mock_subtitle_service.convert_to_subtitle_segments.assert_not_called()
     mock_sentence_service.create_sentence_models.assert_not_called()
     mock_translation_service.translate_sentences.assert_not_called()
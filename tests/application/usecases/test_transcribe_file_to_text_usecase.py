@@ -1,13 +1,13 @@
 from unittest.mock import AsyncMock, Mock
 
 import pytest
-from fastapi import UploadFile
 
 from application.usecases.transcribe_file_to_text_usecase import (
     TranscribeFileToTextUseCase,
 )
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from domain.models.saved_file_model import SavedFileModel
 from domain.models.transcription_result_model import TranscriptionResultModel
 from domain.repositories.file_repository import FileRepository
 from domain.services.transcription_service import TranscriptionService
@@ -61,8 +61,7 @@ async def test_execute_success_no_translation(
     mock_translation_service: Mock,
 ) -> None:
     # Given
-    mock_file = Mock(UploadFile)
-    mock_file.filename = "test_file.txt"
+    mock_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file.txt")
     mock_transcription_service.transcribe = AsyncMock(
         return_value=TranscriptionResultModel(text="transcription_result", segments=[]),
     )
@@ -72,7 +71,9 @@ async def test_execute_success_no_translation(
 
     # Then
     assert result == "transcription_result"
-    mock_transcription_service.transcribe.assert_awaited_once_with(mock_file, "en", {})
+    mock_transcription_service.transcribe.assert_awaited_once_with(
+        mock_file, "en", {}, segment_fields=(), segment_callback=None
+    )
     mock_translation_service.translate_text.assert_not_called()
 
 
@@ -83,20 +84,21 @@ async def test_execute_success_with_translation(
     mock_translation_service: Mock,
 ) -> None:
     # Given
-    mock_file = Mock(UploadFile)
-    mock_file.filename = "test_file.txt"
+    mock_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file.txt")
     mock_transcription_service.transcribe = AsyncMock(
         return_value=TranscriptionResultModel(text="transcription_result", segments=[]),
     )
-    mock_translation_service.translate_text = Mock(return_value="translated_result")
+    mock_translation_service.translate_text = AsyncMock(return_value="translated_result")
 
     # When
     result = await use_case.execute(mock_file, "en", "pl", {}, {})
 
     # Then
     assert result == "translated_result"
-    mock_transcription_service.transcribe.assert_awaited_once_with(mock_file, "en", {})
-    mock_translation_service.translate_text.assert_called_once_with("transcription_result", "en", "pl", {})
+    mock_transcription_service.transcribe.assert_awaited_once_with(
+        mock_file, "en", {}, segment_fields=(), segment_callback=None
+    )
+    mock_translation_service.translate_text.assert_awaited_once_with("transcription_result", "en", "pl", {})
 
 
 @pytest.mark.asyncio
@@ -106,8 +108,7 @@ async def test_execute_failure(
     mock_translation_service: Mock,
 ) -> None:
     # Given
-    mock_file = Mock(UploadFile)
-    mock_file.filename = "test_file.txt"
+    mock_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file.txt")
     mock_transcription_service.transcribe = AsyncMock(side_effect=Exception("Transcription error"))
 
     # When
@@ -115,5 +116,38 @@ async def test_execute_failure(
         await use_case.execute(mock_file, "en", "pl", {}, {})
 
     # Then
-    mock_transcription_service.transcribe.assert_awaited_once_with(mock_file, "en", {})
+    mock_transcription_service.transcribe.assert_awaited_once_with(
+        mock_file, "en", {}, segment_fields=(), segment_callback=None
+    )
     mock_translation_service.translate_text.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_reports_progress(
+    use_case: TranscribeFileToTextUseCase,
+    mock_transcription_service: Mock,
+    mock_translation_service: Mock,
+) -> None:
+    # Given
+    mock_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file.txt")
+    mock_transcription_service.transcribe = AsyncMock(
+        return_value=TranscriptionResultModel(text="transcription_result", segments=[]),
+    )
+    mock_translation_service.translate_text = AsyncMock(return_value="translated_result")
+    progress_reporter = Mock()
+    mock_transcription_service.create_progress_reporter = AsyncMock(return_value=progress_reporter)
+    progress_callback = Mock()
+
+    # When
+    await use_case.execute(mock_file, "en", "pl", {}, {}, progress_callback)
+
+    # Then
+    mock_transcription_service.create_progress_reporter.assert_awaited_once_with(mock_file, progress_callback, 0.6)
+    mock_transcription_service.transcribe.assert_awaited_once_with(
+        mock_file,
+        "en",
+        {},
+        segment_fields=(),
+        segment_callback=progress_reporter,
+    )
+    progress_callback.assert_called_once_with(0.6)
@@ -0,0 +1,87 @@
+from typing import AsyncIterator, List
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+from application.usecases.transcribe_stream_usecase import TranscribeStreamUseCase
+from core.logger.logger import Logger
+from domain.models.streaming_segment_model import (
+    StreamingSegmentModel,
+    StreamingSegmentType,
+)
+from domain.services.streaming_transcription_service import (
+    StreamingTranscriptionService,
+    StreamingTranscriptionSession,
+)
+
+
+async def frames(*items: bytes) -> AsyncIterator[bytes]:
+    for item in items:
+        yield item
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_session() -> StreamingTranscriptionSession:
+    session = Mock(StreamingTranscriptionSession)
+    session.push_audio = AsyncMock(return_value=[])
+    session.finish = AsyncMock(
+        return_value=[
+            StreamingSegmentModel(type=StreamingSegmentType.FINAL, text="Hello", start=0.0, end=0.4, latency=0.3),
+        ],
+    )
+    session.latencies = [0.3]
+    return session
+
+
+@pytest.fixture
+def mock_streaming_transcription_service(mock_session: StreamingTranscriptionSession) -> StreamingTranscriptionService:
+    service = Mock(StreamingTranscriptionService)
+    service.create_session.return_value = mock_session
+    return service
+
+
+@pytest.fixture
+def use_case(
+    mock_logger: Logger,
+    mock_streaming_transcription_service: StreamingTranscriptionService,
+) -> TranscribeStreamUseCase:
+    return TranscribeStreamUseCase(
+        logger=mock_logger,
+        streaming_transcription_service=mock_streaming_transcription_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_feeds_decoded_frames_to_session(
+    use_case: TranscribeStreamUseCase,
+    mock_session: Mock,
+    mock_streaming_transcription_service: Mock,
+    mock_logger: Mock,
+) -> None:
+    # Given
+    samples = np.array([0.25, -0.5], dtype="<f4").tobytes()
+
+    # When
+    result: List[StreamingSegmentModel] = [
+        segment async for segment in use_case.execute(frames(samples), "en_US", "pcm_f32le", {"temperature": 0})
+    ]
+
+    # Then
+    assert [segment.text for segment in result] == ["Hello"]
+    mock_streaming_transcription_service.create_session.assert_called_once_with("en_US", {"temperature": 0})
+    assert mock_session.push_audio.await_args_list[0][0][0] == samples
+    mock_session.finish.assert_awaited_once()
+    assert "average latency 0.300s" in mock_logger.info.call_args[0][0]
+
+
+@pytest.mark.asyncio
+async def test_execute_rejects_unknown_format(use_case: TranscribeStreamUseCase) -> None:
+    # When / Then
+    with pytest.raises(ValueError, match="Unsupported audio format"):
+        [segment async for segment in use_case.execute(frames(), "en_US", "mp3", {})]
@@ -0,0 +1,217 @@
+from typing import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.admission.admission_controller import AdmissionController
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.exceptions.admission_rejected_error import AdmissionRejectedError
+
+
+@pytest.fixture
+def mock_config() -> AppConfig:
+    config = Mock(AppConfig)
+    config.speech_to_text_worker_pool_size = 1
+    config.admission_queue_size = 1
+    config.admission_max_wait_seconds = 0
+    return config
+
+
+@pytest.fixture
+def admission_controller(mock_config: AppConfig) -> Iterator[AdmissionController]:
+    with patch.object(AdmissionController, "_instance", None):
+        yield AdmissionController(mock_config, Mock(Logger))
+
+
+@pytest.mark.asyncio
+async def test_admit_tracks_depth(admission_controller: AdmissionController) -> None:
+    # When
+    async with admission_controller.admit():
+        depth = admission_controller.depth
+
+    # Then
+    assert depth == 1
+    assert admission_controller.depth == 0
+
+
+@pytest.mark.asyncio
+async def test_admit_rejects_when_queue_is_full(admission_controller: AdmissionController) -> None:
+    # Given
+    admission_controller.depth = 2
+
+    # When / Then
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        async with admission_controller.admit():
+            pass
+
+    assert exc_info.value.retry_after == 1
+    assert admission_controller.depth == 2
+
+
+@pytest.mark.asyncio
+async def test_admit_rejects_when_estimated_wait_exceeds_budget(
+    admission_controller: AdmissionController,
+    mock_config: AppConfig,
+) -> None:
+    # Given
+    mock_config.admission_queue_size = 0
+    mock_config.admission_max_wait_seconds = 10
+    admission_controller.processed_requests = 1.0
+    admission_controller.processed_audio_seconds = 60.0
+    admission_controller.busy_seconds = 8.0
+    admission_controller.depth = 2
+
+    # When / Then
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        async with admission_controller.admit():
+            pass
+
+    assert admission_controller.estimate_wait() == 16.0
+    assert exc_info.value.retry_after == 6
+
+
+@pytest.mark.asyncio
+async def test_track_transcription_measures_audio_processing_rate(
+    admission_controller: AdmissionController,
+) -> None:
+    # Given
+    with patch("core.admission.admission_controller.time.monotonic", side_effect=[100.0, 104.0, 104.0]):
+        # When
+        async with admission_controller.admit():
+            async with admission_controller.track_transcription(40.0):
+                background_transcriptions = admission_controller.background_transcriptions
+
+    # Then
+    assert admission_controller.get_processing_rate() == pytest.approx(10.0)
+    assert background_transcriptions == 0
+
+
+@pytest.mark.asyncio
+async def test_track_transcription_keeps_steady_rate_across_decay(
+    admission_controller: AdmissionController,
+) -> None:
+    # Given
+    clock = [100.0, 104.0, 104.0, 110.0, 112.0, 112.0]
+
+    with patch("core.admission.admission_controller.time.monotonic", side_effect=clock):
+        # When
+        for audio_seconds in (40.0, 20.0):
+            async with admission_controller.track_transcription(audio_seconds):
+                pass
+
+    # Then
+    assert admission_controller.get_processing_rate() == pytest.approx(10.0)
+
+
+@pytest.mark.asyncio
+async def test_requests_without_transcription_do_not_count_towards_rate(
+    admission_controller: AdmissionController,
+) -> None:
+    # When
+    async with admission_controller.admit():
+        pass
+
+    # Then
+    assert admission_controller.get_processing_rate() is None
+    assert admission_controller.busy_seconds == 0.0
+
+
+@pytest.mark.asyncio
+async def test_track_transcription_measures_background_jobs_without_requests(
+    admission_controller: AdmissionController,
+) -> None:
+    # Given
+    with patch("core.admission.admission_controller.time.monotonic", side_effect=[100.0, 106.0, 106.0]):
+        # When
+        async with admission_controller.track_transcription(60.0):
+            background_transcriptions = admission_controller.background_transcriptions
+
+    # Then
+    assert background_transcriptions == 1
+    assert admission_controller.get_processing_rate() == pytest.approx(10.0)
+
+
+@pytest.mark.asyncio
+async def test_admit_counts_running_background_job_ahead_of_request(
+    admission_controller: AdmissionController,
+    mock_config: AppConfig,
+) -> None:
+    # Given
+    mock_config.admission_queue_size = 0
+    mock_config.admission_max_wait_seconds = 5
+    admission_controller.processed_requests = 1.0
+    admission_controller.processed_audio_seconds = 60.0
+    admission_controller.busy_seconds = 6.0
+
+    # When
+    async with admission_controller.track_transcription(60.0):
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            async with admission_controller.admit():
+                pass
+
+        estimated_wait = admission_controller.estimate_wait()
+
+    # Then
+    assert estimated_wait == pytest.approx(6.0)
+    assert exc_info.value.retry_after == 1
+    assert admission_controller.estimate_wait() == 0.0
+
+
+@pytest.mark.asyncio
+async def test_estimate_wait_weights_requests_by_audio_seconds(
+    admission_controller: AdmissionController,
+) -> None:
+    # Given
+    with patch("core.admission.admission_controller.time.monotonic", side_effect=[90.0, 100.0, 100.0]):
+        async with admission_controller.track_transcription(300.0):
+            pass
+
+    # When
+    admission_controller.depth = 3
+
+    # Then
+    assert admission_controller.get_processing_rate() == pytest.approx(30.0)
+    assert admission_controller.estimate_wait() == pytest.approx(3 * 10.0)
+
+
+@pytest.mark.asyncio
+async def test_admit_releases_slot_on_error(admission_controller: AdmissionController) -> None:
+    # When
+    with pytest.raises(RuntimeError):
+        async with admission_controller.admit():
+            raise RuntimeError("Transcription error")
+
+    # Then
+    assert admission_controller.depth == 0
+
+
+@pytest.mark.asyncio
+async def test_admit_runs_batch_larger_than_queue_when_nothing_else_waits(
+    admission_controller: AdmissionController,
+) -> None:
+    # Given
+    admission_controller.depth = 1
+
+    # When
+    async with admission_controller.admit(4, held_units=1):
+        depth = admission_controller.depth
+
+    # Then
+    assert depth == 5
+    assert admission_controller.depth == 1
+
+
+@pytest.mark.asyncio
+async def test_admit_rejects_batch_files_exceeding_queue_behind_other_requests(
+    admission_controller: AdmissionController,
+) -> None:
+    # Given
+    admission_controller.depth = 2
+
+    # When / Then
+    with pytest.raises(AdmissionRejectedError):
+        async with admission_controller.admit(4, held_units=1):
+            pass
+
+    assert admission_controller.depth == 2
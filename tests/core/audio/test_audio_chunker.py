@@ -0,0 +1,60 @@
+import numpy as np
+
+from core.audio.audio_chunker import (
+    FRAME_SAMPLES,
+    find_quietest_frame,
+    split_at_silence,
+)
+
+
+def test_find_quietest_frame_returns_center_of_lowest_energy_frame() -> None:
+    # Given
+    samples = np.ones(FRAME_SAMPLES * 4, dtype=np.float32)
+    silence_start, silence_end = FRAME_SAMPLES * 2, FRAME_SAMPLES * 3
+    samples[silence_start:silence_end] = 0.0
+
+    # When
+    result = find_quietest_frame(samples)
+
+    # Then
+    assert result == FRAME_SAMPLES * 2 + FRAME_SAMPLES // 2
+
+
+def test_split_at_silence_cuts_chunks_in_quiet_frames() -> None:
+    # Given
+    samples = np.ones(FRAME_SAMPLES * 25, dtype=np.float32)
+    for silence_start, silence_end in [
+        (FRAME_SAMPLES * 9, FRAME_SAMPLES * 10),
+        (FRAME_SAMPLES * 17, FRAME_SAMPLES * 20),
+    ]:
+        samples[silence_start:silence_end] = 0.0
+
+    # When
+    result = split_at_silence(samples, FRAME_SAMPLES * 10)
+
+    # Then
+    first_cut = FRAME_SAMPLES * 9 + FRAME_SAMPLES // 2
+    # The second search window starts half a frame into the silence
+    second_cut = FRAME_SAMPLES * 18
+    assert result == [(0, first_cut), (first_cut, second_cut), (second_cut, FRAME_SAMPLES * 25)]
+
+
+def test_split_at_silence_keeps_short_audio_whole() -> None:
+    # When
+    result = split_at_silence(np.zeros(100, dtype=np.float32), 1000)
+
+    # Then
+    assert result == [(0, 100)]
+
+
+def test_split_at_silence_never_exceeds_chunk_length() -> None:
+    # Given
+    samples = np.random.default_rng(0).standard_normal(FRAME_SAMPLES * 100).astype(np.float32)
+
+    # When
+    result = split_at_silence(samples, FRAME_SAMPLES * 7)
+
+    # Then
+    assert all(0 < end - start <= FRAME_SAMPLES * 7 for start, end in result)
+    assert result[0][0] == 0
+    assert result[-1][1] == len(samples)
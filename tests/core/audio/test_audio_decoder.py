@@ -0,0 +1,193 @@
+import io
+import os
+import subprocess
+from typing import Any
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from core.audio.audio_decoder import AudioDecoder, process_shared_audio
+from core.logger.logger import Logger
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def audio_decoder(mock_logger: Logger) -> AudioDecoder:
+    return AudioDecoder(logger=mock_logger)
+
+
+def test_decode_to_shared_memory_success(audio_decoder: AudioDecoder) -> None:
+    # Given
+    samples = np.array([0.0, 0.5, -0.5, 1.0], dtype=np.float32)
+    completed_process = Mock(stdout=samples.tobytes())
+
+    with patch("core.audio.audio_decoder.subprocess.run", return_value=completed_process) as mock_run:
+        # When
+        shared_audio = audio_decoder.decode_to_shared_memory("audio.mp3")
+
+    try:
+        # Then
+        assert shared_audio.descriptor.num_samples == 4
+        assert process_shared_audio(shared_audio.descriptor, lambda audio: audio.tolist()) == samples.tolist()
+        assert "audio.mp3" in mock_run.call_args[0][0]
+    finally:
+        shared_audio.release()
+
+
+def test_process_shared_audio_reads_slice(audio_decoder: AudioDecoder) -> None:
+    # Given
+    samples = np.array([0.0, 0.25, 0.5, 0.75, 1.0], dtype=np.float32)
+    shared_audio = audio_decoder.copy_to_shared_memory(samples.tobytes())
+
+    try:
+        # When
+        result = process_shared_audio(shared_audio.descriptor.slice(1, 4).slice(1, 3), lambda audio: audio.tolist())
+
+        # Then
+        assert result == [0.5, 0.75]
+    finally:
+        shared_audio.release()
+
+
+def test_copy_regions_to_shared_memory_joins_regions(audio_decoder: AudioDecoder) -> None:
+    # Given
+    samples = np.array([0.0, 0.25, 0.5, 0.75, 1.0], dtype=np.float32)
+    shared_audio = audio_decoder.copy_to_shared_memory(samples.tobytes())
+
+    # When
+    regions_audio = audio_decoder.copy_regions_to_shared_memory(shared_audio.descriptor, [(0, 1), (3, 5)])
+
+    try:
+        # Then
+        assert regions_audio.descriptor.num_samples == 3
+        assert process_shared_audio(regions_audio.descriptor, lambda audio: audio.tolist()) == [0.0, 0.75, 1.0]
+    finally:
+        regions_audio.release()
+        shared_audio.release()
+
+
+def test_decode_to_shared_memory_ffmpeg_error(audio_decoder: AudioDecoder) -> None:
+    # Given
+    error = subprocess.CalledProcessError(1, "ffmpeg", stderr=b"Invalid data found")
+
+    with patch("core.audio.audio_decoder.subprocess.run", side_effect=error):
+        # When / Then
+        with pytest.raises(ValueError, match="Failed to decode audio: Invalid data found"):
+            audio_decoder.decode_to_shared_memory("audio.mp3")
+
+
+def test_decode_to_scratch_file_streams_ffmpeg_output(audio_decoder: AudioDecoder) -> None:
+    # Given
+    samples = np.array([0.0, 0.25, 0.5, 0.75, 1.0], dtype=np.float32)
+    process = Mock(stdout=io.BytesIO(samples.tobytes()))
+    process.wait.return_value = 0
+
+    with patch("core.audio.audio_decoder.subprocess.Popen", return_value=process) as mock_popen:
+        # When
+        scratch_audio = audio_decoder.decode_to_scratch_file("audio.mp3")
+
+    try:
+        # Then
+        assert scratch_audio.descriptor.file_backed is True
+        assert scratch_audio.descriptor.num_samples == 5
+        assert process_shared_audio(scratch_audio.descriptor.slice(1, 4), lambda audio: audio.tolist()) == [
+            0.25,
+            0.5,
+            0.75,
+        ]
+        assert "audio.mp3" in mock_popen.call_args[0][0]
+    finally:
+        scratch_audio.release()
+
+    assert not os.path.exists(scratch_audio.descriptor.name)
+
+
+def test_decode_to_scratch_file_ffmpeg_error_removes_file(audio_decoder: AudioDecoder) -> None:
+    # Given
+    def start_ffmpeg(command: list[str], stdout: int, stderr: Any) -> Mock:
+        stderr.write(b"Invalid data found")
+        process = Mock(stdout=io.BytesIO(b"\x00\x00"))
+        process.wait.return_value = 1
+        return process
+
+    scratch_files: list[Any] = []
+
+    def create_scratch_file() -> Any:
+        scratch_files.append(AudioDecoder._create_scratch_file())
+        return scratch_files[-1]
+
+    with (
+        patch("core.audio.audio_decoder.subprocess.Popen", side_effect=start_ffmpeg),
+        patch.object(audio_decoder, "_create_scratch_file", side_effect=create_scratch_file),
+    ):
+        # When / Then
+        with pytest.raises(ValueError, match="Failed to decode audio: Invalid data found"):
+            audio_decoder.decode_to_scratch_file("audio.mp3")
+
+    assert not os.path.exists(scratch_files[0].name)
+
+
+def test_copy_regions_of_scratch_file_audio_to_scratch_file(audio_decoder: AudioDecoder) -> None:
+    # Given
+    samples = np.array([0.0, 0.25, 0.5, 0.75, 1.0], dtype=np.float32)
+    process = Mock(stdout=io.BytesIO(samples.tobytes()))
+    process.wait.return_value = 0
+
+    with patch("core.audio.audio_decoder.subprocess.Popen", return_value=process):
+        scratch_audio = audio_decoder.decode_to_scratch_file("audio.mp3")
+
+    # When
+    regions_audio = audio_decoder.copy_regions_to_shared_memory(scratch_audio.descriptor, [(0, 1), (3, 5)])
+
+    try:
+        # Then
+        assert regions_audio.descriptor.file_backed is True
+        assert process_shared_audio(regions_audio.descriptor, lambda audio: audio.tolist()) == [0.0, 0.75, 1.0]
+    finally:
+        regions_audio.release()
+        scratch_audio.release()
+
+
+def test_release_unlinks_shared_memory(audio_decoder: AudioDecoder) -> None:
+    # Given
+    completed_process = Mock(stdout=np.zeros(2, dtype=np.float32).tobytes())
+
+    with patch("core.audio.audio_decoder.subprocess.run", return_value=completed_process):
+        shared_audio = audio_decoder.decode_to_shared_memory("audio.mp3")
+
+    # When
+    shared_audio.release()
+
+    # Then
+    with pytest.raises(FileNotFoundError):
+        process_shared_audio(shared_audio.descriptor, lambda audio: audio)
+
+
+def test_probe_duration_reads_container_metadata(audio_decoder: AudioDecoder) -> None:
+    # Given
+    completed_process = Mock(stdout=b"12.480000\n")
+
+    with patch("core.audio.audio_decoder.subprocess.run", return_value=completed_process) as mock_run:
+        # When
+        duration = audio_decoder.probe_duration("audio.mp3")
+
+    # Then
+    assert duration == 12.48
+    assert mock_run.call_args[0][0][0] == "ffprobe"
+
+
+def test_probe_duration_returns_none_when_unknown(audio_decoder: AudioDecoder) -> None:
+    # Given
+    completed_process = Mock(stdout=b"N/A\n")
+
+    with patch("core.audio.audio_decoder.subprocess.run", return_value=completed_process):
+        # When
+        duration = audio_decoder.probe_duration("audio.mp3")
+
+    # Then
+    assert duration is None
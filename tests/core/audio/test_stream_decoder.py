@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from core.audio.stream_decoder import (
+    FfmpegStreamDecoder,
+    PcmStreamDecoder,
+    create_stream_decoder,
+)
+
+
+@pytest.mark.asyncio
+async def test_pcm_stream_decoder_converts_s16le_samples() -> None:
+    # Given
+    stream_decoder = create_stream_decoder("pcm_s16le")
+    samples = np.array([0, 16384, -32767], dtype="<i2").tobytes()
+
+    # When
+    first = await stream_decoder.decode(samples[:3])
+    second = await stream_decoder.decode(samples[3:])
+
+    # Then
+    assert np.frombuffer(first, dtype=np.float32).tolist() == [0.0]
+    assert np.frombuffer(second, dtype=np.float32).tolist() == pytest.approx([0.5, -1.0], abs=1e-4)
+
+
+@pytest.mark.asyncio
+async def test_pcm_stream_decoder_passes_f32le_samples() -> None:
+    # Given
+    stream_decoder = create_stream_decoder("pcm_f32le")
+    samples = np.array([0.25, -0.5], dtype="<f4").tobytes()
+
+    # When
+    result = await stream_decoder.decode(samples)
+
+    # Then
+    assert result == samples
+    assert await stream_decoder.flush() == b""
+
+
+def test_create_stream_decoder_selects_decoder() -> None:
+    # Then
+    assert isinstance(create_stream_decoder("pcm_f32le"), PcmStreamDecoder)
+    assert isinstance(create_stream_decoder("opus"), FfmpegStreamDecoder)
+
+
+def test_create_stream_decoder_rejects_unknown_format() -> None:
+    # When / Then
+    with pytest.raises(ValueError, match="Unsupported audio format: mp3"):
+        create_stream_decoder("mp3")
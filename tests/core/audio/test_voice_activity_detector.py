@@ -0,0 +1,97 @@
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+
+from core.audio.audio_decoder import SAMPLE_RATE
+from core.audio.voice_activity_detector import (
+    VoiceActivityParameters,
+    create_speech_timeline,
+    detect_speech,
+    split_voice_activity_parameters,
+)
+from domain.exceptions.invalid_voice_activity_parameter_error import (
+    InvalidVoiceActivityParameterError,
+)
+
+
+def tone(seconds: float) -> np.ndarray:
+    time = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    samples: np.ndarray = (0.5 * np.sin(2 * np.pi * 220 * time)).astype(np.float32)
+    return samples
+
+
+def test_split_voice_activity_parameters_keeps_them_from_whisper() -> None:
+    # When
+    voice_activity_parameters, whisper_parameters = split_voice_activity_parameters(
+        {"vad": True, "vad_padding_ms": 100, "temperature": 0.0},
+    )
+
+    # Then
+    assert voice_activity_parameters == VoiceActivityParameters(padding_ms=100.0)
+    assert whisper_parameters == {"temperature": 0.0}
+
+
+def test_split_voice_activity_parameters_disabled_by_default() -> None:
+    # When
+    voice_activity_parameters, whisper_parameters = split_voice_activity_parameters({"vad_padding_ms": 100})
+
+    # Then
+    assert voice_activity_parameters is None
+    assert whisper_parameters == {}
+
+
+@pytest.mark.parametrize("parameters", [{"vad_unknown": 1}, {"vad_padding_ms": "long"}, {"vad_padding_ms": True}])
+def test_split_voice_activity_parameters_rejects_invalid_values(parameters: Dict[str, Any]) -> None:
+    # When / Then
+    with pytest.raises(InvalidVoiceActivityParameterError):
+        split_voice_activity_parameters({"vad": True, **parameters})
+
+
+def test_detect_speech_finds_regions_between_silence() -> None:
+    # Given
+    silence = np.zeros(2 * SAMPLE_RATE, dtype=np.float32)
+    samples = np.concatenate([silence, tone(1.0), silence, tone(1.0), silence])
+
+    # When
+    result = detect_speech(samples, VoiceActivityParameters(padding_ms=100))
+
+    # Then
+    padding = SAMPLE_RATE // 10
+    assert result == [
+        (2 * SAMPLE_RATE - padding, 3 * SAMPLE_RATE + padding),
+        (5 * SAMPLE_RATE - padding, 6 * SAMPLE_RATE + padding),
+    ]
+
+
+def test_detect_speech_ignores_noise_and_silence() -> None:
+    # Given
+    noise = np.random.default_rng(0).standard_normal(3 * SAMPLE_RATE).astype(np.float32) * 0.1
+    silence = np.zeros(3 * SAMPLE_RATE, dtype=np.float32)
+
+    # When / Then
+    assert detect_speech(noise, VoiceActivityParameters()) == []
+    assert detect_speech(silence, VoiceActivityParameters()) == []
+
+
+def test_detect_speech_bridges_short_pauses() -> None:
+    # Given
+    pause = np.zeros(SAMPLE_RATE // 5, dtype=np.float32)
+    samples = np.concatenate([tone(1.0), pause, tone(1.0)])
+
+    # When
+    result = detect_speech(samples, VoiceActivityParameters(padding_ms=0))
+
+    # Then
+    assert result == [(0, len(samples))]
+
+
+def test_create_speech_timeline() -> None:
+    # When
+    speech_starts, original_starts = create_speech_timeline(
+        [(SAMPLE_RATE, 3 * SAMPLE_RATE), (5 * SAMPLE_RATE, 6 * SAMPLE_RATE)]
+    )
+
+    # Then
+    assert speech_starts.tolist() == [0.0, 2.0]
+    assert original_starts.tolist() == [1.0, 5.0]
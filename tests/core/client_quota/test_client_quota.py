@@ -0,0 +1,88 @@
+import asyncio
+from typing import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.client_quota.client_quota import ClientQuota
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+
+
+@pytest.fixture
+def mock_config() -> AppConfig:
+    config = Mock(AppConfig)
+    config.client_max_concurrent_jobs = 1
+    config.client_audio_seconds_per_minute = 60
+    return config
+
+
+@pytest.fixture
+def client_quota(mock_config: AppConfig) -> Iterator[ClientQuota]:
+    with patch.object(ClientQuota, "_instance", None):
+        yield ClientQuota(mock_config, Mock(Logger))
+
+
+@pytest.mark.asyncio
+async def test_reserve_limits_concurrent_jobs_per_client(client_quota: ClientQuota) -> None:
+    # Given
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with client_quota.reserve("batch", 1.0):
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+
+    # When
+    async with client_quota.reserve("interactive", 1.0):
+        other_client_admitted = True
+
+    # Then
+    assert other_client_admitted
+    assert client_quota.budgets["batch"].active_jobs == 1
+    assert not waiter.done()
+
+    # When
+    release.set()
+    await asyncio.gather(holder, waiter)
+
+    # Then
+    assert client_quota.budgets["batch"].active_jobs == 0
+
+
+@pytest.mark.asyncio
+async def test_reserve_waits_for_audio_budget(client_quota: ClientQuota) -> None:
+    # Given
+    async with client_quota.reserve("batch", 50.0):
+        pass
+
+    with patch("core.client_quota.client_quota.asyncio.sleep") as mock_sleep:
+        mock_sleep.side_effect = lambda delay: client_quota.budgets["batch"].__setattr__("tokens", 60.0)
+
+        # When
+        async with client_quota.reserve("batch", 30.0):
+            pass
+
+    # Then
+    assert mock_sleep.call_args[0][0] == pytest.approx(20.0, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_reserve_without_limits_does_not_wait(client_quota: ClientQuota, mock_config: AppConfig) -> None:
+    # Given
+    mock_config.client_max_concurrent_jobs = 0
+    mock_config.client_audio_seconds_per_minute = 0
+
+    with patch("core.client_quota.client_quota.asyncio.sleep") as mock_sleep:
+        # When
+        async with client_quota.reserve("batch", 3600.0):
+            async with client_quota.reserve("batch", 3600.0):
+                pass
+
+    # Then
+    mock_sleep.assert_not_called()
+    assert client_quota.budgets == {}
@@ -32,6 +32,38 @@ def test_initialize(app_config: AppConfig, mock_logger: Logger) -> None:
             "TRANSLATION_MODEL_NAME": "test_translation_model",
             "TRANSLATION_MODEL_DOWNLOAD_PATH": "translation_model_path",
             "MODEL_IDLE_TIMEOUT": "150",
+            "SPEECH_TO_TEXT_WORKER_POOL_SIZE": "4",
+            "TRANSLATION_BATCH_WINDOW_MS": "25",
+            "TRANSLATION_MAX_BATCH_SIZE": "8",
+            "TRANSLATION_MAX_BATCH_TOKENS": "1024",
+            "TRANSLATION_CACHE_SIZE": "500",
+            "TRANSLATION_CACHE_PERSISTENT": "true",
+            "TRANSLATION_CACHE_PERSISTENT_SIZE": "2000",
+            "TRANSCRIPTION_CACHE_SIZE": "20",
+            "TRANSCRIPTION_CACHE_PATH": "cache_path",
+            "TRANSCRIPTION_CACHE_MAX_SIZE_MB": "64",
+            "FILE_UPLOAD_MAX_AGE_SECONDS": "600",
+            "FILE_UPLOAD_CLEANUP_INTERVAL": "30",
+            "FILE_UPLOAD_QUOTA_MB": "2048",
+            "JOB_QUEUE_SIZE": "10",
+            "JOB_WORKERS": "2",
+            "JOB_RESULT_TTL": "60",
+            "ADMISSION_QUEUE_SIZE": "8",
+            "ADMISSION_MAX_WAIT_SECONDS": "60",
+            "SPEECH_TO_TEXT_SCHEDULER_AGING": "0.5",
+            "CLIENT_WEIGHTS": "interactive=4, batch=0.5",
+            "CLIENT_API_KEYS": "tenant=secret",
+            "CLIENT_MAX_CONCURRENT_JOBS": "2",
+            "CLIENT_AUDIO_SECONDS_PER_MINUTE": "600",
+            "STREAMING_STEP_MS": "500",
+            "STREAMING_MAX_WINDOW_SECONDS": "20",
+            "TRANSCRIBE_BATCH_MAX_FILES": "20",
+            "SPEECH_TO_TEXT_CHUNK_SECONDS": "300",
+            "SPEECH_TO_TEXT_BLOCK_SECONDS": "600",
+            "SPEECH_TO_TEXT_BATCH_WINDOW_MS": "30",
+            "SPEECH_TO_TEXT_MAX_BATCH_SIZE": "4",
+            "SPEECH_TO_TEXT_CHECKPOINT_SECONDS": "30",
+            "TRANSCRIPTION_CHECKPOINT_PATH": "checkpoint_path",
         },
     ):
         # When
@@ -48,6 +80,38 @@ def test_initialize(app_config: AppConfig, mock_logger: Logger) -> None:
         assert app_config.translation_model_name == "test_translation_model"
         assert app_config.translation_model_download_path == "translation_model_path"
         assert app_config.model_idle_timeout == 150
+        assert app_config.speech_to_text_worker_pool_size == 4
+        assert app_config.translation_batch_window_ms == 25
+        assert app_config.translation_max_batch_size == 8
+        assert app_config.translation_max_batch_tokens == 1024
+        assert app_config.translation_cache_size == 500
+        assert app_config.translation_cache_persistent is True
+        assert app_config.translation_cache_persistent_size == 2000
+        assert app_config.transcription_cache_size == 20
+        assert app_config.transcription_cache_path == "cache_path"
+        assert app_config.transcription_cache_max_size_mb == 64
+        assert app_config.file_upload_max_age_seconds == 600
+        assert app_config.file_upload_cleanup_interval == 30
+        assert app_config.file_upload_quota_mb == 2048
+        assert app_config.job_queue_size == 10
+        assert app_config.job_workers == 2
+        assert app_config.job_result_ttl == 60
+        assert app_config.admission_queue_size == 8
+        assert app_config.admission_max_wait_seconds == 60
+        assert app_config.speech_to_text_scheduler_aging == 0.5
+        assert app_config.client_weights == {"interactive": 4.0, "batch": 0.5}
+        assert app_config.client_api_keys == {"secret": "tenant"}
+        assert app_config.client_max_concurrent_jobs == 2
+        assert app_config.client_audio_seconds_per_minute == 600
+        assert app_config.streaming_step_ms == 500
+        assert app_config.streaming_max_window_seconds == 20
+        assert app_config.transcribe_batch_max_files == 20
+        assert app_config.speech_to_text_chunk_seconds == 300
+        assert app_config.speech_to_text_block_seconds == 600
+        assert app_config.speech_to_text_batch_window_ms == 30
+        assert app_config.speech_to_text_max_batch_size == 4
+        assert app_config.speech_to_text_checkpoint_seconds == 30
+        assert app_config.transcription_checkpoint_path == "checkpoint_path"
 
 
 def test_initialize_invalid_port(app_config: AppConfig, mock_logger: Logger) -> None:
@@ -81,4 +145,37 @@ def test_initialize_log_parameters(app_config: AppConfig, mock_logger: Logger) -
     assert "TRANSLATION_MODEL_NAME" in mock_logger.info.call_args_list[1][0][0]
     assert "TRANSLATION_MODEL_DOWNLOAD_PATH" in mock_logger.info.call_args_list[1][0][0]
     assert "MODEL_IDLE_TIMEOUT" in mock_logger.info.call_args_list[1][0][0]
+    assert "SPEECH_TO_TEXT_WORKER_POOL_SIZE" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_BATCH_WINDOW_MS" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_MAX_BATCH_SIZE" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_MAX_BATCH_TOKENS" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_CACHE_SIZE" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_CACHE_PERSISTENT" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSLATION_CACHE_PERSISTENT_SIZE" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSCRIPTION_CACHE_SIZE" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSCRIPTION_CACHE_PATH" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSCRIPTION_CACHE_MAX_SIZE_MB" in mock_logger.info.call_args_list[1][0][0]
+    assert "FILE_UPLOAD_MAX_AGE_SECONDS" in mock_logger.info.call_args_list[1][0][0]
+    assert "FILE_UPLOAD_CLEANUP_INTERVAL" in mock_logger.info.call_args_list[1][0][0]
+    assert "FILE_UPLOAD_QUOTA_MB" in mock_logger.info.call_args_list[1][0][0]
+    assert "JOB_QUEUE_SIZE" in mock_logger.info.call_args_list[1][0][0]
+    assert "JOB_WORKERS" in mock_logger.info.call_args_list[1][0][0]
+    assert "JOB_RESULT_TTL" in mock_logger.info.call_args_list[1][0][0]
+    assert "ADMISSION_QUEUE_SIZE" in mock_logger.info.call_args_list[1][0][0]
+    assert "ADMISSION_MAX_WAIT_SECONDS" in mock_logger.info.call_args_list[1][0][0]
+    assert "SPEECH_TO_TEXT_SCHEDULER_AGING" in mock_logger.info.call_args_list[1][0][0]
+    assert "CLIENT_WEIGHTS" in mock_logger.info.call_args_list[1][0][0]
+    assert "CLIENT_API_KEYS" in mock_logger.info.call_args_list[1][0][0]
+    assert "secret" not in mock_logger.info.call_args_list[1][0][0]
+    assert "CLIENT_MAX_CONCURRENT_JOBS" in mock_logger.info.call_args_list[1][0][0]
+    assert "CLIENT_AUDIO_SECONDS_PER_MINUTE" in mock_logger.info.call_args_list[1][0][0]
+    assert "STREAMING_STEP_MS" in mock_logger.info.call_args_list[1][0][0]
+    assert "STREAMING_MAX_WINDOW_SECONDS" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSCRIBE_BATCH_MAX_FILES" in mock_logger.info.call_args_list[1][0][0]
+    assert "SPEECH_TO_TEXT_CHUNK_SECONDS" in mock_logger.info.call_args_list[1][0][0]
+    assert "SPEECH_TO_TEXT_BLOCK_SECONDS" in mock_logger.info.call_args_list[1][0][0]
+    assert "SPEECH_TO_TEXT_BATCH_WINDOW_MS" in mock_logger.info.call_args_list[1][0][0]
+    assert "SPEECH_TO_TEXT_MAX_BATCH_SIZE" in mock_logger.info.call_args_list[1][0][0]
+    assert "SPEECH_TO_TEXT_CHECKPOINT_SECONDS" in mock_logger.info.call_args_list[1][0][0]
+    assert "TRANSCRIPTION_CHECKPOINT_PATH" in mock_logger.info.call_args_list[1][0][0]
     assert mock_logger.info.call_args_list[2][0][0] == "Configuration initialized successfully."
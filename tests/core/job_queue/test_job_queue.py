@@ -0,0 +1,237 @@
+import asyncio
+from typing import AsyncIterator, List
+from unittest.mock import Mock, patch
+
+import pytest
+import pytest_asyncio
+
+from core.client_context.client_context import (
+    get_client_id,
+    reset_client_id,
+    set_client_id,
+)
+from core.config.app_config import AppConfig
+from core.job_queue.job_queue import JobFunction, JobQueue, ProgressCallback
+from core.logger.logger import Logger
+from domain.exceptions.job_not_found_error import JobNotFoundError
+from domain.exceptions.job_queue_full_error import JobQueueFullError
+from domain.models.job_model import JobStatus
+
+
+async def transcribe(progress_callback: ProgressCallback) -> str:
+    progress_callback(0.5)
+    await asyncio.sleep(0)
+    return "transcription"
+
+
+async def never_finishes(progress_callback: ProgressCallback) -> str:
+    await asyncio.Event().wait()
+    return "never"
+
+
+async def fails(progress_callback: ProgressCallback) -> str:
+    raise RuntimeError("Transcription error")
+
+
+async def wait_for_status(job_queue: JobQueue, job_id: str, status: JobStatus) -> None:
+    while job_queue.get(job_id).status != status:
+        await asyncio.sleep(0.001)
+
+
+@pytest.fixture
+def mock_config() -> AppConfig:
+    config = Mock(AppConfig)
+    config.job_queue_size = 2
+    config.job_workers = 1
+    config.job_result_ttl = 3600
+    return config
+
+
+@pytest_asyncio.fixture
+async def job_queue(mock_config: AppConfig) -> AsyncIterator[JobQueue]:
+    with patch.object(JobQueue, "_instance", None):
+        job_queue = JobQueue(mock_config, Mock(Logger))
+        yield job_queue
+        await job_queue.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_submit_runs_job_to_completion(job_queue: JobQueue) -> None:
+    # When
+    job = job_queue.submit("key", transcribe, Mock())
+    await wait_for_status(job_queue, job.job_id, JobStatus.COMPLETED)
+
+    # Then
+    result = job_queue.get(job.job_id)
+    assert result.result == "transcription"
+    assert result.progress == 1.0
+
+
+@pytest.mark.asyncio
+async def test_submit_runs_job_as_submitting_client(job_queue: JobQueue) -> None:
+    # Given
+    async def report_client(progress_callback: ProgressCallback) -> str:
+        client_id: str = get_client_id()
+        return client_id
+
+    token = set_client_id("tenant")
+
+    try:
+        # When
+        job = job_queue.submit("key", report_client, Mock())
+    finally:
+        reset_client_id(token)
+
+    await wait_for_status(job_queue, job.job_id, JobStatus.COMPLETED)
+
+    # Then
+    assert job_queue.get(job.job_id).result == "tenant"
+
+
+@pytest.mark.asyncio
+async def test_runners_take_jobs_of_clients_in_turns(job_queue: JobQueue, mock_config: AppConfig) -> None:
+    # Given
+    mock_config.job_queue_size = 4
+    started: List[str] = []
+
+    def record_start(name: str) -> JobFunction:
+        async def run(progress_callback: ProgressCallback) -> str:
+            started.append(name)
+            return name
+
+        return run
+
+    jobs = []
+
+    for client_id, name in (("busy", "busy-1"), ("busy", "busy-2"), ("busy", "busy-3"), ("other", "other-1")):
+        token = set_client_id(client_id)
+
+        try:
+            jobs.append(job_queue.submit(name, record_start(name), Mock()))
+        finally:
+            reset_client_id(token)
+
+    # When
+    for job in jobs:
+        await wait_for_status(job_queue, job.job_id, JobStatus.COMPLETED)
+
+    # Then
+    assert started == ["busy-1", "other-1", "busy-2", "busy-3"]
+
+
+@pytest.mark.asyncio
+async def test_submit_records_failure(job_queue: JobQueue) -> None:
+    # When
+    job = job_queue.submit("key", fails, Mock())
+    await wait_for_status(job_queue, job.job_id, JobStatus.FAILED)
+
+    # Then
+    assert job_queue.get(job.job_id).error == "Transcription error"
+
+
+@pytest.mark.asyncio
+async def test_submit_returns_existing_job_for_identical_key(job_queue: JobQueue) -> None:
+    # Given
+    discard = Mock()
+    job = job_queue.submit("key", transcribe, Mock())
+
+    # When
+    retried_job = job_queue.submit("key", transcribe, discard)
+
+    # Then
+    assert retried_job.job_id == job.job_id
+    discard.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_submit_keeps_identical_jobs_of_different_clients_apart(
+    job_queue: JobQueue,
+    mock_config: AppConfig,
+) -> None:
+    # Given
+    mock_config.job_workers = 2
+    jobs = []
+
+    for client_id in ("first-client", "second-client"):
+        token = set_client_id(client_id)
+
+        try:
+            jobs.append(job_queue.submit("key", never_finishes, Mock()))
+        finally:
+            reset_client_id(token)
+
+    first_job, second_job = jobs
+    await wait_for_status(job_queue, first_job.job_id, JobStatus.RUNNING)
+    await wait_for_status(job_queue, second_job.job_id, JobStatus.RUNNING)
+
+    # When
+    job_queue.cancel(first_job.job_id)
+    await asyncio.sleep(0)
+
+    # Then
+    assert first_job.job_id != second_job.job_id
+    assert job_queue.get(first_job.job_id).status == JobStatus.CANCELLED
+    assert job_queue.get(second_job.job_id).status == JobStatus.RUNNING
+
+
+@pytest.mark.asyncio
+async def test_submit_rejects_job_when_queue_is_full(job_queue: JobQueue) -> None:
+    # Given
+    job_queue.submit("first", never_finishes, Mock())
+    job_queue.submit("second", never_finishes, Mock())
+
+    # When / Then
+    with pytest.raises(JobQueueFullError):
+        job_queue.submit("third", never_finishes, Mock())
+
+
+@pytest.mark.asyncio
+async def test_cancel_queued_job_discards_it(job_queue: JobQueue) -> None:
+    # Given
+    discard = Mock()
+    job_queue.submit("running", never_finishes, Mock())
+    queued_job = job_queue.submit("queued", transcribe, discard)
+
+    # When
+    result = job_queue.cancel(queued_job.job_id)
+
+    # Then
+    assert result.status == JobStatus.CANCELLED
+    discard.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cancel_running_job(job_queue: JobQueue) -> None:
+    # Given
+    job = job_queue.submit("running", never_finishes, Mock())
+    await wait_for_status(job_queue, job.job_id, JobStatus.RUNNING)
+
+    # When
+    job_queue.cancel(job.job_id)
+    next_job = job_queue.submit("next", transcribe, Mock())
+    await wait_for_status(job_queue, next_job.job_id, JobStatus.COMPLETED)
+
+    # Then
+    assert job_queue.get(job.job_id).status == JobStatus.CANCELLED
+
+
+@pytest.mark.asyncio
+async def test_finished_jobs_are_pruned_after_ttl(job_queue: JobQueue, mock_config: AppConfig) -> None:
+    # Given
+    mock_config.job_result_ttl = 0
+    job = job_queue.submit("key", transcribe, Mock())
+    await wait_for_status(job_queue, job.job_id, JobStatus.COMPLETED)
+
+    # When
+    job_queue.submit("other", transcribe, Mock())
+
+    # Then
+    with pytest.raises(JobNotFoundError):
+        job_queue.get(job.job_id)
+
+
+@pytest.mark.asyncio
+async def test_get_unknown_job(job_queue: JobQueue) -> None:
+    # When / Then
+    with pytest.raises(JobNotFoundError):
+        job_queue.get("unknown")
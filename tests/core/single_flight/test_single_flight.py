@@ -0,0 +1,119 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.single_flight.single_flight import SingleFlight
+
+
+async def delayed_result(value: str = "result") -> str:
+    await asyncio.sleep(0.01)
+    return value
+
+
+def test_single_flight_is_singleton() -> None:
+    # When / Then
+    assert SingleFlight() is SingleFlight()
+
+
+@pytest.mark.asyncio
+async def test_run_shares_in_flight_result() -> None:
+    # Given
+    single_flight = SingleFlight()
+    function = AsyncMock(side_effect=delayed_result)
+
+    # When
+    result = await asyncio.gather(
+        single_flight.run("shared_key", function),
+        single_flight.run("shared_key", function),
+    )
+
+    # Then
+    assert list(result) == ["result", "result"]
+    function.assert_called_once()
+    assert not single_flight.is_in_flight("shared_key")
+
+
+@pytest.mark.asyncio
+async def test_run_repeats_work_after_completion() -> None:
+    # Given
+    single_flight = SingleFlight()
+    function = AsyncMock(return_value="result")
+
+    # When
+    await single_flight.run("repeated_key", function)
+    await single_flight.run("repeated_key", function)
+
+    # Then
+    assert function.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_run_shares_error_with_waiting_callers() -> None:
+    # Given
+    single_flight = SingleFlight()
+
+    async def failing_function() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("Work failed")
+
+    # When
+    result = await asyncio.gather(
+        single_flight.run("failing_key", failing_function),
+        single_flight.run("failing_key", failing_function),
+        return_exceptions=True,
+    )
+
+    # Then
+    assert all(isinstance(error, RuntimeError) for error in result)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_work() -> None:
+    # Given
+    single_flight = SingleFlight()
+    first = asyncio.create_task(single_flight.run("cancelled_key", delayed_result))
+    second = asyncio.create_task(single_flight.run("cancelled_key", lambda: delayed_result("other")))
+    await asyncio.sleep(0)
+
+    # When
+    first.cancel()
+    result = await second
+
+    # Then
+    assert result == "result"
+
+
+@pytest.mark.asyncio
+async def test_last_cancelled_caller_cancels_shared_work() -> None:
+    # Given
+    single_flight = SingleFlight()
+    started = asyncio.Event()
+    work_cancelled = asyncio.Event()
+
+    async def long_running_function() -> str:
+        started.set()
+
+        try:
+            await asyncio.Event().wait()
+
+        except asyncio.CancelledError:
+            work_cancelled.set()
+            raise
+
+        return "never"
+
+    first = asyncio.create_task(single_flight.run("abandoned_key", long_running_function))
+    second = asyncio.create_task(single_flight.run("abandoned_key", long_running_function))
+    await started.wait()
+
+    # When
+    first.cancel()
+    await asyncio.sleep(0)
+    still_running = not work_cancelled.is_set()
+    second.cancel()
+    await asyncio.wait_for(work_cancelled.wait(), timeout=1)
+
+    # Then
+    assert still_running
+    assert not single_flight.is_in_flight("abandoned_key")
@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -28,11 +28,14 @@ def test_create_worker_whisper(mock_config: AppConfig, mock_logger: Logger) -> N
     mock_config.speech_to_text_model_type = "base"
     mock_config.speech_to_text_model_download_path = "/path/to/whisper"
     mock_config.log_level = "INFO"
+    mock_config.speech_to_text_worker_pool_size = 4
+    mock_config.speech_to_text_checkpoint_seconds = 60
 
     factory = SpeechToTextWorkerFactory(config=mock_config, logger=mock_logger)
 
     # When
-    worker = factory.create()
+    with patch("data.factories.speech_to_text_worker_factory.os.cpu_count", return_value=32):
+        worker = factory.create()
 
     # Then
     assert isinstance(worker, WhisperSpeechToTextWorker)
@@ -40,6 +43,8 @@ def test_create_worker_whisper(mock_config: AppConfig, mock_logger: Logger) -> N
     assert worker._config.model_type == "base"
     assert worker._config.model_download_path == "/path/to/whisper"
     assert worker._config.log_level == "INFO"
+    assert worker._config.num_threads == 8
+    assert worker._config.checkpoint_interval_seconds == 60
 
 
 def test_create_worker_unsupported_model(mock_config: AppConfig, mock_logger: Logger) -> None:
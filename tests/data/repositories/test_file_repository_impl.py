@@ -1,23 +1,56 @@
+import hashlib
+import io
 import os
-from unittest.mock import AsyncMock, Mock, mock_open, patch
+import zipfile
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterator, List
+from unittest.mock import Mock, patch
 
 import pytest
-from fastapi import UploadFile
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
 from data.repositories.file_repository_impl import FileRepositoryImpl
+from domain.exceptions.batch_too_large_error import BatchTooLargeError
+from domain.exceptions.invalid_archive_error import InvalidArchiveError
+from domain.exceptions.upload_quota_exceeded_error import UploadQuotaExceededError
 from domain.repositories.directory_repository import DirectoryRepository
 
 
+async def stream_chunks(chunks: List[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def failing_chunks() -> AsyncIterator[bytes]:
+    yield b"partial content"
+    raise ConnectionError("Client disconnected")
+
+
+def create_archive(entries: Dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in entries.items():
+            archive.writestr(name, content)
+
+    return buffer.getvalue()
+
+
 @pytest.fixture
 def mock_logger() -> Logger:
     return Mock(Logger)
 
 
 @pytest.fixture
-def mock_config() -> AppConfig:
-    return Mock(AppConfig)
+def mock_config(tmp_path: Path) -> AppConfig:
+    config = Mock(AppConfig)
+    config.file_upload_path = str(tmp_path)
+    config.file_upload_quota_mb = 0
+    config.file_upload_max_age_seconds = 3600
+    config.file_upload_cleanup_interval = 300
+    config.delete_files_after_transcription = True
+    return config
 
 
 @pytest.fixture
@@ -30,12 +63,15 @@ def file_repository(
     mock_config: AppConfig,
     mock_logger: Logger,
     mock_directory_repository: DirectoryRepository,
-) -> FileRepositoryImpl:
-    return FileRepositoryImpl(
-        config=mock_config,
-        logger=mock_logger,
-        directory_repository=mock_directory_repository,
-    )
+) -> Iterator[FileRepositoryImpl]:
+    with patch.object(FileRepositoryImpl, "_instance", None):
+        file_repository = FileRepositoryImpl(
+            config=mock_config,
+            logger=mock_logger,
+            directory_repository=mock_directory_repository,
+        )
+        yield file_repository
+        file_repository.shutdown()
 
 
 @pytest.mark.asyncio
@@ -44,64 +80,244 @@ async def test_save_file(
     mock_config: AppConfig,
     mock_directory_repository: DirectoryRepository,
 ) -> None:
-    # Given
-    mock_file = Mock(UploadFile)
-    mock_file.filename = "test_file.txt"
-    mock_file.read = AsyncMock(side_effect=[b"file content", b""])
-    mock_config.file_upload_path = "test_upload_path"
-    expected_path = os.path.join(mock_config.file_upload_path, mock_file.filename)
+    # When
+    result = await file_repository.save_file("test_file.txt", stream_chunks([b"file ", b"content"]))
 
-    with patch("builtins.open", mock_open()) as mock_open_func:
-        # When
-        result = await file_repository.save_file(mock_file)
+    # Then
+    assert os.path.dirname(result.path) == os.path.abspath(mock_config.file_upload_path)
+    assert result.path.endswith(".txt")
+    assert result.content_hash == hashlib.sha256(b"file content").hexdigest()
+    assert result.file_name == "test_file.txt"
+    assert result.size == len(b"file content")
+    assert Path(result.path).read_bytes() == b"file content"
+    mock_directory_repository.create_directory.assert_called_once_with(mock_config.file_upload_path)
 
-        # Then
-        assert result == os.path.abspath(expected_path)
-        mock_open_func.assert_called_once_with(os.path.abspath(expected_path), "wb")
-        mock_directory_repository.create_directory.assert_called_once_with(mock_config.file_upload_path)
+
+@pytest.mark.asyncio
+async def test_save_file_uses_unique_paths(file_repository: FileRepositoryImpl) -> None:
+    # When
+    first = await file_repository.save_file("audio.mp3", stream_chunks([b"first"]))
+    second = await file_repository.save_file("audio.mp3", stream_chunks([b"second"]))
+
+    # Then
+    assert first.path != second.path
+    assert Path(first.path).read_bytes() == b"first"
+    assert Path(second.path).read_bytes() == b"second"
 
 
 @pytest.mark.asyncio
-async def test_save_file_invalid_path(
+async def test_save_file_removes_partial_file_on_error(
     file_repository: FileRepositoryImpl,
     mock_config: AppConfig,
 ) -> None:
-    # Given
-    mock_file = Mock(UploadFile)
-    mock_file.filename = "../test_file.txt"
-    mock_config.file_upload_path = "test_upload_path"
+    # When / Then
+    with pytest.raises(ConnectionError, match="Client disconnected"):
+        await file_repository.save_file("test_file.txt", failing_chunks())
+
+    assert os.listdir(mock_config.file_upload_path) == []
+    assert file_repository.disk_usage == 0
+
 
+@pytest.mark.asyncio
+async def test_save_file_invalid_path(file_repository: FileRepositoryImpl) -> None:
     # When / Then
     with pytest.raises(Exception, match="Invalid file name"):
-        await file_repository.save_file(mock_file)
+        await file_repository.save_file("../test_file.txt", stream_chunks([b"file content"]))
 
 
-def test_delete_file(
+@pytest.mark.asyncio
+async def test_save_file_rejects_upload_over_quota(
     file_repository: FileRepositoryImpl,
     mock_config: AppConfig,
-    mock_directory_repository: DirectoryRepository,
 ) -> None:
     # Given
-    mock_config.file_upload_path = "test_upload_path"
-    test_path = os.path.join(mock_config.file_upload_path, "test_file.txt")
+    file_repository.quota_bytes = 10
 
-    with patch("os.remove") as mock_remove:
-        # When
-        file_repository.delete_file(test_path)
+    # When / Then
+    with pytest.raises(UploadQuotaExceededError):
+        await file_repository.save_file("test_file.txt", stream_chunks([b"file content"]))
 
-        # Then
-        mock_remove.assert_called_once_with(os.path.abspath(test_path))
-        mock_directory_repository.create_directory.assert_called_once_with(mock_config.file_upload_path)
+    assert os.listdir(mock_config.file_upload_path) == []
+    assert file_repository.disk_usage == 0
 
 
-def test_delete_file_invalid_path(
+@pytest.mark.asyncio
+async def test_extract_archive_stages_media_entries(file_repository: FileRepositoryImpl) -> None:
+    # Given
+    archive = await file_repository.save_file(
+        "clips.zip",
+        stream_chunks(
+            [
+                create_archive(
+                    {"one.mp3": b"first", "nested/two.wav": b"second", "__MACOSX/._one.mp3": b"", ".hidden": b""}
+                )
+            ],
+        ),
+    )
+
+    # When
+    result = await file_repository.extract_archive(archive, 10)
+
+    # Then
+    assert [(file.file_name, Path(file.path).read_bytes()) for file in result] == [
+        ("one.mp3", b"first"),
+        ("two.wav", b"second"),
+    ]
+    assert result[0].content_hash == hashlib.sha256(b"first").hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_extract_archive_rejects_too_many_entries(
     file_repository: FileRepositoryImpl,
     mock_config: AppConfig,
 ) -> None:
     # Given
-    mock_config.file_upload_path = "test_upload_path"
-    test_path = "../test_file.txt"
+    archive = await file_repository.save_file(
+        "clips.zip",
+        stream_chunks([create_archive({"one.mp3": b"first", "two.mp3": b"second"})]),
+    )
+
+    # When / Then
+    with pytest.raises(BatchTooLargeError):
+        await file_repository.extract_archive(archive, 1)
+
+    assert os.listdir(mock_config.file_upload_path) == [os.path.basename(archive.path)]
+
+
+@pytest.mark.asyncio
+async def test_extract_archive_rejects_invalid_archive(file_repository: FileRepositoryImpl) -> None:
+    # Given
+    archive = await file_repository.save_file("clips.zip", stream_chunks([b"not a zip archive"]))
+
+    # When / Then
+    with pytest.raises(InvalidArchiveError, match="clips.zip"):
+        await file_repository.extract_archive(archive, 10)
+
+
+@pytest.mark.asyncio
+async def test_delete_file_removes_file_in_background(file_repository: FileRepositoryImpl) -> None:
+    # Given
+    saved_file = await file_repository.save_file("test_file.txt", stream_chunks([b"file content"]))
+
+    # When
+    file_repository.delete_file(saved_file.path)
+    file_repository.shutdown()
 
+    # Then
+    assert not os.path.exists(saved_file.path)
+    assert file_repository.disk_usage == 0
+
+
+def test_delete_file_invalid_path(file_repository: FileRepositoryImpl) -> None:
     # When / Then
     with pytest.raises(Exception, match="Invalid file path"):
-        file_repository.delete_file(test_path)
+        file_repository.delete_file("../test_file.txt")
+
+
+@pytest.mark.asyncio
+async def test_sweep_removes_only_released_files(file_repository: FileRepositoryImpl) -> None:
+    # Given
+    released_file = await file_repository.save_file("released.txt", stream_chunks([b"released"]))
+    active_file = await file_repository.save_file("active.txt", stream_chunks([b"active"]))
+    file_repository.release_file(released_file.path)
+
+    # When
+    file_repository._sweep(os.path.getmtime(active_file.path) + 1)
+
+    # Then
+    assert not os.path.exists(released_file.path)
+    assert os.path.exists(active_file.path)
+
+
+def test_janitor_removes_orphaned_files_at_startup(
+    mock_config: AppConfig,
+    mock_logger: Logger,
+    mock_directory_repository: DirectoryRepository,
+) -> None:
+    # Given
+    orphaned_file = Path(mock_config.file_upload_path) / "orphaned.mp3"
+    orphaned_file.write_bytes(b"orphaned content")
+    os.utime(orphaned_file, (0, 0))
+
+    with patch.object(FileRepositoryImpl, "_instance", None):
+        # When
+        file_repository = FileRepositoryImpl(mock_config, mock_logger, mock_directory_repository)
+        file_repository.shutdown()
+
+    # Then
+    assert not orphaned_file.exists()
+    assert file_repository.disk_usage == 0
+
+
+@pytest.mark.asyncio
+async def test_release_file_stops_counting_kept_file_against_quota(file_repository: FileRepositoryImpl) -> None:
+    # Given
+    file_repository.quota_bytes = 10
+    saved_file = await file_repository.save_file("kept.txt", stream_chunks([b"kept file"]))
+
+    # When
+    file_repository.release_file(saved_file.path)
+    next_file = await file_repository.save_file("next.txt", stream_chunks([b"next file"]))
+
+    # Then
+    assert os.path.exists(saved_file.path)
+    assert file_repository.disk_usage == len(b"next file")
+    assert next_file.size == len(b"next file")
+
+
+@pytest.mark.asyncio
+async def test_janitor_sweeps_while_deletions_keep_arriving(
+    file_repository: FileRepositoryImpl,
+    mock_config: AppConfig,
+) -> None:
+    # Given
+    file_repository.shutdown()
+    # The orphan is older than the age limit but newer than the start, so only the periodic sweep removes it
+    file_repository.started_at = 0.0
+    old_file = await file_repository.save_file("old.txt", stream_chunks([b"old"]))
+    file_repository.release_file(old_file.path)
+    os.utime(old_file.path, (1, 1))
+    deleted_files = [await file_repository.save_file(f"{index}.txt", stream_chunks([b"x"])) for index in range(3)]
+
+    for deleted_file in deleted_files:
+        file_repository.delete_file(deleted_file.path)
+
+    file_repository.deletion_queue.put(None)
+    clock = iter(range(0, 10000, 100))
+
+    # When
+    with patch("data.repositories.file_repository_impl.time.monotonic", side_effect=lambda: next(clock)):
+        file_repository._run_janitor()
+
+    # Then
+    assert not os.path.exists(old_file.path)
+    assert not any(os.path.exists(deleted_file.path) for deleted_file in deleted_files)
+    assert file_repository.disk_usage == 0
+
+
+@pytest.mark.asyncio
+async def test_janitor_keeps_released_files_when_deletion_disabled(
+    file_repository: FileRepositoryImpl,
+    mock_config: AppConfig,
+) -> None:
+    # Given
+    file_repository.shutdown()
+    mock_config.delete_files_after_transcription = False
+    kept_file = await file_repository.save_file("kept.txt", stream_chunks([b"kept"]))
+    file_repository.release_file(kept_file.path)
+    os.utime(kept_file.path, (0, 0))
+    deleted_files = [await file_repository.save_file(f"{index}.txt", stream_chunks([b"x"])) for index in range(3)]
+
+    for deleted_file in deleted_files:
+        file_repository.delete_file(deleted_file.path)
+
+    file_repository.deletion_queue.put(None)
+    clock = iter(range(0, 10000, 100))
+
+    # When
+    with patch("data.repositories.file_repository_impl.time.monotonic", side_effect=lambda: next(clock)):
+        file_repository._run_janitor()
+
+    # Then
+    assert os.path.exists(kept_file.path)
+    assert not any(os.path.exists(deleted_file.path) for deleted_file in deleted_files)
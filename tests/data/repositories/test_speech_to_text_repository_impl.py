@@ -1,13 +1,33 @@
+import asyncio
+import importlib
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator
 from unittest.mock import Mock, patch
 
 import pytest
 
+from core.admission.admission_controller import AdmissionController
+from core.audio.audio_decoder import AudioDecoder, SharedAudio, SharedAudioDescriptor
+from core.client_context.client_context import ANONYMOUS_CLIENT_ID
+from core.client_quota.client_quota import ClientQuota
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
 from core.timer.timer import Timer, TimerFactory
 from data.factories.speech_to_text_worker_factory import SpeechToTextWorkerFactory
 from data.repositories.speech_to_text_repository_impl import SpeechToTextRepositoryImpl
+from data.workers.compact_transcription_result import CompactTranscriptionResult
+from data.workers.transcription_checkpoint import (
+    TranscriptionCheckpoint,
+    TranscriptionCheckpointWriter,
+    save_checkpoint,
+)
+from data.workers.transcription_cost_model import TranscriptionCostModel
+from data.workers.whisper_segment_progress import report_decoded_windows
 from data.workers.whisper_speech_to_text_worker import WhisperSpeechToTextWorker
+from domain.exceptions.worker_not_running_error import WorkerNotRunningError
+from domain.models.transcription_result_model import TranscriptionResultModel
+from domain.models.word_model import WordModel
 from domain.repositories.directory_repository import DirectoryRepository
 
 
@@ -20,6 +40,15 @@ def mock_config() -> AppConfig:
     config.speech_to_text_model_name = "openai/whisper"
     config.speech_to_text_model_type = "base"
     config.model_idle_timeout = 60
+    config.speech_to_text_worker_pool_size = 2
+    config.speech_to_text_chunk_seconds = 0
+    config.speech_to_text_block_seconds = 900
+    config.speech_to_text_batch_window_ms = 10
+    config.speech_to_text_max_batch_size = 1
+    config.speech_to_text_checkpoint_seconds = 0
+    config.transcription_checkpoint_path = "/checkpoints"
+    config.speech_to_text_scheduler_aging = 1.0
+    config.client_weights = {}
     return config
 
 
@@ -57,6 +86,45 @@ def mock_worker_factory(mock_worker: Mock) -> Mock:
     return factory
 
 
+@pytest.fixture
+def mock_shared_audio() -> Mock:
+    shared_audio = Mock(SharedAudio)
+    shared_audio.descriptor = SharedAudioDescriptor("audio", 3)
+    return shared_audio
+
+
+@pytest.fixture
+def mock_audio_decoder(mock_shared_audio: Mock) -> Mock:
+    decoder = Mock(spec=AudioDecoder)
+    decoder.decode_to_shared_memory.return_value = mock_shared_audio
+    decoder.probe_duration.return_value = 12.0
+    return decoder
+
+
+@asynccontextmanager
+async def reserve(client_id: str, audio_seconds: float) -> AsyncIterator[None]:
+    yield
+
+
+@pytest.fixture
+def mock_client_quota() -> Mock:
+    client_quota = Mock(spec=ClientQuota)
+    client_quota.reserve = Mock(side_effect=reserve)
+    return client_quota
+
+
+@asynccontextmanager
+async def track_transcription(audio_seconds: float) -> AsyncIterator[None]:
+    yield
+
+
+@pytest.fixture
+def mock_admission_controller() -> Mock:
+    admission_controller = Mock(spec=AdmissionController)
+    admission_controller.track_transcription = Mock(side_effect=track_transcription)
+    return admission_controller
+
+
 @pytest.fixture
 def speech_to_text_repository_impl(
     mock_config: Mock,
@@ -64,6 +132,9 @@ def speech_to_text_repository_impl(
     mock_timer_factory: Mock,
     mock_logger: Mock,
     mock_worker_factory: Mock,
+    mock_audio_decoder: Mock,
+    mock_client_quota: Mock,
+    mock_admission_controller: Mock,
 ) -> SpeechToTextRepositoryImpl:
     with patch.object(SpeechToTextRepositoryImpl, "_instance", None):
         return SpeechToTextRepositoryImpl(
@@ -72,43 +143,523 @@ def speech_to_text_repository_impl(
             timer_factory=mock_timer_factory,
             logger=mock_logger,
             worker_factory=mock_worker_factory,
+            audio_decoder=mock_audio_decoder,
+            client_quota=mock_client_quota,
+            admission_controller=mock_admission_controller,
         )
 
 
-def test_transcribe_success(
+def test_initialize_creates_worker_per_pool_slot(
+    speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
+    mock_worker_factory: Mock,
+) -> None:
+    # Then
+    assert mock_worker_factory.create.call_count == 2
+    assert len(speech_to_text_repository_impl.worker_pool._workers) == 2
+
+
+@pytest.mark.asyncio
+async def test_transcribe_success(
     speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
     mock_worker: Mock,
     mock_timer: Mock,
+    mock_audio_decoder: Mock,
+    mock_shared_audio: Mock,
+    mock_admission_controller: Mock,
 ) -> None:
     # Given
     mock_worker.is_alive.return_value = False
-    mock_worker.transcribe.return_value = {"text": "transcribed text"}
+    mock_worker.transcribe.return_value = CompactTranscriptionResult.from_whisper_result(
+        {"text": "transcribed text", "segments": [{"start": 0.0, "end": 1.5, "text": "transcribed text"}]},
+        [],
+    )
 
     # When
-    result = speech_to_text_repository_impl.transcribe("path/to/file", "en", {})
+    result = await speech_to_text_repository_impl.transcribe("path/to/file", "en", {}, ["start"])
 
     # Then
-    assert result == {"text": "transcribed text"}
+    assert result.text == "transcribed text"
+    assert result.segments[0].end == 1.5
     mock_worker.start.assert_called_once()
-    mock_worker.transcribe.assert_called_once_with("path/to/file", "en", {})
-    mock_timer.start.assert_called_once_with(60, speech_to_text_repository_impl._check_idle_timeout)
+    mock_audio_decoder.decode_to_shared_memory.assert_called_once_with("path/to/file")
+    mock_worker.transcribe.assert_called_once_with(
+        SharedAudioDescriptor("audio", 3),
+        "en",
+        {},
+        frozenset({"start"}),
+        None,
+        None,
+    )
+    mock_shared_audio.release.assert_called_once()
+    mock_timer.start.assert_called_once()
+    assert mock_timer.start.call_args[0][0] == 60
+    mock_admission_controller.track_transcription.assert_called_once_with(12.0)
 
 
-def test_check_idle_timeout_stops_worker(
+@pytest.mark.asyncio
+async def test_transcribe_forwards_window_segments_to_callback(
     speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
     mock_worker: Mock,
-    mock_timer: Mock,
+) -> None:
+    # Given
+    window = CompactTranscriptionResult.from_whisper_result(
+        {"text": " First.", "segments": [{"start": 0.0, "end": 2.0, "text": " First."}]},
+        [],
+    )
+
+    async def transcribe(*args: Any) -> CompactTranscriptionResult:
+        args[4](window)
+        return window
+
+    mock_worker.transcribe.side_effect = transcribe
+    partial_results: list[TranscriptionResultModel] = []
+
+    # When
+    await speech_to_text_repository_impl.transcribe("path/to/file", "en", {}, [], partial_results.append)
+
+    # Then
+    assert [segment.text for result in partial_results for segment in result.segments] == [" First."]
+
+
+@pytest.mark.asyncio
+async def test_transcribe_splits_long_file_into_parallel_chunks(
+    speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
+    mock_config: Mock,
+    mock_worker: Mock,
+    mock_shared_audio: Mock,
+) -> None:
+    # Given
+    mock_config.speech_to_text_chunk_seconds = 2
+    mock_shared_audio.descriptor = SharedAudioDescriptor("audio", 48000)
+    later_chunk_completed = asyncio.Event()
+
+    def chunk_result(text: str) -> CompactTranscriptionResult:
+        return CompactTranscriptionResult.from_whisper_result(
+            {"text": text, "segments": [{"id": 0, "seek": 0, "start": 0.5, "end": 1.0, "text": text}]},
+            ["id", "seek"],
+        )
+
+    async def transcribe(*args: Any) -> CompactTranscriptionResult:
+        descriptor, on_segments = args[0], args[4]
+        result = chunk_result(" First." if descriptor.offset == 0 else " Second.")
+
+        if descriptor.offset == 0:
+            await later_chunk_completed.wait()
+            on_segments(result)
+        else:
+            on_segments(result)
+            later_chunk_completed.set()
+
+        return result
+
+    mock_worker.transcribe.side_effect = transcribe
+    partial_results: list[TranscriptionResultModel] = []
+
+    with patch(
+        "data.repositories.speech_to_text_repository_impl.process_shared_audio",
+        return_value=[(0, 32000), (32000, 48000)],
+    ):
+        # When
+        result = await speech_to_text_repository_impl.transcribe("path/to/file", "en", {}, [], partial_results.append)
+
+    # Then
+    assert [call.args[0] for call in mock_worker.transcribe.call_args_list] == [
+        SharedAudioDescriptor("audio", 32000, 0),
+        SharedAudioDescriptor("audio", 16000, 32000),
+    ]
+    assert result.text == " First. Second."
+    assert [(segment.id, segment.seek, segment.start, segment.end) for segment in result.segments] == [
+        (0, 0, 0.5, 1.0),
+        (1, 200, 2.5, 3.0),
+    ]
+    assert [segment.model_dump() for partial in partial_results for segment in partial.segments] == [
+        segment.model_dump() for segment in result.segments
+    ]
+    mock_shared_audio.release.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_decodes_long_file_to_scratch_file_and_transcribes_blocks(
+    speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
+    mock_config: Mock,
+    mock_worker: Mock,
+    mock_audio_decoder: Mock,
+) -> None:
+    # Given
+    mock_config.speech_to_text_block_seconds = 2
+    scratch_audio = Mock(SharedAudio)
+    scratch_audio.descriptor = SharedAudioDescriptor("scratch", 48000, file_backed=True)
+    mock_audio_decoder.decode_to_scratch_file.return_value = scratch_audio
+
+    async def transcribe(*args: Any) -> CompactTranscriptionResult:
+        text = " First." if args[0].offset == 0 else " Second."
+        result = CompactTranscriptionResult.from_whisper_result(
+            {"text": text, "segments": [{"id": 0, "start": 0.5, "end": 1.0, "text": text}]},
+            ["id"],
+        )
+        args[4](result)
+        return result
+
+    mock_worker.transcribe.side_effect = transcribe
+    partial_results: list[TranscriptionResultModel] = []
+
+    with patch(
+        "data.repositories.speech_to_text_repository_impl.process_shared_audio",
+        return_value=[(0, 32000), (32000, 48000)],
+    ):
+        # When
+        result = await speech_to_text_repository_impl.transcribe(
+            "path/to/file",
+            "en",
+            {"initial_prompt": "Glossary."},
+            [],
+            partial_results.append,
+        )
+
+    # Then
+    mock_audio_decoder.decode_to_scratch_file.assert_called_once_with("path/to/file")
+    mock_audio_decoder.decode_to_shared_memory.assert_not_called()
+    assert [call.args[0] for call in mock_worker.transcribe.call_args_list] == [
+        SharedAudioDescriptor("scratch", 32000, 0, file_backed=True),
+        SharedAudioDescriptor("scratch", 16000, 32000, file_backed=True),
+    ]
+    assert [call.args[2] for call in mock_worker.transcribe.call_args_list] == [
+        {"initial_prompt": "Glossary."},
+        {"initial_prompt": "First."},
+    ]
+    assert [(segment.id, segment.start, segment.end) for segment in result.segments] == [(0, 0.5, 1.0), (1, 2.5, 3.0)]
+    assert [segment.model_dump() for partial in partial_results for segment in partial.segments] == [
+        segment.model_dump() for segment in result.segments
+    ]
+    scratch_audio.release.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_sends_only_detected_speech_to_worker(
+    speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
+    mock_worker: Mock,
+    mock_audio_decoder: Mock,
+    mock_shared_audio: Mock,
+) -> None:
+    # Given
+    speech_audio = Mock(SharedAudio)
+    speech_audio.descriptor = SharedAudioDescriptor("speech", 32000)
+    mock_audio_decoder.copy_regions_to_shared_memory.return_value = speech_audio
+    mock_worker.transcribe.return_value = CompactTranscriptionResult.from_whisper_result(
+        {
+            "text": " One. Two.",
+            "segments": [{"start": 0.5, "end": 0.9, "text": " One."}, {"start": 1.2, "end": 1.8, "text": " Two."}],
+        },
+        [],
+    )
+
+    with patch(
+        "data.repositories.speech_to_text_repository_impl.process_shared_audio",
+        return_value=[(16000, 32000), (64000, 80000)],
+    ):
+        # When
+        result = await speech_to_text_repository_impl.transcribe(
+            "path/to/file",
+            "en",
+            {"vad": True, "vad_padding_ms": 100, "temperature": 0.0},
+            [],
+        )
+
+    # Then
+    mock_audio_decoder.copy_regions_to_shared_memory.assert_called_once_with(
+        SharedAudioDescriptor("audio", 3),
+        [(16000, 32000), (64000, 80000)],
+    )
+    mock_worker.transcribe.assert_called_once_with(
+        SharedAudioDescriptor("speech", 32000),
+        "en",
+        {"temperature": 0.0},
+        frozenset(),
+        None,
+        None,
+    )
+    assert [(segment.start, segment.end) for segment in result.segments] == [(1.5, 1.9), (4.2, 4.8)]
+    speech_audio.release.assert_called_once()
+    mock_shared_audio.release.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_returns_empty_result_for_silent_file(
+    speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
+    mock_worker: Mock,
+    mock_shared_audio: Mock,
+) -> None:
+    # Given
+    with patch("data.repositories.speech_to_text_repository_impl.process_shared_audio", return_value=[]):
+        # When
+        result = await speech_to_text_repository_impl.transcribe("path/to/file", "en", {"vad": True})
+
+    # Then
+    assert result.text == ""
+    assert result.segments == []
+    mock_worker.transcribe.assert_not_called()
+    mock_shared_audio.release.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_decodes_short_clips_in_one_batch(
+    speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
+    mock_config: Mock,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_config.speech_to_text_max_batch_size = 2
+    speech_to_text_repository_impl.batcher._max_batch_size = 2
+    mock_worker.transcribe_batch.return_value = [
+        CompactTranscriptionResult.from_whisper_result({"text": text, "segments": []}, []) for text in ("one", "two")
+    ]
+
+    # When
+    results = await asyncio.gather(
+        speech_to_text_repository_impl.transcribe("path/to/one", "en", {"beam_size": 2}, []),
+        speech_to_text_repository_impl.transcribe("path/to/two", "en", {"beam_size": 2}, []),
+    )
+
+    # Then
+    assert [result.text for result in results] == ["one", "two"]
+    mock_worker.transcribe_batch.assert_called_once()
+    assert mock_worker.transcribe_batch.call_args[0][1:] == ("en", {"beam_size": 2}, frozenset())
+    mock_worker.transcribe.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_batch_charges_each_client_for_its_clips(
+    speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    short_clip = SharedAudioDescriptor("short", 16000)
+    long_clip = SharedAudioDescriptor("long", 160000)
+    mock_worker.transcribe_batch.return_value = [None, None]
+    cost_model = speech_to_text_repository_impl.cost_model
+
+    # When
+    with patch.object(speech_to_text_repository_impl.worker_pool, "charge") as mock_charge:
+        await speech_to_text_repository_impl._transcribe_batch(
+            [short_clip, long_clip],
+            "en",
+            {},
+            None,
+            ["first-client", "second-client"],
+        )
+
+    # Then
+    mock_worker.transcribe_batch.assert_called_once_with([short_clip, long_clip], "en", {}, None)
+    mock_charge.assert_any_call("first-client", cost_model.estimate(1.0, {}))
+    mock_charge.assert_any_call("second-client", cost_model.estimate(10.0, {}))
+    assert mock_charge.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_transcribe_resumes_from_checkpoint_after_worker_crash(
+    speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
+    mock_config: Mock,
+    mock_worker: Mock,
+    mock_shared_audio: Mock,
+    tmp_path: Path,
+) -> None:
+    # Given
+    mock_config.speech_to_text_checkpoint_seconds = 60
+    mock_config.transcription_checkpoint_path = str(tmp_path)
+    mock_shared_audio.descriptor = SharedAudioDescriptor("audio", 48000)
+
+    def window(text: str, start: float) -> CompactTranscriptionResult:
+        return CompactTranscriptionResult.from_whisper_result(
+            {"text": text, "segments": [{"id": 0, "start": start, "end": start + 0.5, "text": text}]},
+            ["id"],
+        )
+
+    async def transcribe(*args: Any) -> CompactTranscriptionResult:
+        on_segments, checkpoint_path = args[4], args[5]
+
+        if mock_worker.transcribe.call_count == 1:
+            save_checkpoint(
+                checkpoint_path, TranscriptionCheckpoint(1.0, [{"id": 0, "start": 0.0, "end": 0.5, "text": " First."}])
+            )
+            on_segments(window(" First.", 0.0))
+            on_segments(window(" Second.", 1.0))
+            raise WorkerNotRunningError()
+
+        on_segments(window(" Second.", 0.0))
+        on_segments(window(" Third.", 1.0))
+        return CompactTranscriptionResult.concatenate([window(" Second.", 0.0), window(" Third.", 1.0).shift(0.0, 1)])
+
+    mock_worker.transcribe.side_effect = transcribe
+    partial_results: list[TranscriptionResultModel] = []
+
+    # When
+    result = await speech_to_text_repository_impl.transcribe("path/to/file", "en", {}, ["id"], partial_results.append)
+
+    # Then
+    assert [call.args[0] for call in mock_worker.transcribe.call_args_list] == [
+        SharedAudioDescriptor("audio", 48000),
+        SharedAudioDescriptor("audio", 32000, 16000),
+    ]
+    assert mock_worker.transcribe.call_args_list[1].args[2] == {"initial_prompt": "First."}
+    assert result.text == " First. Second. Third."
+    assert [(segment.id, segment.start) for segment in result.segments] == [(0, 0.0), (1, 1.0), (2, 2.0)]
+    assert [(segment.id, segment.text) for partial in partial_results for segment in partial.segments] == [
+        (0, " First."),
+        (1, " Second."),
+        (2, " Third."),
+    ]
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_transcribe_resumes_after_decoded_windows_when_worker_dies(
+    speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
+    mock_config: Mock,
+    mock_worker: Mock,
+    mock_shared_audio: Mock,
+    mock_logger: Mock,
+    tmp_path: Path,
+) -> None:
+    # Given
+    mock_config.speech_to_text_checkpoint_seconds = 60
+    mock_config.transcription_checkpoint_path = str(tmp_path)
+    mock_shared_audio.descriptor = SharedAudioDescriptor("audio", 48000)
+    transcribe_module: Any = importlib.import_module("whisper.transcribe")
+
+    async def transcribe(*args: Any) -> CompactTranscriptionResult:
+        if mock_worker.transcribe.call_count > 1:
+            return CompactTranscriptionResult.from_whisper_result({"text": " Rest.", "segments": []}, [])
+
+        # The worker saves a checkpoint after each decoded window and dies before the transcription ends
+        all_segments: list[dict[str, Any]] = []
+
+        with report_decoded_windows(TranscriptionCheckpointWriter(args[5], 0.0).on_window):
+            with transcribe_module.tqdm.tqdm(total=300, unit="frames") as pbar:
+                all_segments.append({"start": 0.0, "end": 1.5, "text": " First."})
+                pbar.update(150)
+
+        raise WorkerNotRunningError()
+
+    mock_worker.transcribe.side_effect = transcribe
+
+    # When
+    result = await speech_to_text_repository_impl.transcribe("path/to/file", "en", {}, [])
+
+    # Then
+    resumed_audio = mock_worker.transcribe.call_args_list[1].args[0]
+    assert resumed_audio.offset == 24000
+    assert resumed_audio.num_samples == 24000
+    assert result.text == " First. Rest."
+    mock_logger.warning.assert_called_once_with(
+        "Speech to text worker stopped during transcription, resuming from checkpoint at 1.5s",
+    )
+
+
+@pytest.mark.asyncio
+async def test_transcribe_fails_after_worker_crash_without_checkpoint(
+    speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
+    mock_config: Mock,
+    mock_worker: Mock,
     mock_logger: Mock,
+    tmp_path: Path,
+) -> None:
+    # Given
+    mock_config.speech_to_text_checkpoint_seconds = 60
+    mock_config.transcription_checkpoint_path = str(tmp_path)
+    mock_worker.transcribe.side_effect = WorkerNotRunningError()
+
+    # When / Then
+    with pytest.raises(WorkerNotRunningError):
+        await speech_to_text_repository_impl.transcribe("path/to/file", "en", {})
+
+    mock_worker.transcribe.assert_called_once()
+    mock_logger.warning.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_releases_worker_on_error(
+    speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
+    mock_worker: Mock,
+    mock_shared_audio: Mock,
 ) -> None:
     # Given
     mock_worker.is_alive.return_value = True
-    mock_worker.is_processing.return_value = False
+    mock_worker.transcribe.side_effect = RuntimeError("Transcription error")
+
+    # When
+    with pytest.raises(RuntimeError, match="Transcription error"):
+        await speech_to_text_repository_impl.transcribe("path/to/file", "en", {})
+
+    # Then
+    assert len(speech_to_text_repository_impl.worker_pool._idle_workers) == 2
+    mock_shared_audio.release.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_schedules_by_estimated_cost(
+    speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
+    mock_worker: Mock,
+    mock_audio_decoder: Mock,
+) -> None:
+    # Given
+    mock_worker.transcribe.return_value = CompactTranscriptionResult.from_whisper_result(
+        {"text": "", "segments": []}, []
+    )
+    speech_to_text_repository_impl.cost_model = Mock(TranscriptionCostModel)
+    speech_to_text_repository_impl.cost_model.estimate.return_value = 6.0
+
+    with patch.object(
+        speech_to_text_repository_impl.worker_pool, "acquire", wraps=speech_to_text_repository_impl.worker_pool.acquire
+    ) as mock_acquire:
+        # When
+        await speech_to_text_repository_impl.transcribe("path/to/file", "en", {"num_beams": 2})
+
+    # Then
+    mock_audio_decoder.probe_duration.assert_called_once_with("path/to/file")
+    speech_to_text_repository_impl.cost_model.estimate.assert_called_once_with(12.0, {"num_beams": 2})
+    mock_acquire.assert_called_once_with(6.0)
+    speech_to_text_repository_impl.cost_model.observe.assert_called_once()
+    assert speech_to_text_repository_impl.cost_model.observe.call_args[0][:2] == (3 / 16000, {"num_beams": 2})
+
+
+@pytest.mark.asyncio
+async def test_transcribe_reserves_client_quota_before_decoding(
+    speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
+    mock_worker: Mock,
+    mock_audio_decoder: Mock,
+    mock_client_quota: Mock,
+) -> None:
+    # Given
+    mock_worker.transcribe.return_value = CompactTranscriptionResult.from_whisper_result(
+        {"text": "", "segments": []}, []
+    )
+    mock_client_quota.reserve.side_effect = RuntimeError("Quota error")
+
+    # When
+    with pytest.raises(RuntimeError, match="Quota error"):
+        await speech_to_text_repository_impl.transcribe("path/to/file", "en", {})
+
+    # Then
+    mock_client_quota.reserve.assert_called_once_with(ANONYMOUS_CLIENT_ID, 12.0)
+    mock_audio_decoder.decode_to_shared_memory.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_words_success(
+    speech_to_text_repository_impl: SpeechToTextRepositoryImpl,
+    mock_worker: Mock,
+    mock_audio_decoder: Mock,
+    mock_shared_audio: Mock,
+) -> None:
+    # Given
+    mock_audio_decoder.copy_to_shared_memory.return_value = mock_shared_audio
+    mock_worker.transcribe_words.return_value = [(0.0, 0.4, " Hello")]
 
     # When
-    speech_to_text_repository_impl._check_idle_timeout()
+    result = await speech_to_text_repository_impl.transcribe_words(b"\x00" * 12, "en", {})
 
     # Then
-    mock_worker.stop.assert_called_once()
-    mock_timer.cancel.assert_called_once()
-    mock_logger.debug.assert_any_call("Checking speech to text model idle timeout")
-    mock_logger.info.assert_any_call("Speech to text model stopped due to idle timeout")
+    assert result == [WordModel(start=0.0, end=0.4, text=" Hello")]
+    mock_audio_decoder.copy_to_shared_memory.assert_called_once_with(b"\x00" * 12)
+    mock_worker.transcribe_words.assert_called_once_with(SharedAudioDescriptor("audio", 3), "en", {})
+    mock_shared_audio.release.assert_called_once()
@@ -0,0 +1,126 @@
+import os
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from data.repositories.transcription_cache_repository_impl import (
+    TranscriptionCacheRepositoryImpl,
+)
+from domain.models.transcription_result_model import (
+    SegmentModel,
+    TranscriptionResultModel,
+)
+from domain.repositories.directory_repository import DirectoryRepository
+
+
+@pytest.fixture
+def mock_config(tmp_path: Path) -> AppConfig:
+    config = Mock(AppConfig)
+    config.speech_to_text_model_name = "openai/whisper"
+    config.speech_to_text_model_type = "turbo"
+    config.transcription_cache_size = 1
+    config.transcription_cache_path = str(tmp_path)
+    config.transcription_cache_max_size_mb = 1
+    return config
+
+
+@pytest.fixture
+def mock_directory_repository() -> Mock:
+    return Mock(spec=DirectoryRepository)
+
+
+@pytest.fixture
+def transcription_result() -> TranscriptionResultModel:
+    return TranscriptionResultModel(
+        text="Hello world",
+        segments=[SegmentModel(start=0.0, end=1.5, text="Hello world")],
+    )
+
+
+def create_repository(config: AppConfig, directory_repository: Mock) -> TranscriptionCacheRepositoryImpl:
+    with patch.object(TranscriptionCacheRepositoryImpl, "_instance", None):
+        return TranscriptionCacheRepositoryImpl(
+            config=config,
+            directory_repository=directory_repository,
+            logger=Mock(Logger),
+        )
+
+
+def test_get_transcription_returns_stored_result(
+    mock_config: AppConfig,
+    mock_directory_repository: Mock,
+    transcription_result: TranscriptionResultModel,
+) -> None:
+    # Given
+    repository = create_repository(mock_config, mock_directory_repository)
+    repository.put_transcription("hash", "en", {"beam_size": 5}, None, transcription_result)
+
+    # When
+    result = repository.get_transcription("hash", "en", {"beam_size": 5}, None)
+    other_parameters_result = repository.get_transcription("hash", "en", {}, None)
+
+    # Then
+    assert result == transcription_result
+    assert other_parameters_result is None
+    assert repository.get_statistics().model_dump() == {"hits": 1, "misses": 1, "entries": 1}
+    mock_directory_repository.create_directory.assert_called_once_with(mock_config.transcription_cache_path)
+
+
+def test_get_transcription_loads_result_from_disk(
+    mock_config: AppConfig,
+    mock_directory_repository: Mock,
+    transcription_result: TranscriptionResultModel,
+) -> None:
+    # Given
+    repository = create_repository(mock_config, mock_directory_repository)
+    repository.put_transcription("hash", "en", {}, ["start"], transcription_result)
+
+    # When
+    restarted_repository = create_repository(mock_config, mock_directory_repository)
+    result = restarted_repository.get_transcription("hash", "en", {}, ["start"])
+
+    # Then
+    assert result == transcription_result
+
+
+def test_put_transcription_evicts_oldest_files_over_size_limit(
+    mock_config: AppConfig,
+    mock_directory_repository: Mock,
+    transcription_result: TranscriptionResultModel,
+) -> None:
+    # Given
+    repository = create_repository(mock_config, mock_directory_repository)
+    repository.put_transcription("first", "en", {}, None, transcription_result)
+    first_file = next(Path(mock_config.transcription_cache_path).iterdir())
+    os.utime(first_file, (0, 0))
+    repository.max_disk_bytes = first_file.stat().st_size
+
+    # When
+    repository.put_transcription("second", "en", {}, None, transcription_result)
+
+    # Then
+    assert not first_file.exists()
+    assert len(list(Path(mock_config.transcription_cache_path).iterdir())) == 1
+    assert repository.disk_usage == repository.max_disk_bytes
+
+
+def test_disabled_tiers_do_not_store_results(
+    mock_config: AppConfig,
+    mock_directory_repository: Mock,
+    transcription_result: TranscriptionResultModel,
+) -> None:
+    # Given
+    mock_config.transcription_cache_size = 0
+    mock_config.transcription_cache_max_size_mb = 0
+    repository = create_repository(mock_config, mock_directory_repository)
+
+    # When
+    repository.put_transcription("hash", "en", {}, None, transcription_result)
+
+    # Then
+    assert repository.get_transcription("hash", "en", {}, None) is None
+    assert list(Path(mock_config.transcription_cache_path).iterdir()) == []
+    mock_directory_repository.create_directory.assert_not_called()
@@ -0,0 +1,157 @@
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from data.repositories.translation_cache_repository_impl import (
+    TranslationCacheRepositoryImpl,
+)
+from domain.repositories.directory_repository import DirectoryRepository
+
+
+@pytest.fixture
+def mock_config(tmp_path: Path) -> AppConfig:
+    config = Mock(AppConfig)
+    config.translation_model_name = "facebook/mbart-large-50-many-to-many-mmt"
+    config.translation_model_download_path = str(tmp_path)
+    config.translation_cache_size = 2
+    config.translation_cache_persistent = False
+    config.translation_cache_persistent_size = 100
+    return config
+
+
+@pytest.fixture
+def mock_directory_repository() -> Mock:
+    return Mock(spec=DirectoryRepository)
+
+
+def create_repository(config: AppConfig, directory_repository: Mock) -> TranslationCacheRepositoryImpl:
+    with patch.object(TranslationCacheRepositoryImpl, "_instance", None):
+        return TranslationCacheRepositoryImpl(
+            config=config,
+            directory_repository=directory_repository,
+            logger=Mock(Logger),
+        )
+
+
+def test_get_translations_counts_hits_and_misses(mock_config: AppConfig, mock_directory_repository: Mock) -> None:
+    # Given
+    repository = create_repository(mock_config, mock_directory_repository)
+    repository.put_translations(["Hello  world"], "en_XX", "fr_XX", {}, ["Bonjour le monde"])
+
+    # When
+    result = repository.get_translations([" Hello world", "Goodbye"], "en_XX", "fr_XX", {})
+
+    # Then
+    assert result == ["Bonjour le monde", None]
+    assert repository.get_statistics().model_dump() == {"hits": 1, "misses": 1, "entries": 1}
+
+
+def test_get_translations_keys_on_languages_and_parameters(
+    mock_config: AppConfig,
+    mock_directory_repository: Mock,
+) -> None:
+    # Given
+    repository = create_repository(mock_config, mock_directory_repository)
+    repository.put_translations(["Hello"], "en_XX", "fr_XX", {"num_beams": 2}, ["Bonjour"])
+
+    # When
+    result = [
+        repository.get_translations(["Hello"], "en_XX", "de_DE", {"num_beams": 2})[0],
+        repository.get_translations(["Hello"], "en_XX", "fr_XX", {})[0],
+        repository.get_translations(["Hello"], "en_XX", "fr_XX", {"num_beams": 2})[0],
+    ]
+
+    # Then
+    assert result == [None, None, "Bonjour"]
+
+
+def test_put_translations_evicts_least_recently_used(mock_config: AppConfig, mock_directory_repository: Mock) -> None:
+    # Given
+    repository = create_repository(mock_config, mock_directory_repository)
+    repository.put_translations(["one", "two"], "en_XX", "fr_XX", {}, ["un", "deux"])
+    repository.get_translations(["one"], "en_XX", "fr_XX", {})
+
+    # When
+    repository.put_translations(["three"], "en_XX", "fr_XX", {}, ["trois"])
+
+    # Then
+    assert repository.get_translations(["one", "two", "three"], "en_XX", "fr_XX", {}) == ["un", None, "trois"]
+    assert repository.get_statistics().entries == 2
+
+
+def test_persistent_cache_survives_restart(mock_config: AppConfig, mock_directory_repository: Mock) -> None:
+    # Given
+    mock_config.translation_cache_persistent = True
+    repository = create_repository(mock_config, mock_directory_repository)
+    repository.put_translations(["Hello"], "en_XX", "fr_XX", {}, ["Bonjour"])
+    repository.flush()
+
+    # When
+    restarted_repository = create_repository(mock_config, mock_directory_repository)
+    result = restarted_repository.get_translations(["Hello"], "en_XX", "fr_XX", {})
+
+    # Then
+    assert result == ["Bonjour"]
+    assert restarted_repository.get_statistics().model_dump() == {"hits": 1, "misses": 0, "entries": 1}
+    mock_directory_repository.create_directory.assert_called_with(mock_config.translation_model_download_path)
+
+
+def test_persistent_cache_commits_writes_in_batches(mock_config: AppConfig, mock_directory_repository: Mock) -> None:
+    # Given
+    mock_config.translation_cache_persistent = True
+    repository = create_repository(mock_config, mock_directory_repository)
+
+    # When
+    repository.put_translations(["Hello"], "en_XX", "fr_XX", {}, ["Bonjour"])
+    unflushed_result = create_repository(mock_config, mock_directory_repository).get_translations(
+        ["Hello"],
+        "en_XX",
+        "fr_XX",
+        {},
+    )
+
+    with patch("data.repositories.translation_cache_repository_impl.PERSIST_BATCH_SIZE", 2):
+        repository.put_translations(["Goodbye"], "en_XX", "fr_XX", {}, ["Au revoir"])
+
+    flushed_result = create_repository(mock_config, mock_directory_repository).get_translations(
+        ["Hello", "Goodbye"],
+        "en_XX",
+        "fr_XX",
+        {},
+    )
+
+    # Then
+    assert unflushed_result == [None]
+    assert flushed_result == ["Bonjour", "Au revoir"]
+
+
+def test_persistent_cache_deletes_least_recently_used_rows(
+    mock_config: AppConfig,
+    mock_directory_repository: Mock,
+) -> None:
+    # Given
+    mock_config.translation_cache_persistent = True
+    mock_config.translation_cache_size = 0
+    mock_config.translation_cache_persistent_size = 2
+    repository = create_repository(mock_config, mock_directory_repository)
+
+    with patch("data.repositories.translation_cache_repository_impl.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+        repository.put_translations(["one"], "en_XX", "fr_XX", {}, ["un"])
+        repository.put_translations(["two"], "en_XX", "fr_XX", {}, ["deux"])
+        repository.flush()
+        repository.get_translations(["one"], "en_XX", "fr_XX", {})
+
+        # When
+        repository.put_translations(["three"], "en_XX", "fr_XX", {}, ["trois"])
+        repository.flush()
+
+    # Then
+    restarted_repository = create_repository(mock_config, mock_directory_repository)
+    assert restarted_repository.get_translations(["one", "two", "three"], "en_XX", "fr_XX", {}) == [
+        "un",
+        None,
+        "trois",
+    ]
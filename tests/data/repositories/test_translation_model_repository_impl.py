@@ -1,7 +1,9 @@
+import asyncio
 from unittest.mock import Mock, patch
 
 import pytest
 
+from core.client_context.client_context import reset_client_id, set_client_id
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
 from core.timer.timer import Timer, TimerFactory
@@ -9,7 +11,11 @@ from data.factories.translation_worker_factory import TranslationWorkerFactory
 from data.repositories.translation_model_repository_impl import (
     TranslationModelRepositoryImpl,
 )
+from data.workers.mbart_translation_worker import MBartTranslationWorker
+from data.workers.translation_batcher import estimate_tokens
+from domain.models.cache_statistics_model import CacheStatisticsModel
 from domain.repositories.directory_repository import DirectoryRepository
+from domain.repositories.translation_cache_repository import TranslationCacheRepository
 
 
 @pytest.fixture
@@ -20,6 +26,10 @@ def mock_config() -> AppConfig:
     config.translation_model_name = "openai/translation"
     config.translation_model_type = "base"
     config.model_idle_timeout = 60
+    config.translation_batch_window_ms = 10
+    config.translation_max_batch_size = 2
+    config.translation_max_batch_tokens = 4096
+    config.client_weights = {}
     return config
 
 
@@ -47,7 +57,7 @@ def mock_logger() -> Mock:
 
 @pytest.fixture
 def mock_worker() -> Mock:
-    return Mock()
+    return Mock(spec=MBartTranslationWorker)
 
 
 @pytest.fixture
@@ -57,6 +67,13 @@ def mock_worker_factory(mock_worker: Mock) -> Mock:
     return factory
 
 
+@pytest.fixture
+def mock_translation_cache_repository() -> Mock:
+    repository = Mock(spec=TranslationCacheRepository)
+    repository.get_translations.side_effect = lambda texts, *args: [None] * len(texts)
+    return repository
+
+
 @pytest.fixture
 def translation_model_repository_impl(
     mock_config: Mock,
@@ -64,6 +81,7 @@ def translation_model_repository_impl(
     mock_timer_factory: Mock,
     mock_logger: Mock,
     mock_worker_factory: Mock,
+    mock_translation_cache_repository: Mock,
 ) -> TranslationModelRepositoryImpl:
     with patch.object(TranslationModelRepositoryImpl, "_instance", None):
         return TranslationModelRepositoryImpl(
@@ -72,26 +90,158 @@ def translation_model_repository_impl(
             timer_factory=mock_timer_factory,
             logger=mock_logger,
             worker_factory=mock_worker_factory,
+            translation_cache_repository=mock_translation_cache_repository,
         )
 
 
-def test_translate_success(
+@pytest.mark.asyncio
+async def test_translate_success(
     translation_model_repository_impl: TranslationModelRepositoryImpl,
     mock_worker: Mock,
     mock_timer: Mock,
+    mock_translation_cache_repository: Mock,
 ) -> None:
     # Given
     mock_worker.is_alive.return_value = False
-    mock_worker.translate.return_value = "translated text"
+    mock_worker.translate_batch.return_value = ["translated text"]
 
     # When
-    result = translation_model_repository_impl.translate("text to translate", "en", "fr", {})
+    result = await translation_model_repository_impl.translate("text to translate", "en", "fr", {})
 
     # Then
     assert result == "translated text"
     mock_worker.start.assert_called_once()
-    mock_worker.translate.assert_called_once_with("text to translate", "en", "fr", {})
+    mock_worker.translate_batch.assert_called_once_with(["text to translate"], "en", "fr", {})
     mock_timer.start.assert_called_once_with(60, translation_model_repository_impl._check_idle_timeout)
+    mock_translation_cache_repository.put_translations.assert_called_once_with(
+        ["text to translate"],
+        "en",
+        "fr",
+        {},
+        ["translated text"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_translate_cache_hit_skips_worker(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_worker: Mock,
+    mock_translation_cache_repository: Mock,
+) -> None:
+    # Given
+    mock_translation_cache_repository.get_translations.side_effect = None
+    mock_translation_cache_repository.get_translations.return_value = ["cached text"]
+
+    # When
+    result = await translation_model_repository_impl.translate("text to translate", "en", "fr", {})
+
+    # Then
+    assert result == "cached text"
+    mock_worker.start.assert_not_called()
+    mock_worker.translate_batch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_translate_batches_concurrent_requests(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_worker.is_alive.return_value = True
+    mock_worker.translate_batch.return_value = ["un", "deux"]
+
+    # When
+    result = await asyncio.gather(
+        translation_model_repository_impl.translate("one", "en", "fr", {}),
+        translation_model_repository_impl.translate("two", "en", "fr", {}),
+    )
+
+    # Then
+    assert list(result) == ["un", "deux"]
+    mock_worker.translate_batch.assert_called_once_with(["one", "two"], "en", "fr", {})
+
+
+@pytest.mark.asyncio
+async def test_translate_charges_each_client_for_its_share_of_batch(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_worker.is_alive.return_value = True
+    mock_worker.translate_batch.return_value = ["un", "deux"]
+    translations = []
+
+    for client_id, text in (("first-client", "one"), ("second-client", "a longer text")):
+        token = set_client_id(client_id)
+        translations.append(asyncio.create_task(translation_model_repository_impl.translate(text, "en", "fr", {})))
+        reset_client_id(token)
+
+    # When
+    with patch.object(translation_model_repository_impl.fair_semaphore, "charge") as mock_charge:
+        await asyncio.gather(*translations)
+
+    # Then
+    mock_worker.translate_batch.assert_called_once_with(["one", "a longer text"], "en", "fr", {})
+    mock_charge.assert_any_call("first-client", estimate_tokens("one"))
+    mock_charge.assert_any_call("second-client", estimate_tokens("a longer text"))
+    assert mock_charge.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_translate_batch_keeps_original_order(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_worker: Mock,
+) -> None:
+    # Given
+    mock_worker.is_alive.return_value = True
+    mock_worker.translate_batch.side_effect = lambda texts, *args: [text.upper() for text in texts]
+    texts = ["a much longer sentence", "hi", "medium text", "ok"]
+
+    # When
+    result = await translation_model_repository_impl.translate_batch(texts, "en", "fr", {})
+
+    # Then
+    assert result == ["A MUCH LONGER SENTENCE", "HI", "MEDIUM TEXT", "OK"]
+    assert [call.args[0] for call in mock_worker.translate_batch.call_args_list] == [
+        ["hi", "ok"],
+        ["medium text", "a much longer sentence"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_translate_batch_sends_only_uncached_unique_texts(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_worker: Mock,
+    mock_translation_cache_repository: Mock,
+) -> None:
+    # Given
+    mock_worker.is_alive.return_value = True
+    mock_worker.translate_batch.side_effect = lambda texts, *args: [text.upper() for text in texts]
+    mock_translation_cache_repository.get_translations.side_effect = None
+    mock_translation_cache_repository.get_translations.return_value = [None, "deux", None]
+
+    # When
+    result = await translation_model_repository_impl.translate_batch(["one", "two", "one"], "en", "fr", {})
+
+    # Then
+    assert result == ["ONE", "deux", "ONE"]
+    mock_worker.translate_batch.assert_called_once_with(["one"], "en", "fr", {})
+    mock_translation_cache_repository.put_translations.assert_called_once_with(["one"], "en", "fr", {}, ["ONE"])
+
+
+def test_get_cache_statistics(
+    translation_model_repository_impl: TranslationModelRepositoryImpl,
+    mock_translation_cache_repository: Mock,
+) -> None:
+    # Given
+    statistics = CacheStatisticsModel(hits=1, misses=2, entries=3)
+    mock_translation_cache_repository.get_statistics.return_value = statistics
+
+    # When
+    result = translation_model_repository_impl.get_cache_statistics()
+
+    # Then
+    assert result == statistics
 
 
 def test_check_idle_timeout_stops_worker(
@@ -1,12 +1,13 @@
+import asyncio
 import multiprocessing
 from multiprocessing.sharedctypes import Synchronized
-from typing import Generator
+from typing import Any, Dict, Generator, cast
 from unittest.mock import Mock, patch
 
 import pytest
 
 from core.logger.logger import Logger
-from data.workers.base_worker import BaseWorker
+from data.workers.base_worker import BaseWorker, PartialResponse, ResponsePipe
 
 
 class MockBaseWorker(BaseWorker[str, str, dict, None]):  # type: ignore
@@ -133,3 +134,197 @@ def test_is_processing_returns_correct_status(base_worker: MockBaseWorker) -> No
 
     # Then
     assert not processing_status
+
+
+def test_send_request_tags_messages_with_request_ids(base_worker: MockBaseWorker) -> None:
+    # Given
+    with patch("multiprocessing.Process"), patch.object(base_worker._pipe_parent, "send") as mock_send:
+        base_worker.start()
+
+        # When
+        _, first = base_worker._send_request("command", "first")
+        _, second = base_worker._send_request("command", "second")
+
+        # Then
+        assert mock_send.call_args_list[0][0][0] == (0, "command", "first")
+        assert mock_send.call_args_list[1][0][0] == (1, "command", "second")
+        assert not first.done()
+        assert not second.done()
+        assert base_worker.is_processing()
+
+
+def test_route_responses_delivers_out_of_order_replies(base_worker: MockBaseWorker) -> None:
+    # Given
+    with patch("multiprocessing.Process"), patch.object(base_worker._pipe_parent, "send"):
+        base_worker.start()
+        _, first = base_worker._send_request("command", "first")
+        _, second = base_worker._send_request("command", "second")
+
+        # When
+        base_worker._pipe_child.send((1, "second result"))
+        base_worker._pipe_child.send((0, ValueError("first failed")))
+
+        # Then
+        assert second.result(timeout=5) == "second result"
+        with pytest.raises(ValueError, match="first failed"):
+            first.result(timeout=5)
+
+
+def test_route_responses_passes_partial_results_to_callback(base_worker: MockBaseWorker) -> None:
+    # Given
+    partial_results: list[str] = []
+
+    with patch("multiprocessing.Process"), patch.object(base_worker._pipe_parent, "send"):
+        base_worker.start()
+        _, future = base_worker._send_request("command", "args", partial_results.append)
+
+        # When
+        base_worker._pipe_child.send((0, PartialResponse("first window")))
+        base_worker._pipe_child.send((0, PartialResponse("second window")))
+        base_worker._pipe_child.send((0, "final result"))
+
+        # Then
+        assert future.result(timeout=5) == "final result"
+        assert partial_results == ["first window", "second window"]
+        assert not base_worker._partial_callbacks
+
+
+@pytest.mark.asyncio
+async def test_execute_delivers_partial_results_before_final_result(base_worker: MockBaseWorker) -> None:
+    # Given
+    received: list[str] = []
+
+    def reply(message: tuple[int, str, str]) -> None:
+        base_worker._deliver_response(message[0], PartialResponse("partial"))
+        base_worker._deliver_response(message[0], "final")
+
+    with patch("multiprocessing.Process"), patch.object(base_worker._pipe_parent, "send", side_effect=reply):
+        base_worker.start()
+
+        # When
+        result = await base_worker._execute("command", "args", received.append)
+
+    # Then
+    assert result == "final"
+    assert received == ["partial"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_execute_cancels_worker_request(base_worker: MockBaseWorker) -> None:
+    # Given
+    with patch("multiprocessing.Process"), patch.object(base_worker._pipe_parent, "send"):
+        base_worker.start()
+        execution = asyncio.create_task(base_worker._execute("command", "args"))
+        await asyncio.sleep(0)
+
+        # When
+        execution.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await execution
+
+    # Then
+    assert base_worker._cancelled_request_id.value == 0
+    assert not base_worker.is_processing()
+
+
+def test_deliver_response_ignores_result_of_cancelled_request(base_worker: MockBaseWorker) -> None:
+    # Given
+    with patch("multiprocessing.Process"), patch.object(base_worker._pipe_parent, "send"):
+        base_worker.start()
+        _, future = base_worker._send_request("command", "args")
+        future.cancel()
+
+        # When
+        base_worker._deliver_response(0, "late result")
+
+    # Then
+    assert future.cancelled()
+    assert not base_worker._pending_requests
+
+
+def test_response_pipe_drops_results_of_cancelled_request() -> None:
+    # Given
+    pipe = Mock()
+    cancelled_request_id = Mock(value=7)
+    response_pipe = ResponsePipe(pipe, 7, cancelled_request_id)
+
+    # When
+    response_pipe.send_partial("partial")
+    response_pipe.send("result")
+
+    # Then
+    assert response_pipe.is_cancelled()
+    pipe.send.assert_not_called()
+
+
+def test_stop_fails_pending_requests(base_worker: MockBaseWorker) -> None:
+    # Given
+    with patch("multiprocessing.Process"), patch.object(base_worker._pipe_parent, "send"):
+        base_worker.start()
+        _, future = base_worker._send_request("command", "args")
+
+        # When
+        base_worker.stop()
+
+        # Then
+        with pytest.raises(RuntimeError, match="Worker process is not running"):
+            future.result(timeout=5)
+
+
+def test_send_request_raises_error_if_worker_not_running(base_worker: MockBaseWorker) -> None:
+    # When / Then
+    with pytest.raises(RuntimeError, match="Worker process is not running"):
+        base_worker._send_request("command", "args")
+
+
+def test_run_process_replies_with_request_id(mock_logger: Logger) -> None:
+    # Given
+    worker = MockBaseWorker("cpu", mock_logger)
+    pipe = Mock()
+    pipe.poll.return_value = True
+    pipe.recv.return_value = (7, "echo", "payload")
+    stop_event = Mock()
+    stop_event.is_set.side_effect = [False, True]
+
+    with patch.object(
+        worker,
+        "handle_command",
+        side_effect=lambda command, args, shared_object, config, response_pipe, *_: response_pipe.send(args),
+    ):
+        # When
+        BaseWorker._run_process(worker, Mock(), pipe, stop_event, Mock(), Mock())
+
+    # Then
+    pipe.send.assert_called_once_with((7, "payload"))
+    pipe.close.assert_called_once()
+
+
+def test_run_process_skips_cancelled_request(mock_logger: Logger) -> None:
+    # Given
+    worker = MockBaseWorker("cpu", mock_logger)
+    worker._cancelled_request_id.value = 7
+    pipe = Mock()
+    pipe.poll.return_value = True
+    pipe.recv.return_value = (7, "echo", "payload")
+    stop_event = Mock()
+    stop_event.is_set.side_effect = [False, True]
+
+    with patch.object(worker, "handle_command") as mock_handle_command:
+        # When
+        BaseWorker._run_process(worker, Mock(), pipe, stop_event, Mock(), Mock())
+
+    # Then
+    mock_handle_command.assert_not_called()
+    pipe.send.assert_not_called()
+
+
+def test_getstate_excludes_parent_only_state(base_worker: MockBaseWorker) -> None:
+    # When
+    state = cast(Dict[str, Any], base_worker.__getstate__())
+
+    # Then
+    assert "_router_thread" not in state
+    assert "_pending_requests" not in state
+    assert "_send_lock" not in state
+    assert "_pipe_child" in state
@@ -0,0 +1,123 @@
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+
+from data.workers.compact_transcription_result import CompactTranscriptionResult
+
+
+@pytest.fixture
+def whisper_result() -> Dict[str, Any]:
+    return {
+        "text": " Hello world. Bye.",
+        "language": "en",
+        "segments": [
+            {
+                "id": 0,
+                "seek": 0,
+                "start": 0.0,
+                "end": 1.25,
+                "text": " Hello world.",
+                "tokens": [1, 2, 3],
+                "temperature": 0.0,
+                "avg_logprob": -0.25,
+                "compression_ratio": 1.5,
+                "no_speech_prob": 0.125,
+            },
+            {
+                "id": 1,
+                "seek": 0,
+                "start": 1.25,
+                "end": 2.5,
+                "text": " Bye.",
+                "tokens": [4],
+                "temperature": 0.2,
+                "avg_logprob": -0.5,
+                "compression_ratio": 1.0,
+                "no_speech_prob": 0.0625,
+            },
+        ],
+    }
+
+
+def test_round_trip_keeps_all_fields_by_default(whisper_result: Dict[str, Any]) -> None:
+    # When
+    result = CompactTranscriptionResult.from_whisper_result(whisper_result).to_transcription_result_model()
+
+    # Then
+    assert result.text == " Hello world. Bye."
+    assert [segment.model_dump() for segment in result.segments] == [
+        {key: value for key, value in segment.items()} for segment in whisper_result["segments"]
+    ]
+
+
+def test_requested_fields_drop_other_columns(whisper_result: Dict[str, Any]) -> None:
+    # When
+    compact_result = CompactTranscriptionResult.from_whisper_result(whisper_result, ["no_speech_prob"])
+    result = compact_result.to_transcription_result_model()
+
+    # Then
+    assert set(compact_result.columns) == {"start", "end", "no_speech_prob"}
+    assert compact_result.tokens is None
+    assert [segment.text for segment in result.segments] == [" Hello world.", " Bye."]
+    assert [segment.end for segment in result.segments] == [1.25, 2.5]
+    assert [segment.no_speech_prob for segment in result.segments] == [0.125, 0.0625]
+    assert result.segments[0].tokens is None
+    assert result.segments[0].avg_logprob is None
+
+
+def test_shifted_results_concatenate_into_one_timeline(whisper_result: Dict[str, Any]) -> None:
+    # Given
+    first = CompactTranscriptionResult.from_whisper_result(whisper_result)
+    second = CompactTranscriptionResult.from_whisper_result(whisper_result)
+
+    # When
+    result = CompactTranscriptionResult.concatenate(
+        [first.shift(0.0, 0), second.shift(30.0, first.segment_count)],
+    ).to_transcription_result_model()
+
+    # Then
+    assert result.text == " Hello world. Bye. Hello world. Bye."
+    assert [segment.text for segment in result.segments] == [" Hello world.", " Bye.", " Hello world.", " Bye."]
+    assert [segment.id for segment in result.segments] == [0, 1, 2, 3]
+    assert [segment.seek for segment in result.segments] == [0, 0, 3000, 3000]
+    assert [segment.start for segment in result.segments] == [0.0, 1.25, 30.0, 31.25]
+    assert [segment.tokens for segment in result.segments] == [[1, 2, 3], [4], [1, 2, 3], [4]]
+
+
+def test_remap_timestamps_moves_segments_back_to_their_regions(whisper_result: Dict[str, Any]) -> None:
+    # Given
+    compact_result = CompactTranscriptionResult.from_whisper_result(whisper_result, ["seek"])
+
+    # When
+    result = compact_result.remap_timestamps(
+        np.array([0.0, 1.25]),
+        np.array([10.0, 20.0]),
+    ).to_transcription_result_model()
+
+    # Then
+    assert [(segment.start, segment.end) for segment in result.segments] == [(10.0, 11.25), (20.0, 21.25)]
+    assert [segment.seek for segment in result.segments] == [1000, 1000]
+
+
+def test_skip_segments_drops_leading_segments(whisper_result: Dict[str, Any]) -> None:
+    # Given
+    compact_result = CompactTranscriptionResult.from_whisper_result(whisper_result)
+
+    # When
+    result = compact_result.skip_segments(1).to_transcription_result_model()
+
+    # Then
+    assert result.text == " Bye."
+    assert [(segment.id, segment.text, segment.tokens) for segment in result.segments] == [(1, " Bye.", [4])]
+
+
+def test_empty_result_has_no_segments() -> None:
+    # When
+    result = CompactTranscriptionResult.from_whisper_result(
+        {"text": "", "segments": []}
+    ).to_transcription_result_model()
+
+    # Then
+    assert result.text == ""
+    assert result.segments == []
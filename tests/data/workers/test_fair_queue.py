@@ -0,0 +1,135 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from core.client_context.client_context import reset_client_id, set_client_id
+from data.workers.fair_queue import FairQueue, FairSemaphore
+
+
+def test_pop_alternates_between_clients() -> None:
+    # Given
+    fair_queue: FairQueue[str] = FairQueue({})
+
+    for index in range(3):
+        fair_queue.push(f"batch-{index}", "batch", 10.0)
+
+    fair_queue.push("interactive-0", "interactive", 10.0)
+
+    # When
+    result = [fair_queue.pop(), fair_queue.pop(), fair_queue.pop()]
+
+    # Then
+    assert result == ["batch-0", "interactive-0", "batch-1"]
+    assert len(fair_queue) == 1
+
+
+def test_pop_shares_service_by_weight() -> None:
+    # Given
+    fair_queue: FairQueue[str] = FairQueue({"heavy": 2.0})
+
+    for index in range(4):
+        fair_queue.push(f"heavy-{index}", "heavy", 10.0)
+        fair_queue.push(f"light-{index}", "light", 10.0)
+
+    # When
+    result = [fair_queue.pop() for _ in range(6)]
+
+    # Then
+    assert sum(item.startswith("heavy") for item in result) == 4
+    assert sum(item.startswith("light") for item in result) == 2
+
+
+def test_pop_serves_shortest_request_of_client_first() -> None:
+    # Given
+    fair_queue: FairQueue[str] = FairQueue({})
+    fair_queue.push("long", "client", 100.0)
+    fair_queue.push("short", "client", 1.0)
+
+    # When
+    result = fair_queue.pop()
+
+    # Then
+    assert result == "short"
+
+
+def test_pop_charges_clients_for_request_cost() -> None:
+    # Given
+    fair_queue: FairQueue[str] = FairQueue({})
+    fair_queue.push("long", "batch", 100.0)
+    fair_queue.pop()
+    fair_queue.push("next", "batch", 5.0)
+    fair_queue.push("short", "interactive", 5.0)
+
+    # When
+    result = [fair_queue.pop(), fair_queue.pop()]
+
+    # Then
+    assert result == ["short", "next"]
+
+
+def test_charge_accounts_for_requests_served_without_waiting() -> None:
+    # Given
+    fair_queue: FairQueue[str] = FairQueue({})
+    fair_queue.charge("batch", 100.0)
+    fair_queue.push("next", "batch", 5.0)
+    fair_queue.push("short", "interactive", 5.0)
+
+    # When
+    result = fair_queue.pop()
+
+    # Then
+    assert result == "short"
+
+
+@pytest.mark.asyncio
+async def test_fair_semaphore_orders_waiters_by_client() -> None:
+    # Given
+    fair_semaphore = FairSemaphore(1, {})
+    order: List[str] = []
+    release = asyncio.Event()
+
+    async def use(client_id: str, name: str) -> None:
+        token = set_client_id(client_id)
+
+        try:
+            async with fair_semaphore.acquire(1.0):
+                order.append(name)
+                await release.wait()
+        finally:
+            reset_client_id(token)
+
+    first = asyncio.create_task(use("batch", "batch-0"))
+    await asyncio.sleep(0)
+    waiting = [
+        asyncio.create_task(use("batch", "batch-1")),
+        asyncio.create_task(use("batch", "batch-2")),
+        asyncio.create_task(use("interactive", "interactive-0")),
+    ]
+    await asyncio.sleep(0)
+
+    # When
+    release.set()
+    await asyncio.gather(first, *waiting)
+
+    # Then
+    assert order == ["batch-0", "interactive-0", "batch-1", "batch-2"]
+
+
+@pytest.mark.asyncio
+async def test_fair_semaphore_passes_slot_on_when_waiter_is_cancelled() -> None:
+    # Given
+    fair_semaphore = FairSemaphore(1, {})
+
+    async with fair_semaphore.acquire():
+        cancelled = asyncio.create_task(fair_semaphore.acquire().__aenter__())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.gather(cancelled, return_exceptions=True)
+
+    # When
+    async with fair_semaphore.acquire():
+        # Then
+        assert fair_semaphore._available == 0
+
+    assert fair_semaphore._available == 1
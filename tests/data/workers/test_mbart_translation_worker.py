@@ -47,7 +47,8 @@ class MockTensor:
         return self
 
 
-def test_translate_sends_correct_command(mbart_worker: MBartTranslationWorker) -> None:
+@pytest.mark.asyncio
+async def test_translate_sends_correct_command(mbart_worker: MBartTranslationWorker) -> None:
     with (
         patch("multiprocessing.Process") as MockProcess,
         patch(
@@ -71,21 +72,20 @@ def test_translate_sends_correct_command(mbart_worker: MBartTranslationWorker) -
         target_language = "fr"
 
         # When
-        with (
-            patch.object(mbart_worker._pipe_parent, "send") as mock_send,
-            patch.object(
-                mbart_worker._pipe_parent,
-                "recv",
-                return_value="Bonjour, le monde!",
-            ),
-        ):
-            mbart_worker.translate(text, source_language, target_language, {})
+        with patch.object(
+            mbart_worker._pipe_parent,
+            "send",
+            side_effect=lambda message: mbart_worker._deliver_response(message[0], ["Bonjour, le monde!"]),
+        ) as mock_send:
+            result = await mbart_worker.translate_batch([text], source_language, target_language, {})
 
             # Then
-            mock_send.assert_called_once_with(("translate", (text, source_language, target_language, {})))
+            assert result == ["Bonjour, le monde!"]
+            mock_send.assert_called_once_with((0, "translate_batch", ([text], source_language, target_language, {})))
 
 
-def test_translate_raises_error_if_worker_not_running(mbart_worker: MBartTranslationWorker) -> None:
+@pytest.mark.asyncio
+async def test_translate_raises_error_if_worker_not_running(mbart_worker: MBartTranslationWorker) -> None:
     # Given
     text = "Hello, world!"
     source_language = "en"
@@ -93,7 +93,7 @@ def test_translate_raises_error_if_worker_not_running(mbart_worker: MBartTransla
 
     # When / Then
     with pytest.raises(RuntimeError, match="Worker process is not running"):
-        mbart_worker.translate(text, source_language, target_language, {})
+        await mbart_worker.translate_batch([text], source_language, target_language, {})
 
 
 def test_initialize_shared_object(mbart_config: MBartTranslationConfig, mock_logger: Logger) -> None:
@@ -143,14 +143,14 @@ def test_handle_command_translate(mbart_worker: MBartTranslationWorker, mbart_co
         pipe = Mock()
         mock_input_tensors = {"input_ids": MockTensor(), "attention_mask": MockTensor()}
         mock_tokenizer.return_value = mock_input_tensors
-        mock_generated_tokens = torch.tensor([[4, 5, 6]])
+        mock_generated_tokens = torch.tensor([[4, 5, 6], [7, 8, 0]])
         mock_model.generate.return_value = mock_generated_tokens
-        mock_tokenizer.decode.return_value = "Bonjour, le monde!"
+        mock_tokenizer.batch_decode.return_value = ["Bonjour, le monde!", "Au revoir!"]
 
         # When
         mbart_worker.handle_command(
-            command="translate",
-            args=("Hello, world!", "en", "fr", {}),
+            command="translate_batch",
+            args=(["Hello, world!", "Goodbye!"], "en", "fr", {}),
             shared_object=(mock_model, mock_tokenizer),
             config=mbart_config,
             pipe=pipe,
@@ -160,9 +160,9 @@ def test_handle_command_translate(mbart_worker: MBartTranslationWorker, mbart_co
 
         # Then
         assert not mock_is_processing.value
-        mock_tokenizer.assert_called_once_with("Hello, world!", return_tensors="pt")
+        mock_tokenizer.assert_called_once_with(["Hello, world!", "Goodbye!"], return_tensors="pt", padding=True)
         mock_model.generate.assert_called_once_with(**mock_input_tensors, forced_bos_token_id=1)
-        pipe.send.assert_called_once_with("Bonjour, le monde!")
+        pipe.send.assert_called_once_with(["Bonjour, le monde!", "Au revoir!"])
 
 
 def test_handle_command_translate_error(
@@ -190,8 +190,8 @@ def test_handle_command_translate_error(
 
         # When
         mbart_worker.handle_command(
-            command="translate",
-            args=("Hello, world!", "en", "fr", {}),
+            command="translate_batch",
+            args=(["Hello, world!", "Goodbye!"], "en", "fr", {}),
             shared_object=(mock_model, mock_tokenizer),
             config=mbart_config,
             pipe=pipe,
@@ -33,36 +33,43 @@ def mock_worker(mock_config: SeamlessTranslationConfig, mock_logger: Logger) ->
     return worker
 
 
-def test_translate_success(mock_worker: SeamlessTranslationWorker) -> None:
+@pytest.mark.asyncio
+async def test_translate_success(mock_worker: SeamlessTranslationWorker) -> None:
     # Given
     mock_worker.is_alive = Mock(return_value=True)
-    mock_worker._pipe_parent.recv = Mock(return_value="translated text")
+    mock_worker._pipe_parent.send = Mock(
+        side_effect=lambda message: mock_worker._deliver_response(message[0], ["translated text"]),
+    )
 
     # When
-    result = mock_worker.translate("hello", "en", "fr", {})
+    result = await mock_worker.translate_batch(["hello"], "en", "fr", {})
 
     # Then
-    assert result == "translated text"
-    mock_worker._pipe_parent.send.assert_called_once_with(("translate", ("hello", "en", "fr", {})))
+    assert result == ["translated text"]
+    mock_worker._pipe_parent.send.assert_called_once_with((0, "translate_batch", (["hello"], "en", "fr", {})))
 
 
-def test_translate_worker_not_running(mock_worker: SeamlessTranslationWorker) -> None:
+@pytest.mark.asyncio
+async def test_translate_worker_not_running(mock_worker: SeamlessTranslationWorker) -> None:
     # Given
     mock_worker.is_alive = Mock(return_value=False)
 
     # When / Then
     with pytest.raises(RuntimeError, match="Worker process is not running"):
-        mock_worker.translate("hello", "en", "fr", {})
+        await mock_worker.translate_batch(["hello"], "en", "fr", {})
 
 
-def test_translate_exception(mock_worker: SeamlessTranslationWorker) -> None:
+@pytest.mark.asyncio
+async def test_translate_exception(mock_worker: SeamlessTranslationWorker) -> None:
     # Given
     mock_worker.is_alive = Mock(return_value=True)
-    mock_worker._pipe_parent.recv = Mock(return_value=Exception("Translation error"))
+    mock_worker._pipe_parent.send = Mock(
+        side_effect=lambda message: mock_worker._deliver_response(message[0], Exception("Translation error")),
+    )
 
     # When / Then
     with pytest.raises(Exception, match="Translation error"):
-        mock_worker.translate("hello", "en", "fr", {})
+        await mock_worker.translate_batch(["hello"], "en", "fr", {})
 
 
 def test_initialize_shared_object(mock_config: SeamlessTranslationConfig, mock_logger: Logger) -> None:
@@ -99,12 +106,12 @@ def test_handle_command_translate_success(
     processing_lock = multiprocessing.Lock()
     mock_model = MagicMock()
     mock_processor = MagicMock()
-    mock_processor.decode.return_value = "translated text"
+    mock_processor.batch_decode.return_value = ["translated hello", "translated world"]
 
     # When
     mock_worker.handle_command(
-        "translate",
-        ("hello", "en", "fr", {}),
+        "translate_batch",
+        (["hello", "world"], "en", "fr", {}),
         (mock_model, mock_processor),
         mock_config,
         mock_pipe,
@@ -113,7 +120,14 @@ def test_handle_command_translate_success(
     )
 
     # Then
-    mock_pipe.send.assert_called_once_with("translated text")
+    mock_processor.assert_called_once_with(
+        text=["hello", "world"],
+        src_lang="en",
+        return_tensors="pt",
+        padding=True,
+    )
+    mock_model.generate.assert_called_once()
+    mock_pipe.send.assert_called_once_with(["translated hello", "translated world"])
 
 
 def test_handle_command_translate_exception(
@@ -126,12 +140,12 @@ def test_handle_command_translate_exception(
     processing_lock = multiprocessing.Lock()
     mock_model = MagicMock()
     mock_processor = MagicMock()
-    mock_processor.decode.side_effect = RuntimeError("Decoding error")
+    mock_processor.batch_decode.side_effect = RuntimeError("Decoding error")
 
     # When
     mock_worker.handle_command(
-        "translate",
-        ("hello", "en", "fr", {}),
+        "translate_batch",
+        (["hello", "world"], "en", "fr", {}),
         (mock_model, mock_processor),
         mock_config,
         mock_pipe,
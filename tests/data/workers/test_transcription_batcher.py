@@ -0,0 +1,140 @@
+import asyncio
+from typing import Any, Dict, FrozenSet, List, Optional
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.audio.audio_decoder import SharedAudioDescriptor
+from core.client_context.client_context import (
+    ANONYMOUS_CLIENT_ID,
+    reset_client_id,
+    set_client_id,
+)
+from core.logger.logger import Logger
+from data.workers.compact_transcription_result import CompactTranscriptionResult
+from data.workers.transcription_batcher import TranscriptionBatcher
+
+
+def named_result(name: str) -> CompactTranscriptionResult:
+    return CompactTranscriptionResult.from_whisper_result({"text": name, "segments": []}, [])
+
+
+async def transcribe_names(
+    audios: List[SharedAudioDescriptor],
+    language: str,
+    transcription_parameters: Dict[str, Any],
+    segment_fields: Optional[FrozenSet[str]],
+    client_ids: List[str],
+) -> List[Optional[CompactTranscriptionResult]]:
+    return [named_result(audio.name) for audio in audios]
+
+
+@pytest.fixture
+def mock_transcribe_batch() -> AsyncMock:
+    return AsyncMock(side_effect=transcribe_names)
+
+
+@pytest.fixture
+def transcription_batcher(mock_transcribe_batch: AsyncMock) -> TranscriptionBatcher:
+    return TranscriptionBatcher(mock_transcribe_batch, 0.01, 3, Mock(Logger))
+
+
+@pytest.mark.asyncio
+async def test_transcribe_groups_clips_by_language_and_parameters(
+    transcription_batcher: TranscriptionBatcher,
+    mock_transcribe_batch: AsyncMock,
+) -> None:
+    # Given
+    one, two, three = (SharedAudioDescriptor(name, 10) for name in ("one", "two", "three"))
+
+    # When
+    results = await asyncio.gather(
+        transcription_batcher.transcribe(one, "en", {"beam_size": 2}, None),
+        transcription_batcher.transcribe(two, "en", {"beam_size": 2}, None),
+        transcription_batcher.transcribe(three, "de", {"beam_size": 2}, None),
+    )
+
+    # Then
+    assert [result.text for result in results] == ["one", "two", "three"]
+    assert mock_transcribe_batch.await_count == 2
+    mock_transcribe_batch.assert_any_await(
+        [one, two],
+        "en",
+        {"beam_size": 2},
+        None,
+        [ANONYMOUS_CLIENT_ID, ANONYMOUS_CLIENT_ID],
+    )
+    mock_transcribe_batch.assert_any_await([three], "de", {"beam_size": 2}, None, [ANONYMOUS_CLIENT_ID])
+
+
+@pytest.mark.asyncio
+async def test_transcribe_dispatches_full_batch(
+    transcription_batcher: TranscriptionBatcher,
+    mock_transcribe_batch: AsyncMock,
+) -> None:
+    # When
+    await asyncio.gather(
+        *(transcription_batcher.transcribe(SharedAudioDescriptor(str(index), 10), "en", {}, None) for index in range(5))
+    )
+
+    # Then
+    assert [[audio.name for audio in call.args[0]] for call in mock_transcribe_batch.await_args_list] == [
+        ["0", "1", "2"],
+        ["3", "4"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_transcribe_propagates_batch_error(
+    transcription_batcher: TranscriptionBatcher,
+    mock_transcribe_batch: AsyncMock,
+) -> None:
+    # Given
+    mock_transcribe_batch.side_effect = RuntimeError("Batch error")
+
+    # When / Then
+    with pytest.raises(RuntimeError, match="Batch error"):
+        await transcription_batcher.transcribe(SharedAudioDescriptor("one", 10), "en", {}, None)
+
+
+@pytest.mark.asyncio
+async def test_transcribe_skips_cancelled_clips(
+    transcription_batcher: TranscriptionBatcher,
+    mock_transcribe_batch: AsyncMock,
+) -> None:
+    # Given
+    cancelled = asyncio.ensure_future(
+        transcription_batcher.transcribe(SharedAudioDescriptor("one", 10), "en", {}, None)
+    )
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    # When
+    result = await transcription_batcher.transcribe(SharedAudioDescriptor("two", 10), "en", {}, None)
+
+    # Then
+    assert result.text == "two"
+    mock_transcribe_batch.assert_awaited_once()
+    assert [audio.name for audio in mock_transcribe_batch.await_args_list[0].args[0]] == ["two"]
+
+
+@pytest.mark.asyncio
+async def test_transcribe_batches_clips_of_different_clients_together(
+    transcription_batcher: TranscriptionBatcher,
+    mock_transcribe_batch: AsyncMock,
+) -> None:
+    # Given
+    one, two = (SharedAudioDescriptor(name, 10) for name in ("one", "two"))
+    transcriptions = []
+
+    for client_id, audio in (("first-client", one), ("second-client", two)):
+        token = set_client_id(client_id)
+        transcriptions.append(asyncio.create_task(transcription_batcher.transcribe(audio, "en", {}, None)))
+        reset_client_id(token)
+
+    # When
+    results = await asyncio.gather(*transcriptions)
+
+    # Then
+    assert [result.text for result in results] == ["one", "two"]
+    mock_transcribe_batch.assert_awaited_once_with([one, two], "en", {}, None, ["first-client", "second-client"])
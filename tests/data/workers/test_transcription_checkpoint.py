@@ -0,0 +1,67 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from data.workers.transcription_checkpoint import (
+    TranscriptionCheckpoint,
+    TranscriptionCheckpointWriter,
+    delete_checkpoint,
+    load_checkpoint,
+    save_checkpoint,
+)
+
+
+def test_save_checkpoint_replaces_previous_checkpoint(tmp_path: Path) -> None:
+    # Given
+    path = os.path.join(tmp_path, "checkpoint.json")
+    save_checkpoint(path, TranscriptionCheckpoint(30.0, [{"start": 0.0, "end": 2.0, "text": " First."}]))
+
+    # When
+    save_checkpoint(path, TranscriptionCheckpoint(60.0, [{"start": 30.0, "end": 32.0, "text": " Second."}]))
+
+    # Then
+    checkpoint = load_checkpoint(path)
+    assert checkpoint == TranscriptionCheckpoint(60.0, [{"start": 30.0, "end": 32.0, "text": " Second."}])
+    assert checkpoint.text == " Second."
+    assert os.listdir(tmp_path) == ["checkpoint.json"]
+
+
+def test_load_checkpoint_returns_none_when_missing(tmp_path: Path) -> None:
+    # When
+    checkpoint = load_checkpoint(os.path.join(tmp_path, "missing.json"))
+
+    # Then
+    assert checkpoint is None
+
+
+def test_delete_checkpoint_ignores_missing_file(tmp_path: Path) -> None:
+    # Given
+    path = os.path.join(tmp_path, "checkpoint.json")
+    save_checkpoint(path, TranscriptionCheckpoint(30.0, []))
+
+    # When
+    delete_checkpoint(path)
+    delete_checkpoint(path)
+
+    # Then
+    assert os.listdir(tmp_path) == []
+
+
+def test_writer_saves_all_segments_once_interval_elapsed(tmp_path: Path) -> None:
+    # Given
+    path = os.path.join(tmp_path, "checkpoint.json")
+
+    with patch("data.workers.transcription_checkpoint.time.monotonic", side_effect=[0.0, 30.0, 60.0]):
+        writer = TranscriptionCheckpointWriter(path, 60.0)
+
+        # When
+        writer.on_window([{"start": 0.0, "end": 2.0, "text": " First."}], 3000)
+        saved_early = os.path.exists(path)
+        writer.on_window([{"start": 30.0, "end": 32.0, "text": " Second."}], 6000)
+
+    # Then
+    assert not saved_early
+    assert load_checkpoint(path) == TranscriptionCheckpoint(
+        60.0,
+        [{"start": 0.0, "end": 2.0, "text": " First."}, {"start": 30.0, "end": 32.0, "text": " Second."}],
+    )
@@ -0,0 +1,65 @@
+import pytest
+
+from data.workers.transcription_cost_model import TranscriptionCostModel
+
+
+@pytest.fixture
+def cost_model() -> TranscriptionCostModel:
+    return TranscriptionCostModel("base")
+
+
+def test_estimate_uses_default_ratio_before_observations(cost_model: TranscriptionCostModel) -> None:
+    # When
+    result = cost_model.estimate(30.0, {})
+
+    # Then
+    assert result == 30.0
+
+
+def test_observe_learns_ratio_per_parameters(cost_model: TranscriptionCostModel) -> None:
+    # Given
+    cost_model.observe(10.0, {"num_beams": 5}, 4.0)
+    cost_model.observe(10.0, {}, 1.0)
+
+    # When
+    beam_search = cost_model.estimate(20.0, {"num_beams": 5})
+    greedy = cost_model.estimate(20.0, {})
+
+    # Then
+    assert beam_search == pytest.approx(8.0)
+    assert greedy == pytest.approx(2.0)
+
+
+def test_observe_smooths_repeated_measurements(cost_model: TranscriptionCostModel) -> None:
+    # Given
+    cost_model.observe(10.0, {}, 1.0)
+    cost_model.observe(10.0, {}, 6.0)
+
+    # When
+    result = cost_model.estimate(10.0, {})
+
+    # Then
+    assert result == pytest.approx(2.0)
+
+
+def test_estimate_falls_back_to_overall_ratio(cost_model: TranscriptionCostModel) -> None:
+    # Given
+    cost_model.observe(10.0, {}, 5.0)
+
+    # When
+    result = cost_model.estimate(10.0, {"num_beams": 2})
+
+    # Then
+    assert result == pytest.approx(5.0)
+
+
+def test_estimate_ignores_prompt(cost_model: TranscriptionCostModel) -> None:
+    # Given
+    cost_model.observe(10.0, {"num_beams": 5, "initial_prompt": "Previous text."}, 4.0)
+    cost_model.observe(10.0, {}, 1.0)
+
+    # When
+    result = cost_model.estimate(20.0, {"num_beams": 5, "initial_prompt": "Other text."})
+
+    # Then
+    assert result == pytest.approx(8.0)
@@ -0,0 +1,171 @@
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.client_context.client_context import (
+    ANONYMOUS_CLIENT_ID,
+    reset_client_id,
+    set_client_id,
+)
+from core.logger.logger import Logger
+from data.workers.translation_batcher import (
+    TranslationBatcher,
+    create_length_buckets,
+    join_generated_sequences,
+)
+
+
+async def translate_upper(
+    texts: List[str],
+    source_language: str,
+    target_language: str,
+    translation_parameters: Dict[str, Any],
+    client_ids: List[str],
+) -> List[str]:
+    return [text.upper() for text in texts]
+
+
+@pytest.fixture
+def mock_translate_batch() -> AsyncMock:
+    return AsyncMock(side_effect=translate_upper)
+
+
+@pytest.fixture
+def translation_batcher(mock_translate_batch: AsyncMock) -> TranslationBatcher:
+    return TranslationBatcher(mock_translate_batch, 0.01, 3, 100, Mock(Logger))
+
+
+@pytest.mark.asyncio
+async def test_translate_groups_requests_by_languages_and_parameters(
+    translation_batcher: TranslationBatcher,
+    mock_translate_batch: AsyncMock,
+) -> None:
+    # When
+    result = await asyncio.gather(
+        translation_batcher.translate("one", "en", "fr", {"num_beams": 2}),
+        translation_batcher.translate("two", "en", "fr", {"num_beams": 2}),
+        translation_batcher.translate("three", "en", "de", {"num_beams": 2}),
+        translation_batcher.translate("four", "en", "fr", {}),
+    )
+
+    # Then
+    assert list(result) == ["ONE", "TWO", "THREE", "FOUR"]
+    assert mock_translate_batch.await_count == 3
+    mock_translate_batch.assert_any_await(
+        ["one", "two"],
+        "en",
+        "fr",
+        {"num_beams": 2},
+        [ANONYMOUS_CLIENT_ID, ANONYMOUS_CLIENT_ID],
+    )
+    mock_translate_batch.assert_any_await(["three"], "en", "de", {"num_beams": 2}, [ANONYMOUS_CLIENT_ID])
+    mock_translate_batch.assert_any_await(["four"], "en", "fr", {}, [ANONYMOUS_CLIENT_ID])
+
+
+@pytest.mark.asyncio
+async def test_translate_dispatches_full_batch(
+    translation_batcher: TranslationBatcher,
+    mock_translate_batch: AsyncMock,
+) -> None:
+    # When
+    result = await asyncio.gather(*(translation_batcher.translate(str(index), "en", "fr", {}) for index in range(5)))
+
+    # Then
+    assert result == ["0", "1", "2", "3", "4"]
+    assert [call.args[0] for call in mock_translate_batch.await_args_list] == [["0", "1", "2"], ["3", "4"]]
+
+
+@pytest.mark.asyncio
+async def test_translate_splits_batch_over_token_budget(mock_translate_batch: AsyncMock) -> None:
+    # Given
+    translation_batcher = TranslationBatcher(mock_translate_batch, 0.01, 10, 20, Mock(Logger))
+
+    # When
+    await asyncio.gather(
+        translation_batcher.translate("a" * 40, "en", "fr", {}),
+        translation_batcher.translate("b" * 40, "en", "fr", {}),
+    )
+
+    # Then
+    assert mock_translate_batch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_translate_propagates_error_to_batch(
+    translation_batcher: TranslationBatcher,
+    mock_translate_batch: AsyncMock,
+) -> None:
+    # Given
+    mock_translate_batch.side_effect = RuntimeError("Translation error")
+
+    # When
+    result = await asyncio.gather(
+        translation_batcher.translate("one", "en", "fr", {}),
+        translation_batcher.translate("two", "en", "fr", {}),
+        return_exceptions=True,
+    )
+
+    # Then
+    assert all(isinstance(error, RuntimeError) for error in result)
+    mock_translate_batch.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_translate_skips_cancelled_requests(
+    translation_batcher: TranslationBatcher,
+    mock_translate_batch: AsyncMock,
+) -> None:
+    # Given
+    cancelled = asyncio.create_task(translation_batcher.translate("one", "en", "fr", {}))
+    kept = asyncio.create_task(translation_batcher.translate("two", "en", "fr", {}))
+    await asyncio.sleep(0)
+
+    # When
+    cancelled.cancel()
+    result = await kept
+
+    # Then
+    assert result == "TWO"
+    mock_translate_batch.assert_awaited_once_with(["two"], "en", "fr", {}, [ANONYMOUS_CLIENT_ID])
+
+
+@pytest.mark.asyncio
+async def test_translate_batches_texts_of_different_clients_together(
+    translation_batcher: TranslationBatcher,
+    mock_translate_batch: AsyncMock,
+) -> None:
+    # Given
+    translations = []
+
+    for client_id, text in (("first-client", "one"), ("second-client", "two")):
+        token = set_client_id(client_id)
+        translations.append(asyncio.create_task(translation_batcher.translate(text, "en", "fr", {})))
+        reset_client_id(token)
+
+    # When
+    result = await asyncio.gather(*translations)
+
+    # Then
+    assert list(result) == ["ONE", "TWO"]
+    mock_translate_batch.assert_awaited_once_with(["one", "two"], "en", "fr", {}, ["first-client", "second-client"])
+
+
+def test_join_generated_sequences_groups_return_sequences() -> None:
+    # When
+    result = join_generated_sequences(["a", "b", "c", "d"], 2)
+
+    # Then
+    assert result == ["ab", "cd"]
+
+
+def test_create_length_buckets_sorts_and_limits_batches() -> None:
+    # Given
+    texts = ["x" * 30, "x", "x" * 10, "x" * 2, "x" * 20]
+
+    # When
+    result = create_length_buckets(texts, 2, 8)
+
+    # Then
+    assert result == [[1, 3], [2], [4], [0]]
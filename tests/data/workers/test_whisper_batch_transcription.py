@@ -0,0 +1,99 @@
+from typing import Any, List
+from unittest.mock import Mock
+
+import numpy as np
+import torch
+from whisper.decoding import DecodingOptions, DecodingResult
+from whisper.tokenizer import get_tokenizer
+
+from data.workers.whisper_batch_transcription import (
+    split_timestamped_segments,
+    transcribe_batch,
+)
+
+TIMESTAMP_BEGIN = 50364
+HELLO_WORLD = [2425, 1002, 13]
+BYE = [4621, 13]
+
+
+def timestamp(seconds: float) -> int:
+    return TIMESTAMP_BEGIN + round(seconds / 0.02)
+
+
+def decoding_result(tokens: List[int], avg_logprob: float = -0.2, temperature: float = 0.0) -> DecodingResult:
+    return DecodingResult(
+        audio_features=torch.zeros(1),
+        language="en",
+        tokens=tokens,
+        avg_logprob=avg_logprob,
+        no_speech_prob=0.01,
+        temperature=temperature,
+        compression_ratio=1.0,
+    )
+
+
+def mock_model() -> Mock:
+    model = Mock()
+    model.dims.n_mels = 80
+    model.dims.n_audio_ctx = 1500
+    model.device = torch.device("cpu")
+    model.is_multilingual = True
+    model.num_languages = 99
+    return model
+
+
+def test_split_timestamped_segments_uses_timestamp_pairs() -> None:
+    # Given
+    tokens = [timestamp(0.0), *HELLO_WORLD, timestamp(1.0), timestamp(1.5), *BYE, timestamp(2.0)]
+
+    # When
+    result = split_timestamped_segments(tokens, TIMESTAMP_BEGIN, 3.0, 0.02)
+
+    # Then
+    assert result == [
+        (0.0, 1.0, [timestamp(0.0), *HELLO_WORLD, timestamp(1.0)]),
+        (1.5, 2.0, [timestamp(1.5), *BYE, timestamp(2.0)]),
+    ]
+
+
+def test_split_timestamped_segments_without_pairs_spans_clip() -> None:
+    # When
+    result = split_timestamped_segments([timestamp(0.0), *BYE], TIMESTAMP_BEGIN, 3.0, 0.02)
+
+    # Then
+    assert result == [(0.0, 3.0, [timestamp(0.0), *BYE])]
+
+
+def test_transcribe_batch_decodes_clips_together_and_retries_failed_ones() -> None:
+    # Given
+    model = mock_model()
+    decode_calls: List[Any] = []
+    first_clip = [timestamp(0.0), *HELLO_WORLD, timestamp(1.0), timestamp(1.5), *BYE, timestamp(2.0)]
+    second_clip = [timestamp(0.0), *BYE, timestamp(0.5)]
+
+    def decode(mel: torch.Tensor, options: DecodingOptions) -> List[DecodingResult]:
+        decode_calls.append((mel.shape[0], options.temperature))
+
+        if options.temperature == 0.0:
+            return [decoding_result(first_clip), decoding_result(second_clip, avg_logprob=-2.0)]
+
+        return [decoding_result(second_clip, temperature=options.temperature)]
+
+    model.decode = decode
+
+    # When
+    results = transcribe_batch(
+        model,
+        [np.zeros(32000, dtype=np.float32), np.zeros(8000, dtype=np.float32)],
+        {"language": "en", "temperature": (0.0, 0.5)},
+    )
+
+    # Then
+    assert decode_calls == [(2, 0.0), (1, 0.5)]
+    assert results[0]["text"] == " Hello world. Bye."
+    assert [(segment["start"], segment["end"], segment["text"]) for segment in results[0]["segments"]] == [
+        (0.0, 1.0, " Hello world."),
+        (1.5, 2.0, " Bye."),
+    ]
+    assert results[1]["segments"][0]["temperature"] == 0.5
+    assert get_tokenizer(True, num_languages=99, language="en").decode(results[1]["segments"][0]["tokens"]) == " Bye."
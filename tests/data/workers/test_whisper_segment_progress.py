@@ -0,0 +1,73 @@
+import importlib
+from typing import Any, Dict, List, Tuple
+from unittest.mock import patch
+
+import pytest
+
+from data.workers.whisper_segment_progress import report_decoded_windows
+from domain.exceptions.unsupported_whisper_version_error import (
+    UnsupportedWhisperVersionError,
+)
+
+# The whisper package exports a transcribe function under the name of its module
+transcribe_module: Any = importlib.import_module("whisper.transcribe")
+
+
+def decode_windows(windows: List[Tuple[List[Dict[str, Any]], int]]) -> None:
+    # Mirrors the loop of whisper.transcribe, which keeps the decoded segments in all_segments
+    all_segments: List[Dict[str, Any]] = []
+
+    with transcribe_module.tqdm.tqdm(total=3000, unit="frames") as pbar:
+        for segments, frames in windows:
+            all_segments.extend(segments)
+            pbar.update(frames)
+
+
+def test_report_decoded_windows_reports_new_segments_of_each_window() -> None:
+    # Given
+    reported: List[Tuple[List[str], int]] = []
+    first = {"start": 0.0, "end": 2.0, "text": " First."}
+    second = {"start": 30.0, "end": 32.0, "text": " Second."}
+
+    # When
+    with report_decoded_windows(
+        lambda segments, decoded_frames: reported.append(([segment["text"] for segment in segments], decoded_frames)),
+    ):
+        decode_windows([([first], 3000), ([], 3000), ([second], 2500)])
+
+    # Then
+    assert reported == [([" First."], 3000), ([], 6000), ([" Second."], 8500)]
+
+
+def test_report_decoded_windows_restores_progress_bar() -> None:
+    # Given
+    original_tqdm = transcribe_module.tqdm
+
+    # When
+    with report_decoded_windows(lambda segments, decoded_frames: None):
+        replaced_tqdm = transcribe_module.tqdm
+
+    # Then
+    assert replaced_tqdm is not original_tqdm
+    assert transcribe_module.tqdm is original_tqdm
+
+
+def test_report_decoded_windows_rejects_other_whisper_version() -> None:
+    # Given
+    original_tqdm = transcribe_module.tqdm
+
+    # When / Then
+    with patch("data.workers.whisper_segment_progress.get_whisper_version", return_value="20231117"):
+        with pytest.raises(UnsupportedWhisperVersionError):
+            with report_decoded_windows(lambda segments, decoded_frames: None):
+                pass
+
+    assert transcribe_module.tqdm is original_tqdm
+
+
+def test_report_decoded_windows_fails_when_segments_are_not_found() -> None:
+    # When / Then
+    with report_decoded_windows(lambda segments, decoded_frames: None):
+        with transcribe_module.tqdm.tqdm(total=3000, unit="frames") as pbar:
+            with pytest.raises(UnsupportedWhisperVersionError):
+                pbar.update(3000)
@@ -1,14 +1,26 @@
+import importlib
 import multiprocessing
+from multiprocessing import shared_memory
+from pathlib import Path
 from typing import Any, Generator
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
+from core.audio.audio_decoder import SharedAudio, SharedAudioDescriptor
 from core.logger.logger import Logger
+from data.workers.base_worker import PartialResponse
+from data.workers.compact_transcription_result import CompactTranscriptionResult
+from data.workers.transcription_checkpoint import (
+    TranscriptionCheckpoint,
+    load_checkpoint,
+)
 from data.workers.whisper_speech_to_text_worker import (
     WhisperSpeechToTextConfig,
     WhisperSpeechToTextWorker,
 )
+from domain.exceptions.request_cancelled_error import RequestCancelledError
 
 
 @pytest.fixture
@@ -26,6 +38,16 @@ def mock_logger() -> Logger:
     return Mock(Logger)
 
 
+@pytest.fixture
+def shared_audio() -> Generator[SharedAudio, None, None]:
+    samples = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+    memory = shared_memory.SharedMemory(create=True, size=samples.nbytes)
+    np.ndarray(samples.shape, dtype=samples.dtype, buffer=memory.buf)[:] = samples
+    audio = SharedAudio(memory, len(samples))
+    yield audio
+    audio.release()
+
+
 @pytest.fixture
 def whisper_worker(
     whisper_config: WhisperSpeechToTextConfig,
@@ -36,7 +58,11 @@ def whisper_worker(
     worker.stop()
 
 
-def test_transcribe_sends_correct_command(whisper_worker: WhisperSpeechToTextWorker) -> None:
+@pytest.mark.asyncio
+async def test_transcribe_sends_correct_command(
+    whisper_worker: WhisperSpeechToTextWorker,
+    shared_audio: SharedAudio,
+) -> None:
     with (
         patch("multiprocessing.Process") as MockProcess,
         patch(
@@ -50,32 +76,31 @@ def test_transcribe_sends_correct_command(whisper_worker: WhisperSpeechToTextWor
 
         # Given
         whisper_worker.start()
-        file_path = "test.wav"
         language = "en"
 
         # When
-        with (
-            patch.object(whisper_worker._pipe_parent, "send") as mock_send,
-            patch.object(
-                whisper_worker._pipe_parent,
-                "recv",
-                return_value={},
-            ),
-        ):
-            whisper_worker.transcribe(file_path, language, {})
+        with patch.object(
+            whisper_worker._pipe_parent,
+            "send",
+            side_effect=lambda message: whisper_worker._deliver_response(message[0], {}),
+        ) as mock_send:
+            await whisper_worker.transcribe(shared_audio.descriptor, language, {}, frozenset({"tokens"}))
 
             # Then
-            mock_send.assert_called_once_with(("transcribe", (file_path, language, {})))
+            mock_send.assert_called_once_with(
+                (0, "transcribe", (shared_audio.descriptor, language, {}, frozenset({"tokens"}), None)),
+            )
 
 
-def test_transcribe_raises_error_if_worker_not_running(whisper_worker: WhisperSpeechToTextWorker) -> None:
+@pytest.mark.asyncio
+async def test_transcribe_raises_error_if_worker_not_running(whisper_worker: WhisperSpeechToTextWorker) -> None:
     # Given
-    file_path = "test.wav"
+    audio = SharedAudioDescriptor("missing", 0)
     language = "en"
 
     # When / Then
     with pytest.raises(RuntimeError, match="Worker process is not running"):
-        whisper_worker.transcribe(file_path, language, {})
+        await whisper_worker.transcribe(audio, language, {})
 
 
 def test_initialize_shared_object(whisper_config: WhisperSpeechToTextConfig, mock_logger: Logger) -> None:
@@ -96,45 +121,327 @@ def test_initialize_shared_object(whisper_config: WhisperSpeechToTextConfig, moc
         assert model == mock_model
 
 
-def test_handle_command_transcribe(whisper_config: WhisperSpeechToTextConfig, mock_logger: Logger) -> None:
+def test_initialize_shared_object_sets_num_threads(
+    whisper_config: WhisperSpeechToTextConfig,
+    mock_logger: Logger,
+) -> None:
+    # Given
+    whisper_config.num_threads = 4
+    worker = WhisperSpeechToTextWorker(whisper_config, mock_logger)
+
+    with (
+        patch("data.workers.whisper_speech_to_text_worker.whisper.load_model"),
+        patch("data.workers.whisper_speech_to_text_worker.torch.set_num_threads") as mock_set_num_threads,
+    ):
+        # When
+        worker.initialize_shared_object(whisper_config)
+
+        # Then
+        mock_set_num_threads.assert_called_once_with(4)
+
+
+def test_handle_command_transcribe(
+    whisper_config: WhisperSpeechToTextConfig,
+    mock_logger: Logger,
+    shared_audio: SharedAudio,
+) -> None:
     worker = WhisperSpeechToTextWorker(whisper_config, mock_logger)
     model = Mock()
     pipe = Mock()
+    pipe.is_cancelled.return_value = False
     is_processing = multiprocessing.Value("b", False)
     processing_lock = multiprocessing.Lock()
 
-    file_path = "test.wav"
     language = "en"
     command = "transcribe"
-    args: tuple[str, str, dict[str, Any]] = (file_path, language, {})
+    args: tuple[SharedAudioDescriptor, str, dict[str, Any], Any, Any] = (
+        shared_audio.descriptor,
+        language,
+        {},
+        None,
+        None,
+    )
 
-    with patch.object(model, "transcribe", return_value={"text": "transcribed text"}):
-        # When
-        worker.handle_command(command, args, model, whisper_config, pipe, is_processing, processing_lock)
+    calls: list[tuple[list[float], dict[str, Any]]] = []
 
-        # Then
-        model.transcribe.assert_called_once_with(file_path, language="en", fp16=True)
-        pipe.send.assert_called_once_with({"text": "transcribed text"})
+    def transcribe(samples: np.ndarray, **kwargs: Any) -> dict[str, str]:
+        calls.append((samples.tolist(), kwargs))
+        return {"text": "transcribed text"}
+
+    model.transcribe = transcribe
+
+    # When
+    worker.handle_command(command, args, model, whisper_config, pipe, is_processing, processing_lock)
 
+    # Then
+    assert len(calls) == 1
+    assert calls[0][0] == pytest.approx([0.1, 0.2, 0.3])
+    assert calls[0][1] == {"language": "en", "fp16": True}
+    sent_result = pipe.send.call_args[0][0]
+    assert isinstance(sent_result, CompactTranscriptionResult)
+    assert sent_result.text == "transcribed text"
 
-def test_handle_command_transcribe_error(whisper_config: WhisperSpeechToTextConfig, mock_logger: Logger) -> None:
+
+def test_handle_command_transcribe_error(
+    whisper_config: WhisperSpeechToTextConfig,
+    mock_logger: Logger,
+    shared_audio: SharedAudio,
+) -> None:
     worker = WhisperSpeechToTextWorker(whisper_config, mock_logger)
     model = Mock()
     pipe = Mock()
+    pipe.is_cancelled.return_value = False
     is_processing = multiprocessing.Value("b", False)
     processing_lock = multiprocessing.Lock()
 
-    file_path = "test.wav"
     language = "en"
     command = "transcribe"
-    args: tuple[str, str, dict[str, Any]] = (file_path, language, {})
+    args: tuple[SharedAudioDescriptor, str, dict[str, Any], Any, Any] = (
+        shared_audio.descriptor,
+        language,
+        {},
+        None,
+        None,
+    )
+
+    def transcribe(samples: np.ndarray, **kwargs: Any) -> dict[str, str]:
+        raise RuntimeError("Transcription error")
+
+    model.transcribe = transcribe
+
+    # When
+    worker.handle_command(command, args, model, whisper_config, pipe, is_processing, processing_lock)
+
+    # Then
+    assert pipe.send.call_count == 1
+    sent_exception = pipe.send.call_args[0][0]
+    assert isinstance(sent_exception, RuntimeError)
+    assert str(sent_exception) == "Transcription error"
+
+
+def test_handle_command_transcribe_words(
+    whisper_config: WhisperSpeechToTextConfig,
+    mock_logger: Logger,
+    shared_audio: SharedAudio,
+) -> None:
+    worker = WhisperSpeechToTextWorker(whisper_config, mock_logger)
+    model = Mock()
+    pipe = Mock()
+    pipe.is_cancelled.return_value = False
+    is_processing = multiprocessing.Value("b", False)
+    processing_lock = multiprocessing.Lock()
+
+    args: tuple[SharedAudioDescriptor, str, dict[str, Any], Any, Any] = (shared_audio.descriptor, "en", {}, None, None)
+    calls: list[dict[str, Any]] = []
+
+    def transcribe(samples: np.ndarray, **kwargs: Any) -> dict[str, Any]:
+        calls.append(kwargs)
+        return {
+            "text": " Hello world",
+            "segments": [
+                {"words": [{"start": 0.0, "end": 0.4, "word": " Hello"}, {"start": 0.5, "end": 0.9, "word": " world"}]},
+            ],
+        }
+
+    model.transcribe = transcribe
+
+    # When
+    worker.handle_command("transcribe_words", args, model, whisper_config, pipe, is_processing, processing_lock)
+
+    # Then
+    assert calls == [{"language": "en", "fp16": True, "word_timestamps": True}]
+    pipe.send.assert_called_once_with([(0.0, 0.4, " Hello"), (0.5, 0.9, " world")])
+
+
+@pytest.mark.asyncio
+async def test_transcribe_with_segment_callback_sends_stream_command(
+    whisper_worker: WhisperSpeechToTextWorker,
+    shared_audio: SharedAudio,
+) -> None:
+    # Given
+    received: list[Any] = []
+
+    def reply(message: tuple[int, str, Any]) -> None:
+        whisper_worker._deliver_response(message[0], PartialResponse("window"))
+        whisper_worker._deliver_response(message[0], "result")
+
+    with patch("multiprocessing.Process"), patch.object(whisper_worker._pipe_parent, "send", side_effect=reply) as send:
+        whisper_worker.start()
 
-    with patch.object(model, "transcribe", side_effect=RuntimeError("Transcription error")):
         # When
-        worker.handle_command(command, args, model, whisper_config, pipe, is_processing, processing_lock)
+        result = await whisper_worker.transcribe(shared_audio.descriptor, "en", {}, None, received.append)
 
-        # Then
-        assert pipe.send.call_count == 1
-        sent_exception = pipe.send.call_args[0][0]
-        assert isinstance(sent_exception, RuntimeError)
-        assert str(sent_exception) == "Transcription error"
+    # Then
+    assert send.call_args[0][0][1] == "transcribe_stream"
+    assert result == "result"
+    assert received == ["window"]
+
+
+def test_handle_command_transcribe_stream_reports_segments_of_each_window(
+    whisper_config: WhisperSpeechToTextConfig,
+    mock_logger: Logger,
+    shared_audio: SharedAudio,
+) -> None:
+    worker = WhisperSpeechToTextWorker(whisper_config, mock_logger)
+    model = Mock()
+    pipe = Mock()
+    pipe.is_cancelled.return_value = False
+    is_processing = multiprocessing.Value("b", False)
+    processing_lock = multiprocessing.Lock()
+
+    args: tuple[SharedAudioDescriptor, str, dict[str, Any], Any, Any] = (
+        shared_audio.descriptor,
+        "en",
+        {},
+        frozenset(),
+        None,
+    )
+    windows = [
+        [{"start": 0.0, "end": 2.0, "text": " First."}, {"start": 2.0, "end": 4.0, "text": " Second."}],
+        [],
+        [{"start": 30.0, "end": 32.0, "text": " Third."}],
+    ]
+
+    def transcribe(samples: np.ndarray, **kwargs: Any) -> dict[str, Any]:
+        # Mirrors how whisper.transcribe extends all_segments before updating its progress bar
+        transcribe_module = importlib.import_module("whisper.transcribe")
+        all_segments: list[dict[str, Any]] = []
+
+        with transcribe_module.tqdm.tqdm(total=3, unit="frames", disable=False) as pbar:
+            for window in windows:
+                all_segments.extend(window)
+                pbar.update(1)
+
+        return {"text": " First. Second. Third.", "segments": all_segments}
+
+    model.transcribe = transcribe
+    original_tqdm = importlib.import_module("whisper.transcribe").tqdm
+
+    # When
+    worker.handle_command("transcribe_stream", args, model, whisper_config, pipe, is_processing, processing_lock)
+
+    # Then
+    partial_results = [call.args[0] for call in pipe.send_partial.call_args_list]
+    assert [result.text for result in partial_results] == [" First. Second.", " Third."]
+    assert partial_results[1].columns["start"].tolist() == [30.0]
+    assert pipe.send.call_args[0][0].text == " First. Second. Third."
+    assert importlib.import_module("whisper.transcribe").tqdm is original_tqdm
+
+
+def test_handle_command_transcribe_saves_checkpoint_of_decoded_windows(
+    whisper_config: WhisperSpeechToTextConfig,
+    mock_logger: Logger,
+    shared_audio: SharedAudio,
+    tmp_path: Path,
+) -> None:
+    # Given
+    whisper_config.checkpoint_interval_seconds = 60.0
+    worker = WhisperSpeechToTextWorker(whisper_config, mock_logger)
+    model = Mock()
+    pipe = Mock()
+    pipe.is_cancelled.return_value = False
+    is_processing = multiprocessing.Value("b", False)
+    processing_lock = multiprocessing.Lock()
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+
+    args: tuple[Any, ...] = (shared_audio.descriptor, "en", {}, frozenset(), checkpoint_path)
+    saved_checkpoints: list[Any] = []
+
+    def transcribe(samples: np.ndarray, **kwargs: Any) -> dict[str, Any]:
+        transcribe_module = importlib.import_module("whisper.transcribe")
+        all_segments: list[dict[str, Any]] = []
+
+        with transcribe_module.tqdm.tqdm(total=6000, unit="frames", disable=False) as pbar:
+            all_segments.append({"start": 0.0, "end": 2.0, "text": " First."})
+            pbar.update(3000)
+            saved_checkpoints.append(load_checkpoint(checkpoint_path))
+
+        return {"text": " First.", "segments": all_segments}
+
+    model.transcribe = transcribe
+
+    # When
+    with patch("data.workers.transcription_checkpoint.time.monotonic", side_effect=[0.0, 60.0]):
+        worker.handle_command("transcribe", args, model, whisper_config, pipe, is_processing, processing_lock)
+
+    # Then
+    assert saved_checkpoints == [TranscriptionCheckpoint(30.0, [{"start": 0.0, "end": 2.0, "text": " First."}])]
+    pipe.send_partial.assert_not_called()
+    assert pipe.send.call_args[0][0].text == " First."
+
+
+def test_handle_command_transcribe_stops_decoding_cancelled_request(
+    whisper_config: WhisperSpeechToTextConfig,
+    mock_logger: Logger,
+    shared_audio: SharedAudio,
+) -> None:
+    # Given
+    worker = WhisperSpeechToTextWorker(whisper_config, mock_logger)
+    model = Mock()
+    pipe = Mock()
+    pipe.is_cancelled.side_effect = [False, True]
+    is_processing = multiprocessing.Value("b", False)
+    processing_lock = multiprocessing.Lock()
+    decoded_windows: list[int] = []
+
+    args: tuple[SharedAudioDescriptor, str, dict[str, Any], Any, Any] = (
+        shared_audio.descriptor,
+        "en",
+        {},
+        frozenset(),
+        None,
+    )
+
+    def transcribe(samples: np.ndarray, **kwargs: Any) -> dict[str, Any]:
+        transcribe_module = importlib.import_module("whisper.transcribe")
+        all_segments: list[dict[str, Any]] = []
+
+        with transcribe_module.tqdm.tqdm(total=9000, unit="frames", disable=False) as pbar:
+            for window in range(3):
+                decoded_windows.append(window)
+                pbar.update(3000)
+
+        return {"text": "", "segments": all_segments}
+
+    model.transcribe = transcribe
+
+    # When
+    worker.handle_command("transcribe", args, model, whisper_config, pipe, is_processing, processing_lock)
+
+    # Then
+    assert decoded_windows == [0, 1]
+    assert isinstance(pipe.send.call_args[0][0], RequestCancelledError)
+    assert not is_processing.value
+
+
+def test_handle_command_transcribe_batch_skips_released_audio(
+    whisper_config: WhisperSpeechToTextConfig,
+    mock_logger: Logger,
+    shared_audio: SharedAudio,
+) -> None:
+    worker = WhisperSpeechToTextWorker(whisper_config, mock_logger)
+    pipe = Mock()
+    is_processing = multiprocessing.Value("b", False)
+    processing_lock = multiprocessing.Lock()
+
+    args: tuple[Any, ...] = (
+        [shared_audio.descriptor, SharedAudioDescriptor("released", 3)],
+        "en",
+        {"beam_size": 2},
+        frozenset(),
+        None,
+    )
+
+    with patch(
+        "data.workers.whisper_speech_to_text_worker.transcribe_batch",
+        return_value=[{"text": " Hello.", "segments": [{"start": 0.0, "end": 1.0, "text": " Hello."}]}],
+    ) as mock_transcribe_batch:
+        # When
+        worker.handle_command("transcribe_batch", args, Mock(), whisper_config, pipe, is_processing, processing_lock)
+
+    # Then
+    assert mock_transcribe_batch.call_args[0][1][0].tolist() == pytest.approx([0.1, 0.2, 0.3])
+    assert mock_transcribe_batch.call_args[0][2] == {"language": "en", "fp16": True, "beam_size": 2}
+    first_result, released_result = pipe.send.call_args[0][0]
+    assert first_result.text == " Hello."
+    assert released_result is None
@@ -0,0 +1,201 @@
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.client_context.client_context import reset_client_id, set_client_id
+from core.logger.logger import Logger
+from core.timer.timer import Timer, TimerFactory
+from data.workers.base_worker import BaseWorker
+from data.workers.worker_pool import WorkerPool
+
+
+@pytest.fixture
+def mock_logger() -> Logger:
+    return Mock(Logger)
+
+
+@pytest.fixture
+def mock_timer_factory() -> TimerFactory:
+    factory = Mock(TimerFactory)
+    factory.create.side_effect = lambda: Mock(Timer)
+    return factory
+
+
+@pytest.fixture
+def mock_workers() -> list[Mock]:
+    return [Mock(BaseWorker), Mock(BaseWorker)]
+
+
+@pytest.fixture
+def worker_pool(
+    mock_workers: list[Mock],
+    mock_timer_factory: TimerFactory,
+    mock_logger: Logger,
+) -> WorkerPool[Mock]:
+    return WorkerPool(mock_workers, mock_timer_factory, 60, mock_logger, "Test model")
+
+
+@pytest.mark.asyncio
+async def test_lease_starts_idle_worker(worker_pool: WorkerPool[Mock], mock_workers: list[Mock]) -> None:
+    # Given
+    mock_workers[0].is_alive.return_value = False
+
+    # When
+    async with worker_pool.lease() as worker:
+        # Then
+        assert worker is mock_workers[0]
+        mock_workers[0].start.assert_called_once()
+        assert list(worker_pool._idle_workers) == [1]
+
+    assert list(worker_pool._idle_workers) == [1, 0]
+    worker_pool._timers[0].start.assert_called_once()
+
+
+def test_acquire_queues_request_when_all_workers_busy(worker_pool: WorkerPool[Mock]) -> None:
+    # Given
+    first = worker_pool.acquire().result()
+    second = worker_pool.acquire().result()
+
+    # When
+    waiter = worker_pool.acquire()
+
+    # Then
+    assert not waiter.done()
+
+    # When
+    worker_pool.release(first)
+
+    # Then
+    assert waiter.result() == first
+    assert second != first
+    assert list(worker_pool._idle_workers) == []
+
+
+def test_release_skips_cancelled_waiters(worker_pool: WorkerPool[Mock]) -> None:
+    # Given
+    first = worker_pool.acquire().result()
+    worker_pool.acquire().result()
+    cancelled_waiter = worker_pool.acquire()
+    waiter = worker_pool.acquire()
+    cancelled_waiter.cancel()
+
+    # When
+    worker_pool.release(first)
+
+    # Then
+    assert waiter.result() == first
+
+
+@pytest.mark.asyncio
+async def test_lease_cancelled_while_waiting_keeps_worker_available(worker_pool: WorkerPool[Mock]) -> None:
+    # Given
+    first = worker_pool.acquire().result()
+    worker_pool.acquire().result()
+
+    async def lease_worker() -> None:
+        async with worker_pool.lease():
+            pass
+
+    task = asyncio.create_task(lease_worker())
+    await asyncio.sleep(0)
+
+    # When
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    worker_pool.release(first)
+
+    # Then
+    assert list(worker_pool._idle_workers) == [first]
+
+
+def test_check_idle_timeout_stops_idle_worker(
+    worker_pool: WorkerPool[Mock],
+    mock_workers: list[Mock],
+    mock_logger: Mock,
+) -> None:
+    # Given
+    mock_workers[1].is_alive.return_value = True
+    mock_workers[1].is_processing.return_value = False
+
+    # When
+    worker_pool._check_idle_timeout(1)
+
+    # Then
+    mock_workers[1].stop.assert_called_once()
+    mock_workers[0].stop.assert_not_called()
+    worker_pool._timers[1].cancel.assert_called_once()
+    mock_logger.info.assert_any_call("Test model worker 1 stopped due to idle timeout")
+
+
+def test_check_idle_timeout_keeps_leased_worker(
+    worker_pool: WorkerPool[Mock],
+    mock_workers: list[Mock],
+) -> None:
+    # Given
+    mock_workers[0].is_alive.return_value = True
+    mock_workers[0].is_processing.return_value = False
+    index = worker_pool.acquire().result()
+
+    # When
+    worker_pool._check_idle_timeout(index)
+
+    # Then
+    mock_workers[index].stop.assert_not_called()
+
+
+def test_release_serves_lowest_priority_first(worker_pool: WorkerPool[Mock]) -> None:
+    # Given
+    first = worker_pool.acquire().result()
+    worker_pool.acquire().result()
+    long_waiter = worker_pool.acquire(100.0)
+    short_waiter = worker_pool.acquire(1.0)
+
+    # When
+    worker_pool.release(first)
+
+    # Then
+    assert short_waiter.result() == first
+    assert not long_waiter.done()
+
+
+def test_charge_serves_clients_charged_less_first(worker_pool: WorkerPool[Mock]) -> None:
+    # Given
+    first = worker_pool.acquire().result()
+    worker_pool.acquire().result()
+    worker_pool.charge("first-client", 100.0)
+    waiters = {}
+
+    for client_id in ("first-client", "second-client"):
+        token = set_client_id(client_id)
+        waiters[client_id] = worker_pool.acquire(1.0)
+        reset_client_id(token)
+
+    # When
+    worker_pool.release(first)
+
+    # Then
+    assert waiters["second-client"].result() == first
+    assert not waiters["first-client"].done()
+
+
+def test_release_ages_waiting_requests(
+    mock_workers: list[Mock],
+    mock_timer_factory: TimerFactory,
+    mock_logger: Logger,
+) -> None:
+    # Given
+    worker_pool = WorkerPool(mock_workers, mock_timer_factory, 60, mock_logger, "Test model", aging=1.0)
+    first = worker_pool.acquire().result()
+    worker_pool.acquire().result()
+
+    with patch("data.workers.fair_queue.time.monotonic", side_effect=[0.0, 50.0]):
+        long_waiter = worker_pool.acquire(30.0)
+        short_waiter = worker_pool.acquire(1.0)
+
+    # When
+    worker_pool.release(first)
+
+    # Then
+    assert long_waiter.result() == first
+    assert not short_waiter.done()
@@ -124,6 +124,38 @@ def test_create_sentence_models_split_segments(sentence_service: SentenceService
     assert result[1].segment_percentage == {"2": 0.20, "3": 0.80}
 
 
+def test_create_sentence_models_keeps_words_equal_to_last_word(sentence_service: SentenceService) -> None:
+    # Given
+    segments = [SubtitleSegmentModel(counter="1", time_range="", text="the cat saw the")]
+
+    # When
+    result = sentence_service.create_sentence_models(segments)
+
+    # Then
+    assert [sentence.text for sentence in result] == ["the cat saw the"]
+
+
+def test_sentence_builder_returns_sentences_once_completed(sentence_service: SentenceService) -> None:
+    # Given
+    sentence_builder = sentence_service.create_sentence_builder()
+
+    # When
+    first_sentences = sentence_builder.add_segments(
+        [SubtitleSegmentModel(counter="1", time_range="", text="First sentence. Second")],
+    )
+    second_sentences = sentence_builder.add_segments(
+        [SubtitleSegmentModel(counter="2", time_range="", text="sentence. Trailing words")],
+    )
+    remaining_sentences = sentence_builder.flush()
+
+    # Then
+    assert [sentence.text for sentence in first_sentences] == ["First sentence."]
+    assert [sentence.text for sentence in second_sentences] == ["Second sentence."]
+    assert second_sentences[0].segment_percentage == {"1": 0.5, "2": 0.5}
+    assert [sentence.text for sentence in remaining_sentences] == ["Trailing words"]
+    assert sentence_builder.flush() == []
+
+
 def test_apply_translated_sentences_single_sentence(sentence_service: SentenceService, mock_segment: Mock) -> None:
     # Given
     translated_sentences = [
@@ -0,0 +1,166 @@
+from typing import List, Tuple
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.config.app_config import AppConfig
+from core.logger.logger import Logger
+from domain.models.streaming_segment_model import StreamingSegmentType
+from domain.models.word_model import WordModel
+from domain.repositories.speech_to_text_repository import SpeechToTextRepository
+from domain.services.language_mapping_service import LanguageMappingService
+from domain.services.streaming_transcription_service import (
+    StreamingTranscriptionService,
+    StreamingTranscriptionSession,
+)
+
+ONE_SECOND = b"\x00" * 16000 * 4
+
+
+def words(*items: Tuple[float, float, str]) -> List[WordModel]:
+    return [WordModel(start=start, end=end, text=text) for start, end, text in items]
+
+
+@pytest.fixture
+def mock_speech_to_text_repository() -> SpeechToTextRepository:
+    repository = Mock(SpeechToTextRepository)
+    repository.transcribe_words = AsyncMock()
+    return repository
+
+
+@pytest.fixture
+def session(mock_speech_to_text_repository: SpeechToTextRepository) -> StreamingTranscriptionSession:
+    return StreamingTranscriptionSession(mock_speech_to_text_repository, "en", {}, 1.0, 15.0)
+
+
+@pytest.mark.asyncio
+async def test_push_audio_waits_for_step(
+    session: StreamingTranscriptionSession,
+    mock_speech_to_text_repository: SpeechToTextRepository,
+) -> None:
+    # When
+    result = await session.push_audio(ONE_SECOND[: len(ONE_SECOND) // 2])
+
+    # Then
+    assert result == []
+    mock_speech_to_text_repository.transcribe_words.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_push_audio_confirms_words_agreed_by_two_windows(
+    session: StreamingTranscriptionSession,
+    mock_speech_to_text_repository: SpeechToTextRepository,
+) -> None:
+    # Given
+    mock_speech_to_text_repository.transcribe_words.side_effect = [
+        words((0.0, 0.4, " Hello"), (0.5, 0.9, " word")),
+        words((0.0, 0.4, " Hello"), (0.5, 0.9, " world"), (1.2, 1.6, " again")),
+    ]
+
+    # When
+    first = await session.push_audio(ONE_SECOND)
+    second = await session.push_audio(ONE_SECOND)
+
+    # Then
+    assert [(segment.type, segment.text) for segment in first] == [(StreamingSegmentType.PARTIAL, "Hello word")]
+    assert [(segment.type, segment.text) for segment in second] == [
+        (StreamingSegmentType.FINAL, "Hello"),
+        (StreamingSegmentType.PARTIAL, "world again"),
+    ]
+    assert second[0].latency is not None
+    assert session.latencies == [second[0].latency]
+    assert mock_speech_to_text_repository.transcribe_words.await_args[0][2] == {"condition_on_previous_text": False}
+
+
+@pytest.mark.asyncio
+async def test_push_audio_skips_confirmed_words_and_prompts_with_them(
+    session: StreamingTranscriptionSession,
+    mock_speech_to_text_repository: SpeechToTextRepository,
+) -> None:
+    # Given
+    mock_speech_to_text_repository.transcribe_words.side_effect = [
+        words((0.0, 0.4, " Hello")),
+        words((0.0, 0.4, " Hello"), (1.2, 1.6, " again")),
+        words((0.0, 0.4, " Hello"), (1.2, 1.6, " again"), (2.1, 2.5, " friend")),
+    ]
+
+    # When
+    await session.push_audio(ONE_SECOND)
+    await session.push_audio(ONE_SECOND)
+    result = await session.push_audio(ONE_SECOND)
+
+    # Then
+    assert [(segment.type, segment.text) for segment in result] == [
+        (StreamingSegmentType.FINAL, "again"),
+        (StreamingSegmentType.PARTIAL, "friend"),
+    ]
+    assert mock_speech_to_text_repository.transcribe_words.await_args[0][2]["initial_prompt"] == "Hello"
+
+
+@pytest.mark.asyncio
+async def test_push_audio_trims_window_to_confirmed_words(
+    mock_speech_to_text_repository: SpeechToTextRepository,
+) -> None:
+    # Given
+    session = StreamingTranscriptionSession(mock_speech_to_text_repository, "en", {}, 1.0, 1.5)
+    mock_speech_to_text_repository.transcribe_words.side_effect = [
+        words((0.0, 0.5, " Hello")),
+        words((0.0, 0.5, " Hello"), (1.2, 1.6, " again")),
+        words((0.7, 1.1, " again"), (1.5, 1.9, " friend")),
+    ]
+
+    # When
+    await session.push_audio(ONE_SECOND)
+    await session.push_audio(ONE_SECOND)
+    result = await session.push_audio(ONE_SECOND)
+
+    # Then
+    assert len(mock_speech_to_text_repository.transcribe_words.await_args[0][0]) == len(ONE_SECOND) * 5 // 2
+    assert [(segment.type, segment.text, segment.start) for segment in result] == [
+        (StreamingSegmentType.FINAL, "again", 1.2),
+        (StreamingSegmentType.PARTIAL, "friend", 2.0),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_finish_confirms_remaining_hypothesis(
+    session: StreamingTranscriptionSession,
+    mock_speech_to_text_repository: SpeechToTextRepository,
+) -> None:
+    # Given
+    mock_speech_to_text_repository.transcribe_words.side_effect = [
+        words((0.0, 0.4, " Hello")),
+        words((0.0, 0.4, " Hello"), (1.0, 1.3, " there")),
+    ]
+    await session.push_audio(ONE_SECOND)
+    await session.push_audio(ONE_SECOND[: len(ONE_SECOND) // 2])
+
+    # When
+    result = await session.finish()
+
+    # Then
+    assert [(segment.type, segment.text) for segment in result] == [(StreamingSegmentType.FINAL, "Hello there")]
+    assert await session.finish() == []
+
+
+def test_create_session_maps_language(mock_speech_to_text_repository: SpeechToTextRepository) -> None:
+    # Given
+    config = Mock(AppConfig)
+    config.speech_to_text_model_name = "openai/whisper"
+    config.streaming_step_ms = 500
+    config.streaming_max_window_seconds = 10
+    language_mapping_service = Mock(LanguageMappingService)
+    language_mapping_service.map_language.return_value = "en"
+    service = StreamingTranscriptionService(
+        config,
+        mock_speech_to_text_repository,
+        language_mapping_service,
+        Mock(Logger),
+    )
+
+    # When
+    session = service.create_session("en_US", {})
+
+    # Then
+    assert isinstance(session, StreamingTranscriptionSession)
+    language_mapping_service.map_language.assert_called_once_with("en_US", "openai/whisper")
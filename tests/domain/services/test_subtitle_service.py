@@ -74,6 +74,20 @@ def test_convert_to_subtitle_segments_empty_segments(subtitle_service: SubtitleS
     assert result == []
 
 
+def test_convert_to_subtitle_segments_continues_counter(subtitle_service: SubtitleService) -> None:
+    # Given
+    transcription_result = TranscriptionResultModel(
+        segments=[SegmentModel(start=30.0, end=31.5, text="Later")],
+        text="Later",
+    )
+
+    # When
+    result = subtitle_service.convert_to_subtitle_segments(transcription_result, 5)
+
+    # Then
+    assert result == [SubtitleSegmentModel(counter="5", time_range="00:00:30,000 --> 00:00:31,500", text="Later")]
+
+
 def test_format_time(subtitle_service: SubtitleService) -> None:
     # Given
     seconds = 3661.123  # 1 hour, 1 minute, 1 second, and 123 milliseconds
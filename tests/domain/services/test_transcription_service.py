@@ -1,12 +1,23 @@
+import asyncio
+from typing import Any
 from unittest.mock import AsyncMock, Mock
 
 import pytest
-from fastapi import UploadFile
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from core.single_flight.single_flight import SingleFlight
+from domain.models.cache_statistics_model import CacheStatisticsModel
+from domain.models.saved_file_model import SavedFileModel
+from domain.models.transcription_result_model import (
+    SegmentModel,
+    TranscriptionResultModel,
+)
 from domain.repositories.file_repository import FileRepository
 from domain.repositories.speech_to_text_repository import SpeechToTextRepository
+from domain.repositories.transcription_cache_repository import (
+    TranscriptionCacheRepository,
+)
 from domain.services.language_mapping_service import LanguageMappingService
 from domain.services.transcription_service import TranscriptionService
 
@@ -39,6 +50,13 @@ def mock_language_mapping_service() -> LanguageMappingService:
     return Mock(LanguageMappingService)
 
 
+@pytest.fixture
+def mock_transcription_cache_repository() -> TranscriptionCacheRepository:
+    repository = Mock(TranscriptionCacheRepository)
+    repository.get_transcription.return_value = None
+    return repository
+
+
 @pytest.fixture
 def transcription_service(
     mock_logger: Logger,
@@ -46,6 +64,7 @@ def transcription_service(
     mock_speech_to_text_repository: SpeechToTextRepository,
     mock_file_repository: FileRepository,
     mock_language_mapping_service: LanguageMappingService,
+    mock_transcription_cache_repository: TranscriptionCacheRepository,
 ) -> TranscriptionService:
     return TranscriptionService(
         logger=mock_logger,
@@ -53,6 +72,8 @@ def transcription_service(
         speech_to_text_repository=mock_speech_to_text_repository,
         file_repository=mock_file_repository,
         language_mapping_service=mock_language_mapping_service,
+        transcription_cache_repository=mock_transcription_cache_repository,
+        single_flight=SingleFlight(),
     )
 
 
@@ -64,19 +85,19 @@ async def test_transcribe_success(
     mock_language_mapping_service: LanguageMappingService,
 ) -> None:
     # Given
-    mock_file = Mock(UploadFile)
-    mock_file.filename = "test_file"
-    mock_file_repository.save_file.return_value = "test_path"
-    mock_speech_to_text_repository.transcribe.return_value = {"text": "transcribed text", "segments": []}
+    saved_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file")
+    mock_speech_to_text_repository.transcribe.return_value = TranscriptionResultModel(
+        text="transcribed text",
+        segments=[],
+    )
     mock_language_mapping_service.map_language.return_value = "en"
 
     # When
-    result = await transcription_service.transcribe(mock_file, "en", {})
+    result = await transcription_service.transcribe(saved_file, "en", {})
 
     # Then
     assert result.text == "transcribed text"
-    mock_file_repository.save_file.assert_awaited_once_with(mock_file)
-    mock_speech_to_text_repository.transcribe.assert_called_once_with("test_path", "en", {})
+    mock_speech_to_text_repository.transcribe.assert_called_once_with("test_path", "en", {}, None, None)
     mock_file_repository.delete_file.assert_called_once_with("test_path")
 
 
@@ -90,20 +111,21 @@ async def test_transcribe_with_file_deletion_disabled(
 ) -> None:
     # Given
     mock_config.delete_files_after_transcription = False
-    mock_file = Mock(UploadFile)
-    mock_file.filename = "test_file"
-    mock_file_repository.save_file.return_value = "test_path"
-    mock_speech_to_text_repository.transcribe.return_value = {"text": "transcribed text", "segments": []}
+    saved_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file")
+    mock_speech_to_text_repository.transcribe.return_value = TranscriptionResultModel(
+        text="transcribed text",
+        segments=[],
+    )
     mock_language_mapping_service.map_language.return_value = "en"
 
     # When
-    result = await transcription_service.transcribe(mock_file, "en", {})
+    result = await transcription_service.transcribe(saved_file, "en", {})
 
     # Then
     assert result.text == "transcribed text"
-    mock_file_repository.save_file.assert_awaited_once_with(mock_file)
-    mock_speech_to_text_repository.transcribe.assert_called_once_with("test_path", "en", {})
+    mock_speech_to_text_repository.transcribe.assert_called_once_with("test_path", "en", {}, None, None)
     mock_file_repository.delete_file.assert_not_called()
+    mock_file_repository.release_file.assert_called_once_with("test_path")
 
 
 @pytest.mark.asyncio
@@ -111,16 +133,326 @@ async def test_transcribe_failure(
     transcription_service: TranscriptionService,
     mock_file_repository: FileRepository,
     mock_speech_to_text_repository: SpeechToTextRepository,
+    mock_transcription_cache_repository: Mock,
 ) -> None:
     # Given
-    mock_file = Mock(UploadFile)
-    mock_file.filename = "test_file"
-    mock_file_repository.save_file.side_effect = Exception("Save failed")
+    saved_file = SavedFileModel(path="test_path", content_hash="failure_hash", file_name="test_file")
+    mock_speech_to_text_repository.transcribe.side_effect = Exception("Transcription failed")
 
     # When / Then
-    with pytest.raises(Exception, match="Save failed"):
-        await transcription_service.transcribe(mock_file, "en", {})
+    with pytest.raises(Exception, match="Transcription failed"):
+        await transcription_service.transcribe(saved_file, "en", {})
+
+    mock_transcription_cache_repository.put_transcription.assert_not_called()
+    mock_file_repository.delete_file.assert_called_once_with("test_path")
+
+
+@pytest.mark.asyncio
+async def test_stage_file(
+    transcription_service: TranscriptionService,
+    mock_file_repository: FileRepository,
+) -> None:
+    # Given
+    chunks = Mock()
+    saved_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file", size=12)
+    mock_file_repository.save_file.return_value = saved_file
+
+    # When
+    result = await transcription_service.stage_file("test_file", chunks)
+
+    # Then
+    assert result == saved_file
+    mock_file_repository.save_file.assert_awaited_once_with("test_file", chunks)
+
+
+def test_discard_file(
+    transcription_service: TranscriptionService,
+    mock_file_repository: FileRepository,
+) -> None:
+    # Given
+    saved_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file")
+
+    # When
+    transcription_service.discard_file(saved_file)
+
+    # Then
+    mock_file_repository.delete_file.assert_called_once_with("test_path")
+
+
+@pytest.mark.asyncio
+async def test_transcribe_stores_result_in_cache(
+    transcription_service: TranscriptionService,
+    mock_file_repository: FileRepository,
+    mock_speech_to_text_repository: SpeechToTextRepository,
+    mock_language_mapping_service: LanguageMappingService,
+    mock_transcription_cache_repository: Mock,
+) -> None:
+    # Given
+    saved_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file")
+    transcription_result = TranscriptionResultModel(text="transcribed text", segments=[])
+    mock_speech_to_text_repository.transcribe.return_value = transcription_result
+    mock_language_mapping_service.map_language.return_value = "en"
+
+    # When
+    await transcription_service.transcribe(saved_file, "en", {"beam_size": 5}, ())
+
+    # Then
+    mock_transcription_cache_repository.get_transcription.assert_called_once_with("hash", "en", {"beam_size": 5}, ())
+    mock_transcription_cache_repository.put_transcription.assert_called_once_with(
+        "hash",
+        "en",
+        {"beam_size": 5},
+        (),
+        transcription_result,
+    )
+
+
+@pytest.mark.asyncio
+async def test_transcribe_returns_cached_result(
+    transcription_service: TranscriptionService,
+    mock_file_repository: FileRepository,
+    mock_speech_to_text_repository: SpeechToTextRepository,
+    mock_language_mapping_service: LanguageMappingService,
+    mock_transcription_cache_repository: Mock,
+) -> None:
+    # Given
+    saved_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file")
+    cached_result = TranscriptionResultModel(text="cached text", segments=[])
+    mock_transcription_cache_repository.get_transcription.return_value = cached_result
+    mock_language_mapping_service.map_language.return_value = "en"
 
-    mock_file_repository.save_file.assert_awaited_once_with(mock_file)
+    # When
+    result = await transcription_service.transcribe(saved_file, "en", {})
+
+    # Then
+    assert result == cached_result
     mock_speech_to_text_repository.transcribe.assert_not_called()
-    mock_file_repository.delete_file.assert_not_called()
+    mock_transcription_cache_repository.put_transcription.assert_not_called()
+    mock_file_repository.delete_file.assert_called_once_with("test_path")
+
+
+@pytest.mark.asyncio
+async def test_transcribe_coalesces_identical_in_flight_requests(
+    transcription_service: TranscriptionService,
+    mock_file_repository: FileRepository,
+    mock_speech_to_text_repository: SpeechToTextRepository,
+    mock_language_mapping_service: LanguageMappingService,
+) -> None:
+    # Given
+    first_file = SavedFileModel(path="first_path", content_hash="same_hash", file_name="test_file")
+    second_file = SavedFileModel(path="second_path", content_hash="same_hash", file_name="test_file")
+    transcription_result = TranscriptionResultModel(text="transcribed text", segments=[])
+
+    async def transcribe(*args: object) -> TranscriptionResultModel:
+        await asyncio.sleep(0.01)
+        return transcription_result
+
+    mock_speech_to_text_repository.transcribe.side_effect = transcribe
+    mock_language_mapping_service.map_language.return_value = "en"
+
+    # When
+    result = await asyncio.gather(
+        transcription_service.transcribe(first_file, "en", {}),
+        transcription_service.transcribe(second_file, "en", {}),
+    )
+
+    # Then
+    assert list(result) == [transcription_result, transcription_result]
+    mock_speech_to_text_repository.transcribe.assert_called_once_with("first_path", "en", {}, None, None)
+    mock_file_repository.delete_file.assert_any_call("first_path")
+    mock_file_repository.delete_file.assert_any_call("second_path")
+
+
+@pytest.mark.asyncio
+async def test_transcribe_keeps_shared_file_until_flight_ends_when_leader_is_cancelled(
+    transcription_service: TranscriptionService,
+    mock_file_repository: FileRepository,
+    mock_speech_to_text_repository: SpeechToTextRepository,
+    mock_language_mapping_service: LanguageMappingService,
+) -> None:
+    # Given
+    first_file = SavedFileModel(path="first_path", content_hash="leader_hash", file_name="test_file")
+    second_file = SavedFileModel(path="second_path", content_hash="leader_hash", file_name="test_file")
+    transcription_result = TranscriptionResultModel(text="transcribed text", segments=[])
+    transcription_started = asyncio.Event()
+    finish_transcription = asyncio.Event()
+
+    async def transcribe(*args: object) -> TranscriptionResultModel:
+        transcription_started.set()
+        await finish_transcription.wait()
+        return transcription_result
+
+    mock_speech_to_text_repository.transcribe.side_effect = transcribe
+    mock_language_mapping_service.map_language.return_value = "en"
+    leader = asyncio.create_task(transcription_service.transcribe(first_file, "en", {}))
+    await transcription_started.wait()
+    follower = asyncio.create_task(transcription_service.transcribe(second_file, "en", {}))
+    await asyncio.sleep(0)
+
+    # When
+    leader.cancel()
+    await asyncio.gather(leader, return_exceptions=True)
+    deleted_while_running = [call.args[0] for call in mock_file_repository.delete_file.call_args_list]
+    finish_transcription.set()
+    result = await follower
+
+    # Then
+    assert leader.cancelled()
+    assert deleted_while_running == []
+    assert result == transcription_result
+    mock_file_repository.delete_file.assert_any_call("first_path")
+    mock_file_repository.delete_file.assert_any_call("second_path")
+
+
+@pytest.mark.asyncio
+async def test_transcribe_cancels_transcription_when_its_only_caller_is_cancelled(
+    transcription_service: TranscriptionService,
+    mock_file_repository: FileRepository,
+    mock_speech_to_text_repository: SpeechToTextRepository,
+    mock_language_mapping_service: LanguageMappingService,
+) -> None:
+    # Given
+    saved_file = SavedFileModel(path="test_path", content_hash="abandoned_hash", file_name="test_file")
+    transcription_started = asyncio.Event()
+    transcription_cancelled = asyncio.Event()
+
+    async def transcribe(*args: object) -> TranscriptionResultModel:
+        transcription_started.set()
+
+        try:
+            await asyncio.Event().wait()
+
+        except asyncio.CancelledError:
+            transcription_cancelled.set()
+            raise
+
+        return TranscriptionResultModel(text="never", segments=[])
+
+    mock_speech_to_text_repository.transcribe.side_effect = transcribe
+    mock_language_mapping_service.map_language.return_value = "en"
+    caller = asyncio.create_task(transcription_service.transcribe(saved_file, "en", {}))
+    await transcription_started.wait()
+
+    # When
+    caller.cancel()
+    await asyncio.gather(caller, return_exceptions=True)
+    await asyncio.wait_for(transcription_cancelled.wait(), timeout=1)
+    await asyncio.sleep(0)
+
+    # Then
+    mock_file_repository.delete_file.assert_called_once_with("test_path")
+
+
+@pytest.mark.asyncio
+async def test_create_progress_reporter_reports_decoded_share_of_file(
+    transcription_service: TranscriptionService,
+    mock_speech_to_text_repository: SpeechToTextRepository,
+) -> None:
+    # Given
+    saved_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file")
+    mock_speech_to_text_repository.probe_duration = AsyncMock(return_value=120.0)
+    progress_callback = Mock()
+
+    # When
+    report_progress = await transcription_service.create_progress_reporter(saved_file, progress_callback, 0.9)
+    report_progress(TranscriptionResultModel(text="", segments=[]))
+    report_progress(
+        TranscriptionResultModel(
+            text=" First. Second.",
+            segments=[
+                SegmentModel(start=0.0, end=30.0, text=" First."),
+                SegmentModel(start=30.0, end=60.0, text=" Second."),
+            ],
+        ),
+    )
+    report_progress(
+        TranscriptionResultModel(text=" Last.", segments=[SegmentModel(start=60.0, end=125.0, text=" Last.")])
+    )
+
+    # Then
+    mock_speech_to_text_repository.probe_duration.assert_awaited_once_with("test_path")
+    assert [call.args[0] for call in progress_callback.call_args_list] == [0.45, 0.9]
+
+
+@pytest.mark.asyncio
+async def test_transcribe_streams_segments_and_delivers_the_rest_at_completion(
+    transcription_service: TranscriptionService,
+    mock_speech_to_text_repository: SpeechToTextRepository,
+    mock_language_mapping_service: LanguageMappingService,
+) -> None:
+    # Given
+    saved_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file")
+    first_segment = SegmentModel(start=0.0, end=2.0, text=" First.")
+    second_segment = SegmentModel(start=30.0, end=32.0, text=" Second.")
+
+    async def transcribe(*args: Any) -> TranscriptionResultModel:
+        args[-1](TranscriptionResultModel(text=" First.", segments=[first_segment]))
+        return TranscriptionResultModel(text=" First. Second.", segments=[first_segment, second_segment])
+
+    mock_speech_to_text_repository.transcribe.side_effect = transcribe
+    mock_language_mapping_service.map_language.return_value = "en"
+    partial_results: list[TranscriptionResultModel] = []
+
+    # When
+    await transcription_service.transcribe(saved_file, "en", {}, (), partial_results.append)
+
+    # Then
+    assert [result.segments for result in partial_results] == [[first_segment], [second_segment]]
+    assert partial_results[1].text == " Second."
+
+
+@pytest.mark.asyncio
+async def test_transcribe_delivers_cached_segments_to_callback(
+    transcription_service: TranscriptionService,
+    mock_language_mapping_service: LanguageMappingService,
+    mock_transcription_cache_repository: Mock,
+) -> None:
+    # Given
+    saved_file = SavedFileModel(path="test_path", content_hash="hash", file_name="test_file")
+    segment = SegmentModel(start=0.0, end=2.0, text=" Cached.")
+    mock_transcription_cache_repository.get_transcription.return_value = TranscriptionResultModel(
+        text=" Cached.",
+        segments=[segment],
+    )
+    mock_language_mapping_service.map_language.return_value = "en"
+    partial_results: list[TranscriptionResultModel] = []
+
+    # When
+    await transcription_service.transcribe(saved_file, "en", {}, (), partial_results.append)
+
+    # Then
+    assert [result.segments for result in partial_results] == [[segment]]
+
+
+@pytest.mark.asyncio
+async def test_extract_archive_deletes_archive_after_extraction(
+    transcription_service: TranscriptionService,
+    mock_file_repository: Mock,
+) -> None:
+    # Given
+    archive = SavedFileModel(path="archive_path", content_hash="hash", file_name="clips.zip")
+    extracted = [SavedFileModel(path="clip_path", content_hash="clip_hash", file_name="clip.mp3")]
+    mock_file_repository.extract_archive.return_value = extracted
+
+    # When
+    result = await transcription_service.extract_archive(archive, 10)
+
+    # Then
+    assert result == extracted
+    mock_file_repository.extract_archive.assert_awaited_once_with(archive, 10)
+    mock_file_repository.delete_file.assert_called_once_with("archive_path")
+
+
+def test_get_cache_statistics(
+    transcription_service: TranscriptionService,
+    mock_transcription_cache_repository: Mock,
+) -> None:
+    # Given
+    statistics = CacheStatisticsModel(hits=1, misses=2, entries=1)
+    mock_transcription_cache_repository.get_statistics.return_value = statistics
+
+    # When
+    result = transcription_service.get_cache_statistics()
+
+    # Then
+    assert result == statistics
@@ -1,9 +1,12 @@
+import asyncio
 from unittest.mock import Mock
 
 import pytest
 
 from core.config.app_config import AppConfig
 from core.logger.logger import Logger
+from core.single_flight.single_flight import SingleFlight
+from domain.models.cache_statistics_model import CacheStatisticsModel
 from domain.models.sentence_model import SentenceModel
 from domain.repositories.translation_model_repository import TranslationModelRepository
 from domain.services.language_mapping_service import LanguageMappingService
@@ -44,10 +47,12 @@ def translation_service(
         config=mock_config,
         translation_model_repository=mock_translation_model_repository,
         language_mapping_service=mock_language_mapping_service,
+        single_flight=SingleFlight(),
     )
 
 
-def test_translate_sentences_success(
+@pytest.mark.asyncio
+async def test_translate_sentences_success(
     translation_service: TranslationService,
     mock_translation_model_repository: TranslationModelRepository,
     mock_language_mapping_service: LanguageMappingService,
@@ -60,19 +65,24 @@ def test_translate_sentences_success(
     source_language = "en"
     target_language = "es"
     mock_language_mapping_service.map_language.side_effect = ["en", "es"]
-    mock_translation_model_repository.translate.side_effect = ["Hola", "Mundo"]
+    mock_translation_model_repository.translate_batch.return_value = ["Hola", "Mundo"]
 
     # When
-    translation_service.translate_sentences(sentences, source_language, target_language, {})
+    await translation_service.translate_sentences(sentences, source_language, target_language, {})
 
     # Then
     assert sentences[0].translation == "Hola"
     assert sentences[1].translation == "Mundo"
-    mock_translation_model_repository.translate.assert_any_call("Hello", source_language, target_language, {})
-    mock_translation_model_repository.translate.assert_any_call("World", source_language, target_language, {})
+    mock_translation_model_repository.translate_batch.assert_called_once_with(
+        ["Hello", "World"],
+        source_language,
+        target_language,
+        {},
+    )
 
 
-def test_translate_sentences_exception(
+@pytest.mark.asyncio
+async def test_translate_sentences_exception(
     translation_service: TranslationService,
     mock_translation_model_repository: TranslationModelRepository,
     mock_language_mapping_service: LanguageMappingService,
@@ -82,14 +92,15 @@ def test_translate_sentences_exception(
     source_language = "en"
     target_language = "es"
     mock_language_mapping_service.map_language.side_effect = ["en", "es"]
-    mock_translation_model_repository.translate.side_effect = Exception("Translation error")
+    mock_translation_model_repository.translate_batch.side_effect = Exception("Translation error")
 
     # When / Then
     with pytest.raises(Exception, match="Translation error"):
-        translation_service.translate_sentences(sentences, source_language, target_language, {})
+        await translation_service.translate_sentences(sentences, source_language, target_language, {})
 
 
-def test_translate_text_success(
+@pytest.mark.asyncio
+async def test_translate_text_success(
     translation_service: TranslationService,
     mock_translation_model_repository: TranslationModelRepository,
     mock_language_mapping_service: LanguageMappingService,
@@ -102,14 +113,15 @@ def test_translate_text_success(
     mock_translation_model_repository.translate.return_value = "Hola Mundo"
 
     # When
-    result = translation_service.translate_text(text, source_language, target_language, {})
+    result = await translation_service.translate_text(text, source_language, target_language, {})
 
     # Then
     assert result == "Hola Mundo"
     mock_translation_model_repository.translate.assert_called_once_with(text, source_language, target_language, {})
 
 
-def test_translate_text_exception(
+@pytest.mark.asyncio
+async def test_translate_text_exception(
     translation_service: TranslationService,
     mock_translation_model_repository: TranslationModelRepository,
     mock_language_mapping_service: LanguageMappingService,
@@ -123,4 +135,46 @@ def test_translate_text_exception(
 
     # When / Then
     with pytest.raises(Exception, match="Translation error"):
-        translation_service.translate_text(text, source_language, target_language, {})
+        await translation_service.translate_text(text, source_language, target_language, {})
+
+
+@pytest.mark.asyncio
+async def test_translate_text_coalesces_identical_in_flight_requests(
+    translation_service: TranslationService,
+    mock_translation_model_repository: TranslationModelRepository,
+    mock_language_mapping_service: LanguageMappingService,
+) -> None:
+    # Given
+    mock_language_mapping_service.map_language.side_effect = lambda language, model: language
+
+    async def translate(*args: object) -> str:
+        await asyncio.sleep(0.01)
+        return "Hola Mundo"
+
+    mock_translation_model_repository.translate.side_effect = translate
+
+    # When
+    result = await asyncio.gather(
+        translation_service.translate_text("Hello World", "en", "es", {}),
+        translation_service.translate_text("Hello World", "en", "es", {}),
+        translation_service.translate_text("Hello World", "en", "de", {}),
+    )
+
+    # Then
+    assert list(result) == ["Hola Mundo", "Hola Mundo", "Hola Mundo"]
+    assert mock_translation_model_repository.translate.call_count == 2
+
+
+def test_get_cache_statistics(
+    translation_service: TranslationService,
+    mock_translation_model_repository: TranslationModelRepository,
+) -> None:
+    # Given
+    statistics = CacheStatisticsModel(hits=1, misses=2, entries=3)
+    mock_translation_model_repository.get_cache_statistics.return_value = statistics
+
+    # When
+    result = translation_service.get_cache_statistics()
+
+    # Then
+    assert result == statistics